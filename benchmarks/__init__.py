@@ -0,0 +1 @@
+"""Performance benchmarks for langchain-skilllite (see ``benchmarks/run.py``)."""
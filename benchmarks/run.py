@@ -0,0 +1,449 @@
+"""
+Benchmark runner for the LangChain adapter path.
+
+Measures, with the ``.skills/`` fixtures (echo, greeter, text-upper) and
+generated directories of 1k-10k skills:
+
+- construction: ``SkillLiteToolkit.from_directory`` time, eager and lazy
+  (cold and warm manifest)
+- latency: per-call ``SkillLiteTool.invoke`` latency at sandbox levels
+  1/2/3 and with the warm worker pool
+- throughput: ``aexecute_batch`` calls per second at several concurrency
+  levels
+- callbacks: per-run overhead of the callback and metrics handlers
+- memory: traced bytes per loaded tool
+
+Levels that need the skillbox binary are reported as skipped when it is not
+installed. Results are written as JSON; ``--compare`` checks them against a
+previous run and exits with status 1 on regressions.
+
+Usage:
+    python -m benchmarks.run -o results.json
+    python -m benchmarks.run --quick --only construction,memory
+    python -m benchmarks.run --sizes 1000,10000 --compare baseline.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from uuid import uuid4
+
+from benchmarks.skillgen import generate_skills
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / ".skills"
+
+DEFAULT_SIZES = (1000, 5000, 10000)
+QUICK_SIZES = (100, 1000)
+DEFAULT_CONCURRENCY = (1, 8, 32, 128)
+BENCHMARKS = ("construction", "latency", "throughput", "callbacks", "memory")
+
+
+@dataclass
+class BenchContext:
+    """Settings and scratch space shared by all benchmarks."""
+
+    workdir: Path
+    sizes: Sequence[int]
+    concurrency: Sequence[int]
+    repeats: int
+    calls: int
+
+    def skills_dir(self, size: Optional[int]) -> Path:
+        """Fixture directory for ``None``, a generated directory otherwise."""
+        if size is None:
+            return FIXTURES_DIR
+        return generate_skills(self.workdir, size)
+
+
+# ==================== Results ====================
+
+
+def timing_result(name: str, params: Dict[str, Any], samples: List[float]) -> Dict[str, Any]:
+    """Summarize timing samples (seconds); ``value`` is the median."""
+    ordered = sorted(samples)
+    return {
+        "name": name,
+        "params": params,
+        "unit": "s",
+        "better": "lower",
+        "value": statistics.median(ordered),
+        "samples": len(ordered),
+        "min": ordered[0],
+        "mean": statistics.fmean(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+
+def value_result(
+    name: str, params: Dict[str, Any], value: float, unit: str, better: str
+) -> Dict[str, Any]:
+    return {"name": name, "params": params, "unit": unit, "better": better, "value": value}
+
+
+def skipped_result(name: str, params: Dict[str, Any], reason: str) -> Dict[str, Any]:
+    return {"name": name, "params": params, "skipped": reason}
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _size_label(size: Optional[int]) -> Any:
+    return "fixtures" if size is None else size
+
+
+def _execution_error(output: Any) -> Optional[str]:
+    """Error text of a tool output, or None if the call succeeded."""
+    if isinstance(output, str) and output.startswith(("Error:", "Execution failed:")):
+        return output.splitlines()[0]
+    return None
+
+
+# ==================== Benchmarks ====================
+
+
+def bench_construction(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """Toolkit construction time, eager and lazy."""
+    from langchain_skilllite import SkillLiteToolkit
+
+    results = []
+    for size in [None, *ctx.sizes]:
+        skills_dir = ctx.skills_dir(size)
+        manifest = ctx.workdir / f"manifest-{_size_label(size)}.json"
+        repeats = ctx.repeats if (size or 0) <= 1000 else 1
+        modes: Dict[str, Callable[[], Any]] = {
+            "eager": lambda: SkillLiteToolkit.from_directory(str(skills_dir)),
+            "lazy_cold": lambda: (
+                manifest.unlink(missing_ok=True),
+                SkillLiteToolkit.from_directory(
+                    str(skills_dir), lazy=True, manifest_path=str(manifest)
+                ),
+            ),
+            "lazy_warm": lambda: SkillLiteToolkit.from_directory(
+                str(skills_dir), lazy=True, manifest_path=str(manifest)
+            ),
+        }
+        for mode, build in modes.items():
+            samples = [_time(build) for _ in range(repeats)]
+            results.append(
+                timing_result("construction", {"skills": _size_label(size), "mode": mode}, samples)
+            )
+    return results
+
+
+def bench_latency(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """Per-call invoke latency of the echo fixture per sandbox level."""
+    from langchain_skilllite import SkillLiteToolkit
+    from langchain_skilllite.pool import PoolConfig
+
+    variants = [
+        ({"sandbox_level": 1}, {}),
+        ({"sandbox_level": 2}, {}),
+        ({"sandbox_level": 3}, {"confirmation_callback": lambda report, scan_id: True}),
+        ({"sandbox_level": 1, "pool": True}, {"pool": PoolConfig(min_size=1, max_size=1)}),
+    ]
+    results = []
+    for params, options in variants:
+        tool = SkillLiteToolkit.from_directory(
+            str(FIXTURES_DIR),
+            skill_names=["echo"],
+            sandbox_level=params["sandbox_level"],
+            cache=False,
+            **options,
+        )[0]
+        error = _execution_error(tool.invoke({"message": "warmup"}))
+        if error:
+            results.append(skipped_result("latency", params, error))
+            continue
+        samples = [_time(lambda: tool.invoke({"message": "hi"})) for _ in range(ctx.calls)]
+        results.append(timing_result("latency", params, samples))
+        if tool.pool is not None:
+            tool.pool.shutdown()
+    return results
+
+
+def bench_throughput(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """``aexecute_batch`` throughput at several concurrency levels."""
+    from skilllite import SkillManager
+
+    from langchain_skilllite import SkillLiteToolkit
+    from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+
+    results = []
+    manager = SkillManager(skills_dir=str(FIXTURES_DIR))
+    for backend in ("asyncio", "pool"):
+        pool = None
+        if backend == "pool":
+            pool = SkillWorkerPool(PoolConfig(min_size=1, max_size=min(8, os.cpu_count() or 1)))
+        toolkit = SkillLiteToolkit(manager=manager, sandbox_level=1, pool=pool, cache=False)
+
+        warmup = asyncio.run(toolkit.aexecute_batch([("echo", {"message": "warmup"})]))[0]
+        if not warmup.success:
+            for concurrency in ctx.concurrency:
+                params = {"backend": backend, "concurrency": concurrency}
+                results.append(skipped_result("throughput", params, str(warmup.error)))
+            continue
+
+        for concurrency in ctx.concurrency:
+            calls = [("echo", {"message": str(i)}) for i in range(max(ctx.calls, concurrency * 4))]
+            elapsed = _time(
+                lambda: asyncio.run(toolkit.aexecute_batch(calls, max_concurrency=concurrency))
+            )
+            params = {"backend": backend, "concurrency": concurrency}
+            results.append(value_result("throughput", params, len(calls) / elapsed, "calls/s", "higher"))
+        if pool is not None:
+            pool.shutdown()
+    return results
+
+
+def bench_callbacks(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """Per-run overhead of the callback handlers (start + custom event + end)."""
+    from langchain_skilllite import AsyncSkillLiteCallbackHandler, SkillLiteCallbackHandler
+    from langchain_skilllite.metrics import (
+        SANDBOX_LEVEL_METADATA_KEY,
+        PrometheusExporter,
+        SkillLiteMetricsHandler,
+    )
+    from langchain_skilllite.timing import TIMING_EVENT
+
+    runs = ctx.calls * 100
+    run_ids = [uuid4() for _ in range(runs)]
+    serialized = {"name": "echo"}
+    metadata = {SANDBOX_LEVEL_METADATA_KEY: 1}
+    timing = {"skill_name": "echo", "phases": {"execution": 0.001}}
+
+    handlers = {
+        "callback": SkillLiteCallbackHandler(),
+        "callback_no_log": SkillLiteCallbackHandler(max_log_size=0),
+        "metrics_prometheus": SkillLiteMetricsHandler(PrometheusExporter()),
+    }
+    results = []
+    for name, handler in handlers.items():
+        def drive() -> None:
+            for run_id in run_ids:
+                handler.on_tool_start(serialized, "{}", run_id=run_id, metadata=metadata)
+                handler.on_custom_event(TIMING_EVENT, timing, run_id=run_id)
+                handler.on_tool_end("ok", run_id=run_id)
+
+        samples = [_time(drive) / runs for _ in range(ctx.repeats)]
+        results.append(timing_result("callback_overhead", {"handler": name}, samples))
+
+    async_handler = AsyncSkillLiteCallbackHandler()
+
+    async def drive_async() -> None:
+        for run_id in run_ids:
+            await async_handler.on_tool_start(serialized, "{}", run_id=run_id, metadata=metadata)
+            await async_handler.on_custom_event(TIMING_EVENT, timing, run_id=run_id)
+            await async_handler.on_tool_end("ok", run_id=run_id)
+
+    samples = [_time(lambda: asyncio.run(drive_async())) / runs for _ in range(ctx.repeats)]
+    results.append(timing_result("callback_overhead", {"handler": "async_callback"}, samples))
+    return results
+
+
+def bench_memory(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """Traced memory per loaded tool."""
+    from langchain_skilllite import SkillLiteToolkit
+
+    results = []
+    for size in [None, *ctx.sizes]:
+        skills_dir = ctx.skills_dir(size)
+        for lazy in (False, True):
+            manifest = ctx.workdir / f"memory-manifest-{_size_label(size)}.json"
+            manifest.unlink(missing_ok=True)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                tools = SkillLiteToolkit.from_directory(
+                    str(skills_dir), lazy=lazy, manifest_path=str(manifest)
+                )
+                current, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            params = {"skills": _size_label(size), "mode": "lazy" if lazy else "eager"}
+            results.append(
+                value_result("memory_per_tool", params, current / max(len(tools), 1), "bytes", "lower")
+            )
+            del tools
+    return results
+
+
+_BENCHMARK_FUNCS: Dict[str, Callable[[BenchContext], List[Dict[str, Any]]]] = {
+    "construction": bench_construction,
+    "latency": bench_latency,
+    "throughput": bench_throughput,
+    "callbacks": bench_callbacks,
+    "memory": bench_memory,
+}
+
+
+# ==================== Runner ====================
+
+
+def _metadata() -> Dict[str, Any]:
+    from importlib.metadata import PackageNotFoundError, version
+
+    import langchain_skilllite
+
+    versions = {"langchain-skilllite": langchain_skilllite.__version__}
+    for package in ("skilllite", "langchain-core"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": versions,
+        "commit": commit,
+    }
+
+
+def run_benchmarks(names: Sequence[str], ctx: BenchContext) -> Dict[str, Any]:
+    """Run the named benchmarks and return the JSON report."""
+    results: List[Dict[str, Any]] = []
+    for name in names:
+        print(f"[bench] {name} ...", file=sys.stderr, flush=True)
+        results.extend(_BENCHMARK_FUNCS[name](ctx))
+    return {
+        "metadata": _metadata(),
+        "config": {
+            "sizes": list(ctx.sizes),
+            "concurrency": list(ctx.concurrency),
+            "repeats": ctx.repeats,
+            "calls": ctx.calls,
+        },
+        "results": results,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare a report with a baseline.
+
+    Args:
+        report: Current results
+        baseline: Previous results
+        threshold: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        One line per regression
+    """
+    previous = {result_key(r): r for r in baseline.get("results", []) if "value" in r}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get(result_key(result))
+        if "value" not in result or old is None or not old["value"] or not result["value"]:
+            continue
+        if result["better"] == "lower":
+            change = result["value"] / old["value"] - 1
+        else:
+            change = old["value"] / result["value"] - 1
+        if change > threshold:
+            regressions.append(
+                f"{result['name']} {json.dumps(result['params'], sort_keys=True)}: "
+                f"{old['value']:.6g} -> {result['value']:.6g} {result['unit']} ({change:+.0%})"
+            )
+    return regressions
+
+
+def _print_summary(report: Dict[str, Any]) -> None:
+    for result in report["results"]:
+        params = " ".join(f"{k}={v}" for k, v in result["params"].items())
+        if "skipped" in result:
+            line = f"skipped ({result['skipped']})"
+        else:
+            line = f"{result['value']:.6g} {result['unit']}"
+        print(f"{result['name']:<18} {params:<40} {line}", file=sys.stderr)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark langchain-skilllite.")
+    parser.add_argument("-o", "--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument(
+        "--only", help=f"Comma-separated benchmarks to run ({', '.join(BENCHMARKS)})"
+    )
+    parser.add_argument("--sizes", type=_int_list, help="Generated directory sizes")
+    parser.add_argument("--concurrency", type=_int_list, default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--repeats", type=int, default=5, help="Samples per timing benchmark")
+    parser.add_argument("--calls", type=int, default=100, help="Calls per latency sample set")
+    parser.add_argument("--quick", action="store_true", help="Small sizes and fewer samples")
+    parser.add_argument("--workdir", help="Keep generated skills here between runs")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in _BENCHMARK_FUNCS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="skilllite-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    ctx = BenchContext(
+        workdir=workdir,
+        sizes=sizes,
+        concurrency=args.concurrency,
+        repeats=2 if args.quick else args.repeats,
+        calls=20 if args.quick else args.calls,
+    )
+    try:
+        report = run_benchmarks(names, ctx)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    _print_summary(report)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(report, json.loads(Path(args.compare).read_text()), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Synthetic skill directories for benchmarks.
+
+``generate_skills(root, count)`` writes ``count`` small Python skills (an
+echo script with a realistic SKILL.md) below ``root``. A directory that
+already holds a complete set of the same size is reused, so large trees
+(10k skills) are only written once per workdir.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Union
+
+_MARKER = ".skillgen-complete"
+
+_SKILL_MD = """---
+name: {name}
+description: Synthetic benchmark skill number {index}. Echoes the input message back, optionally upper-cased.
+---
+
+# {name}
+
+Echoes the `message` field of its JSON input.
+
+## Usage
+
+`{{"message": "Hello"}}` -> `{{"message": "Hello"}}`
+
+`{{"message": "Hello", "upper": true}}` -> `{{"message": "HELLO"}}`
+"""
+
+_SCRIPT = """import json
+import sys
+
+data = json.loads(sys.stdin.read() or "{}")
+message = str(data.get("message", ""))
+print(json.dumps({"message": message.upper() if data.get("upper") else message}))
+"""
+
+
+def skill_name(index: int) -> str:
+    return f"bench-skill-{index:05d}"
+
+
+def generate_skills(root: Union[str, Path], count: int) -> Path:
+    """
+    Create (or reuse) a directory with ``count`` synthetic skills.
+
+    Args:
+        root: Parent directory; skills go to ``root/skills-<count>``
+        count: Number of skills
+
+    Returns:
+        Path of the skills directory
+    """
+    skills_dir = Path(root) / f"skills-{count}"
+    marker = skills_dir / _MARKER
+    if marker.exists() and marker.read_text() == str(count):
+        return skills_dir
+
+    for index in range(count):
+        name = skill_name(index)
+        scripts = skills_dir / name / "scripts"
+        scripts.mkdir(parents=True, exist_ok=True)
+        (skills_dir / name / "SKILL.md").write_text(_SKILL_MD.format(name=name, index=index))
+        (scripts / "main.py").write_text(_SCRIPT)
+    marker.write_text(str(count))
+    return skills_dir
+
+
+__all__ = ["generate_skills", "skill_name"]
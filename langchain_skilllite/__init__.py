@@ -9,7 +9,27 @@ Key Features:
 - SkillLiteTool: LangChain BaseTool adapter for individual skills
 - SkillLiteToolkit: Convenient toolkit for loading multiple skills
 - Security scanning and confirmation callbacks for sandbox level 3
+- Deferred confirmation: parked executions resumed by approve/reject
+- Optional warm worker pool to avoid per-call interpreter start-up
+- Persistent skill servers that load heavy skill modules once
+- Large inputs and outputs staged in shared memory instead of the pipes
+- Pluggable orjson/msgspec serializers and msgpack framing for skill servers
+- Prebuilt dependency environments and an explicit, timed warmup step
+- Content-addressed cache of security scan verdicts and approvals
+- Parallel build-time security prescan with a per-skill issue summary
+- Lazy, manifest-backed discovery for large skill directories
+- Binary toolkit snapshots for fast cold starts
+- Local BM25 tool selection so prompts only carry relevant skills
+- Compact, process-wide shared tool descriptions and input schemas
+- Hot reload of a skills directory with versioned tool snapshots
+- Result memoization for deterministic skills
+- Per-skill and global concurrency limits with bounded wait queues
+- Streaming skill output with an output size cap
+- Output policy bounding tool results, with a side store and a retrieval tool
+- Concurrency-safe sync and async callback handlers with latency percentiles
+- OpenTelemetry / Prometheus metrics for tool execution
 - Full async support for LangGraph agents
+- Lazy imports: ``import langchain_skilllite`` loads nothing until used
 
 Installation:
     pip install langchain-skilllite
@@ -33,21 +53,98 @@ For more information, see:
 - LangChain: https://python.langchain.com/
 """
 
-from langchain_skilllite.tools import (
-    SkillLiteTool,
-    SkillLiteToolkit,
-)
-from langchain_skilllite.callbacks import (
-    SkillLiteCallbackHandler,
-)
+from typing import TYPE_CHECKING, Any, List
+
 from langchain_skilllite._version import __version__
 
+if TYPE_CHECKING:
+    from langchain_skilllite.callbacks import (
+        AsyncSkillLiteCallbackHandler,
+        SkillLiteCallbackHandler,
+    )
+    from langchain_skilllite.confirmation import ConfirmationQueue
+    from langchain_skilllite.discovery import LazySkillManager
+    from langchain_skilllite.limits import ConcurrencyLimiter
+    from langchain_skilllite.metrics import PrometheusExporter, SkillLiteMetricsHandler
+    from langchain_skilllite.outputs import OutputPolicy, OutputStore
+    from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+    from langchain_skilllite.result_cache import ResultCache
+    from langchain_skilllite.scan_cache import ScanCache
+    from langchain_skilllite.selection import SkillIndex
+    from langchain_skilllite.templates import TemplateCache
+    from langchain_skilllite.tools import SkillLiteTool, SkillLiteToolkit
+    from langchain_skilllite.watch import ToolSnapshot, WatchingSkillLiteToolkit
+
+# Public names are imported on first access, so ``import langchain_skilllite``
+# does not load skilllite or LangChain until they are actually used.
+_LAZY_EXPORTS = {
+    # Core Tools
+    "SkillLiteTool": "langchain_skilllite.tools",
+    "SkillLiteToolkit": "langchain_skilllite.tools",
+    # Callbacks
+    "SkillLiteCallbackHandler": "langchain_skilllite.callbacks",
+    "AsyncSkillLiteCallbackHandler": "langchain_skilllite.callbacks",
+    "SkillLiteMetricsHandler": "langchain_skilllite.metrics",
+    "PrometheusExporter": "langchain_skilllite.metrics",
+    # Discovery
+    "LazySkillManager": "langchain_skilllite.discovery",
+    "WatchingSkillLiteToolkit": "langchain_skilllite.watch",
+    "ToolSnapshot": "langchain_skilllite.watch",
+    "SkillIndex": "langchain_skilllite.selection",
+    # Execution
+    "PoolConfig": "langchain_skilllite.pool",
+    "SkillWorkerPool": "langchain_skilllite.pool",
+    "ResultCache": "langchain_skilllite.result_cache",
+    "ConcurrencyLimiter": "langchain_skilllite.limits",
+    "TemplateCache": "langchain_skilllite.templates",
+    "OutputPolicy": "langchain_skilllite.outputs",
+    "OutputStore": "langchain_skilllite.outputs",
+    # Security
+    "ScanCache": "langchain_skilllite.scan_cache",
+    "ConfirmationQueue": "langchain_skilllite.confirmation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     # Core Tools
     "SkillLiteTool",
     "SkillLiteToolkit",
     # Callbacks
     "SkillLiteCallbackHandler",
+    "AsyncSkillLiteCallbackHandler",
+    "SkillLiteMetricsHandler",
+    "PrometheusExporter",
+    # Discovery
+    "LazySkillManager",
+    "WatchingSkillLiteToolkit",
+    "ToolSnapshot",
+    "SkillIndex",
+    # Execution
+    "PoolConfig",
+    "SkillWorkerPool",
+    "ResultCache",
+    "ConcurrencyLimiter",
+    "TemplateCache",
+    "OutputPolicy",
+    "OutputStore",
+    # Security
+    "ScanCache",
+    "ConfirmationQueue",
     # Version
     "__version__",
 ]
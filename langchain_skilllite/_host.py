@@ -0,0 +1,87 @@
+"""
+Start-up shared by the pool's worker and skill server scripts.
+
+``_worker.py`` and ``_server.py`` are executed as scripts, never imported
+from the package, and import this module from their own directory. Like
+them, it must only depend on the standard library (``orjson`` is used for
+JSON lines when installed).
+
+Usage:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from _host import bootstrap, dumps, loads  # noqa: E402
+
+    channel_in, channel_out = bootstrap()
+"""
+
+import json
+import os
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MAX_MEMORY_ENV = "SKILLLITE_WORKER_MAX_MEMORY_MB"
+
+_HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def dumps(message):
+    """Encode one JSON message (no newline), with orjson when it accepts it."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message)
+        except TypeError:
+            pass
+    return json.dumps(message).encode("utf-8")
+
+
+def loads(data):
+    """Decode one JSON message, with orjson when it accepts it."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
+def limit_memory():
+    """Apply the address-space limit requested by the pool, if any."""
+    max_memory_mb = os.environ.get(MAX_MEMORY_ENV)
+    if not max_memory_mb:
+        return
+    try:
+        import resource
+
+        limit = int(max_memory_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def bootstrap():
+    """
+    Prepare a host process and return its private IPC channel.
+
+    Keeps private handles on the pipes the pool talks over, then points
+    fds 0/1 elsewhere so skill code writing to the raw file descriptors
+    cannot corrupt the channel. Drops this package's directory from
+    ``sys.path`` (skills get their own) and applies the memory limit.
+
+    Returns:
+        (channel_in, channel_out) binary file objects
+    """
+    channel_in = os.fdopen(os.dup(0), "rb")
+    channel_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+
+    sys.path[:] = [path for path in sys.path if not path or os.path.abspath(path) != _HOST_DIR]
+    # Nor can a skill's own ``_host`` module resolve to this one.
+    sys.modules.pop(__name__, None)
+
+    limit_memory()
+    return channel_in, channel_out
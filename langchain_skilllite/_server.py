@@ -0,0 +1,159 @@
+"""
+Persistent skill server host for the SkillLite warm pool.
+
+This file is executed as a script by langchain_skilllite.server (it is never
+imported), so it must only depend on the standard library and its sibling
+``_host`` (``orjson`` is used for JSON lines when installed). It loads the skill's server module once, so
+imports and model loading happen a single time, then answers
+newline-delimited JSON requests by calling the module's handler function.
+
+Request:  {"id": "7", "input": {...}}
+          {"id": "7", "input_file": "<path of a JSON file>"}   (large inputs)
+Response: {"id": "7", "output": <handler result>}
+          {"id": "7", "error": "<traceback>"}
+
+Requests carry an id and responses may arrive out of order: with
+``SKILLLITE_SERVER_CONCURRENCY`` above 1 the handler runs on that many
+threads. If the module cannot be loaded, a single ``{"fatal": "..."}`` line
+is written and the server exits.
+
+With ``SKILLLITE_SERVER_FRAMING=msgpack`` the same messages are exchanged as
+msgpack frames, each a 4-byte big-endian length followed by the body
+(``msgpack`` or ``msgspec`` must be importable). The ``fatal`` message is
+still a JSON line.
+"""
+
+import json
+import os
+import runpy
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _host import bootstrap, dumps, loads  # noqa: E402
+
+
+def _json_codec():
+    """(encode, decode) for JSON lines."""
+    return (lambda message: dumps(message) + b"\n"), loads
+
+
+def _msgpack_codec():
+    """(encode, decode) for length-prefixed msgpack frames."""
+    try:
+        import msgpack
+
+        pack, unpack = msgpack.packb, lambda data: msgpack.unpackb(data, raw=False)
+    except ImportError:
+        import msgspec
+
+        pack, unpack = msgspec.msgpack.encode, msgspec.msgpack.decode
+
+    def encode(message):
+        body = pack(message)
+        return len(body).to_bytes(4, "big") + body
+
+    return encode, unpack
+
+
+def _json_requests(channel_in):
+    for line in channel_in:
+        if line.strip():
+            yield line
+
+
+def _msgpack_requests(channel_in):
+    while True:
+        header = channel_in.read(4)
+        if len(header) < 4:
+            return
+        size = int.from_bytes(header, "big")
+        body = channel_in.read(size)
+        if len(body) < size:
+            return
+        yield body
+
+
+def _load_handler(script, name):
+    """Run the server module once and return its handler function."""
+    sys.argv = [script]
+    sys.path.insert(0, os.path.dirname(script))
+    namespace = runpy.run_path(script, run_name="__skilllite_server__")
+    handler = namespace.get(name)
+    if not callable(handler):
+        raise LookupError(f"{script} does not define a callable '{name}'")
+    return handler
+
+
+def main() -> None:
+    channel_in, channel_out = bootstrap()
+    lock = threading.Lock()
+
+    def fatal(error):
+        # Always a JSON line, so the pool can read it in any framing.
+        channel_out.write(json.dumps({"fatal": error}).encode("utf-8") + b"\n")
+        channel_out.flush()
+        sys.exit(1)
+
+    # Staged inputs are JSON files in either framing.
+    load_json = _json_codec()[1]
+    if os.environ.get("SKILLLITE_SERVER_FRAMING") == "msgpack":
+        try:
+            encode, decode = _msgpack_codec()
+        except ImportError:
+            fatal("msgpack framing requires msgpack or msgspec in the server's interpreter")
+        requests = _msgpack_requests(channel_in)
+    else:
+        encode, decode = _json_codec()
+        requests = _json_requests(channel_in)
+
+    def send(message):
+        frame = encode(message)
+        with lock:
+            channel_out.write(frame)
+            channel_out.flush()
+
+    try:
+        handler = _load_handler(
+            os.environ["SKILLLITE_SERVER_SCRIPT"],
+            os.environ.get("SKILLLITE_SERVER_HANDLER", "handle"),
+        )
+    except BaseException:
+        fatal(traceback.format_exc().strip())
+
+    def answer(request):
+        request_id = request.get("id")
+        try:
+            input_file = request.get("input_file")
+            if input_file:
+                with open(input_file, "rb") as f:
+                    data = load_json(f.read())
+            else:
+                data = request.get("input")
+            output = handler(data or {})
+            send({"id": request_id, "output": output})
+        except BaseException:
+            send({"id": request_id, "error": traceback.format_exc().strip()})
+
+    concurrency = int(os.environ.get("SKILLLITE_SERVER_CONCURRENCY", "1") or 1)
+    executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    try:
+        for frame in requests:
+            try:
+                request = decode(frame)
+            except Exception as e:
+                send({"id": None, "error": f"Invalid server request: {e}"})
+                continue
+            if executor is not None:
+                executor.submit(answer, request)
+            else:
+                answer(request)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
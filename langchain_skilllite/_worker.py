@@ -0,0 +1,234 @@
+"""
+Long-lived worker process for the SkillLite warm pool.
+
+This file is executed as a script by langchain_skilllite.pool (it is never
+imported), so it must only depend on the standard library and its sibling
+``_host`` (``orjson`` is used for the request and response lines when
+installed). The worker reads
+newline-delimited JSON requests from its stdin and writes one JSON response
+line per request.
+
+Each request runs in a child forked from the warm worker, with
+stdin/stdout/stderr redirected. The worker's start-up cost is paid once,
+while nothing a skill changes (``sys.modules``, ``os.environ``, the working
+directory, module globals, signal handlers, threads) outlives its call.
+
+Request:  {"script": "/abs/path/main.py", "input": "<stdin text>", "args": []}
+Response: {"stdout": "...", "stderr": "...", "exit_code": 0}
+
+With ``"stream": true`` the script's stdout is sent as it is written, as
+``{"out": "..."}`` lines before the response (whose ``stdout`` is then
+empty). ``"max_output": <bytes>`` stops forwarding stdout beyond that many
+UTF-8 bytes; the response reports the rest as ``"dropped"``.
+
+Large payloads travel out of band. ``"input_file": "<path>"`` replaces
+``input``: the file becomes the script's stdin and its path is exported as
+``SKILLLITE_INPUT_FILE``. With ``"spill_output": <chars>`` captured stdout
+longer than that is written to a new file in ``"spill_dir"`` and returned as
+``"stdout_file"`` (the pool removes it after reading).
+"""
+
+import io
+import os
+import runpy
+import sys
+import tempfile
+import threading
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _host import bootstrap, dumps, loads  # noqa: E402
+
+# Streamed stdout is sent once this much text is buffered, or on a newline
+STREAM_FLUSH_CHARS = 8192
+
+INPUT_FILE_ENV = "SKILLLITE_INPUT_FILE"
+
+# Spilled stdout is written in slices of this many characters
+_SPILL_CHUNK_CHARS = 1024 * 1024
+
+
+class _StreamingStdout(io.TextIOBase):
+    """stdout replacement that forwards output to the pool as ``out`` frames."""
+
+    encoding = "utf-8"
+
+    def __init__(self, send, max_output):
+        self._send = send
+        self._max_output = max_output
+        self._buffer = []
+        self._buffered = 0
+        self.sent = 0
+        self.dropped = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if "\n" in text or self._buffered >= STREAM_FLUSH_CHARS:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer = []
+        self._buffered = 0
+        if self._max_output is not None:
+            room = max(self._max_output - self.sent, 0)
+            if len(data) > room:
+                self.dropped += len(data) - room
+                data = data[:room]
+        if data:
+            self.sent += len(data)
+            self._send({"out": data.decode("utf-8", errors="ignore")})
+
+
+def _spill(text, directory):
+    """Write captured stdout to a new file and return its path (None on failure)."""
+    try:
+        fd, path = tempfile.mkstemp(prefix="skilllite-payload-", dir=directory)
+    except OSError:
+        return None
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for start in range(0, len(text), _SPILL_CHUNK_CHARS):
+                f.write(text[start:start + _SPILL_CHUNK_CHARS].encode("utf-8"))
+    except OSError:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return None
+    return path
+
+
+def _join_threads():
+    """Wait for threads the script left running, as interpreter exit would."""
+    current = threading.current_thread()
+    for thread in threading.enumerate():
+        if thread is not current and not thread.daemon:
+            thread.join()
+
+
+def _run_script(request, send=None):
+    """Run one skill script as ``__main__`` and capture (or stream) its output."""
+    script = request["script"]
+    if request.get("stream") and send is not None:
+        stdout = _StreamingStdout(send, request.get("max_output"))
+    else:
+        stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+    saved_argv = sys.argv[:]
+    saved_path = sys.path[:]
+
+    input_file = request.get("input_file")
+    if input_file:
+        stdin = open(input_file, "r", encoding="utf-8")
+        os.environ[INPUT_FILE_ENV] = input_file
+    else:
+        stdin = io.StringIO(request.get("input", ""))
+    sys.stdin = stdin
+    sys.stdout = stdout
+    sys.stderr = stderr
+    sys.argv = [script] + list(request.get("args") or [])
+    sys.path.insert(0, os.path.dirname(script))
+
+    exit_code = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc(file=stderr)
+        exit_code = 1
+    finally:
+        _join_threads()
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        if input_file:
+            stdin.close()
+            os.environ.pop(INPUT_FILE_ENV, None)
+
+    if isinstance(stdout, _StreamingStdout):
+        stdout.flush()
+        return {
+            "stdout": "",
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+            "dropped": stdout.dropped,
+        }
+    response = {
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "exit_code": exit_code,
+    }
+    spill_output = request.get("spill_output")
+    if spill_output is not None and len(response["stdout"]) > spill_output:
+        path = _spill(response["stdout"], request.get("spill_dir"))
+        if path is not None:
+            response["stdout"] = ""
+            response["stdout_file"] = path
+    return response
+
+
+def _run_forked(request, send):
+    """Run one request in a forked child and return the response it reports."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        status = 1
+        try:
+            data = dumps(_run_script(request, send))
+            with os.fdopen(write_fd, "wb") as result:
+                result.write(data)
+            status = 0
+        finally:
+            # Skip the worker's own exit handlers and buffered channel handles.
+            os._exit(status)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as result:
+        data = result.read()
+    _, status = os.waitpid(pid, 0)
+    if data:
+        return loads(data)
+    exit_code = os.waitstatus_to_exitcode(status)
+    return {
+        "stdout": "",
+        "stderr": f"Skill process exited without a response (status {exit_code})",
+        "exit_code": exit_code or 1,
+    }
+
+
+def main() -> None:
+    channel_in, channel_out = bootstrap()
+
+    def send(message):
+        channel_out.write(dumps(message) + b"\n")
+        channel_out.flush()
+
+    for line in channel_in:
+        if not line.strip():
+            continue
+        try:
+            response = _run_forked(loads(line), send)
+        except Exception as e:
+            response = {"stdout": "", "stderr": f"Invalid worker request: {e}", "exit_code": 1}
+        send(response)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Native asyncio execution path for SkillLite skills.
+
+skilllite's UnifiedExecutionService is synchronous, so the SDK's
+SkillLiteTool._arun runs it on a worker thread. Under LangGraph that ties
+one default-executor thread to every in-flight skill call. The helpers in
+this module run the same skillbox commands with asyncio subprocesses
+instead, so a single event loop can keep many skill invocations in flight.
+
+Command construction, environment and output parsing are delegated to
+skilllite's UnifiedExecutor so both paths stay behaviourally identical.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from skilllite.core.protocols import SecurityScanResult
+from skilllite.sandbox.base import ExecutionResult
+
+from langchain_skilllite.timing import (
+    PHASE_EXECUTION,
+    PHASE_OUTPUT_PARSING,
+    PHASE_SANDBOX_SPAWN,
+    phase,
+)
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+    from skilllite.sandbox.context import ExecutionContext
+
+# Matches the timeout skilllite's SecurityScanner uses for skillbox scans.
+SCAN_TIMEOUT = 30
+
+
+def _scan_failure(issue_type: str, rule_id: str, description: str, scan_id: str,
+                  code_hash: str, snippet: str = "") -> SecurityScanResult:
+    """Fail-secure scan result: scan problems always require confirmation."""
+    return SecurityScanResult(
+        is_safe=False,
+        issues=[{
+            "severity": "High",
+            "issue_type": issue_type,
+            "rule_id": rule_id,
+            "line_number": 0,
+            "description": description,
+            "code_snippet": snippet,
+        }],
+        scan_id=scan_id,
+        code_hash=code_hash,
+        high_severity_count=1,
+    )
+
+
+def _entry_script(skill_info: "SkillInfo") -> Optional[Path]:
+    """Resolve the script SecurityScanner would scan for this skill."""
+    metadata = skill_info.metadata
+    if metadata and metadata.entry_point:
+        return skill_info.path / metadata.entry_point
+    for default_entry in ("scripts/main.py", "main.py"):
+        candidate = skill_info.path / default_entry
+        if candidate.exists():
+            return candidate
+    return None
+
+
+async def scan_skill(skill_info: "SkillInfo", input_data: Dict[str, Any]) -> SecurityScanResult:
+    """
+    Async equivalent of ``SecurityScanner.scan_skill``.
+
+    Runs ``skillbox security-scan`` as an asyncio subprocess. Results are
+    registered in the shared SecurityScanner cache so ``scan_id`` lookups and
+    ``verify_scan`` keep working.
+
+    Args:
+        skill_info: SkillInfo of the skill to scan
+        input_data: Input data for the pending execution
+
+    Returns:
+        SecurityScanResult with any issues found
+    """
+    from skilllite.core.security import SecurityScanner, parse_scan_json_output
+
+    scanner = SecurityScanner.get_instance()
+    scan_id = str(uuid.uuid4())
+    code_hash = scanner._generate_input_hash(skill_info.name, input_data)
+
+    script = _entry_script(skill_info)
+    if script is None or not script.exists() or not scanner.skillbox_path:
+        return SecurityScanResult.safe(scan_id=scan_id, code_hash=code_hash)
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            scanner.skillbox_path, "security-scan", "--json", str(script),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), SCAN_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return _scan_failure(
+                "Scan Timeout", "scan-timeout",
+                "Security scan timed out. Manual review required.",
+                scan_id, code_hash,
+            )
+    except Exception:
+        return _scan_failure(
+            "Scan Error", "scan-exception",
+            "Security scan encountered an error. Manual review required.",
+            scan_id, code_hash,
+        )
+
+    if process.returncode != 0:
+        return _scan_failure(
+            "Scan Error", "scan-error",
+            f"Security scan failed (exit code {process.returncode}). Manual review required.",
+            scan_id, code_hash,
+            snippet=stderr.decode("utf-8", errors="replace").strip()[:100],
+        )
+
+    data = parse_scan_json_output(stdout.decode("utf-8", errors="replace"))
+    scan_result = SecurityScanResult(
+        is_safe=data["is_safe"],
+        issues=data["issues"],
+        scan_id=scan_id,
+        code_hash=code_hash,
+        high_severity_count=data["high_severity_count"],
+        medium_severity_count=data["medium_severity_count"],
+        low_severity_count=data["low_severity_count"],
+    )
+    scanner._scan_cache[scan_id] = scan_result
+    return scan_result
+
+
+async def run_skill(
+    context: "ExecutionContext",
+    skill_info: "SkillInfo",
+    input_data: Dict[str, Any],
+) -> ExecutionResult:
+    """
+    Execute a skill through skillbox using an asyncio subprocess.
+
+    The caller is responsible for the level 3 security flow; ``context``
+    must already reflect its outcome (as UnifiedExecutionService does).
+
+    Args:
+        context: Resolved execution context
+        skill_info: SkillInfo of the skill to run
+        input_data: Input data for the skill (also piped to stdin)
+
+    Returns:
+        ExecutionResult with output or error
+    """
+    from skilllite.sandbox.execution_service import UnifiedExecutionService
+
+    executor = UnifiedExecutionService.get_instance()._executor
+    cmd = executor._build_run_command(context, skill_info.path, input_data)
+    env = executor._build_env(context, skill_info.path)
+
+    try:
+        with phase(PHASE_SANDBOX_SPAWN):
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+    except FileNotFoundError:
+        return ExecutionResult(
+            success=False,
+            error=f"skillbox binary not found at: {cmd[0]}",
+            exit_code=-1,
+        )
+    except Exception as e:
+        return ExecutionResult(
+            success=False,
+            error=f"Execution failed: {str(e)}",
+            exit_code=-1,
+        )
+
+    try:
+        with phase(PHASE_EXECUTION):
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(json.dumps(input_data).encode("utf-8")),
+                context.timeout,
+            )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return ExecutionResult(
+            success=False,
+            error=f"Execution timed out after {context.timeout} seconds",
+            exit_code=-1,
+        )
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    with phase(PHASE_OUTPUT_PARSING):
+        return executor._parse_output(
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+            process.returncode,
+        )
+
+
+__all__ = ["scan_skill", "run_skill"]
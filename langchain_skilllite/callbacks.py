@@ -3,25 +3,432 @@ LangChain callback handlers for SkillLite.
 
 This module provides callback handlers for integrating SkillLite
 with LangChain's callback system for logging, tracing, and monitoring.
+
+Both handlers are safe to share between concurrently running tools:
+in-flight runs are keyed by ``run_id``, and counters and latency
+histograms are sharded per thread, so parallel tool calls (LangGraph
+ToolNode, ``execute_batch``) are attributed correctly without
+serializing on a single lock.
+
+- ``SkillLiteCallbackHandler``: for synchronous and threaded execution
+- ``AsyncSkillLiteCallbackHandler``: for ``ainvoke`` / ``astream`` agents
+
+Streaming tools (``SkillLiteTool(streaming=True)``) report output chunks
+through ``on_tool_stream``; handlers count them and track time to first
+output per tool without logging every chunk.
 """
 
 from __future__ import annotations
 
+import itertools
+import json
 import logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+import queue
+import reprlib
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.callbacks import AsyncCallbackHandler, BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
+from langchain_skilllite.result_cache import CACHE_EVENT
+from langchain_skilllite.streaming import STREAM_EVENT
+from langchain_skilllite.timing import TIMING_EVENT, LatencyHistogram
+
 if TYPE_CHECKING:
     from langchain_core.agents import AgentAction, AgentFinish
     from langchain_core.messages import BaseMessage
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_LOG_SIZE = 10_000
+DEFAULT_STATS_SHARDS = 8
+
+# Where events can be streamed: a JSONL file path, a queue, or a callable
+EventSink = Union[str, Path, "queue.Queue[Dict[str, Any]]", Callable[[Dict[str, Any]], None]]
+
+
+class ExecutionLog(deque):
+    """
+    Ring buffer of execution events.
+
+    Keeps the most recent ``maxlen`` events (all of them when ``maxlen`` is
+    None). Unlike a plain deque it can be sliced (``log[-10:]``), which
+    returns a list, as the list it replaces did.
+    """
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+        return super().__getitem__(index)
+
+    def recent(self, n: int) -> List[Dict[str, Any]]:
+        """The last ``n`` events, oldest first, without copying the whole log."""
+        if n <= 0:
+            return []
+        events = list(itertools.islice(reversed(self), n))
+        events.reverse()
+        return events
+
+
+@dataclass
+class _RunState:
+    """Bookkeeping for one in-flight tool run."""
+
+    tool_name: str
+    started: float
+    phases: Dict[str, float] = field(default_factory=dict)
+    first_output: Optional[float] = None
+    stream_chunks: int = 0
+    stream_bytes: int = 0
+
+
+class _StatsShard:
+    """Counters and histograms updated by the threads assigned to one shard."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+        self.dropped = 0
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.phase_latency: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.first_output: Dict[str, LatencyHistogram] = {}
+
+    def clear(self) -> None:
+        with self.lock:
+            self.counts.clear()
+            self.dropped = 0
+            self.latency.clear()
+            self.phase_latency.clear()
+            self.first_output.clear()
+
+
+def _histogram(histograms: Dict[str, LatencyHistogram], name: str) -> LatencyHistogram:
+    histogram = histograms.get(name)
+    if histogram is None:
+        histogram = histograms[name] = LatencyHistogram()
+    return histogram
+
+
+# Previews are built with a size-limited repr, so a huge non-string output is
+# never stringified in full just to keep its first 200 characters.
+_PREVIEW_CHARS = 200
+_preview_repr = reprlib.Repr()
+_preview_repr.maxstring = _PREVIEW_CHARS
+_preview_repr.maxother = _PREVIEW_CHARS
+_preview_repr.maxdict = _preview_repr.maxlist = _preview_repr.maxtuple = 32
+
+
+def _preview(value: Any) -> str:
+    if isinstance(value, str):
+        return value[:_PREVIEW_CHARS]
+    if isinstance(value, (dict, list, tuple)):
+        return _preview_repr.repr(value)[:_PREVIEW_CHARS]
+    return str(value)[:_PREVIEW_CHARS]
+
+
+def _output_preview(output: Any) -> Optional[str]:
+    # Handle different output types (str, ToolMessage, etc.)
+    if isinstance(output, str):
+        return output[:_PREVIEW_CHARS] if output else None
+    if hasattr(output, "content"):
+        # ToolMessage or similar object
+        return _preview(output.content)
+    return _preview(output) if output else None
+
+
+class _JsonlSink:
+    """Appends events as JSON lines to a file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self._file: IO[str] = open(self.path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class _SkillLiteHandlerState:
+    """
+    State and event handling shared by the sync and async handlers.
+
+    In-flight runs live in a plain dict keyed by ``run_id``; inserting and
+    popping a key are atomic, so no lock is taken per run. Counters and
+    histograms are split into shards; each thread is pinned to one shard
+    and only contends with threads sharing it. Reads (summary, histogram)
+    merge all shards.
+    """
+
+    def _init_state(
+        self,
+        verbose: bool,
+        log_level: int,
+        max_log_size: Optional[int],
+        sink: Optional[EventSink],
+        shards: int,
+    ) -> None:
+        if max_log_size is not None and max_log_size < 0:
+            raise ValueError("max_log_size must be >= 0")
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self.verbose = verbose
+        self.log_level = log_level
+        self.execution_log: ExecutionLog = ExecutionLog(maxlen=max_log_size)
+        # In-flight tool runs, keyed by run_id (insertion ordered)
+        self._runs: Dict[UUID, _RunState] = {}
+        self._shards = [_StatsShard() for _ in range(shards)]
+        self._shard_ids = itertools.count()
+        self._local = threading.local()
+        self._sink = self._make_sink(sink)
+
+    @property
+    def _current_tool(self) -> Optional[str]:
+        """Name of the most recently started tool that is still running."""
+        runs = list(self._runs.values())
+        return runs[-1].tool_name if runs else None
+
+    @property
+    def dropped_events(self) -> int:
+        """Events a full queue sink could not accept."""
+        return sum(shard.dropped for shard in self._shards)
+
+    def _shard(self) -> _StatsShard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._shards[next(self._shard_ids) % len(self._shards)]
+            self._local.shard = shard
+        return shard
+
+    @staticmethod
+    def _make_sink(sink: Optional[EventSink]) -> Optional[Callable[[Dict[str, Any]], None]]:
+        if sink is None:
+            return None
+        if isinstance(sink, (str, Path)):
+            return _JsonlSink(sink)
+        if callable(sink):
+            return sink
+        if hasattr(sink, "put_nowait"):
+            return sink.put_nowait
+        raise TypeError("sink must be a path, a queue or a callable")
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        """Count an event, keep it in the ring buffer and stream it to the sink."""
+        shard = self._shard()
+        with shard.lock:
+            shard.counts[event["event"]] = shard.counts.get(event["event"], 0) + 1
+        if self.execution_log.maxlen != 0:
+            self.execution_log.append(event)
+        if self._sink is not None:
+            try:
+                self._sink(event)
+            except queue.Full:
+                with shard.lock:
+                    shard.dropped += 1
+
+    def _handle_tool_start(self, serialized: Dict[str, Any], input_str: str, run_id: UUID) -> None:
+        tool_name = serialized.get("name", "unknown")
+        self._runs[run_id] = _RunState(tool_name=tool_name, started=time.perf_counter())
+
+        event = {
+            "event": "tool_start",
+            "tool_name": tool_name,
+            "run_id": str(run_id),
+            "input": input_str[:200] if input_str else None,
+        }
+        self._record(event)
+
+        if self.verbose:
+            print(f"🔧 [SkillLite] Starting tool: {tool_name}")
+            logger.log(self.log_level, f"Tool started: {tool_name}")
+
+    def _handle_tool_end(self, output: Any, run_id: UUID) -> None:
+        tool_name, timing = self._finish_run(run_id)
+        event = {
+            "event": "tool_end",
+            "tool_name": tool_name,
+            "run_id": str(run_id),
+            "output_preview": _output_preview(output),
+            "success": True,
+            **timing,
+        }
+        self._record(event)
+
+        if self.verbose:
+            print(f"✅ [SkillLite] Tool completed: {tool_name}")
+            logger.log(self.log_level, f"Tool completed: {tool_name}")
+
+    def _handle_tool_error(self, error: BaseException, run_id: UUID) -> None:
+        tool_name, timing = self._finish_run(run_id)
+        event = {
+            "event": "tool_error",
+            "tool_name": tool_name,
+            "run_id": str(run_id),
+            "error": str(error),
+            "success": False,
+            **timing,
+        }
+        self._record(event)
+
+        if self.verbose:
+            print(f"❌ [SkillLite] Tool error: {tool_name} - {error}")
+            logger.error(f"Tool error: {tool_name} - {error}")
+
+    def _finish_run(self, run_id: UUID) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Close a run: record its wall time and return its tool name and timing fields."""
+        now = time.perf_counter()
+        state = self._runs.pop(run_id, None)
+        if state is None:
+            return None, {}
+        duration = now - state.started
+        shard = self._shard()
+        with shard.lock:
+            _histogram(shard.latency, state.tool_name).record(duration)
+        timing: Dict[str, Any] = {"duration": duration}
+        if state.phases:
+            timing["phases"] = state.phases
+        if state.stream_chunks:
+            timing["stream"] = {
+                "chunks": state.stream_chunks,
+                "bytes": state.stream_bytes,
+                "time_to_first_output": state.first_output,
+            }
+        return state.tool_name, timing
+
+    def _handle_tool_stream(self, data: Dict[str, Any], run_id: UUID) -> None:
+        """Count a streamed chunk; the first one of a run sets its time to first output."""
+        state = self._runs.get(run_id)
+        shard = self._shard()
+        with shard.lock:
+            shard.counts["tool_stream"] = shard.counts.get("tool_stream", 0) + 1
+            if state is not None and state.first_output is None:
+                state.first_output = time.perf_counter() - state.started
+                _histogram(shard.first_output, state.tool_name).record(state.first_output)
+        if state is not None:
+            state.stream_chunks += 1
+            state.stream_bytes = data.get("bytes", state.stream_bytes)
+
+        if self.verbose and state is not None and state.stream_chunks == 1:
+            print(f"📡 [SkillLite] Streaming output: {state.tool_name}")
+            logger.log(self.log_level, f"Tool streaming: {state.tool_name}")
+
+    def _handle_custom_event(self, name: str, data: Any, run_id: UUID) -> None:
+        if name == TIMING_EVENT:
+            self._record_phases(run_id, data)
+            return
+        if name != CACHE_EVENT:
+            return
+        event = {
+            "event": "cache_hit" if data.get("hit") else "cache_miss",
+            "tool_name": data.get("skill_name"),
+            "run_id": str(run_id),
+        }
+        self._record(event)
 
-class SkillLiteCallbackHandler(BaseCallbackHandler):
+        if self.verbose:
+            print(f"💾 [SkillLite] Result cache {'hit' if data.get('hit') else 'miss'}: {event['tool_name']}")
+            logger.log(self.log_level, f"Result cache {event['event']}: {event['tool_name']}")
+
+    def _record_phases(self, run_id: UUID, data: Dict[str, Any]) -> None:
+        phases = data.get("phases") or {}
+        state = self._runs.get(run_id)
+        tool_name = state.tool_name if state else data.get("skill_name", "unknown")
+        if state is not None:
+            state.phases = dict(phases)
+        shard = self._shard()
+        with shard.lock:
+            histograms = shard.phase_latency.setdefault(tool_name, {})
+            for phase_name, seconds in phases.items():
+                _histogram(histograms, phase_name).record(seconds)
+
+    def get_latency_histogram(self, tool_name: str) -> Optional[LatencyHistogram]:
+        """Wall-time histogram of a tool, if it has completed at least once."""
+        merged: Optional[LatencyHistogram] = None
+        for shard in self._shards:
+            with shard.lock:
+                histogram = shard.latency.get(tool_name)
+                if histogram is None:
+                    continue
+                if merged is None:
+                    merged = LatencyHistogram(histogram.sub_bucket_bits)
+                merged.merge(histogram)
+        return merged
+
+    def get_execution_summary(self) -> Dict[str, Any]:
+        """
+        Get a summary of all execution events (includes evicted events).
+
+        Counters cost O(shards). ``latency`` holds per-tool wall-time
+        statistics, ``phases`` per-tool, per-phase statistics and
+        ``time_to_first_output`` per-tool statistics for streaming runs
+        (count, mean, p50, p95, p99 and max, in seconds).
+        """
+        counts: Dict[str, int] = {}
+        latency: Dict[str, LatencyHistogram] = {}
+        phase_latency: Dict[str, Dict[str, LatencyHistogram]] = {}
+        first_output: Dict[str, LatencyHistogram] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for name, count in shard.counts.items():
+                    counts[name] = counts.get(name, 0) + count
+                for tool, histogram in shard.latency.items():
+                    _histogram(latency, tool).merge(histogram)
+                for tool, histograms in shard.phase_latency.items():
+                    merged = phase_latency.setdefault(tool, {})
+                    for phase_name, histogram in histograms.items():
+                        _histogram(merged, phase_name).merge(histogram)
+                for tool, histogram in shard.first_output.items():
+                    _histogram(first_output, tool).merge(histogram)
+
+        tool_starts = counts.get("tool_start", 0)
+        tool_ends = counts.get("tool_end", 0)
+        cache_hits = counts.get("cache_hit", 0)
+        cache_misses = counts.get("cache_miss", 0)
+
+        return {
+            "total_events": sum(counts.values()) - counts.get("tool_stream", 0),
+            "tool_executions": tool_starts,
+            "successful": tool_ends,
+            "errors": counts.get("tool_error", 0),
+            "success_rate": tool_ends / tool_starts if tool_starts > 0 else 0,
+            "cache_hits": cache_hits,
+            "cache_misses": cache_misses,
+            "cache_hit_rate": (
+                cache_hits / (cache_hits + cache_misses) if cache_hits + cache_misses else 0
+            ),
+            "latency": {tool: hist.summary() for tool, hist in latency.items()},
+            "phases": {
+                tool: {name: hist.summary() for name, hist in histograms.items()}
+                for tool, histograms in phase_latency.items()
+            },
+            "stream_chunks": counts.get("tool_stream", 0),
+            "time_to_first_output": {tool: hist.summary() for tool, hist in first_output.items()},
+        }
+
+    def clear_log(self) -> None:
+        """Clear the execution log and reset the summary counters and histograms."""
+        self.execution_log.clear()
+        for shard in self._shards:
+            shard.clear()
+
+    def close(self) -> None:
+        """Close the sink if the handler opened it (JSONL file)."""
+        if isinstance(self._sink, _JsonlSink):
+            self._sink.close()
+
+
+class SkillLiteCallbackHandler(_SkillLiteHandlerState, BaseCallbackHandler):
     """
     LangChain callback handler for SkillLite skill execution.
 
@@ -36,15 +443,27 @@ class SkillLiteCallbackHandler(BaseCallbackHandler):
         # Use with LangChain agent
         agent.invoke({"input": "..."}, config={"callbacks": [handler]})
 
+    For long-lived servers, the in-memory log is a ring buffer of the last
+    ``max_log_size`` events, and summary counters are maintained as events
+    arrive, so memory stays flat and ``get_execution_summary`` is cheap.
+    Events can additionally (or exclusively, with ``max_log_size=0``) be
+    streamed to a sink:
+
+        handler = SkillLiteCallbackHandler(max_log_size=0, sink="events.jsonl")
+
     Attributes:
         verbose: Whether to print execution details
-        execution_log: List of execution events
+        execution_log: Ring buffer of the most recent execution events
+        dropped_events: Events a full queue sink could not accept
     """
 
     def __init__(
         self,
         verbose: bool = False,
         log_level: int = logging.INFO,
+        max_log_size: Optional[int] = DEFAULT_MAX_LOG_SIZE,
+        sink: Optional[EventSink] = None,
+        shards: int = DEFAULT_STATS_SHARDS,
     ):
         """
         Initialize the callback handler.
@@ -52,12 +471,14 @@ class SkillLiteCallbackHandler(BaseCallbackHandler):
         Args:
             verbose: If True, print execution details to stdout
             log_level: Logging level for internal logging
+            max_log_size: Number of recent events kept in ``execution_log``
+                (None = unbounded, 0 = keep none)
+            sink: Optional destination every event is streamed to: a path
+                (appended as JSON lines), a ``queue.Queue`` or a callable
+            shards: Number of counter/histogram shards threads are spread over
         """
         super().__init__()
-        self.verbose = verbose
-        self.log_level = log_level
-        self.execution_log: List[Dict[str, Any]] = []
-        self._current_tool: Optional[str] = None
+        self._init_state(verbose, log_level, max_log_size, sink, shards)
 
     def on_tool_start(
         self,
@@ -72,20 +493,7 @@ class SkillLiteCallbackHandler(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Called when a tool starts running."""
-        tool_name = serialized.get("name", "unknown")
-        self._current_tool = tool_name
-
-        event = {
-            "event": "tool_start",
-            "tool_name": tool_name,
-            "run_id": str(run_id),
-            "input": input_str[:200] if input_str else None,
-        }
-        self.execution_log.append(event)
-
-        if self.verbose:
-            print(f"🔧 [SkillLite] Starting tool: {tool_name}")
-            logger.log(self.log_level, f"Tool started: {tool_name}")
+        self._handle_tool_start(serialized, input_str, run_id)
 
     def on_tool_end(
         self,
@@ -96,30 +504,7 @@ class SkillLiteCallbackHandler(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Called when a tool finishes."""
-        # Handle different output types (str, ToolMessage, etc.)
-        if isinstance(output, str):
-            output_preview = output[:200] if output else None
-        elif hasattr(output, "content"):
-            # ToolMessage or similar object
-            content = output.content
-            output_preview = content[:200] if isinstance(content, str) and content else str(content)[:200]
-        else:
-            output_preview = str(output)[:200] if output else None
-
-        event = {
-            "event": "tool_end",
-            "tool_name": self._current_tool,
-            "run_id": str(run_id),
-            "output_preview": output_preview,
-            "success": True,
-        }
-        self.execution_log.append(event)
-
-        if self.verbose:
-            print(f"✅ [SkillLite] Tool completed: {self._current_tool}")
-            logger.log(self.log_level, f"Tool completed: {self._current_tool}")
-
-        self._current_tool = None
+        self._handle_tool_end(output, run_id)
 
     def on_tool_error(
         self,
@@ -130,37 +515,144 @@ class SkillLiteCallbackHandler(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Called when a tool errors."""
-        event = {
-            "event": "tool_error",
-            "tool_name": self._current_tool,
-            "run_id": str(run_id),
-            "error": str(error),
-            "success": False,
-        }
-        self.execution_log.append(event)
+        self._handle_tool_error(error, run_id)
 
-        if self.verbose:
-            print(f"❌ [SkillLite] Tool error: {self._current_tool} - {error}")
-            logger.error(f"Tool error: {self._current_tool} - {error}")
+    def on_custom_event(
+        self,
+        name: str,
+        data: Any,
+        *,
+        run_id: UUID,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called for custom events; records SkillLite cache hits/misses and phase timing."""
+        if name == STREAM_EVENT:
+            self.on_tool_stream(data.get("chunk"), run_id=run_id, data=data)
+            return
+        self._handle_custom_event(name, data, run_id)
 
-        self._current_tool = None
+    def on_tool_stream(
+        self,
+        chunk: Any,
+        *,
+        run_id: UUID,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called for each output chunk (or NDJSON record) of a streaming tool."""
+        self._handle_tool_stream(data or {}, run_id)
 
-    def get_execution_summary(self) -> Dict[str, Any]:
-        """Get a summary of all execution events."""
-        total = len(self.execution_log)
-        tool_starts = sum(1 for e in self.execution_log if e["event"] == "tool_start")
-        tool_ends = sum(1 for e in self.execution_log if e["event"] == "tool_end")
-        tool_errors = sum(1 for e in self.execution_log if e["event"] == "tool_error")
 
-        return {
-            "total_events": total,
-            "tool_executions": tool_starts,
-            "successful": tool_ends,
-            "errors": tool_errors,
-            "success_rate": tool_ends / tool_starts if tool_starts > 0 else 0,
-        }
+class AsyncSkillLiteCallbackHandler(_SkillLiteHandlerState, AsyncCallbackHandler):
+    """
+    Async variant of SkillLiteCallbackHandler.
+
+    LangChain awaits async handlers on the event loop instead of running
+    sync handlers in a thread pool, so events of concurrently awaited tools
+    are recorded without executor hops. Event handling never blocks; a
+    callable sink should be non-blocking too (or a ``queue.Queue``).
+
+    Usage:
+        from langchain_skilllite import AsyncSkillLiteCallbackHandler
+
+        handler = AsyncSkillLiteCallbackHandler()
+        await agent.ainvoke({"input": "..."}, config={"callbacks": [handler]})
+        print(handler.get_execution_summary())
+
+    Attributes:
+        verbose: Whether to print execution details
+        execution_log: Ring buffer of the most recent execution events
+        dropped_events: Events a full queue sink could not accept
+    """
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        log_level: int = logging.INFO,
+        max_log_size: Optional[int] = DEFAULT_MAX_LOG_SIZE,
+        sink: Optional[EventSink] = None,
+        shards: int = DEFAULT_STATS_SHARDS,
+    ):
+        """
+        Initialize the callback handler.
+
+        Args:
+            verbose: If True, print execution details to stdout
+            log_level: Logging level for internal logging
+            max_log_size: Number of recent events kept in ``execution_log``
+                (None = unbounded, 0 = keep none)
+            sink: Optional destination every event is streamed to: a path
+                (appended as JSON lines), a ``queue.Queue`` or a callable
+            shards: Number of counter/histogram shards threads are spread over
+        """
+        super().__init__()
+        self._init_state(verbose, log_level, max_log_size, sink, shards)
+
+    async def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        inputs: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called when a tool starts running."""
+        self._handle_tool_start(serialized, input_str, run_id)
+
+    async def on_tool_end(
+        self,
+        output: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called when a tool finishes."""
+        self._handle_tool_end(output, run_id)
+
+    async def on_tool_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called when a tool errors."""
+        self._handle_tool_error(error, run_id)
+
+    async def on_custom_event(
+        self,
+        name: str,
+        data: Any,
+        *,
+        run_id: UUID,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called for custom events; records SkillLite cache hits/misses and phase timing."""
+        if name == STREAM_EVENT:
+            await self.on_tool_stream(data.get("chunk"), run_id=run_id, data=data)
+            return
+        self._handle_custom_event(name, data, run_id)
+
+    async def on_tool_stream(
+        self,
+        chunk: Any,
+        *,
+        run_id: UUID,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called for each output chunk (or NDJSON record) of a streaming tool."""
+        self._handle_tool_stream(data or {}, run_id)
 
-    def clear_log(self) -> None:
-        """Clear the execution log."""
-        self.execution_log.clear()
 
+__all__ = ["SkillLiteCallbackHandler", "AsyncSkillLiteCallbackHandler"]
@@ -0,0 +1,302 @@
+"""
+Deferred security confirmation for sandbox level 3.
+
+With a ``confirmation_callback`` every level 3 call that needs approval
+blocks its thread (or, for the sync callback on the async path, a thread of
+the default executor) until a human answers. Under load those threads fill
+up with calls waiting for people.
+
+A ConfirmationQueue turns that into a ticket workflow. When a scan needs
+approval, the call returns immediately with a pending-confirmation error
+carrying the ticket's scan id and the scan report, and the execution is
+parked as plain data (tool, skill name and input), holding no thread or
+process. A later ``approve(scan_id)`` records the approval exactly as an
+accepted callback would and runs the parked call, returning its
+ExecutionResult; ``reject(scan_id)`` drops it. Both have async twins.
+
+Tickets expire after ``ttl`` seconds and at most ``max_pending`` are kept;
+when the queue is full, new calls needing approval are refused instead of
+parked.
+
+Usage:
+    from langchain_skilllite import ConfirmationQueue, SkillLiteToolkit
+
+    queue = ConfirmationQueue(ttl=900, max_pending=1000)
+    tools = SkillLiteToolkit.from_directory(
+        "./skills", sandbox_level=3, confirmation_queue=queue
+    )
+
+    # later, e.g. from a review UI
+    for ticket in queue.pending():
+        print(ticket.scan_id, ticket.skill_name, ticket.report)
+    result = queue.approve(scan_id)      # or: await queue.aapprove(scan_id)
+    queue.reject(other_scan_id)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from skilllite.sandbox.base import ExecutionResult
+
+if TYPE_CHECKING:
+    from langchain_skilllite.tools import SkillLiteTool
+
+DEFAULT_TTL = 900.0
+DEFAULT_MAX_PENDING = 1000
+
+
+class UnknownTicketError(KeyError):
+    """No pending ticket has this scan id (it never existed, expired or was resolved)."""
+
+
+@dataclass
+class PendingTicket:
+    """
+    A parked execution waiting for approval.
+
+    Attributes:
+        scan_id: Ticket id; the scan id, suffixed when the same scan is
+            pending for several calls
+        skill_name: Skill the call is for
+        report: Formatted security scan report
+        input_data: Input of the parked call
+        created_at: Wall-clock time the call was parked
+        expires_at: Wall-clock time after which the ticket is dropped
+    """
+
+    scan_id: str
+    skill_name: str
+    report: str
+    input_data: Dict[str, Any]
+    created_at: float
+    expires_at: float
+    tool: Optional["SkillLiteTool"] = field(default=None, repr=False, compare=False)
+    approval_key: str = field(default="", repr=False)
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+
+class ConfirmationQueue:
+    """
+    Bounded, TTL-limited store of executions awaiting security approval.
+
+    Thread-safe; one queue can be shared by several toolkits. Expired
+    tickets are dropped lazily whenever the queue is used.
+
+    Attributes:
+        ttl: Seconds a ticket stays pending
+        max_pending: Maximum number of pending tickets
+        expired: Number of tickets dropped because their TTL ran out
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Initialize the queue.
+
+        Args:
+            ttl: Seconds a ticket stays pending
+            max_pending: Maximum number of pending tickets
+
+        Raises:
+            ValueError: If ``ttl`` or ``max_pending`` is not positive
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self.ttl = ttl
+        self.max_pending = max_pending
+        self.expired = 0
+        self._tickets: "OrderedDict[str, PendingTicket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_locked()
+            return len(self._tickets)
+
+    def __contains__(self, scan_id: object) -> bool:
+        with self._lock:
+            self._purge_locked()
+            return scan_id in self._tickets
+
+    def _purge_locked(self) -> None:
+        """Drop expired tickets (lock held). Tickets are ordered by expiry."""
+        now = time.time()
+        while self._tickets:
+            scan_id, ticket = next(iter(self._tickets.items()))
+            if ticket.expires_at > now:
+                break
+            del self._tickets[scan_id]
+            self.expired += 1
+
+    # ==================== Parking ====================
+
+    def park(
+        self,
+        tool: "SkillLiteTool",
+        scan_id: str,
+        report: str,
+        input_data: Dict[str, Any],
+        approval_key: str,
+    ) -> Optional[PendingTicket]:
+        """
+        Park a call that needs approval.
+
+        Args:
+            tool: Tool the call was made on (used to resume it)
+            scan_id: Scan id of the security scan
+            report: Formatted scan report
+            input_data: Input of the call
+            approval_key: Key the approval is recorded under
+
+        Returns:
+            The new ticket, or None when ``max_pending`` tickets are pending
+        """
+        now = time.time()
+        with self._lock:
+            self._purge_locked()
+            if len(self._tickets) >= self.max_pending:
+                return None
+            ticket_id, n = scan_id, 1
+            while ticket_id in self._tickets:
+                n += 1
+                ticket_id = f"{scan_id}-{n}"
+            ticket = PendingTicket(
+                scan_id=ticket_id,
+                skill_name=tool.skill_name,
+                report=report,
+                input_data=input_data,
+                created_at=now,
+                expires_at=now + self.ttl,
+                tool=tool,
+                approval_key=approval_key,
+            )
+            self._tickets[ticket_id] = ticket
+        return ticket
+
+    def pending(self) -> List[PendingTicket]:
+        """Return the pending tickets, oldest first."""
+        with self._lock:
+            self._purge_locked()
+            return list(self._tickets.values())
+
+    def get(self, scan_id: str) -> Optional[PendingTicket]:
+        """Return a pending ticket without resolving it."""
+        with self._lock:
+            self._purge_locked()
+            return self._tickets.get(scan_id)
+
+    def _take(self, scan_id: str) -> PendingTicket:
+        with self._lock:
+            self._purge_locked()
+            ticket = self._tickets.pop(scan_id, None)
+        if ticket is None:
+            raise UnknownTicketError(scan_id)
+        return ticket
+
+    # ==================== Resolution ====================
+
+    def approve(self, scan_id: str) -> ExecutionResult:
+        """
+        Approve a ticket and run its parked call on the current thread.
+
+        The approval is remembered like an accepted confirmation callback,
+        so further calls of the unchanged skill are not parked again.
+
+        Args:
+            scan_id: Ticket id from the pending-confirmation result
+
+        Returns:
+            ExecutionResult of the resumed call
+
+        Raises:
+            UnknownTicketError: If no such ticket is pending
+        """
+        ticket = self._take(scan_id)
+        skill_info, resumed = self._approve(ticket)
+        if resumed is None:
+            return skill_info
+        return resumed._execute_cached(skill_info, ticket.input_data)
+
+    async def aapprove(self, scan_id: str) -> ExecutionResult:
+        """Async twin of ``approve``; the call resumes on the async execution path."""
+        ticket = self._take(scan_id)
+        skill_info, resumed = self._approve(ticket)
+        if resumed is None:
+            return skill_info
+        return await resumed._aexecute_cached(skill_info, ticket.input_data)
+
+    def reject(self, scan_id: str) -> ExecutionResult:
+        """
+        Reject a ticket and drop its parked call.
+
+        Returns:
+            The cancellation ExecutionResult a declined callback produces
+
+        Raises:
+            UnknownTicketError: If no such ticket is pending
+        """
+        from langchain_skilllite.tools import _cancelled_by_user
+
+        self._take(scan_id)
+        return _cancelled_by_user()
+
+    async def areject(self, scan_id: str) -> ExecutionResult:
+        """Async twin of ``reject``."""
+        return self.reject(scan_id)
+
+    @staticmethod
+    def _approve(ticket: PendingTicket) -> Tuple[Any, Optional["SkillLiteTool"]]:
+        """
+        Record the approval and build the tool that resumes the call.
+
+        Returns:
+            (skill_info, tool) to resume with, or (failure result, None)
+            when the skill is gone or its code changed since the scan
+        """
+        tool = ticket.tool
+        skill_info = tool.manager._registry.get_skill(ticket.skill_name)
+        if skill_info is None:
+            return ExecutionResult(
+                success=False,
+                error=f"Skill '{ticket.skill_name}' not found",
+                exit_code=1,
+            ), None
+        if tool._approval_key(skill_info) != ticket.approval_key:
+            # The approval covered the scanned code, not what is there now.
+            return ExecutionResult(
+                success=False,
+                error=(
+                    f"Skill '{ticket.skill_name}' changed after scan {ticket.scan_id}; "
+                    "call it again for a new security review"
+                ),
+                exit_code=2,
+            ), None
+        tool._confirmation_outcome(skill_info, ticket.approval_key, True)
+        # Confirm the scan of the unchanged code without parking the call again
+        # (skills without an approval key are rescanned on every call).
+        resumed = tool.model_copy(update={
+            "confirmation_queue": None,
+            "confirmation_callback": _approved,
+            "async_confirmation_callback": None,
+        })
+        return skill_info, resumed
+
+
+def _approved(report: str, scan_id: str) -> bool:
+    return True
+
+
+__all__ = [
+    "ConfirmationQueue",
+    "PendingTicket",
+    "UnknownTicketError",
+]
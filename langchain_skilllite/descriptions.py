@@ -0,0 +1,166 @@
+"""
+Compact, shared tool descriptions.
+
+By default a SkillLiteTool's description is the full SKILL.md, so the LLM
+can infer parameters from usage examples. With hundreds of skills that text
+is sent on every agent step and held once per tool, per toolkit, per agent.
+
+``SkillLiteToolkit(description_mode="summary")`` describes each tool with
+its front-matter ``description`` only and passes the declared
+``input_schema`` as the tool's argument schema. The full SKILL.md stays
+available on demand through a ``describe_skill`` meta-tool, which the
+toolkit adds to its tools.
+
+Descriptions are interned and input schemas deduplicated process-wide, so
+toolkits and agents built from the same skills directory share one copy of
+each string and schema. Shared schemas must be treated as read-only.
+
+Usage:
+    from langchain_skilllite import SkillLiteToolkit
+
+    tools = SkillLiteToolkit.from_directory("./skills", description_mode="summary")
+    # -> one compact tool per skill, plus "describe_skill"
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from langchain_skilllite.discovery import front_matter
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+DESCRIPTION_MODES = ("full", "summary")
+
+DESCRIBE_TOOL_NAME = "describe_skill"
+
+# Appended to summaries when the describe tool is available; identical for
+# every tool so it is stored (and tokenized) once.
+DESCRIBE_HINT = f" Call {DESCRIBE_TOOL_NAME} for parameters and usage examples."
+
+
+class _SharedSchema(dict):
+    """Schema dict that can be held in a weak-value map."""
+
+    __slots__ = ("__weakref__",)
+
+
+class DescriptionStore:
+    """
+    Process-wide store of interned descriptions and input schemas.
+
+    Strings are interned with ``sys.intern`` and schemas deduplicated by
+    their canonical JSON, both without keeping anything alive once no tool
+    refers to it. Front-matter ``input_schema`` lookups go through the
+    cached ``discovery.front_matter``.
+    """
+
+    def __init__(self) -> None:
+        self._schemas: "weakref.WeakValueDictionary[str, _SharedSchema]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def intern(text: str) -> str:
+        """Return the process-wide copy of ``text``."""
+        return sys.intern(text)
+
+    def share_schema(self, schema: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Return the shared copy of an input schema (None for no schema)."""
+        if not isinstance(schema, dict) or not schema:
+            return None
+        key = json.dumps(schema, sort_keys=True, default=str)
+        with self._lock:
+            shared = self._schemas.get(key)
+            if shared is None:
+                shared = _SharedSchema(schema)
+                self._schemas[key] = shared
+        return shared
+
+    def input_schema(self, skill_info: "SkillInfo") -> Optional[Dict[str, Any]]:
+        """
+        Shared ``input_schema`` declared in a skill's front matter.
+
+        Read from SKILL.md directly, so lazily discovered skills are not
+        fully parsed.
+        """
+        return self.share_schema(front_matter(skill_info.path).get("input_schema"))
+
+    def summary(self, skill_info: "SkillInfo", hint: bool = True) -> str:
+        """Compact description: the front-matter summary, plus the describe hint."""
+        text = (skill_info.description or f"Execute the {skill_info.name} skill").strip()
+        if hint:
+            text += DESCRIBE_HINT
+        return self.intern(text)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"schemas": len(self._schemas)}
+
+
+_default_store = DescriptionStore()
+
+
+def default_store() -> DescriptionStore:
+    """The DescriptionStore shared by every toolkit in this process."""
+    return _default_store
+
+
+class _DescribeSkillInput(BaseModel):
+    skill_name: str = Field(description="Name of the skill to describe")
+
+
+class DescribeSkillTool(BaseTool):
+    """
+    Meta-tool returning the full SKILL.md of a skill.
+
+    Lets an agent working with compact descriptions look up the parameters
+    and examples of a skill only when it is about to call it.
+
+    Attributes:
+        manager: SkillManager holding the skills
+        skill_names: Skills that may be described (None = all executable skills)
+    """
+
+    name: str = DESCRIBE_TOOL_NAME
+    description: str = (
+        "Return the full documentation (parameters and usage examples) of a "
+        "skill. Call it before using a skill whose arguments are unclear."
+    )
+    args_schema: Any = _DescribeSkillInput
+    manager: Any = Field(exclude=True)
+    skill_names: Optional[List[str]] = None
+
+    def _describe(self, skill_name: str) -> str:
+        allowed = self.skill_names is None or skill_name in self.skill_names
+        skill = self.manager.get_skill(skill_name) if allowed else None
+        if skill is None:
+            available = self.skill_names
+            if available is None:
+                available = [s.name for s in self.manager.list_executable_skills()]
+            return f"Error: unknown skill '{skill_name}'. Available skills: {', '.join(available)}"
+        content = skill.get_full_content()
+        return default_store().intern(content) if content else (skill.description or "")
+
+    def _run(self, skill_name: str, run_manager: Any = None) -> str:
+        return self._describe(skill_name)
+
+    async def _arun(self, skill_name: str, run_manager: Any = None) -> str:
+        return self._describe(skill_name)
+
+
+__all__ = [
+    "DESCRIPTION_MODES",
+    "DescribeSkillTool",
+    "DescriptionStore",
+    "default_store",
+]
@@ -0,0 +1,372 @@
+"""
+Lazy, incremental skill discovery.
+
+``SkillManager(skills_dir=...)`` eagerly parses every SKILL.md (YAML front
+matter, entry point detection, ``.skilllite.lock``) at startup. With
+thousands of skills that takes seconds. LazySkillManager instead indexes
+only what is needed to list tools - name, description and entry point - and
+parses the full metadata and SKILL.md content of a skill on first use.
+
+The index is persisted as a manifest (path, mtime, size, content hash per
+skill), so later starts only re-read skills whose SKILL.md or scripts
+directory changed. Manifests live in the user cache directory
+(``$XDG_CACHE_HOME/skilllite/manifests``, default ``~/.cache``), one per
+skills directory, so nothing is written into the skills directory itself.
+
+Usage:
+    from langchain_skilllite import SkillLiteToolkit
+
+    tools = SkillLiteToolkit.from_directory("./skills", lazy=True)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import yaml
+from skilllite import SkillManager
+from skilllite.core.handler import ToolCallHandler
+from skilllite.core.metadata import SkillMetadata, detect_entry_point, parse_skill_metadata
+from skilllite.core.prompt_builder import PromptBuilder
+from skilllite.core.registry import SkillRegistry
+from skilllite.core.skill_info import SkillInfo
+from skilllite.core.tool_builder import ToolBuilder
+
+MANIFEST_VERSION = 1
+
+_FRONT_MATTER = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+
+# SKILL.md path -> ((mtime_ns, size), parsed front matter)
+_front_matter_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_front_matter_lock = threading.Lock()
+
+
+def _parse_front_matter(text: str) -> Dict[str, Any]:
+    match = _FRONT_MATTER.match(text)
+    if not match:
+        return {}
+    try:
+        data = yaml.safe_load(match.group(1))
+    except yaml.YAMLError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def front_matter(skill_dir: Union[str, Path]) -> Dict[str, Any]:
+    """
+    YAML front matter of a skill's SKILL.md.
+
+    Parsed once per file and cached until its mtime or size changes, so the
+    toolkit, result cache, limiter and skill servers can all read their
+    settings from it without re-parsing. The returned dict is shared and
+    must not be modified.
+
+    Returns:
+        The front matter mapping ({} if SKILL.md is missing or unreadable,
+        has no front matter, or it is not a YAML mapping)
+    """
+    try:
+        skill_md = Path(skill_dir) / "SKILL.md"
+        stat = skill_md.stat()
+    except (OSError, TypeError):
+        return {}
+    key = str(skill_md)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _front_matter_lock:
+        cached = _front_matter_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    try:
+        data = _parse_front_matter(skill_md.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return {}
+    with _front_matter_lock:
+        _front_matter_cache[key] = (version, data)
+    return data
+
+
+def default_manifest_path(skills_dir: Union[str, Path]) -> Path:
+    """Manifest location for a skills directory, keyed by its resolved path."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser()
+    key = hashlib.sha256(str(Path(skills_dir).resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_home / "skilllite" / "manifests" / f"{key}.json"
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _index_entry(skill_dir: Path) -> Dict[str, Any]:
+    """Read SKILL.md front matter and detect the entry point of one skill."""
+    skill_md = skill_dir / "SKILL.md"
+    raw = skill_md.read_bytes()
+    stat = skill_md.stat()
+
+    data = _parse_front_matter(raw.decode("utf-8"))
+
+    return {
+        "path": str(skill_dir),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "hash": hashlib.sha256(raw).hexdigest(),
+        "scripts_mtime_ns": _mtime_ns(skill_dir / "scripts"),
+        "name": data.get("name", ""),
+        "description": data.get("description"),
+        "entry_point": detect_entry_point(skill_dir) or "",
+    }
+
+
+class LazySkillInfo(SkillInfo):
+    """
+    SkillInfo backed by a manifest entry.
+
+    ``name``, ``description`` and the entry point come from the index;
+    ``metadata`` and ``get_full_content()`` read the skill from disk the
+    first time they are used.
+    """
+
+    def __init__(self, path: Path, name: str, description: Optional[str], entry_point: str):
+        # No metadata yet: it is parsed on first access to ``metadata``.
+        super().__init__(None, path)  # type: ignore[arg-type]
+        self._name = name
+        self._description = description
+        self._entry_point = entry_point
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._description
+
+    @property
+    def entry_point(self) -> str:
+        """Entry point recorded in the index (no parsing required)."""
+        return self._entry_point
+
+    @property
+    def metadata(self) -> SkillMetadata:
+        if self._metadata is None:
+            self._metadata = parse_skill_metadata(self.path)
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Optional[SkillMetadata]) -> None:
+        self._metadata = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the full metadata has been parsed yet."""
+        return self._metadata is not None
+
+
+class LazySkillRegistry(SkillRegistry):
+    """
+    SkillRegistry that registers LazySkillInfo objects from a manifest.
+
+    Attributes:
+        manifest_path: Where the manifest is stored (None = not persisted)
+        parsed: Number of skills (re-)read during the last scan
+        reused: Number of skills taken unchanged from the manifest
+    """
+
+    def __init__(self, manifest_path: Optional[Union[str, Path]] = None):
+        super().__init__()
+        self.manifest_path = Path(manifest_path).expanduser() if manifest_path else None
+        self.parsed = 0
+        self.reused = 0
+
+    def scan_directory(self, directory: Path) -> int:
+        """
+        Index a directory of skills, reusing unchanged manifest entries.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Number of skills registered
+
+        Raises:
+            FileNotFoundError: If directory does not exist
+        """
+        if not directory.exists():
+            raise FileNotFoundError(f"Skills directory does not exist: {directory}")
+
+        directory = directory.resolve()
+        if (directory / "SKILL.md").exists():
+            skill_dirs = [directory]
+        else:
+            skill_dirs = sorted(
+                path for path in directory.iterdir()
+                if path.is_dir() and (path / "SKILL.md").exists()
+            )
+
+        previous = self._load_manifest()
+        entries: Dict[str, Dict[str, Any]] = {}
+        self.parsed = self.reused = 0
+        for skill_dir in skill_dirs:
+            key = str(skill_dir)
+            try:
+                entry = self._refresh(skill_dir, previous.get(key))
+            except Exception as e:
+                print(f"Warning: Failed to register skill at {skill_dir}: {e}")
+                continue
+            entries[key] = entry
+            self._register_entry(entry)
+
+        if entries != previous:
+            self._save_manifest(entries)
+        return len(entries)
+
+    def register_skill(self, skill_dir: Path) -> SkillInfo:
+        """Register a single skill lazily (the manifest is not consulted)."""
+        return self._register_entry(_index_entry(skill_dir))
+
+    def _refresh(self, skill_dir: Path, entry: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the manifest entry for a skill, re-reading it only if it changed."""
+        if entry is not None:
+            try:
+                stat = (skill_dir / "SKILL.md").stat()
+            except OSError:
+                stat = None
+            if (
+                stat is not None
+                and entry.get("mtime_ns") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size
+                and entry.get("scripts_mtime_ns") == _mtime_ns(skill_dir / "scripts")
+            ):
+                self.reused += 1
+                return entry
+        self.parsed += 1
+        return _index_entry(skill_dir)
+
+    def _register_entry(self, entry: Dict[str, Any]) -> LazySkillInfo:
+        info = LazySkillInfo(
+            path=Path(entry["path"]),
+            name=entry["name"],
+            description=entry["description"],
+            entry_point=entry["entry_point"],
+        )
+        self._skills[info.name] = info
+        return info
+
+    # ==================== Executability (from the index) ====================
+
+    @staticmethod
+    def _entry_point(info: SkillInfo) -> str:
+        if isinstance(info, LazySkillInfo) and not info.is_loaded:
+            return info.entry_point
+        return info.metadata.entry_point
+
+    def is_executable(self, name: str) -> bool:
+        if name in self._multi_script_tools:
+            return True
+        info = self._skills.get(name)
+        return info is not None and bool(self._entry_point(info))
+
+    def list_executable_skills(self) -> List[SkillInfo]:
+        multi_script_skill_names = {t["skill_name"] for t in self._multi_script_tools.values()}
+        return [
+            info for info in self._skills.values()
+            if self._entry_point(info) or info.name in multi_script_skill_names
+        ]
+
+    def list_prompt_only_skills(self) -> List[SkillInfo]:
+        multi_script_skill_names = {t["skill_name"] for t in self._multi_script_tools.values()}
+        return [
+            info for info in self._skills.values()
+            if not self._entry_point(info) and info.name not in multi_script_skill_names
+        ]
+
+    def analyze_multi_script_skill(self, skill_name: str) -> None:
+        info = self._skills.get(skill_name)
+        if info is not None and self._entry_point(info):
+            # Single entry point: nothing to analyze, keep the skill unparsed.
+            self._analyzed_skills.add(skill_name)
+            return
+        super().analyze_multi_script_skill(skill_name)
+
+    # ==================== Manifest ====================
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        if self.manifest_path is None:
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        skills = data.get("skills")
+        return skills if isinstance(skills, dict) else {}
+
+    def _save_manifest(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        if self.manifest_path is None:
+            return
+        data = {"version": MANIFEST_VERSION, "skills": entries}
+        tmp = self.manifest_path.with_name(f".{self.manifest_path.name}.{os.getpid()}.tmp")
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.manifest_path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+class LazySkillManager(SkillManager):
+    """
+    SkillManager that discovers skills lazily and incrementally.
+
+    Usage:
+        manager = LazySkillManager(skills_dir="./skills")
+        toolkit = SkillLiteToolkit(manager)
+    """
+
+    def __init__(
+        self,
+        skills_dir: Optional[Union[str, Path]] = None,
+        manifest_path: Optional[Union[str, Path]] = None,
+        persist_manifest: bool = True,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            skills_dir: Directory containing skills
+            manifest_path: Where to persist the index (default:
+                ``default_manifest_path(skills_dir)``, in the user cache)
+            persist_manifest: Set to False to keep the index in memory only
+        """
+        super().__init__()
+        if persist_manifest and manifest_path is None and skills_dir:
+            manifest_path = default_manifest_path(skills_dir)
+        self._registry = LazySkillRegistry(manifest_path if persist_manifest else None)
+        self._tool_builder = ToolBuilder(self._registry)
+        self._prompt_builder = PromptBuilder(self._registry)
+        self._handler = ToolCallHandler(self._registry)
+
+        if skills_dir:
+            self.scan_directory(Path(skills_dir))
+
+
+__all__ = [
+    "LazySkillInfo",
+    "LazySkillRegistry",
+    "LazySkillManager",
+    "default_manifest_path",
+    "front_matter",
+]
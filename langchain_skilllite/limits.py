@@ -0,0 +1,385 @@
+"""
+Per-skill and global concurrency limits for SkillLite tools.
+
+A heavy skill hammered by many agents at once can exhaust the host. A
+ConcurrencyLimiter caps how many runs of each skill (and of all skills
+together) execute at the same time. Callers over a limit wait in a bounded
+FIFO queue; when the queue is full, or a caller waits longer than
+``queue_timeout``, the tool returns an error to the LLM instead of piling
+up more work.
+
+The same slots are used by the sync (``invoke``) and async (``ainvoke``)
+paths, so threads and coroutines share one limit.
+
+Per-skill limits come from ``skill_limits``, from the skill's SKILL.md
+front matter::
+
+    ---
+    name: pdf-render
+    max_concurrency: 2
+    ---
+
+or from ``default_skill_limit``, in that order.
+
+Usage:
+    from langchain_skilllite import ConcurrencyLimiter, SkillLiteToolkit
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills",
+        limits=ConcurrencyLimiter(
+            max_concurrency=16,
+            skill_limits={"pdf-render": 2},
+            max_queue=32,
+            queue_timeout=30,
+        ),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+from langchain_skilllite.discovery import front_matter
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+DEFAULT_MAX_QUEUE = 64
+
+
+class ConcurrencyLimitError(RuntimeError):
+    """A run was not admitted because a concurrency limit was reached."""
+
+
+class QueueFullError(ConcurrencyLimitError):
+    """The wait queue of a limit was full."""
+
+
+class QueueTimeoutError(ConcurrencyLimitError):
+    """A run waited longer than ``queue_timeout`` for a free slot."""
+
+
+# ==================== Slots ====================
+
+
+class _Waiter:
+    """A queued thread (event) or coroutine (future) waiting for a slot."""
+
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(
+        self,
+        event: Optional[threading.Event] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        future: Optional["asyncio.Future[None]"] = None,
+    ):
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+
+    def grant(self) -> None:
+        """Hand a slot to this waiter. Called with the slots lock held."""
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        else:
+            try:
+                self.loop.call_soon_threadsafe(_resolve, self.future)
+            except RuntimeError:
+                # Loop closed: the coroutine is gone and will never release.
+                self.granted = False
+                raise
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Slots:
+    """
+    Counting semaphore usable from threads and event loops alike.
+
+    Slots are handed directly to the oldest waiter on release, so waiters
+    are served in FIFO order and a late arrival cannot overtake the queue.
+    """
+
+    def __init__(self, label: str, limit: int, max_queue: Optional[int]):
+        self.label = label
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    def _try_take(self) -> bool:
+        """Take a free slot, or check there is room to queue. Lock held."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return True
+        if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            raise QueueFullError(
+                f"{self.label} is at its concurrency limit ({self.active} running, "
+                f"{len(self._waiters)} queued); try again later"
+            )
+        return False
+
+    def _timed_out(self, timeout: Optional[float]) -> QueueTimeoutError:
+        return QueueTimeoutError(
+            f"Timed out after {timeout:g}s waiting for a free slot: {self.label} "
+            f"is at its concurrency limit ({self.active} running)"
+        )
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            if self._try_take():
+                return
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        if waiter.event.wait(timeout):
+            return
+        with self._lock:
+            if waiter.granted:
+                return
+            self._waiters.remove(waiter)
+            raise self._timed_out(timeout)
+
+    async def aacquire(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            if self._try_take():
+                return
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter.future, timeout)
+        except BaseException as exc:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                if isinstance(exc, asyncio.TimeoutError):
+                    return
+                self.release()
+                raise
+            if isinstance(exc, asyncio.TimeoutError):
+                raise self._timed_out(timeout) from None
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.grant()
+                    return
+                except RuntimeError:
+                    continue
+            self.active -= 1
+
+    def set_limit(self, limit: int) -> None:
+        with self._lock:
+            self.limit = limit
+            while self.active < self.limit and self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.grant()
+                    self.active += 1
+                except RuntimeError:
+                    continue
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"limit": self.limit, "active": self.active, "queued": len(self._waiters)}
+
+
+class Lease:
+    """Slots held by one admitted run; release them when the run ends."""
+
+    __slots__ = ("_slots",)
+
+    def __init__(self, slots: List[_Slots]):
+        self._slots = slots
+
+    def release(self) -> None:
+        """Release the held slots (idempotent)."""
+        slots, self._slots = self._slots, []
+        for held in reversed(slots):
+            held.release()
+
+
+# ==================== Limiter ====================
+
+
+class ConcurrencyLimiter:
+    """
+    Admission control for skill executions.
+
+    Attributes:
+        max_concurrency: Limit on concurrent runs across all skills (None = no limit)
+        skill_limits: Per-skill limits, taking precedence over front matter
+        default_skill_limit: Limit for skills without an explicit one (None = no limit)
+        max_queue: Callers allowed to wait per limit before new ones are
+            rejected (None = unbounded)
+        queue_timeout: Seconds a caller may wait for a slot (None = no timeout)
+        rejected: Runs rejected because a queue was full
+        timed_out: Runs that gave up waiting after ``queue_timeout``
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        skill_limits: Optional[Dict[str, int]] = None,
+        default_skill_limit: Optional[int] = None,
+        max_queue: Optional[int] = DEFAULT_MAX_QUEUE,
+        queue_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Limit on concurrent runs across all skills
+            skill_limits: Per-skill limits by skill name
+            default_skill_limit: Limit for skills with no explicit or declared limit
+            max_queue: Waiting callers allowed per limit (None = unbounded)
+            queue_timeout: Seconds a caller may wait for a slot
+
+        Raises:
+            ValueError: If a limit is below 1, or max_queue/queue_timeout is negative
+        """
+        for label, value in (
+            ("max_concurrency", max_concurrency),
+            ("default_skill_limit", default_skill_limit),
+            *((f"skill_limits[{name!r}]", v) for name, v in (skill_limits or {}).items()),
+        ):
+            if value is not None and value < 1:
+                raise ValueError(f"{label} must be >= 1")
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+        if queue_timeout is not None and queue_timeout < 0:
+            raise ValueError("queue_timeout must be >= 0")
+
+        self.max_concurrency = max_concurrency
+        self.skill_limits = dict(skill_limits or {})
+        self.default_skill_limit = default_skill_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.rejected = 0
+        self.timed_out = 0
+        self._global = (
+            _Slots("SkillLite", max_concurrency, max_queue) if max_concurrency else None
+        )
+        self._skills: Dict[str, _Slots] = {}
+        self._lock = threading.Lock()
+
+    # ==================== Policy ====================
+
+    def _declared_limit(self, skill_info: "SkillInfo") -> Optional[int]:
+        """Read ``max_concurrency`` from the skill's front matter."""
+        value = front_matter(skill_info.path).get("max_concurrency")
+        if isinstance(value, int) and not isinstance(value, bool) and value >= 1:
+            return value
+        return None
+
+    def limit_for(self, skill_info: "SkillInfo") -> Optional[int]:
+        """Concurrency limit applying to one skill (None = only the global limit)."""
+        limit = self.skill_limits.get(skill_info.name)
+        if limit is None:
+            limit = self._declared_limit(skill_info)
+        if limit is None:
+            limit = self.default_skill_limit
+        return limit
+
+    def _slots_for(self, skill_info: "SkillInfo") -> List[_Slots]:
+        """Slots to take for one run, skill first so a busy skill holds no global slot."""
+        slots = []
+        limit = self.limit_for(skill_info)
+        if limit is not None:
+            skill_slots = self._skills.get(skill_info.name)
+            if skill_slots is None:
+                with self._lock:
+                    skill_slots = self._skills.setdefault(
+                        skill_info.name,
+                        _Slots(f"Skill '{skill_info.name}'", limit, self.max_queue),
+                    )
+            if skill_slots.limit != limit:
+                skill_slots.set_limit(limit)
+            slots.append(skill_slots)
+        if self._global is not None:
+            slots.append(self._global)
+        return slots
+
+    def _count(self, error: ConcurrencyLimitError) -> None:
+        with self._lock:
+            if isinstance(error, QueueFullError):
+                self.rejected += 1
+            else:
+                self.timed_out += 1
+
+    # ==================== Admission ====================
+
+    def acquire(self, skill_info: "SkillInfo") -> Lease:
+        """
+        Wait for a slot to run ``skill_info`` (blocking).
+
+        Raises:
+            QueueFullError: If a wait queue is full
+            QueueTimeoutError: If no slot freed up within ``queue_timeout``
+        """
+        lease = Lease([])
+        deadline = None if self.queue_timeout is None else time.monotonic() + self.queue_timeout
+        try:
+            for slots in self._slots_for(skill_info):
+                slots.acquire(_remaining(deadline))
+                lease._slots.append(slots)
+        except ConcurrencyLimitError as e:
+            lease.release()
+            self._count(e)
+            raise
+        return lease
+
+    async def aacquire(self, skill_info: "SkillInfo") -> Lease:
+        """Async twin of ``acquire``; waits without blocking the event loop."""
+        lease = Lease([])
+        deadline = None if self.queue_timeout is None else time.monotonic() + self.queue_timeout
+        try:
+            for slots in self._slots_for(skill_info):
+                await slots.aacquire(_remaining(deadline))
+                lease._slots.append(slots)
+        except BaseException as e:
+            lease.release()
+            if isinstance(e, ConcurrencyLimitError):
+                self._count(e)
+            raise
+        return lease
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limits, running and queued calls, plus rejection counters."""
+        with self._lock:
+            skills = dict(self._skills)
+        return {
+            "global": self._global.stats() if self._global is not None else None,
+            "skills": {name: slots.stats() for name, slots in skills.items()},
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+__all__ = [
+    "ConcurrencyLimiter",
+    "ConcurrencyLimitError",
+    "QueueFullError",
+    "QueueTimeoutError",
+]
@@ -0,0 +1,553 @@
+"""
+Metrics export for SkillLite tool execution.
+
+SkillLiteMetricsHandler is a LangChain callback handler that turns tool
+runs into metrics:
+
+- calls per tool, sandbox level and status (ok / error)
+- wall-time and per-phase latency histograms
+- tools currently in flight
+- result cache hits and misses
+- scan cache hit ratio (for ScanCache instances passed to the handler)
+
+Metrics are recorded through an exporter. OpenTelemetryExporter is the
+standard path and reports through the global (or a given) MeterProvider:
+
+    pip install opentelemetry-api opentelemetry-sdk
+
+PrometheusExporter keeps the series in-process and renders the Prometheus
+text format, optionally served over HTTP; it needs no extra dependency.
+
+The hot path does not allocate label sets: each (tool, sandbox level) pair
+is bound once to instruments with precomputed attributes, and every call
+afterwards only adds to them.
+
+Usage:
+    from langchain_skilllite.metrics import OpenTelemetryExporter, SkillLiteMetricsHandler
+
+    handler = SkillLiteMetricsHandler(OpenTelemetryExporter(), scan_cache=scan_cache)
+    agent.invoke({"messages": [...]}, config={"callbacks": [handler]})
+
+    # Prometheus text endpoint without OpenTelemetry
+    exporter = PrometheusExporter()
+    exporter.start_http_server(9464)
+    handler = SkillLiteMetricsHandler(exporter)
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from langchain_skilllite.result_cache import CACHE_EVENT
+from langchain_skilllite.timing import TIMING_EVENT
+
+if TYPE_CHECKING:
+    from langchain_skilllite.scan_cache import ScanCache
+
+# Run metadata key carrying the sandbox level a SkillLiteTool run executes at
+SANDBOX_LEVEL_METADATA_KEY = "skilllite_sandbox_level"
+
+# Latency bucket boundaries in seconds, from pooled calls to slow level 3 runs
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+class BoundToolMetrics(ABC):
+    """Instruments pre-bound to one (tool, sandbox level) label set."""
+
+    @abstractmethod
+    def started(self) -> None:
+        """A run of the tool started."""
+
+    @abstractmethod
+    def finished(self, seconds: float, success: bool) -> None:
+        """A run of the tool ended after ``seconds``."""
+
+    @abstractmethod
+    def phase(self, name: str, seconds: float) -> None:
+        """A run spent ``seconds`` in phase ``name``."""
+
+    @abstractmethod
+    def cache(self, hit: bool) -> None:
+        """A result cache lookup for the tool hit or missed."""
+
+
+class MetricsExporter(ABC):
+    """Destination of SkillLite metrics."""
+
+    @abstractmethod
+    def bind(self, tool_name: str, sandbox_level: str) -> BoundToolMetrics:
+        """Return instruments bound to a tool and sandbox level."""
+
+    @abstractmethod
+    def observe_scan_cache(self, scan_cache: "ScanCache") -> None:
+        """Report the hit ratio of a scan cache."""
+
+
+def _scan_cache_totals(scan_caches: Sequence["ScanCache"]) -> Tuple[int, int]:
+    hits = sum(cache.hits for cache in scan_caches)
+    misses = sum(cache.misses for cache in scan_caches)
+    return hits, misses
+
+
+# ==================== OpenTelemetry ====================
+
+
+class _OpenTelemetryBound(BoundToolMetrics):
+    def __init__(self, exporter: "OpenTelemetryExporter", tool_name: str, sandbox_level: str):
+        self._exporter = exporter
+        self._attributes = {"tool": tool_name, "sandbox_level": sandbox_level}
+        self._ok = {**self._attributes, "status": "ok"}
+        self._error = {**self._attributes, "status": "error"}
+        self._hit = {**self._attributes, "result": "hit"}
+        self._miss = {**self._attributes, "result": "miss"}
+        self._phases: Dict[str, Dict[str, str]] = {}
+
+    def started(self) -> None:
+        self._exporter.in_flight.add(1, self._attributes)
+
+    def finished(self, seconds: float, success: bool) -> None:
+        attributes = self._ok if success else self._error
+        self._exporter.in_flight.add(-1, self._attributes)
+        self._exporter.calls.add(1, attributes)
+        self._exporter.duration.record(seconds, attributes)
+
+    def phase(self, name: str, seconds: float) -> None:
+        attributes = self._phases.get(name)
+        if attributes is None:
+            attributes = self._phases.setdefault(name, {**self._attributes, "phase": name})
+        self._exporter.phase_duration.record(seconds, attributes)
+
+    def cache(self, hit: bool) -> None:
+        self._exporter.cache_lookups.add(1, self._hit if hit else self._miss)
+
+
+class OpenTelemetryExporter(MetricsExporter):
+    """
+    Records SkillLite metrics with OpenTelemetry instruments.
+
+    Instruments (attributes ``tool`` and ``sandbox_level``):
+
+    - ``skilllite.tool.calls`` counter, plus ``status``
+    - ``skilllite.tool.duration`` histogram (s), plus ``status``
+    - ``skilllite.tool.phase.duration`` histogram (s), plus ``phase``
+    - ``skilllite.tool.in_flight`` up-down counter
+    - ``skilllite.result_cache.lookups`` counter, plus ``result``
+    - ``skilllite.scan_cache.hit_ratio`` observable gauge (no attributes)
+    """
+
+    def __init__(self, meter: Optional[Any] = None, meter_provider: Optional[Any] = None):
+        """
+        Create the instruments.
+
+        Args:
+            meter: Meter to create instruments on
+            meter_provider: MeterProvider to get the meter from when ``meter``
+                is not given (default: the global provider)
+        """
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as e:
+                raise ImportError(
+                    "opentelemetry-api is required for OpenTelemetryExporter. "
+                    "Install it with: pip install opentelemetry-api"
+                ) from e
+            meter = metrics.get_meter("langchain_skilllite", meter_provider=meter_provider)
+
+        self.calls = meter.create_counter(
+            "skilllite.tool.calls", unit="{call}", description="Completed SkillLite tool calls"
+        )
+        self.duration = meter.create_histogram(
+            "skilllite.tool.duration", unit="s", description="SkillLite tool wall time"
+        )
+        self.phase_duration = meter.create_histogram(
+            "skilllite.tool.phase.duration", unit="s", description="Time spent per execution phase"
+        )
+        self.in_flight = meter.create_up_down_counter(
+            "skilllite.tool.in_flight", unit="{call}", description="SkillLite tool calls in progress"
+        )
+        self.cache_lookups = meter.create_counter(
+            "skilllite.result_cache.lookups", unit="{lookup}", description="Result cache lookups"
+        )
+        self._scan_caches: List["ScanCache"] = []
+        meter.create_observable_gauge(
+            "skilllite.scan_cache.hit_ratio",
+            callbacks=[self._observe_scan_ratio],
+            description="Share of level 3 security scans served from the scan cache",
+        )
+
+    def bind(self, tool_name: str, sandbox_level: str) -> BoundToolMetrics:
+        return _OpenTelemetryBound(self, tool_name, sandbox_level)
+
+    def observe_scan_cache(self, scan_cache: "ScanCache") -> None:
+        if scan_cache not in self._scan_caches:
+            self._scan_caches.append(scan_cache)
+
+    def _observe_scan_ratio(self, options: Any) -> List[Any]:
+        if not self._scan_caches:
+            return []
+        from opentelemetry.metrics import Observation
+
+        hits, misses = _scan_cache_totals(self._scan_caches)
+        return [Observation(hits / (hits + misses) if hits + misses else 0.0)]
+
+
+# ==================== Prometheus ====================
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Histogram:
+    """Prometheus histogram series: per-bucket counts, sum and count."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def render(self, name: str, labels: str, lines: List[str]) -> None:
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{_number(bound)}"}} {cumulative}')
+        cumulative += self.counts[-1]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {_number(self.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+
+
+class _PrometheusBound(BoundToolMetrics):
+    def __init__(self, tool_name: str, sandbox_level: str, buckets: Sequence[float]):
+        self.labels = f'tool="{_escape(tool_name)}",sandbox_level="{_escape(sandbox_level)}"'
+        self.lock = threading.Lock()
+        self.buckets = buckets
+        self.ok = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.hits = 0
+        self.misses = 0
+        self.duration = _Histogram(buckets)
+        self.phases: Dict[str, _Histogram] = {}
+
+    def started(self) -> None:
+        with self.lock:
+            self.in_flight += 1
+
+    def finished(self, seconds: float, success: bool) -> None:
+        with self.lock:
+            self.in_flight -= 1
+            if success:
+                self.ok += 1
+            else:
+                self.errors += 1
+            self.duration.observe(seconds)
+
+    def phase(self, name: str, seconds: float) -> None:
+        with self.lock:
+            histogram = self.phases.get(name)
+            if histogram is None:
+                histogram = self.phases[name] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def cache(self, hit: bool) -> None:
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class PrometheusExporter(MetricsExporter):
+    """
+    In-process metrics rendered in the Prometheus text exposition format.
+
+    Series: ``skilllite_tool_calls_total``, ``skilllite_tool_duration_seconds``,
+    ``skilllite_tool_phase_duration_seconds``, ``skilllite_tool_in_flight``,
+    ``skilllite_result_cache_lookups_total`` and
+    ``skilllite_scan_cache_hit_ratio``.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the exporter.
+
+        Args:
+            buckets: Upper bounds (seconds) of the latency histogram buckets
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._series: List[_PrometheusBound] = []
+        self._scan_caches: List["ScanCache"] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def bind(self, tool_name: str, sandbox_level: str) -> BoundToolMetrics:
+        bound = _PrometheusBound(tool_name, sandbox_level, self.buckets)
+        with self._lock:
+            self._series.append(bound)
+        return bound
+
+    def observe_scan_cache(self, scan_cache: "ScanCache") -> None:
+        with self._lock:
+            if scan_cache not in self._scan_caches:
+                self._scan_caches.append(scan_cache)
+
+    def render(self) -> str:
+        """Render all series in the Prometheus text format."""
+        with self._lock:
+            series = list(self._series)
+            scan_caches = list(self._scan_caches)
+
+        calls: List[str] = []
+        durations: List[str] = []
+        phases: List[str] = []
+        in_flight: List[str] = []
+        lookups: List[str] = []
+        for bound in series:
+            with bound.lock:
+                calls.append(f'skilllite_tool_calls_total{{{bound.labels},status="ok"}} {bound.ok}')
+                calls.append(
+                    f'skilllite_tool_calls_total{{{bound.labels},status="error"}} {bound.errors}'
+                )
+                bound.duration.render("skilllite_tool_duration_seconds", bound.labels, durations)
+                for name, histogram in sorted(bound.phases.items()):
+                    histogram.render(
+                        "skilllite_tool_phase_duration_seconds",
+                        f'{bound.labels},phase="{_escape(name)}"',
+                        phases,
+                    )
+                in_flight.append(f"skilllite_tool_in_flight{{{bound.labels}}} {bound.in_flight}")
+                if bound.hits or bound.misses:
+                    lookups.append(
+                        f'skilllite_result_cache_lookups_total{{{bound.labels},result="hit"}} {bound.hits}'
+                    )
+                    lookups.append(
+                        f'skilllite_result_cache_lookups_total{{{bound.labels},result="miss"}} {bound.misses}'
+                    )
+
+        lines: List[str] = []
+        families = [
+            ("skilllite_tool_calls_total", "counter", "Completed SkillLite tool calls.", calls),
+            ("skilllite_tool_duration_seconds", "histogram", "SkillLite tool wall time.", durations),
+            (
+                "skilllite_tool_phase_duration_seconds",
+                "histogram",
+                "Time spent per execution phase.",
+                phases,
+            ),
+            ("skilllite_tool_in_flight", "gauge", "SkillLite tool calls in progress.", in_flight),
+            ("skilllite_result_cache_lookups_total", "counter", "Result cache lookups.", lookups),
+        ]
+        if scan_caches:
+            hits, misses = _scan_cache_totals(scan_caches)
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            families.append(
+                (
+                    "skilllite_scan_cache_hit_ratio",
+                    "gauge",
+                    "Share of level 3 security scans served from the scan cache.",
+                    [f"skilllite_scan_cache_hit_ratio {_number(ratio)}"],
+                )
+            )
+        for name, kind, help_text, samples in families:
+            if not samples:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def start_http_server(self, port: int = 9464, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve ``render()`` at ``/metrics`` from a daemon thread.
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            addr: Address to bind
+
+        Returns:
+            The running server (``server.server_address`` has the bound port)
+        """
+        exporter = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((addr, port), _Handler)
+        thread = threading.Thread(
+            target=server.serve_forever, name="skilllite-metrics", daemon=True
+        )
+        thread.start()
+        self._server = server
+        return server
+
+    def shutdown(self) -> None:
+        """Stop the HTTP server, if started."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# ==================== Callback handler ====================
+
+
+class SkillLiteMetricsHandler(BaseCallbackHandler):
+    """
+    LangChain callback handler that records SkillLite tool metrics.
+
+    Only SkillLite tools are measured (SkillLiteTool runs carry the sandbox
+    level they execute at in their run metadata); other tools are ignored.
+    The handler runs inline in async agents, since recording never blocks.
+
+    Attributes:
+        exporter: Where metrics are recorded
+    """
+
+    run_inline = True
+
+    def __init__(
+        self,
+        exporter: Optional[MetricsExporter] = None,
+        scan_cache: Optional["ScanCache"] = None,
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            exporter: Metrics exporter (default: OpenTelemetryExporter on the
+                global MeterProvider)
+            scan_cache: Optional ScanCache whose hit ratio is reported
+        """
+        super().__init__()
+        self.exporter = exporter if exporter is not None else OpenTelemetryExporter()
+        if scan_cache is not None:
+            self.exporter.observe_scan_cache(scan_cache)
+        self._bound: Dict[Tuple[str, Any], BoundToolMetrics] = {}
+        self._bind_lock = threading.Lock()
+        # In-flight runs: run_id -> (instruments, start time)
+        self._runs: Dict[UUID, Tuple[BoundToolMetrics, float]] = {}
+        # In-flight runs whose timing event reported a failed execution
+        self._failed: Set[UUID] = set()
+
+    def _bind(self, tool_name: str, sandbox_level: Any) -> BoundToolMetrics:
+        key = (tool_name, sandbox_level)
+        bound = self._bound.get(key)
+        if bound is None:
+            with self._bind_lock:
+                bound = self._bound.get(key)
+                if bound is None:
+                    bound = self._bound[key] = self.exporter.bind(tool_name, str(sandbox_level))
+        return bound
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        inputs: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called when a tool starts running."""
+        if not metadata or SANDBOX_LEVEL_METADATA_KEY not in metadata:
+            return
+        bound = self._bind(serialized.get("name", "unknown"), metadata[SANDBOX_LEVEL_METADATA_KEY])
+        bound.started()
+        self._runs[run_id] = (bound, time.perf_counter())
+
+    def on_tool_end(
+        self,
+        output: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called when a tool finishes; SkillLite tools return failures as output."""
+        self._finish(run_id, success=run_id not in self._failed)
+
+    def on_tool_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called when a tool errors."""
+        self._finish(run_id, success=False)
+
+    def _finish(self, run_id: UUID, success: bool) -> None:
+        self._failed.discard(run_id)
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            bound, started = run
+            bound.finished(time.perf_counter() - started, success)
+
+    def on_custom_event(
+        self,
+        name: str,
+        data: Any,
+        *,
+        run_id: UUID,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Called for custom events; records phase timing, run outcome and cache lookups."""
+        if name != TIMING_EVENT and name != CACHE_EVENT:
+            return
+        run = self._runs.get(run_id)
+        if run is None:
+            return
+        bound = run[0]
+        if name == TIMING_EVENT:
+            for phase_name, seconds in (data.get("phases") or {}).items():
+                bound.phase(phase_name, seconds)
+            if data.get("success") is False:
+                self._failed.add(run_id)
+        else:
+            bound.cache(bool(data.get("hit")))
+
+
+__all__ = [
+    "SkillLiteMetricsHandler",
+    "MetricsExporter",
+    "OpenTelemetryExporter",
+    "PrometheusExporter",
+]
@@ -0,0 +1,333 @@
+"""
+Bounded tool outputs for long agent runs.
+
+A tool result becomes a ToolMessage that stays in the agent's message state
+for the rest of the conversation, so one skill printing a multi-megabyte
+table is paid for on every later model call and held in memory until the
+run ends. An OutputPolicy caps what a SkillLiteTool returns: output larger
+than ``max_bytes`` (UTF-8) is cut down to its head, its tail, or both, with
+a notice saying how much was left out.
+
+With an OutputStore the full output is kept on the side under a reference
+id that the notice names, and the toolkit adds a ``read_skill_output`` tool
+with which the agent can page through it when it actually needs more. The
+store is bounded by entry count and total size (oldest entries are evicted
+first) and can keep outputs in files instead of memory.
+
+Usage:
+    from langchain_skilllite import OutputPolicy, OutputStore, SkillLiteToolkit
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills",
+        output_policy=OutputPolicy(max_bytes=8192, keep="head_tail", store=OutputStore()),
+    )
+    # tools[-1] is read_skill_output(ref, offset=0, length=None)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel, Field
+
+KEEP_MODES = ("head", "tail", "head_tail")
+
+DEFAULT_MAX_BYTES = 16 * 1024
+
+READ_TOOL_NAME = "read_skill_output"
+
+
+class OutputStore:
+    """
+    Bounded store of full tool outputs, addressed by reference id.
+
+    Thread-safe; one store can be shared by several toolkits. Outputs are
+    kept as UTF-8 bytes, in memory or (with ``directory``) in one file each.
+
+    Attributes:
+        max_entries: Maximum number of stored outputs
+        max_bytes: Maximum total size of stored outputs
+        directory: Directory for output files (None = keep in memory)
+        evicted: Number of outputs dropped to stay within the bounds
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[str] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Maximum number of stored outputs
+            max_bytes: Maximum total size of stored outputs
+            directory: Keep outputs in files under this directory
+
+        Raises:
+            ValueError: If a bound is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.evicted = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # ref -> (skill name, size, bytes or file path)
+        self._entries: "OrderedDict[str, Tuple[str, int, Any]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, ref: object) -> bool:
+        with self._lock:
+            return ref in self._entries
+
+    def put(self, data: bytes, skill_name: str) -> Optional[str]:
+        """
+        Store an output.
+
+        Args:
+            data: The output as UTF-8 bytes
+            skill_name: Skill that produced it
+
+        Returns:
+            Reference id, or None if the output alone exceeds ``max_bytes``
+        """
+        if len(data) > self.max_bytes:
+            return None
+        ref = f"out-{uuid.uuid4().hex[:12]}"
+        value: Any = data
+        if self.directory:
+            value = os.path.join(self.directory, f"{ref}.txt")
+            with open(value, "wb") as f:
+                f.write(data)
+        with self._lock:
+            self._entries[ref] = (skill_name, len(data), value)
+            self._size += len(data)
+            dropped = self._evict_locked()
+        for path in dropped:
+            _remove(path)
+        return ref
+
+    def _evict_locked(self) -> List[str]:
+        """Drop the oldest outputs until within bounds (lock held); returns files to remove."""
+        dropped = []
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._size > self.max_bytes
+        ):
+            _, (_, size, value) = self._entries.popitem(last=False)
+            self._size -= size
+            self.evicted += 1
+            if isinstance(value, str):
+                dropped.append(value)
+        return dropped
+
+    def size(self, ref: str) -> Optional[int]:
+        """Size in bytes of a stored output, or None if unknown."""
+        with self._lock:
+            entry = self._entries.get(ref)
+        return None if entry is None else entry[1]
+
+    def read(self, ref: str, offset: int = 0, length: Optional[int] = None) -> Optional[str]:
+        """
+        Read part of a stored output.
+
+        Offsets count UTF-8 bytes; a character cut by the range is dropped.
+
+        Args:
+            ref: Reference id
+            offset: First byte to return
+            length: Number of bytes to return (None = to the end)
+
+        Returns:
+            The text, or None if ``ref`` is unknown or was evicted
+        """
+        with self._lock:
+            entry = self._entries.get(ref)
+            if entry is not None:
+                self._entries.move_to_end(ref)
+        if entry is None:
+            return None
+        _, size, value = entry
+        offset = max(0, offset)
+        end = size if length is None else min(size, offset + max(0, length))
+        if isinstance(value, bytes):
+            chunk = value[offset:end]
+        else:
+            try:
+                with open(value, "rb") as f:
+                    f.seek(offset)
+                    chunk = f.read(max(0, end - offset))
+            except OSError:
+                return None
+        return chunk.decode("utf-8", errors="ignore")
+
+    def clear(self) -> None:
+        """Drop every stored output."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._size = 0
+        for _, _, value in entries:
+            if isinstance(value, str):
+                _remove(value)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+@dataclass
+class OutputPolicy:
+    """
+    Limits on the output a SkillLiteTool returns.
+
+    Attributes:
+        max_bytes: Largest output (UTF-8 bytes) returned unchanged
+        keep: Part of an oversized output that is returned: "head", "tail"
+            or "head_tail" (half of ``max_bytes`` from each end)
+        store: Optional OutputStore keeping the full output for
+            ``read_skill_output``
+    """
+
+    max_bytes: int = DEFAULT_MAX_BYTES
+    keep: str = "head_tail"
+    store: Optional[OutputStore] = None
+
+    def __post_init__(self) -> None:
+        if self.max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if self.keep not in KEEP_MODES:
+            raise ValueError(f"keep must be one of {', '.join(KEEP_MODES)}")
+
+    def apply(self, output: Any, skill_name: str) -> Any:
+        """
+        Bound one tool output.
+
+        Args:
+            output: What the tool would return (a string or a JSON-like value)
+            skill_name: Skill that produced it
+
+        Returns:
+            ``output`` itself when within ``max_bytes``, else a truncated string
+        """
+        if output is None:
+            return output
+        if isinstance(output, str):
+            # Cheap pre-check: a UTF-8 character takes at most four bytes.
+            if len(output) * 4 <= self.max_bytes:
+                return output
+            text = output
+        else:
+            # The same text LangChain puts into the ToolMessage.
+            text = json.dumps(output, ensure_ascii=False, default=str)
+        data = text.encode("utf-8")
+        if len(data) <= self.max_bytes:
+            return output
+        ref = self.store.put(data, skill_name) if self.store is not None else None
+        return self._truncate(data, ref)
+
+    def _truncate(self, data: bytes, ref: Optional[str]) -> str:
+        total = len(data)
+        if self.keep == "head":
+            head, tail = data[: self.max_bytes], b""
+            shown = f"the first {self.max_bytes}"
+        elif self.keep == "tail":
+            head, tail = b"", data[total - self.max_bytes:]
+            shown = f"the last {self.max_bytes}"
+        else:
+            half = self.max_bytes // 2
+            head, tail = data[:half], data[total - (self.max_bytes - half):]
+            shown = f"the first {half} and last {self.max_bytes - half}"
+        notice = f"[Output truncated: showing {shown} of {total} bytes."
+        if ref is not None:
+            notice += (
+                f" Full output stored as '{ref}'; call {READ_TOOL_NAME} with"
+                f" ref='{ref}' and an offset to read more."
+            )
+        notice += "]"
+        # A character cut at either edge is dropped rather than garbled.
+        head_text = head.decode("utf-8", errors="ignore")
+        tail_text = tail.decode("utf-8", errors="ignore")
+        if head and tail:
+            return f"{head_text}\n{notice}\n{tail_text}"
+        if head:
+            return f"{head_text}\n{notice}"
+        return f"{notice}\n{tail_text}"
+
+
+class _ReadOutputInput(BaseModel):
+    ref: str = Field(description="Reference id from a truncated skill output")
+    offset: int = Field(default=0, description="Byte offset to start reading at")
+    length: Optional[int] = Field(
+        default=None, description="Number of bytes to read (default: as much as allowed)"
+    )
+
+
+class ReadSkillOutputTool(BaseTool):
+    """
+    Meta-tool returning part of a stored, truncated skill output.
+
+    Attributes:
+        store: OutputStore holding the full outputs
+        max_bytes: Largest chunk returned per call
+    """
+
+    name: str = READ_TOOL_NAME
+    description: str = (
+        "Read more of a skill output that was truncated. Pass the ref from the "
+        "truncation notice and the byte offset to continue from."
+    )
+    args_schema: Any = _ReadOutputInput
+    store: Any = Field(exclude=True)
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def _read(self, ref: str, offset: int = 0, length: Optional[int] = None) -> str:
+        size = self.store.size(ref)
+        if size is None:
+            return f"Error: unknown or expired output ref '{ref}'"
+        length = self.max_bytes if length is None else min(length, self.max_bytes)
+        text = self.store.read(ref, offset, length)
+        if text is None:
+            return f"Error: unknown or expired output ref '{ref}'"
+        end = min(size, max(0, offset) + max(0, length))
+        if end < size:
+            text += f"\n[{size - end} more bytes; continue with offset={end}]"
+        return text
+
+    def _run(
+        self, ref: str, offset: int = 0, length: Optional[int] = None, run_manager: Any = None
+    ) -> str:
+        return self._read(ref, offset, length)
+
+    async def _arun(
+        self, ref: str, offset: int = 0, length: Optional[int] = None, run_manager: Any = None
+    ) -> str:
+        return self._read(ref, offset, length)
+
+
+__all__ = [
+    "KEEP_MODES",
+    "OutputPolicy",
+    "OutputStore",
+    "ReadSkillOutputTool",
+]
@@ -0,0 +1,167 @@
+"""
+Out-of-band staging of large skill payloads.
+
+Pooled workers receive their input embedded in a JSON request line: the
+input dict is encoded to a JSON string, that string is escaped again
+inside the request, pushed through the pipe, parsed back by the worker and
+wrapped in a StringIO for ``sys.stdin``. Output takes the same route in
+reverse. For multi-megabyte documents or tables every one of those steps
+is a full copy, and a persistent server cannot read other requests while
+one large line is in transit.
+
+Above a size threshold the pool stages the payload in a file instead and
+sends only its path. Files are created in ``/dev/shm`` when available (a
+shared-memory filesystem, so the data never touches disk) and otherwise in
+the temporary directory. The JSON text is encoded once and written out in
+small chunks (no escaped copy, no full-size bytes copy); the worker hands
+the file to the script as ``sys.stdin`` and exposes its path as
+``SKILLLITE_INPUT_FILE``, so data-heavy scripts can ``mmap`` it instead of
+reading it. Worker stdout above the threshold comes back the same way.
+
+Staged files are private to the user (mode 0600) and removed as soon as the
+call completes.
+
+Usage:
+    from langchain_skilllite import PoolConfig, SkillLiteToolkit
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills",
+        pool=PoolConfig(large_payload_bytes=256 * 1024),   # None disables staging
+    )
+
+    # in a skill script, sys.stdin works as before; for random access:
+    import mmap, os
+    path = os.environ.get("SKILLLITE_INPUT_FILE")
+    if path:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            header = m[:4096]      # no need to read the whole payload
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from langchain_skilllite.serialization import Serializer
+
+DEFAULT_THRESHOLD = 1024 * 1024
+
+INPUT_FILE_ENV = "SKILLLITE_INPUT_FILE"
+
+SHM_DIR = "/dev/shm"
+
+_PREFIX = "skilllite-payload-"
+
+# Staged JSON is written in slices of this many characters
+_CHUNK_CHARS = 1024 * 1024
+
+
+def staging_dir(directory: Optional[str] = None) -> str:
+    """Directory for staged payloads: ``directory``, else /dev/shm, else the temp dir."""
+    if directory:
+        return directory
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return SHM_DIR
+    return tempfile.gettempdir()
+
+
+class StagedPayload:
+    """
+    A payload written to a private file; removed on ``close``.
+
+    Attributes:
+        path: Location of the file
+        size: Size of the payload in bytes
+    """
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+
+    def __enter__(self) -> "StagedPayload":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the file (idempotent)."""
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def read_text(self) -> str:
+        """Read the payload back as text."""
+        with open(self.path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+
+def _create(directory: Optional[str]) -> Tuple[int, str]:
+    return tempfile.mkstemp(prefix=_PREFIX, dir=staging_dir(directory))
+
+
+def encode_json(
+    data: Any,
+    threshold: Optional[int],
+    directory: Optional[str] = None,
+    serializer: Optional["Serializer"] = None,
+) -> Tuple[Optional[str], Optional[StagedPayload]]:
+    """
+    Encode ``data`` as JSON, staging it in a file when it exceeds ``threshold``.
+
+    Args:
+        data: JSON-serializable value
+        threshold: Size in bytes above which the JSON is staged (None = never)
+        directory: Staging directory (default: see ``staging_dir``)
+        serializer: Serializer to encode with (default: stdlib ``json``)
+
+    Returns:
+        (json_text, None) for small payloads, (None, StagedPayload) for large ones
+    """
+    if serializer is not None:
+        return _encode_bytes(serializer.dumps_bytes(data), threshold, directory)
+    text = json.dumps(data)
+    # ensure_ascii (the default) makes characters and bytes the same count.
+    if threshold is None or len(text) <= threshold:
+        return text, None
+
+    fd, path = _create(directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for start in range(0, len(text), _CHUNK_CHARS):
+                f.write(text[start:start + _CHUNK_CHARS].encode("ascii"))
+    except BaseException:
+        StagedPayload(path, 0).close()
+        raise
+    return None, StagedPayload(path, len(text))
+
+
+def _encode_bytes(
+    data: bytes,
+    threshold: Optional[int],
+    directory: Optional[str],
+) -> Tuple[Optional[str], Optional[StagedPayload]]:
+    """``encode_json`` for serializers that produce bytes: written out in one piece."""
+    if threshold is None or len(data) <= threshold:
+        return data.decode("utf-8"), None
+    fd, path = _create(directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        StagedPayload(path, 0).close()
+        raise
+    return None, StagedPayload(path, len(data))
+
+
+__all__ = [
+    "DEFAULT_THRESHOLD",
+    "INPUT_FILE_ENV",
+    "StagedPayload",
+    "encode_json",
+    "staging_dir",
+]
@@ -0,0 +1,1106 @@
+"""
+Warm worker pool for SkillLite skill execution.
+
+By default every SkillLiteTool call goes through UnifiedExecutionService and
+starts a fresh interpreter for the skill script. For small skills the
+interpreter start-up dominates the cost of the call. This module keeps a pool
+of long-lived Python workers per skill, so a call only pays for IPC and a
+fork: each call runs in a child forked from the warm worker, so no state
+leaks from one call into the next.
+
+Pooled workers execute skills the same way the sandbox does once a skill has
+passed its security scan (sandbox level 1 semantics): the script runs with
+``SKILL_DIR`` set and the JSON input on stdin. Skills that need sandbox level 2
+isolation or non-Python entry points are not pooled and keep using the
+regular execution path. Skills with dependencies are pooled once their
+prebuilt environment has been registered with ``use_interpreter`` (which
+``SkillLiteToolkit.warmup`` does); until then they also use the regular path.
+
+Skills that declare a ``server`` entry point in their front matter are run
+on persistent skill servers instead, which load the skill module once and
+answer many calls (see ``langchain_skilllite.server``).
+
+Inputs and outputs larger than ``large_payload_bytes`` are staged in files
+(in ``/dev/shm`` when available) instead of being sent through the pipes
+(see ``langchain_skilllite.payload``). Inputs, outputs and IPC frames are
+encoded with the fastest installed JSON library (see
+``langchain_skilllite.serialization``).
+
+Usage:
+    from langchain_skilllite import SkillLiteToolkit
+    from langchain_skilllite.pool import PoolConfig
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills",
+        pool=PoolConfig(min_size=1, max_size=4, max_calls_per_worker=200),
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import math
+import os
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple, Union
+
+from skilllite.sandbox.base import ExecutionResult
+from skilllite.sandbox.context import ExecutionContext
+
+from langchain_skilllite.payload import DEFAULT_THRESHOLD, StagedPayload, encode_json, staging_dir
+from langchain_skilllite.serialization import Serializer, get_serializer
+from langchain_skilllite.server import (
+    FRAMING_MSGPACK,
+    ServerCrashedError,
+    ServerGroup,
+    ServerSpec,
+    ServerTimeoutError,
+    negotiate_framing,
+    parse_server_spec,
+    server_result,
+)
+from langchain_skilllite.timing import (
+    PHASE_EXECUTION,
+    PHASE_OUTPUT_PARSING,
+    PHASE_SANDBOX_SPAWN,
+    phase,
+)
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+    from langchain_skilllite.streaming import OutputStream
+
+logger = logging.getLogger(__name__)
+
+_WORKER_SCRIPT = str(Path(__file__).with_name("_worker.py"))
+
+# Pools still open at interpreter exit; weak so the hook keeps none alive.
+_open_pools: "weakref.WeakSet[SkillWorkerPool]" = weakref.WeakSet()
+
+# Shortest pause between two idle sweeps of the reaper thread
+_MIN_REAP_INTERVAL = 0.05
+
+
+@atexit.register
+def _shutdown_open_pools() -> None:
+    for pool in list(_open_pools):
+        pool.shutdown()
+
+
+def _reap_idle(
+    pool_ref: "weakref.ReferenceType[SkillWorkerPool]", stop: threading.Event, interval: float
+) -> None:
+    """Reaper thread: evict idle workers until the pool is shut down or collected."""
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool.evict_idle()
+        except Exception:
+            logger.exception("SkillLite pool: idle eviction failed")
+        del pool
+
+
+@dataclass
+class PoolConfig:
+    """
+    Sizing and lifecycle settings for a SkillWorkerPool.
+
+    Attributes:
+        min_size: Workers kept warm per skill once the skill has been used
+        max_size: Maximum number of concurrent workers per skill
+        idle_timeout: Seconds an idle worker above min_size is kept alive
+        max_calls_per_worker: Recycle a worker after this many calls (0 = never)
+        max_memory_mb: Address-space limit for each worker (default:
+            ``SKILLBOX_MAX_MEMORY_MB``, the limit of the regular path;
+            None = unlimited)
+        acquire_timeout: Seconds to wait for a free worker when the pool is full
+        python_executable: Interpreter used to start workers
+        servers: Run skills that declare a ``server`` entry point on
+            persistent skill servers (sized by min_size/max_size/idle_timeout;
+            servers are not recycled by call count)
+        large_payload_bytes: Inputs and outputs larger than this are passed
+            through staged files instead of the pipes (None = never)
+        payload_dir: Directory for staged payloads (default: /dev/shm when
+            available, else the temporary directory)
+    """
+
+    min_size: int = 1
+    max_size: int = 4
+    idle_timeout: float = 300.0
+    max_calls_per_worker: int = 100
+    max_memory_mb: Optional[int] = field(
+        default_factory=lambda: ExecutionContext.from_current_env().max_memory_mb
+    )
+    acquire_timeout: float = 30.0
+    python_executable: str = field(default_factory=lambda: sys.executable)
+    servers: bool = True
+    large_payload_bytes: Optional[int] = DEFAULT_THRESHOLD
+    payload_dir: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError("min_size must be >= 0")
+        if self.max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if self.min_size > self.max_size:
+            raise ValueError("min_size must not exceed max_size")
+        if self.max_calls_per_worker < 0:
+            raise ValueError("max_calls_per_worker must be >= 0")
+        if self.large_payload_bytes is not None and self.large_payload_bytes < 0:
+            raise ValueError("large_payload_bytes must be >= 0")
+
+
+def _response_stdout(response: Dict[str, Any]) -> str:
+    """Return a worker response's stdout, reading (and removing) a spilled file."""
+    path = response.get("stdout_file")
+    if not path:
+        return response.get("stdout", "")
+    with StagedPayload(path, 0) as spilled:
+        return spilled.read_text()
+
+
+class _WorkerTimeoutError(Exception):
+    """Raised when a pooled worker does not answer within the timeout."""
+
+
+class _WorkerCrashedError(Exception):
+    """Raised when a pooled worker exits or breaks the IPC protocol."""
+
+
+def _parse_output(
+    stdout: str,
+    stderr: str,
+    returncode: int,
+    serializer: Optional[Serializer] = None,
+) -> ExecutionResult:
+    """
+    Convert captured script output into an ExecutionResult.
+
+    Mirrors the parsing done by skilllite's UnifiedExecutor so pooled and
+    non-pooled executions return identical results.
+    """
+    loads = json.loads if serializer is None else serializer.loads
+    for line in (stdout + stderr).split("\n"):
+        line = line.strip()
+        if line.startswith("{") and line.endswith("}"):
+            try:
+                data = loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                return ExecutionResult(
+                    success=returncode == 0,
+                    output=data,
+                    exit_code=returncode,
+                    stdout=stdout,
+                    stderr=stderr,
+                )
+
+    if returncode == 0:
+        return ExecutionResult(
+            success=True,
+            output={"result": stdout.strip()} if stdout.strip() else None,
+            exit_code=returncode,
+            stdout=stdout,
+            stderr=stderr,
+        )
+    error_msg = stderr.strip() if stderr.strip() else stdout.strip()
+    return ExecutionResult(
+        success=False,
+        error=f"Skill execution failed with exit code {returncode}: {error_msg}",
+        exit_code=returncode,
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+
+def _set_future_result(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Worker:
+    """A single long-lived worker process bound to one skill directory."""
+
+    def __init__(self, config: PoolConfig, skill_dir: Path):
+        env = os.environ.copy()
+        env["SKILL_DIR"] = str(skill_dir)
+        env["PYTHONPATH"] = str(skill_dir)
+        env["PYTHONUNBUFFERED"] = "1"
+        if config.max_memory_mb:
+            env["SKILLLITE_WORKER_MAX_MEMORY_MB"] = str(config.max_memory_mb)
+
+        self.process = subprocess.Popen(
+            [config.python_executable, _WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            # Own process group, so a forced close also stops a running call.
+            start_new_session=True,
+        )
+        self.calls = 0
+        self.last_used = time.monotonic()
+        self._buffer = bytearray()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _send(self, payload: Dict[str, Any]) -> None:
+        self.calls += 1
+        try:
+            self.process.stdin.write(get_serializer().dumps_bytes(payload) + b"\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise _WorkerCrashedError(f"worker stdin closed: {e}") from e
+
+    def _take_line(self) -> Optional[bytes]:
+        newline = self._buffer.find(b"\n")
+        if newline < 0:
+            return None
+        line = bytes(self._buffer[:newline])
+        del self._buffer[: newline + 1]
+        return line
+
+    @staticmethod
+    def _decode(line: bytes) -> Dict[str, Any]:
+        try:
+            return get_serializer().loads(line)
+        except json.JSONDecodeError as e:
+            raise _WorkerCrashedError(f"invalid worker response: {e}") from e
+
+    def _read_line(self, deadline: Optional[float]) -> bytes:
+        """Wait until a complete line is buffered and return it."""
+        fd = self.process.stdout.fileno()
+        line = self._take_line()
+        while line is None:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise _WorkerTimeoutError()
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                raise _WorkerTimeoutError()
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise _WorkerCrashedError("worker exited unexpectedly")
+            self._buffer.extend(chunk)
+            if b"\n" in chunk:
+                line = self._take_line()
+        return line
+
+    async def _aread_line(self, deadline: Optional[float]) -> bytes:
+        """Async twin of ``_read_line``; waits on the pipe via the event loop."""
+        line = self._take_line()
+        if line is not None:
+            return line
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[None]" = loop.create_future()
+        fd = self.process.stdout.fileno()
+
+        def on_readable() -> None:
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                chunk = b""
+            if future.done():
+                self._buffer.extend(chunk)
+                return
+            if not chunk:
+                loop.remove_reader(fd)
+                future.set_exception(_WorkerCrashedError("worker exited unexpectedly"))
+                return
+            self._buffer.extend(chunk)
+            if b"\n" in chunk:
+                future.set_result(None)
+
+        loop.add_reader(fd, on_readable)
+        try:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise _WorkerTimeoutError() from None
+        finally:
+            loop.remove_reader(fd)
+        return self._take_line()
+
+    def request(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[float],
+        stream: Optional["OutputStream"] = None,
+    ) -> Dict[str, Any]:
+        """Send one request and wait for its response line, feeding ``out`` frames to ``stream``."""
+        self._send(payload)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            message = self._decode(self._read_line(deadline))
+            if "out" not in message:
+                return message
+            if stream is not None:
+                stream.feed(message["out"].encode("utf-8"))
+
+    async def arequest(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[float],
+        stream: Optional["OutputStream"] = None,
+    ) -> Dict[str, Any]:
+        """Async twin of ``request``; waits on the pipe via the event loop."""
+        self._send(payload)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            message = self._decode(await self._aread_line(deadline))
+            if "out" not in message:
+                return message
+            if stream is not None:
+                await stream.afeed(message["out"].encode("utf-8"))
+
+    def close(self, force: bool = False) -> None:
+        """Terminate the worker process (immediately when ``force`` is set)."""
+        if force and self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                self.process.kill()
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass
+
+
+class _WorkerGroup:
+    """The set of workers serving one skill."""
+
+    def __init__(self, config: PoolConfig, skill_dir: Path):
+        self.config = config
+        self.skill_dir = skill_dir
+        self._idle: Deque[_Worker] = deque()
+        self._size = 0
+        self._cond = threading.Condition()
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = deque()
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def _take_locked(self) -> Tuple[Optional[_Worker], bool]:
+        """Pop a live idle worker, or reserve a slot for a new one (lock held)."""
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.alive:
+                return worker, False
+            self._size -= 1
+            worker.close()
+        if self._size < self.config.max_size:
+            self._size += 1
+            return None, True
+        return None, False
+
+    def _spawn(self) -> _Worker:
+        """Start a worker for a slot reserved by ``_take_locked``."""
+        try:
+            return _Worker(self.config, self.skill_dir)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._notify_locked()
+            raise
+
+    def _notify_locked(self) -> None:
+        """Wake one sync waiter and one async waiter (lock held)."""
+        self._cond.notify()
+        while self._async_waiters:
+            loop, future = self._async_waiters.popleft()
+            if not future.done():
+                loop.call_soon_threadsafe(_set_future_result, future)
+                break
+
+    def acquire(self, timeout: Optional[float]) -> Optional[_Worker]:
+        """Take an idle worker, spawning one if the group has capacity."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                worker, spawn = self._take_locked()
+                if worker is not None:
+                    return worker
+                if spawn:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+        return self._spawn()
+
+    async def aacquire(self, timeout: Optional[float]) -> Optional[_Worker]:
+        """Async twin of ``acquire`` that waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    return None
+                worker, spawn = self._take_locked()
+                if worker is not None:
+                    return worker
+                if not spawn:
+                    future = loop.create_future()
+                    self._async_waiters.append((loop, future))
+            if spawn:
+                return self._spawn()
+
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                return None
+
+    def release(self, worker: _Worker) -> None:
+        """Return a worker after a successful call, recycling it if worn out."""
+        worker.last_used = time.monotonic()
+        max_calls = self.config.max_calls_per_worker
+        if self._closed or not worker.alive or (max_calls and worker.calls >= max_calls):
+            self.discard(worker)
+            return
+        with self._cond:
+            self._idle.append(worker)
+            self._notify_locked()
+        self.evict_idle()
+
+    def discard(self, worker: _Worker, force: bool = False) -> None:
+        """Drop a worker that timed out, crashed or reached its call limit."""
+        worker.close(force=force)
+        with self._cond:
+            self._size -= 1
+            self._notify_locked()
+
+    def warm(self) -> None:
+        """Start workers until the group holds at least min_size of them."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.config.min_size:
+                    return
+                self._size += 1
+            try:
+                worker = _Worker(self.config, self.skill_dir)
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._idle.appendleft(worker)
+                self._notify_locked()
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Close idle workers above min_size that exceeded idle_timeout."""
+        now = time.monotonic() if now is None else now
+        evicted: List[_Worker] = []
+        with self._cond:
+            # Oldest idle workers sit on the left of the deque.
+            while (
+                self._idle
+                and self._size > self.config.min_size
+                and now - self._idle[0].last_used > self.config.idle_timeout
+            ):
+                evicted.append(self._idle.popleft())
+                self._size -= 1
+        for worker in evicted:
+            worker.close()
+        return len(evicted)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+            waiters = list(self._async_waiters)
+            self._async_waiters.clear()
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_set_future_result, future)
+        for worker in idle:
+            worker.close()
+
+
+class SkillWorkerPool:
+    """
+    Pool of pre-started Python workers, grouped per skill.
+
+    Workers are started lazily the first time a skill is executed (or eagerly
+    via ``warm``), reused across calls, recycled after
+    ``max_calls_per_worker`` calls and evicted after ``idle_timeout`` seconds
+    of inactivity once the group is above ``min_size``. A background thread
+    sweeps for idle workers every ``idle_timeout / 2`` seconds, so an unused
+    pool shrinks without further calls.
+
+    A single pool can be shared by several toolkits.
+
+    Attributes:
+        config: PoolConfig controlling sizing and lifecycle
+    """
+
+    def __init__(self, config: Optional[PoolConfig] = None):
+        """
+        Initialize the pool.
+
+        Args:
+            config: Pool settings (default: PoolConfig())
+        """
+        self.config = config or PoolConfig()
+        self._groups: Dict[str, _WorkerGroup] = {}
+        self._server_groups: Dict[str, ServerGroup] = {}
+        # skill_dir -> (SKILL.md mtime_ns, declared server)
+        self._server_specs: Dict[str, Tuple[Optional[int], Optional[ServerSpec]]] = {}
+        # skill_dir -> interpreter of its prebuilt dependency environment
+        self._interpreters: Dict[str, str] = {}
+        self._payload_dir = staging_dir(self.config.payload_dir)
+        self._serializer = get_serializer()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._reaper_stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+        _open_pools.add(self)
+        if math.isfinite(self.config.idle_timeout):
+            # The thread only holds a weak reference, so an unreferenced pool is
+            # still collected; collecting it stops the thread.
+            weakref.finalize(self, self._reaper_stop.set)
+            self._reaper = threading.Thread(
+                target=_reap_idle,
+                args=(
+                    weakref.ref(self),
+                    self._reaper_stop,
+                    max(self.config.idle_timeout / 2, _MIN_REAP_INTERVAL),
+                ),
+                name="skilllite-pool-reaper",
+                daemon=True,
+            )
+            self._reaper.start()
+
+    @staticmethod
+    def entry_script(skill_info: "SkillInfo") -> Optional[Path]:
+        """Return the absolute entry script for a skill, if it has one."""
+        metadata = skill_info.metadata
+        entry_point = getattr(metadata, "entry_point", None) if metadata else None
+        if not entry_point:
+            return None
+        return Path(skill_info.path).resolve() / entry_point
+
+    def server_spec(self, skill_info: "SkillInfo") -> Optional[ServerSpec]:
+        """Return the server entry point a skill declares, if servers are enabled."""
+        if not self.config.servers:
+            return None
+        try:
+            mtime = (Path(skill_info.path) / "SKILL.md").stat().st_mtime_ns
+        except (OSError, TypeError):
+            mtime = None
+        key = str(Path(skill_info.path).resolve())
+        with self._lock:
+            cached = self._server_specs.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        spec = parse_server_spec(skill_info)
+        if spec is not None:
+            spec = negotiate_framing(spec)
+        with self._lock:
+            self._server_specs[key] = (mtime, spec)
+        return spec
+
+    def supports(self, skill_info: "SkillInfo") -> bool:
+        """
+        Check whether a skill can run on pooled workers.
+
+        Only Python entry points (or declared servers) are pooled, and
+        skills with dependencies only once their environment's interpreter
+        is registered; everything else uses the regular execution path.
+        """
+        if self.server_spec(skill_info) is None:
+            script = self.entry_script(skill_info)
+            if script is None or script.suffix != ".py":
+                return False
+        if not getattr(skill_info.metadata, "resolved_packages", None):
+            return True
+        with self._lock:
+            return str(Path(skill_info.path).resolve()) in self._interpreters
+
+    def use_interpreter(self, skill_dir: Union[str, Path], python: str) -> None:
+        """
+        Run a skill's workers and servers on a prebuilt interpreter.
+
+        Running workers keep their interpreter; the change applies to the
+        next group started for the skill.
+
+        Args:
+            skill_dir: Skill directory
+            python: Interpreter of the skill's dependency environment
+        """
+        key = str(Path(skill_dir).resolve())
+        with self._lock:
+            if self._interpreters.get(key) == python:
+                return
+            self._interpreters[key] = python
+            group = self._groups.pop(key, None)
+            server_group = self._server_groups.pop(key, None)
+        for closing in (group, server_group):
+            if closing is not None:
+                closing.close()
+
+    def _config_for(self, key: str) -> PoolConfig:
+        """Pool settings for one skill's group (lock held)."""
+        python = self._interpreters.get(key)
+        if python is None or python == self.config.python_executable:
+            return self.config
+        return replace(self.config, python_executable=python)
+
+    def _group(self, skill_info: "SkillInfo") -> _WorkerGroup:
+        skill_dir = Path(skill_info.path).resolve()
+        key = str(skill_dir)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SkillWorkerPool has been shut down")
+            group = self._groups.get(key)
+            if group is None:
+                group = _WorkerGroup(self._config_for(key), skill_dir)
+                self._groups[key] = group
+        return group
+
+    def _server_group(self, skill_info: "SkillInfo", spec: ServerSpec) -> ServerGroup:
+        skill_dir = Path(skill_info.path).resolve()
+        key = str(skill_dir)
+        stale = None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SkillWorkerPool has been shut down")
+            group = self._server_groups.get(key)
+            if group is None or group.spec != spec:
+                # A changed declaration replaces the running servers.
+                stale = group
+                group = ServerGroup(self._config_for(key), skill_dir, spec)
+                self._server_groups[key] = group
+        if stale is not None:
+            stale.close()
+        return group
+
+    def warm(self, skill_info: "SkillInfo") -> None:
+        """Start ``min_size`` workers for a skill ahead of its first call."""
+        if not self.supports(skill_info):
+            return
+        spec = self.server_spec(skill_info)
+        if spec is not None:
+            self._server_group(skill_info, spec).warm()
+        else:
+            self._group(skill_info).warm()
+
+    def execute(
+        self,
+        skill_info: "SkillInfo",
+        input_data: Dict[str, Any],
+        timeout: Optional[int] = None,
+        stream: Optional["OutputStream"] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> ExecutionResult:
+        """
+        Execute a skill on a pooled worker.
+
+        Args:
+            skill_info: SkillInfo of the skill to run
+            input_data: JSON-serializable input passed to the script on stdin
+            timeout: Execution timeout in seconds (None = no timeout)
+            stream: Optional OutputStream receiving stdout as it is written
+            serializer: Serializer for the input and output (default: the
+                fastest installed, see ``get_serializer``)
+
+        Returns:
+            ExecutionResult with output or error
+        """
+        serializer = serializer or self._serializer
+        spec = self.server_spec(skill_info)
+        if spec is not None:
+            return self._server_execute(skill_info, spec, input_data, timeout, stream, serializer)
+
+        script = self.entry_script(skill_info)
+        if script is None or not script.exists():
+            return self._script_missing(skill_info)
+
+        group = self._group(skill_info)
+        with phase(PHASE_SANDBOX_SPAWN):
+            worker = group.acquire(self.config.acquire_timeout)
+        if worker is None:
+            return self._no_worker(skill_info)
+
+        staged = None
+        try:
+            with phase(PHASE_EXECUTION):
+                request, staged = self._payload(script, input_data, stream, serializer)
+                response = worker.request(request, timeout, stream)
+                if stream is not None:
+                    stream.close()
+        except (_WorkerTimeoutError, _WorkerCrashedError) as e:
+            return self._worker_failed(skill_info, group, worker, e, timeout)
+        except BaseException:
+            group.discard(worker, force=True)
+            raise
+        finally:
+            if staged is not None:
+                staged.close()
+        return self._finish(group, worker, response, stream, serializer)
+
+    async def aexecute(
+        self,
+        skill_info: "SkillInfo",
+        input_data: Dict[str, Any],
+        timeout: Optional[int] = None,
+        stream: Optional["OutputStream"] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> ExecutionResult:
+        """
+        Execute a skill on a pooled worker without blocking the event loop.
+
+        Waiting for a free worker and for the worker's response both happen
+        on the running event loop, so no executor thread is held per call.
+
+        Args:
+            skill_info: SkillInfo of the skill to run
+            input_data: JSON-serializable input passed to the script on stdin
+            timeout: Execution timeout in seconds (None = no timeout)
+            stream: Optional OutputStream receiving stdout as it is written
+            serializer: Serializer for the input and output (default: the
+                fastest installed, see ``get_serializer``)
+
+        Returns:
+            ExecutionResult with output or error
+        """
+        serializer = serializer or self._serializer
+        spec = self.server_spec(skill_info)
+        if spec is not None:
+            return await self._aserver_execute(
+                skill_info, spec, input_data, timeout, stream, serializer
+            )
+
+        script = self.entry_script(skill_info)
+        if script is None or not script.exists():
+            return self._script_missing(skill_info)
+
+        group = self._group(skill_info)
+        with phase(PHASE_SANDBOX_SPAWN):
+            worker = await group.aacquire(self.config.acquire_timeout)
+        if worker is None:
+            return self._no_worker(skill_info)
+
+        staged = None
+        try:
+            with phase(PHASE_EXECUTION):
+                request, staged = self._payload(script, input_data, stream, serializer)
+                response = await worker.arequest(request, timeout, stream)
+                if stream is not None:
+                    await stream.aclose()
+        except (_WorkerTimeoutError, _WorkerCrashedError) as e:
+            return self._worker_failed(skill_info, group, worker, e, timeout)
+        except BaseException:
+            # Cancelled mid-request: the worker still owes us a response.
+            group.discard(worker, force=True)
+            raise
+        finally:
+            if staged is not None:
+                staged.close()
+        return self._finish(group, worker, response, stream, serializer)
+
+    def _server_execute(
+        self,
+        skill_info: "SkillInfo",
+        spec: ServerSpec,
+        input_data: Dict[str, Any],
+        timeout: Optional[int],
+        stream: Optional["OutputStream"],
+        serializer: Serializer,
+    ) -> ExecutionResult:
+        """Run one call on a persistent skill server."""
+        if not spec.script.exists():
+            return self._script_missing(skill_info)
+        group = self._server_group(skill_info, spec)
+        server = staged = None
+        try:
+            with phase(PHASE_SANDBOX_SPAWN):
+                server = group.pick()
+            with phase(PHASE_EXECUTION):
+                if server.framing == FRAMING_MSGPACK:
+                    response = server.call(timeout, input_data=input_data)
+                else:
+                    input_json, staged = self._encode_input(input_data, serializer)
+                    response = server.call(timeout, input_json, staged and staged.path)
+        except (ServerTimeoutError, ServerCrashedError) as e:
+            return self._server_failed(skill_info, group, server, e, timeout)
+        finally:
+            if staged is not None:
+                staged.close()
+        result = self._server_finish(response, stream)
+        if stream is not None:
+            stream.close()
+        return result
+
+    async def _aserver_execute(
+        self,
+        skill_info: "SkillInfo",
+        spec: ServerSpec,
+        input_data: Dict[str, Any],
+        timeout: Optional[int],
+        stream: Optional["OutputStream"],
+        serializer: Serializer,
+    ) -> ExecutionResult:
+        """Async twin of ``_server_execute``."""
+        if not spec.script.exists():
+            return self._script_missing(skill_info)
+        group = self._server_group(skill_info, spec)
+        server = staged = None
+        try:
+            with phase(PHASE_SANDBOX_SPAWN):
+                server = group.pick()
+            with phase(PHASE_EXECUTION):
+                if server.framing == FRAMING_MSGPACK:
+                    response = await server.acall(timeout, input_data=input_data)
+                else:
+                    input_json, staged = self._encode_input(input_data, serializer)
+                    response = await server.acall(timeout, input_json, staged and staged.path)
+        except (ServerTimeoutError, ServerCrashedError) as e:
+            return self._server_failed(skill_info, group, server, e, timeout)
+        finally:
+            if staged is not None:
+                staged.close()
+        result = self._server_finish(response, stream)
+        if stream is not None:
+            await stream.aclose()
+        return result
+
+    @staticmethod
+    def _server_finish(
+        response: Dict[str, Any],
+        stream: Optional["OutputStream"],
+    ) -> ExecutionResult:
+        """Build the result; a stream receives the whole output as one chunk."""
+        with phase(PHASE_OUTPUT_PARSING):
+            result = server_result(response)
+        if stream is None or result.output is None:
+            return result
+        stream.feed((json.dumps(result.output) + "\n").encode("utf-8"))
+        return stream.apply(result)
+
+    @staticmethod
+    def _server_failed(
+        skill_info: "SkillInfo",
+        group: ServerGroup,
+        server: Any,
+        error: Exception,
+        timeout: Optional[int],
+    ) -> ExecutionResult:
+        if isinstance(error, ServerTimeoutError):
+            # The handler is still running; a stuck server would hold up later calls.
+            if server is not None:
+                group.discard(server)
+            return ExecutionResult(
+                success=False,
+                error=f"Execution timed out after {timeout} seconds",
+                exit_code=-1,
+            )
+        logger.warning(f"Skill server for skill '{skill_info.name}' failed: {error}")
+        return ExecutionResult(
+            success=False,
+            error=f"Execution failed: skill server crashed ({error})",
+            exit_code=-1,
+        )
+
+    def _encode_input(
+        self,
+        input_data: Dict[str, Any],
+        serializer: Optional[Serializer] = None,
+    ) -> Tuple[Optional[str], Optional[StagedPayload]]:
+        """Encode a call's input, staging it in a file when it is large."""
+        return encode_json(
+            input_data,
+            self.config.large_payload_bytes,
+            self._payload_dir,
+            serializer or self._serializer,
+        )
+
+    def _payload(
+        self,
+        script: Path,
+        input_data: Dict[str, Any],
+        stream: Optional["OutputStream"] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> Tuple[Dict[str, Any], Optional[StagedPayload]]:
+        """Build a worker request; the staged input file (if any) is the caller's to close."""
+        input_json, staged = self._encode_input(input_data, serializer)
+        payload: Dict[str, Any] = {"script": str(script)}
+        if staged is not None:
+            payload["input_file"] = staged.path
+        else:
+            payload["input"] = input_json
+        if stream is not None:
+            payload["stream"] = True
+            payload["max_output"] = stream.max_bytes
+        elif self.config.large_payload_bytes is not None:
+            payload["spill_output"] = self.config.large_payload_bytes
+            payload["spill_dir"] = self._payload_dir
+        return payload, staged
+
+    @staticmethod
+    def _script_missing(skill_info: "SkillInfo") -> ExecutionResult:
+        return ExecutionResult(
+            success=False,
+            error=f"Script not found for skill '{skill_info.name}'",
+            exit_code=-1,
+        )
+
+    def _no_worker(self, skill_info: "SkillInfo") -> ExecutionResult:
+        return ExecutionResult(
+            success=False,
+            error=(
+                f"No pooled worker available for skill '{skill_info.name}' "
+                f"within {self.config.acquire_timeout} seconds"
+            ),
+            exit_code=-1,
+        )
+
+    @staticmethod
+    def _worker_failed(
+        skill_info: "SkillInfo",
+        group: _WorkerGroup,
+        worker: _Worker,
+        error: Exception,
+        timeout: Optional[int],
+    ) -> ExecutionResult:
+        group.discard(worker, force=True)
+        if isinstance(error, _WorkerTimeoutError):
+            return ExecutionResult(
+                success=False,
+                error=f"Execution timed out after {timeout} seconds",
+                exit_code=-1,
+            )
+        logger.warning(f"Pooled worker for skill '{skill_info.name}' crashed: {error}")
+        return ExecutionResult(
+            success=False,
+            error=f"Execution failed: pooled worker crashed ({error})",
+            exit_code=-1,
+        )
+
+    @staticmethod
+    def _finish(
+        group: _WorkerGroup,
+        worker: _Worker,
+        response: Dict[str, Any],
+        stream: Optional["OutputStream"] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> ExecutionResult:
+        group.release(worker)
+        if stream is None:
+            with phase(PHASE_OUTPUT_PARSING):
+                return _parse_output(
+                    _response_stdout(response),
+                    response.get("stderr", ""),
+                    int(response.get("exit_code", 1)),
+                    serializer,
+                )
+        stream.dropped_bytes += int(response.get("dropped", 0))
+        with phase(PHASE_OUTPUT_PARSING):
+            result = _parse_output(
+                stream.text,
+                response.get("stderr", ""),
+                int(response.get("exit_code", 1)),
+                serializer,
+            )
+        return stream.apply(result)
+
+    def evict_idle(self) -> int:
+        """Evict idle workers across all skills. Returns the number evicted."""
+        with self._lock:
+            groups: List[Any] = [*self._groups.values(), *self._server_groups.values()]
+        return sum(group.evict_idle() for group in groups)
+
+    def invalidate(self, skill_dir: Union[str, Path]) -> None:
+        """
+        Drop the workers of one skill, e.g. after its code changed.
+
+        Idle workers are closed now; busy workers (and servers) finish their
+        calls and are then discarded. The next execution starts fresh workers.
+        A registered interpreter is forgotten too, since the skill's
+        dependencies may have changed.
+        """
+        key = str(Path(skill_dir).resolve())
+        with self._lock:
+            group = self._groups.pop(key, None)
+            server_group = self._server_groups.pop(key, None)
+            self._server_specs.pop(key, None)
+            self._interpreters.pop(key, None)
+        for closing in (group, server_group):
+            if closing is not None:
+                closing.close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return the current and idle worker count for each pooled skill.
+
+        Skills on persistent servers also report their requests ``in_flight``.
+        """
+        with self._lock:
+            groups = dict(self._groups)
+            server_groups = dict(self._server_groups)
+        stats = {
+            key: {"workers": group.size, "idle": group.idle_count}
+            for key, group in groups.items()
+        }
+        for key, server_group in server_groups.items():
+            stats[key] = server_group.stats()
+        return stats
+
+    def shutdown(self) -> None:
+        """Terminate all idle workers and refuse further executions."""
+        with self._lock:
+            self._closed = True
+            groups: List[Any] = [*self._groups.values(), *self._server_groups.values()]
+            self._groups.clear()
+            self._server_groups.clear()
+        self._reaper_stop.set()
+        _open_pools.discard(self)
+        for group in groups:
+            group.close()
+
+
+__all__ = [
+    "PoolConfig",
+    "SkillWorkerPool",
+]
@@ -0,0 +1,176 @@
+"""
+Parallel security prescan of a toolkit's skills.
+
+At sandbox level 3 a skill is scanned on its first call (and, without a
+ScanCache, on every call), so first-call latency depends on how many
+skills happen to be cold. Prescanning scans every skill at build time
+instead, CPU-count scans at a time, and stores the verdicts in a ScanCache
+that the tools then consult; on a large skills tree the scan cost moves to
+deploy time and is spread across cores.
+
+Each scan already runs in its own scanner process (``skillbox
+security-scan``), so scans are fanned out from a thread pool rather than a
+pool of Python processes that would only wait on those subprocesses.
+
+Scan verdicts only: a skill flagged by the prescan still goes through the
+confirmation flow when it is called.
+
+Usage:
+    from langchain_skilllite import ScanCache, SkillLiteToolkit
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills", sandbox_level=3, scan_cache=ScanCache("~/.cache/skilllite/scans"),
+        prescan=True,
+    )
+
+    # or, to inspect the report:
+    report = SkillLiteToolkit(manager, scan_cache=cache).prescan()
+    report.flagged          # skills that will need confirmation
+    report.summary()        # {"skill": {"high": 1, "rules": ["py-exec"], ...}}
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from skilllite.core.protocols import SecurityScanResult
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+    from langchain_skilllite.scan_cache import ScanCache
+
+logger = logging.getLogger(__name__)
+
+
+def default_workers() -> int:
+    """Number of scans run at the same time: one per CPU."""
+    return os.cpu_count() or 1
+
+
+@dataclass
+class PrescanReport:
+    """
+    Outcome of a prescan.
+
+    Attributes:
+        results: Scan result per skill
+        timings: Seconds spent per skill (near zero for cached verdicts)
+        cached: Skills whose verdict was already in the ScanCache
+        errors: Error message per skill that could not be scanned
+        elapsed: Wall-clock seconds for the whole prescan
+        workers: Scans run at the same time
+    """
+
+    results: Dict[str, SecurityScanResult] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    cached: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    workers: int = 1
+
+    @property
+    def scanned(self) -> int:
+        """Number of skills actually scanned (not served from the cache)."""
+        return len(self.results) - len(self.cached)
+
+    @property
+    def flagged(self) -> List[str]:
+        """Skills whose scan requires confirmation before they run."""
+        return sorted(name for name, r in self.results.items() if r.requires_confirmation)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Issue summary per skill.
+
+        Returns:
+            skill name -> {"safe", "high", "medium", "low", "rules", "seconds"}
+        """
+        return {
+            name: {
+                "safe": result.is_safe,
+                "high": result.high_severity_count,
+                "medium": result.medium_severity_count,
+                "low": result.low_severity_count,
+                "rules": sorted({i.get("rule_id", "") for i in result.issues if i.get("rule_id")}),
+                "seconds": self.timings.get(name, 0.0),
+            }
+            for name, result in sorted(self.results.items())
+        }
+
+
+def prescan_skills(
+    skills: Sequence["SkillInfo"],
+    scan_cache: "ScanCache",
+    max_workers: Optional[int] = None,
+) -> PrescanReport:
+    """
+    Scan skills concurrently and store their verdicts in ``scan_cache``.
+
+    Args:
+        skills: Skills to scan
+        scan_cache: Verdict store; unchanged skills already in it are not rescanned
+        max_workers: Scans run at the same time (default: CPU count)
+
+    Returns:
+        PrescanReport with results, per-skill timings and errors
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    report = PrescanReport(workers=max_workers or default_workers())
+
+    def scan(skill: "SkillInfo") -> Tuple[SecurityScanResult, bool, float]:
+        started = time.perf_counter()
+        cached = scan_cache.get(scan_cache.content_hash(skill)) is not None
+        result = scan_cache.scan(skill, {})
+        return result, cached, time.perf_counter() - started
+
+    started = time.perf_counter()
+    if skills:
+        with ThreadPoolExecutor(
+            max_workers=min(report.workers, len(skills)), thread_name_prefix="skilllite-prescan"
+        ) as executor:
+            futures = {skill.name: executor.submit(scan, skill) for skill in skills}
+            for name, future in futures.items():
+                try:
+                    result, cached, seconds = future.result()
+                except Exception as e:
+                    report.errors[name] = str(e)
+                    continue
+                report.results[name] = result
+                report.timings[name] = seconds
+                if cached:
+                    report.cached.append(name)
+    report.elapsed = time.perf_counter() - started
+    _log_report(report)
+    return report
+
+
+def _log_report(report: PrescanReport) -> None:
+    logger.info(
+        "Prescanned %d skill(s) in %.2fs with %d worker(s): %d scanned, %d cached, "
+        "%d flagged, %d failed",
+        len(report.results), report.elapsed, report.workers, report.scanned,
+        len(report.cached), len(report.flagged), len(report.errors),
+    )
+    for name, summary in report.summary().items():
+        if not summary["safe"]:
+            logger.info(
+                "  %s: %d high, %d medium, %d low (%s)",
+                name, summary["high"], summary["medium"], summary["low"],
+                ", ".join(summary["rules"]) or "no rule ids",
+            )
+    for name, error in report.errors.items():
+        logger.warning("  %s: scan failed: %s", name, error)
+
+
+__all__ = [
+    "PrescanReport",
+    "default_workers",
+    "prescan_skills",
+]
@@ -0,0 +1,410 @@
+"""
+Result memoization for deterministic skills.
+
+Many skills (``text-upper``, ``greeter``) are pure functions of their JSON
+input, yet every identical call pays for a sandboxed execution. ResultCache
+stores successful results keyed by the canonical JSON of the input and the
+content hash of the skill's scripts, so editing a skill invalidates its
+entries automatically.
+
+A skill is memoized when it declares itself deterministic in its SKILL.md
+front matter::
+
+    ---
+    name: text-upper
+    deterministic: true
+    cache_ttl: 3600        # optional, seconds
+    ---
+
+or when a ResultCache covering it is passed as ``cache=``:
+
+    from langchain_skilllite import SkillLiteToolkit
+    from langchain_skilllite.result_cache import ResultCache
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills",
+        cache=ResultCache(skills=["greeter"], ttl=600, max_bytes=16 * 1024 * 1024),
+    )
+
+Hits and misses are reported to callback handlers as the
+``skilllite_cache`` custom event (see SkillLiteCallbackHandler).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from skilllite.sandbox.base import ExecutionResult
+
+from langchain_skilllite.discovery import front_matter
+from langchain_skilllite.scan_cache import SkillDigests
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+CACHE_EVENT = "skilllite_cache"
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def canonical_json(data: Any) -> str:
+    """Serialize ``data`` so that equal inputs always produce the same string."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+# ==================== Backends ====================
+
+class ResultCacheBackend(ABC):
+    """
+    Storage for serialized results, evicting least recently used entries
+    once ``max_bytes`` is exceeded.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the payload stored under ``key`` and mark it recently used."""
+
+    @abstractmethod
+    def set(self, key: str, payload: bytes) -> None:
+        """Store a payload, evicting old entries as needed."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    @property
+    @abstractmethod
+    def size_bytes(self) -> int:
+        """Total size of the stored payloads."""
+
+
+class MemoryResultBackend(ResultCacheBackend):
+    """In-process LRU backend bounded by total payload size."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = payload
+            self._size += len(payload)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskResultBackend(ResultCacheBackend):
+    """
+    On-disk LRU backend: one file per entry, recency tracked by mtime.
+
+    Entries survive restarts and can be shared by processes using the same
+    ``cache_dir``.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> size, in least-recently-used order
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            payload = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            self._forget(key)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        return payload
+
+    def set(self, key: str, payload: bytes) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+
+        evicted: List[str] = []
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+            self._index[key] = len(payload)
+            self._size += len(payload)
+            while self._size > self.max_bytes and self._index:
+                old_key, old_size = self._index.popitem(last=False)
+                self._size -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._unlink(old_key)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._size -= self._index.pop(key, 0)
+
+    def _unlink(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def delete(self, key: str) -> None:
+        self._forget(key)
+        self._unlink(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._size = 0
+        for key in keys:
+            self._unlink(key)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+
+# ==================== Cache ====================
+
+class ResultCache:
+    """
+    Memoizes successful skill results.
+
+    Attributes:
+        backend: Storage backend
+        ttl: Default time-to-live in seconds (None = no expiry)
+        skills: Skill names cached regardless of their front matter
+            (None = every skill; [] = only skills declaring ``deterministic: true``)
+        hits: Number of results served from the cache
+        misses: Number of cacheable calls that had to execute
+    """
+
+    def __init__(
+        self,
+        backend: Union[str, ResultCacheBackend] = "memory",
+        ttl: Optional[float] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_dir: Optional[Union[str, Path]] = None,
+        skills: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: "memory", "disk" or a ResultCacheBackend instance
+            ttl: Default time-to-live in seconds (None = no expiry)
+            max_bytes: Size bound for the built-in backends
+            cache_dir: Directory for the "disk" backend
+            skills: Skill names to cache even without ``deterministic: true``
+                (None = every skill)
+        """
+        if isinstance(backend, ResultCacheBackend):
+            self.backend = backend
+        elif backend == "memory":
+            self.backend = MemoryResultBackend(max_bytes=max_bytes)
+        elif backend == "disk":
+            if cache_dir is None:
+                raise ValueError("cache_dir is required for the disk backend")
+            self.backend = DiskResultBackend(cache_dir, max_bytes=max_bytes)
+        else:
+            raise ValueError(f"Unknown result cache backend: {backend!r}")
+        self.ttl = ttl
+        self.skills = None if skills is None else frozenset(skills)
+        self.hits = 0
+        self.misses = 0
+        self._digests = SkillDigests()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def deterministic_only(cls, **kwargs: Any) -> "ResultCache":
+        """Cache that only memoizes skills declaring ``deterministic: true``."""
+        return cls(skills=(), **kwargs)
+
+    # ==================== Policy ====================
+
+    def _declared_settings(self, skill_info: "SkillInfo") -> Dict[str, Any]:
+        """Read ``deterministic``/``cache_ttl`` from the skill's front matter."""
+        data = front_matter(skill_info.path)
+        settings: Dict[str, Any] = {}
+        deterministic = data.get("deterministic", False)
+        if isinstance(deterministic, str):
+            deterministic = deterministic.lower() in ("true", "yes", "1")
+        settings["deterministic"] = bool(deterministic)
+        if isinstance(data.get("cache_ttl"), (int, float)):
+            settings["ttl"] = float(data["cache_ttl"])
+        return settings
+
+    def applies_to(self, skill_info: "SkillInfo") -> bool:
+        """Whether results of this skill are memoized."""
+        if self.skills is None or skill_info.name in self.skills:
+            return True
+        return self._declared_settings(skill_info).get("deterministic", False)
+
+    def _ttl_for(self, skill_info: "SkillInfo") -> Optional[float]:
+        return self._declared_settings(skill_info).get("ttl", self.ttl)
+
+    def key(self, skill_info: "SkillInfo", input_data: Dict[str, Any]) -> str:
+        """Cache key: skill name, script content hash and canonical input JSON."""
+        hasher = hashlib.sha256()
+        hasher.update(skill_info.name.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(self._digests.digest(skill_info).encode("ascii"))
+        hasher.update(b"\0")
+        hasher.update(canonical_json(input_data).encode("utf-8"))
+        return hasher.hexdigest()
+
+    # ==================== Entries ====================
+
+    def get(self, key: str) -> Optional[ExecutionResult]:
+        """Return a cached result, dropping it if it has expired."""
+        payload = self.backend.get(key)
+        if payload is None:
+            return None
+        try:
+            entry = json.loads(payload)
+        except ValueError:
+            self.backend.delete(key)
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and time.time() >= expires_at:
+            self.backend.delete(key)
+            return None
+        return ExecutionResult(**entry["result"])
+
+    def put(self, key: str, result: ExecutionResult, ttl: Optional[float] = None) -> None:
+        """Store a successful result; failures are never cached."""
+        if not result.success:
+            return
+        entry = {
+            "expires_at": time.time() + ttl if ttl is not None else None,
+            "result": {
+                "success": result.success,
+                "output": result.output,
+                "error": result.error,
+                "exit_code": result.exit_code,
+                "stdout": result.stdout,
+                "stderr": result.stderr,
+            },
+        }
+        try:
+            payload = json.dumps(entry).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+        self.backend.set(key, payload)
+
+    def lookup(
+        self,
+        skill_info: "SkillInfo",
+        input_data: Dict[str, Any],
+    ) -> Tuple[str, Optional[ExecutionResult]]:
+        """Compute the key for a call and return it with the cached result, if any."""
+        key = self.key(skill_info, input_data)
+        result = self.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return key, result
+
+    def store(self, skill_info: "SkillInfo", key: str, result: ExecutionResult) -> None:
+        """Store the result of a missed call using the skill's TTL."""
+        self.put(key, result, ttl=self._ttl_for(skill_info))
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "size_bytes": self.backend.size_bytes,
+        }
+
+
+__all__ = [
+    "ResultCache",
+    "ResultCacheBackend",
+    "MemoryResultBackend",
+    "DiskResultBackend",
+    "canonical_json",
+]
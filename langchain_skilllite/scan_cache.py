@@ -0,0 +1,376 @@
+"""
+Content-addressed security scan cache for sandbox level 3.
+
+With ``sandbox_level=3`` every call rescans the skill's scripts even though
+they almost never change. ScanCache stores scan verdicts keyed by a hash of
+the skill's script files, the scanner version and the rule set, so an
+unchanged skill is scanned once. Verdicts live in an in-memory LRU and,
+optionally, in an on-disk store shared across processes and restarts.
+
+Confirmation decisions are remembered per content hash as well: once a user
+approves a skill, later calls skip both the scan and the prompt until the
+skill's scripts change.
+
+Usage:
+    from langchain_skilllite import SkillLiteToolkit
+    from langchain_skilllite.scan_cache import ScanCache
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills",
+        sandbox_level=3,
+        scan_cache=ScanCache(cache_dir="~/.cache/skilllite/scans"),
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from skilllite.core.protocols import SecurityScanResult
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+# Scan results produced by scanner failures are transient and never cached.
+_UNCACHEABLE_RULES = {"scan-error", "scan-exception", "scan-timeout"}
+
+_IGNORED_DIRS = {"__pycache__", ".git", "node_modules"}
+
+
+def _scanner_fingerprint() -> str:
+    """Identify the scanner: skilllite version plus the skillbox binary in use."""
+    import skilllite
+    from skilllite.core.security import SecurityScanner
+
+    parts = [f"skilllite={getattr(skilllite, '__version__', 'unknown')}"]
+    binary = SecurityScanner.get_instance().skillbox_path
+    if binary:
+        try:
+            stat = os.stat(binary)
+            parts.append(f"skillbox={binary}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"skillbox={binary}")
+    return ";".join(parts)
+
+
+def _script_files(skill_info: "SkillInfo") -> List[Path]:
+    """All files that make up a skill's executable code."""
+    skill_dir = Path(skill_info.path)
+    files = []
+    scripts_dir = skill_dir / "scripts"
+    if scripts_dir.is_dir():
+        for root, dirs, names in os.walk(scripts_dir):
+            dirs[:] = sorted(d for d in dirs if d not in _IGNORED_DIRS)
+            files.extend(Path(root) / name for name in sorted(names) if not name.endswith(".pyc"))
+
+    entry_point = getattr(skill_info.metadata, "entry_point", None) if skill_info.metadata else None
+    if entry_point:
+        entry = skill_dir / entry_point
+        if entry.is_file() and entry not in files:
+            files.append(entry)
+    return files
+
+
+class SkillDigests:
+    """
+    Memoized sha256 digests of skills' script files.
+
+    A skill's files are only re-read when one of them changes size or mtime.
+    """
+
+    def __init__(self) -> None:
+        # skill_dir -> (stat signature, digest of the script files)
+        self._digests: Dict[str, Tuple[Tuple[Any, ...], str]] = {}
+        self._lock = threading.Lock()
+
+    def digest(self, skill_info: "SkillInfo") -> str:
+        """Return the digest of the skill's script files."""
+        signature = []
+        for path in _script_files(skill_info):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature.append((str(path), stat.st_size, stat.st_mtime_ns))
+        signature_key = tuple(signature)
+
+        skill_key = str(Path(skill_info.path).resolve())
+        with self._lock:
+            cached = self._digests.get(skill_key)
+        if cached is not None and cached[0] == signature_key:
+            return cached[1]
+
+        hasher = hashlib.sha256()
+        base = Path(skill_info.path)
+        for path_str, _, _ in signature:
+            path = Path(path_str)
+            hasher.update(str(path.relative_to(base)).encode("utf-8"))
+            hasher.update(b"\0")
+            try:
+                hasher.update(path.read_bytes())
+            except OSError:
+                pass
+            hasher.update(b"\0")
+        digest = hasher.hexdigest()
+        with self._lock:
+            self._digests[skill_key] = (signature_key, digest)
+        return digest
+
+    def clear(self) -> None:
+        with self._lock:
+            self._digests.clear()
+
+
+class ScanCache:
+    """
+    Cache of security scan verdicts and user approvals, keyed by content hash.
+
+    Attributes:
+        cache_dir: Directory of the on-disk store (None = memory only)
+        max_entries: Maximum number of verdicts kept in memory
+        rules_version: Identifier of the scan rule set; part of every key
+        hits: Number of scans served from the cache
+        misses: Number of scans that had to run
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_entries: int = 1024,
+        rules_version: str = "default",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the persistent store (default: memory only)
+            max_entries: Maximum number of verdicts kept in the in-memory LRU
+            rules_version: Identifier of the scan rule set; changing it
+                invalidates all cached verdicts and approvals
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.max_entries = max_entries
+        self.rules_version = rules_version
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._approved: set = set()
+        self._digests = SkillDigests()
+        self._scanner_fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+        if self.cache_dir:
+            (self.cache_dir / "scans").mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / "approvals").mkdir(parents=True, exist_ok=True)
+
+    # ==================== Content Hashing ====================
+
+    def content_hash(self, skill_info: "SkillInfo") -> str:
+        """
+        Hash a skill's script files together with the scanner and rule set.
+
+        File contents are only re-read when a file's size or mtime changes.
+        """
+        digest = self._digests.digest(skill_info)
+        if self._scanner_fingerprint is None:
+            self._scanner_fingerprint = _scanner_fingerprint()
+        key = f"{digest}|{self._scanner_fingerprint}|{self.rules_version}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    # ==================== Verdicts ====================
+
+    def get(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached verdict for a content hash, if any."""
+        with self._lock:
+            entry = self._entries.get(content_hash)
+            if entry is not None:
+                self._entries.move_to_end(content_hash)
+                return entry
+
+        entry = self._read_json(self._scan_path(content_hash))
+        if entry is not None:
+            self._remember(content_hash, entry)
+        return entry
+
+    def put(self, content_hash: str, result: SecurityScanResult) -> None:
+        """Store a scan verdict unless it came from a scanner failure."""
+        if any(issue.get("rule_id") in _UNCACHEABLE_RULES for issue in result.issues):
+            return
+        entry = {
+            "is_safe": result.is_safe,
+            "issues": result.issues,
+            "high_severity_count": result.high_severity_count,
+            "medium_severity_count": result.medium_severity_count,
+            "low_severity_count": result.low_severity_count,
+            "timestamp": result.timestamp,
+        }
+        self._remember(content_hash, entry)
+        path = self._scan_path(content_hash)
+        if path is not None:
+            self._write_json(path, entry)
+
+    def seed(self, content_hash: str, entry: Dict[str, Any]) -> None:
+        """Add a verdict recorded elsewhere (e.g. in a toolkit snapshot) to memory."""
+        self._remember(content_hash, entry)
+
+    def _remember(self, content_hash: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[content_hash] = entry
+            self._entries.move_to_end(content_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _result_from_entry(
+        self,
+        entry: Dict[str, Any],
+        skill_info: "SkillInfo",
+        input_data: Dict[str, Any],
+    ) -> SecurityScanResult:
+        """Rebuild a SecurityScanResult with a fresh, verifiable scan_id."""
+        from skilllite.core.security import SecurityScanner
+
+        scanner = SecurityScanner.get_instance()
+        result = SecurityScanResult(
+            is_safe=entry["is_safe"],
+            issues=entry["issues"],
+            scan_id=str(uuid.uuid4()),
+            code_hash=scanner._generate_input_hash(skill_info.name, input_data),
+            high_severity_count=entry["high_severity_count"],
+            medium_severity_count=entry["medium_severity_count"],
+            low_severity_count=entry["low_severity_count"],
+        )
+        scanner._scan_cache[result.scan_id] = result
+        return result
+
+    def scan(self, skill_info: "SkillInfo", input_data: Dict[str, Any]) -> SecurityScanResult:
+        """
+        Return the scan result for a skill, scanning only on a cache miss.
+
+        Args:
+            skill_info: SkillInfo of the skill to scan
+            input_data: Input data for the pending execution
+
+        Returns:
+            SecurityScanResult (``scan_id`` and ``format_report`` work as usual)
+        """
+        content_hash = self.content_hash(skill_info)
+        entry = self.get(content_hash)
+        if entry is not None:
+            self.hits += 1
+            return self._result_from_entry(entry, skill_info, input_data)
+
+        from skilllite.core.security import SecurityScanner
+
+        self.misses += 1
+        result = SecurityScanner.get_instance().scan_skill(skill_info, input_data)
+        self.put(content_hash, result)
+        return result
+
+    async def ascan(self, skill_info: "SkillInfo", input_data: Dict[str, Any]) -> SecurityScanResult:
+        """Async twin of ``scan`` using the asyncio scanner."""
+        content_hash = self.content_hash(skill_info)
+        entry = self.get(content_hash)
+        if entry is not None:
+            self.hits += 1
+            return self._result_from_entry(entry, skill_info, input_data)
+
+        from langchain_skilllite import async_execution
+
+        self.misses += 1
+        result = await async_execution.scan_skill(skill_info, input_data)
+        self.put(content_hash, result)
+        return result
+
+    # ==================== Approvals ====================
+
+    def is_approved(self, content_hash: str) -> bool:
+        """Check whether a user already approved this exact skill content."""
+        if not content_hash:
+            return False
+        with self._lock:
+            if content_hash in self._approved:
+                return True
+        path = self._approval_path(content_hash)
+        if path is not None and path.exists():
+            with self._lock:
+                self._approved.add(content_hash)
+            return True
+        return False
+
+    def approve(self, content_hash: str) -> None:
+        """Remember that a user approved this skill content."""
+        if not content_hash:
+            return
+        with self._lock:
+            self._approved.add(content_hash)
+        path = self._approval_path(content_hash)
+        if path is not None:
+            self._write_json(path, {"approved": True})
+
+    def revoke(self, content_hash: str) -> None:
+        """Forget an approval."""
+        with self._lock:
+            self._approved.discard(content_hash)
+        path = self._approval_path(content_hash)
+        if path is not None:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """Drop all in-memory verdicts and approvals (the disk store is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._approved.clear()
+        self._digests.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of scans served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    # ==================== Disk Store ====================
+
+    def _scan_path(self, content_hash: str) -> Optional[Path]:
+        return self.cache_dir / "scans" / f"{content_hash}.json" if self.cache_dir else None
+
+    def _approval_path(self, content_hash: str) -> Optional[Path]:
+        return self.cache_dir / "approvals" / f"{content_hash}.json" if self.cache_dir else None
+
+    @staticmethod
+    def _read_json(path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        if path is None:
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+__all__ = ["ScanCache"]
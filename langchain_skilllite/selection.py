@@ -0,0 +1,239 @@
+"""
+Query-time tool selection for large skill sets.
+
+Handing thousands of SkillLiteTools to an agent puts every tool description
+into every prompt. SkillIndex is a local BM25 index over skill names and
+descriptions (no embedding service): given the user's message it ranks the
+skills, and ``SkillLiteToolkit.select_tools`` returns only the top-k tools
+for the agent to bind.
+
+The index stores term frequencies per skill together with a signature of
+the indexed text. ``update`` only re-tokenizes skills whose name or
+description changed and drops skills that disappeared; when a path is
+given the index is persisted as JSON, so later starts skip tokenizing
+unchanged skills entirely.
+
+Usage:
+    from langchain_skilllite import LazySkillManager, SkillLiteToolkit
+
+    toolkit = SkillLiteToolkit(
+        LazySkillManager(skills_dir="./skills"),
+        index="./skills/.skilllite-index.json",
+    )
+    tools = toolkit.select_tools("convert this invoice PDF to text", k=5)
+    agent = create_react_agent(llm, tools)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+INDEX_FILE_NAME = ".skilllite-index.json"
+INDEX_VERSION = 1
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have how i if in into is it its me "
+    "my of on or please that the this to use uses using was what when which will "
+    "with you your".split()
+)
+
+
+def _stem(token: str) -> str:
+    """Strip common English suffixes so "converts"/"converting" match "convert"."""
+    for suffix in ("ing", "ed", "es", "s"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, split on non-alphanumerics, drop stopwords and stem."""
+    return [_stem(t) for t in _TOKEN.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _document(skill_info: "SkillInfo") -> str:
+    """Text indexed for a skill; the name counts twice so it outranks prose."""
+    name = skill_info.name or ""
+    return f"{name} {name} {skill_info.description or ''}"
+
+
+class SkillIndex:
+    """
+    Incrementally updated BM25 index of skills.
+
+    Attributes:
+        path: JSON file the index is persisted to (None = memory only)
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalization
+        updated: Skills (re-)tokenized by the last ``update``
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Initialize the index, loading ``path`` if it exists.
+
+        Args:
+            path: Where to persist the index (None = memory only)
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.path = Path(path).expanduser() if path else None
+        self.k1 = k1
+        self.b = b
+        self.updated = 0
+        # skill name -> {"sig": signature, "tf": {term: count}, "len": tokens}
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        # term -> {skill name: count}; the document frequency is its length
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+        for name, doc in self._load().items():
+            if isinstance(doc, dict) and isinstance(doc.get("tf"), dict):
+                self._add(name, doc)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._docs
+
+    # ==================== Maintenance ====================
+
+    def _add(self, name: str, doc: Dict[str, Any]) -> None:
+        self._docs[name] = doc
+        for term, count in doc["tf"].items():
+            self._postings.setdefault(term, {})[name] = count
+        self._total_length += doc.get("len", 0)
+
+    def _remove(self, name: str) -> None:
+        doc = self._docs.pop(name)
+        for term in doc["tf"]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(name, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= doc.get("len", 0)
+
+    def update(self, skills: Iterable["SkillInfo"]) -> int:
+        """
+        Bring the index in line with ``skills``.
+
+        Skills whose indexed text is unchanged are kept as they are; skills
+        not in ``skills`` are removed. The index is saved if anything changed.
+
+        Args:
+            skills: The complete set of skills that should be searchable
+
+        Returns:
+            Number of skills added, re-indexed or removed
+        """
+        changed = 0
+        with self._lock:
+            seen = set()
+            for skill in skills:
+                text = _document(skill)
+                signature = hashlib.sha1(text.encode("utf-8")).hexdigest()
+                seen.add(skill.name)
+                current = self._docs.get(skill.name)
+                if current is not None and current["sig"] == signature:
+                    continue
+                if current is not None:
+                    self._remove(skill.name)
+                tokens = tokenize(text)
+                self._add(skill.name, {"sig": signature, "tf": dict(Counter(tokens)), "len": len(tokens)})
+                changed += 1
+            self.updated = changed
+            for name in [name for name in self._docs if name not in seen]:
+                self._remove(name)
+                changed += 1
+            if changed:
+                self._save()
+        return changed
+
+    # ==================== Search ====================
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Rank skills against a query.
+
+        Args:
+            query: Free text, typically the user's message
+            k: Maximum number of results
+
+        Returns:
+            (skill name, BM25 score) pairs, best first; skills sharing no
+            term with the query are not returned
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._docs)
+            if not count or not terms:
+                return []
+            average = self._total_length / count or 1.0
+            totals: Dict[str, float] = {}
+            # Only skills containing a query term are scored.
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for name, freq in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._docs[name].get("len", 0) / average)
+                    totals[name] = totals.get(name, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+        return heapq.nsmallest(k, totals.items(), key=lambda item: (-item[1], item[0]))
+
+    # ==================== Persistence ====================
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self.path is None:
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        docs = data.get("docs")
+        return docs if isinstance(docs, dict) else {}
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {"version": INDEX_VERSION, "docs": self._docs}
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+__all__ = [
+    "INDEX_FILE_NAME",
+    "SkillIndex",
+    "tokenize",
+]
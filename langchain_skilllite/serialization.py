@@ -0,0 +1,251 @@
+"""
+Pluggable JSON serializers for skill inputs, outputs and worker IPC.
+
+Every pooled call encodes its input, wraps it in a request frame, and parses
+the response frame and the script's output. With the stdlib ``json`` module
+each of those is a pure-Python-driven pass over the data; ``orjson`` and
+``msgspec`` do the same work several times faster. ``get_serializer()``
+picks the fastest library installed and falls back to the standard library.
+
+The fast serializers fall back to ``json`` for anything their library
+rejects but the standard library accepts (keys that are not strings,
+integers beyond 64 bits, ``NaN``/``Infinity`` and lone surrogate escapes in
+input text), so they accept everything the standard library does. Text that
+is simply not JSON is rejected without a second parse. Their
+output is compact and not ASCII-escaped, which is still valid JSON for
+every reader.
+
+Skills running on persistent servers may additionally ask for msgpack
+framing in their SKILL.md (``server_framing: msgpack``); requests and
+responses then travel as length-prefixed msgpack frames instead of JSON
+lines (see ``langchain_skilllite.server``). ``msgpack_codec()`` returns the
+codec used for that, from ``msgpack`` or ``msgspec``.
+
+Install a fast library with:
+    pip install langchain-skilllite[fast]
+
+Usage:
+    from langchain_skilllite import SkillLiteToolkit
+    from langchain_skilllite.serialization import get_serializer
+
+    get_serializer().name        # "orjson", "msgspec" or "json"
+
+    tools = SkillLiteToolkit.from_directory(
+        "./skills", pool=PoolConfig(), serializer="orjson"
+    )
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+AUTO = "auto"
+
+SERIALIZERS = (AUTO, "orjson", "msgspec", "json")
+
+# Constructs the stdlib parser accepts and orjson/msgspec reject: NaN and
+# infinities, integers beyond 64 bits, and lone UTF-16 surrogate escapes.
+_STDLIB_ONLY = r"NaN|Infinity|\d{19}|\\u[dD][89a-fA-F]"
+_STDLIB_ONLY_TEXT = re.compile(_STDLIB_ONLY)
+_STDLIB_ONLY_BYTES = re.compile(_STDLIB_ONLY.encode("ascii"))
+
+_INSTALL_HINT = {
+    "orjson": "pip install orjson",
+    "msgspec": "pip install msgspec",
+}
+
+
+class Serializer:
+    """
+    JSON serializer backed by the standard library.
+
+    Attributes:
+        name: Library name
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        """Encode ``obj`` as JSON text."""
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Encode ``obj`` as UTF-8 JSON."""
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """
+        Decode JSON text or bytes.
+
+        Raises:
+            json.JSONDecodeError: If the data is not valid JSON
+        """
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class _FastSerializer(Serializer):
+    """Base for library-backed serializers; falls back to ``json`` on rejection."""
+
+    def _encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def _decode(self, data: Union[str, bytes, bytearray]) -> Any:
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        try:
+            return self._encode(obj)
+        except (TypeError, OverflowError, ValueError):
+            # Values the library rejects get the stdlib's answer (or its error).
+            return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return self._decode(data)
+        except ValueError:
+            # Only re-parse what the stdlib may accept; most rejected text
+            # (plain log lines, truncated output) is not JSON for either.
+            pattern = _STDLIB_ONLY_TEXT if isinstance(data, str) else _STDLIB_ONLY_BYTES
+            if pattern.search(data) is None:
+                raise
+            return json.loads(data)
+
+
+class OrjsonSerializer(_FastSerializer):
+    """Serializer backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._encode = orjson.dumps  # type: ignore[method-assign]
+        self._decode = orjson.loads  # type: ignore[method-assign]
+
+
+class MsgspecSerializer(_FastSerializer):
+    """Serializer backed by ``msgspec.json``."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encode = msgspec.json.encode  # type: ignore[method-assign]
+        self._msgspec_decode = msgspec.json.decode
+        self._error = msgspec.DecodeError
+
+    def _decode(self, data: Union[str, bytes, bytearray]) -> Any:
+        try:
+            return self._msgspec_decode(data)
+        except self._error as e:
+            # msgspec.DecodeError is not a ValueError; raise what json would.
+            doc = data if isinstance(data, str) else ""
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+
+
+_CLASSES = {
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+    "json": Serializer,
+}
+
+_instances: Dict[str, Serializer] = {}
+_lock = threading.Lock()
+
+
+def get_serializer(name: Union[str, Serializer, None] = AUTO) -> Serializer:
+    """
+    Return a shared serializer instance.
+
+    Args:
+        name: "auto" (fastest installed library), "orjson", "msgspec",
+            "json", or a Serializer instance (returned as is)
+
+    Returns:
+        The serializer
+
+    Raises:
+        ValueError: If ``name`` is unknown
+        ImportError: If the requested library is not installed
+    """
+    if isinstance(name, Serializer):
+        return name
+    name = name or AUTO
+    cached = _instances.get(name)
+    if cached is not None:
+        return cached
+    if name not in SERIALIZERS:
+        raise ValueError(f"serializer must be one of {', '.join(SERIALIZERS)}")
+    with _lock:
+        cached = _instances.get(name)
+        if cached is not None:
+            return cached
+        if name == AUTO:
+            serializer = _fastest()
+        else:
+            try:
+                serializer = _CLASSES[name]()
+            except ImportError as e:
+                raise ImportError(
+                    f"{name} is required for serializer='{name}'. "
+                    f"Install it with: {_INSTALL_HINT[name]}"
+                ) from e
+        _instances[name] = serializer
+        return serializer
+
+
+def _fastest() -> Serializer:
+    for cls in (OrjsonSerializer, MsgspecSerializer):
+        try:
+            return cls()
+        except ImportError:
+            continue
+    return Serializer()
+
+
+_MSGPACK_UNSET: Any = object()
+_msgpack: Any = _MSGPACK_UNSET
+
+
+def msgpack_codec() -> Optional[Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]:
+    """
+    Return ``(pack, unpack)`` functions for msgpack, or None if unavailable.
+
+    Uses ``msgpack`` when installed, else ``msgspec.msgpack``.
+    """
+    global _msgpack
+    if _msgpack is _MSGPACK_UNSET:
+        codec = None
+        try:
+            import msgpack
+
+            codec = (msgpack.packb, lambda data: msgpack.unpackb(data, raw=False))
+        except ImportError:
+            try:
+                import msgspec
+
+                codec = (msgspec.msgpack.encode, msgspec.msgpack.decode)
+            except ImportError:
+                pass
+        _msgpack = codec
+    return _msgpack
+
+
+__all__ = [
+    "MsgspecSerializer",
+    "OrjsonSerializer",
+    "SERIALIZERS",
+    "Serializer",
+    "get_serializer",
+    "msgpack_codec",
+]
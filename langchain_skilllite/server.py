@@ -0,0 +1,543 @@
+"""
+Persistent skill servers for the SkillLite warm pool.
+
+A regular skill script is one-shot: it reads its JSON input from stdin,
+writes its result to stdout and exits, so a skill that imports pandas or
+loads a model pays that start-up cost on every call (even on a pooled
+worker, which re-runs the script each time). A skill can instead declare a
+server entry point in its SKILL.md front matter::
+
+    ---
+    name: sentiment
+    entry_point: scripts/main.py
+    server: scripts/main.py            # or scripts/main.py:predict
+    server_concurrency: 1
+    server_framing: msgpack            # optional, default json
+    ---
+
+The module is loaded once per server process and its ``handle`` function
+(or the function named after the colon) is called with the input dict for
+every request::
+
+    import json, sys
+    MODEL = load_model()            # runs once per server process
+
+    def handle(data):
+        return {"label": MODEL.predict(data["text"])}
+
+    if __name__ == "__main__":      # one-shot contract, used by skillbox
+        print(json.dumps(handle(json.loads(sys.stdin.read()))))
+
+SkillWorkerPool starts up to ``max_size`` server processes per skill and
+multiplexes calls over their stdin/stdout as newline-delimited JSON with
+request ids. ``server_concurrency`` lets one server run that many requests
+on threads; by default a server handles one request at a time and further
+requests queue in its pipe. Like pooled workers, servers run with sandbox
+level 1 semantics after the security scan; sandbox level 2 keeps using the
+one-shot entry point. Pointing ``server`` at the scanned ``entry_point``, as
+above, keeps the level 3 scan covering the code the server runs.
+
+``server_framing: msgpack`` replaces the JSON lines with length-prefixed
+msgpack frames (a 4-byte big-endian size, then the body), which saves a
+JSON encode and decode of the input and output on both sides. It is granted
+when ``msgpack`` or ``msgspec`` is importable; otherwise the server falls
+back to JSON lines with a warning. Its interpreter needs the same library.
+Start-up failures are reported as a JSON line in either framing.
+
+Usage:
+    from langchain_skilllite import SkillLiteToolkit
+    from langchain_skilllite.pool import PoolConfig
+
+    tools = SkillLiteToolkit.from_directory("./skills", pool=PoolConfig(max_size=2))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from skilllite.sandbox.base import ExecutionResult
+
+from langchain_skilllite.discovery import front_matter
+from langchain_skilllite.serialization import get_serializer, msgpack_codec
+from langchain_skilllite.streaming import READ_SIZE
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+    from langchain_skilllite.pool import PoolConfig
+
+_SERVER_SCRIPT = str(Path(__file__).with_name("_server.py"))
+
+DEFAULT_HANDLER = "handle"
+
+# Last bytes of a server's stderr kept for the error raised when it crashes
+STDERR_TAIL_BYTES = 4 * 1024
+
+FRAMING_JSON = "json"
+FRAMING_MSGPACK = "msgpack"
+FRAMINGS = (FRAMING_JSON, FRAMING_MSGPACK)
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimeoutError(Exception):
+    """Raised when a skill server does not answer a request in time."""
+
+
+class ServerCrashedError(Exception):
+    """Raised when a skill server exits or breaks the protocol."""
+
+
+class _InvalidResponseError(Exception):
+    """A server response frame could not be decoded."""
+
+
+@dataclass(frozen=True)
+class ServerSpec:
+    """
+    Server entry point declared by a skill.
+
+    Attributes:
+        script: Absolute path of the server module
+        handler: Name of the function called for each request
+        concurrency: Requests one server process runs at the same time
+        framing: "json" (newline-delimited JSON) or "msgpack" frames
+    """
+
+    script: Path
+    handler: str = DEFAULT_HANDLER
+    concurrency: int = 1
+    framing: str = FRAMING_JSON
+
+
+def parse_server_spec(skill_info: "SkillInfo") -> Optional[ServerSpec]:
+    """
+    Read the ``server`` entry point from a skill's front matter.
+
+    Returns:
+        ServerSpec, or None if the skill declares no usable Python server
+    """
+    data = front_matter(skill_info.path)
+    if not isinstance(data.get("server"), str):
+        return None
+
+    entry, _, handler = data["server"].strip().partition(":")
+    script = Path(skill_info.path).resolve() / entry
+    if script.suffix != ".py":
+        return None
+    concurrency = data.get("server_concurrency", 1)
+    if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency < 1:
+        concurrency = 1
+    framing = data.get("server_framing", FRAMING_JSON)
+    if framing not in FRAMINGS:
+        framing = FRAMING_JSON
+    return ServerSpec(
+        script=script,
+        handler=handler.strip() or DEFAULT_HANDLER,
+        concurrency=concurrency,
+        framing=framing,
+    )
+
+
+def negotiate_framing(spec: ServerSpec) -> ServerSpec:
+    """Grant the framing a skill asks for, falling back to JSON without msgpack."""
+    if spec.framing == FRAMING_MSGPACK and msgpack_codec() is None:
+        logger.warning(
+            f"Skill server {spec.script} asks for msgpack framing, but neither msgpack "
+            "nor msgspec is installed; using JSON lines"
+        )
+        return replace(spec, framing=FRAMING_JSON)
+    return spec
+
+
+def server_result(response: Dict[str, Any]) -> ExecutionResult:
+    """Convert a server response into an ExecutionResult."""
+    if "error" in response:
+        return ExecutionResult(
+            success=False,
+            error=f"Skill execution failed: {response['error']}",
+            exit_code=1,
+        )
+    output = response.get("output")
+    if output is not None and not isinstance(output, dict):
+        output = {"result": output}
+    return ExecutionResult(success=True, output=output, exit_code=0)
+
+
+def _decode(decode: Any, frame: bytes) -> Dict[str, Any]:
+    """Decode one response frame into a message dict."""
+    try:
+        message = decode(frame)
+    except Exception as e:
+        raise _InvalidResponseError(str(e)) from e
+    if not isinstance(message, dict):
+        raise _InvalidResponseError(f"expected an object, got {type(message).__name__}")
+    return message
+
+
+def _settle(future: "concurrent.futures.Future[Dict[str, Any]]", outcome: Any) -> None:
+    """Resolve a request future unless its caller already gave up on it."""
+    try:
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+    except concurrent.futures.InvalidStateError:
+        pass
+
+
+class _ServerProcess:
+    """
+    One long-lived server process for one skill.
+
+    Requests are written to the server's stdin under a lock; a reader thread
+    matches responses to pending requests by id, so sync and async callers
+    can have several requests in flight on the same process.
+    """
+
+    def __init__(self, config: "PoolConfig", skill_dir: Path, spec: ServerSpec):
+        env = os.environ.copy()
+        env["SKILL_DIR"] = str(skill_dir)
+        env["PYTHONPATH"] = str(skill_dir)
+        env["PYTHONUNBUFFERED"] = "1"
+        env["SKILLLITE_SERVER_SCRIPT"] = str(spec.script)
+        env["SKILLLITE_SERVER_HANDLER"] = spec.handler
+        env["SKILLLITE_SERVER_CONCURRENCY"] = str(spec.concurrency)
+        env["SKILLLITE_SERVER_FRAMING"] = spec.framing
+        if config.max_memory_mb:
+            env["SKILLLITE_WORKER_MAX_MEMORY_MB"] = str(config.max_memory_mb)
+
+        self.process = subprocess.Popen(
+            [config.python_executable, _SERVER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        self.framing = spec.framing
+        self.calls = 0
+        self.last_used = time.monotonic()
+        self._pending: Dict[str, "concurrent.futures.Future[Dict[str, Any]]"] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._exit_reason: Optional[str] = None
+        # Skill output printed to stdout lands on stderr too, so it is drained
+        # continuously and only its tail is kept, for crash reports.
+        self._stderr = bytearray()
+        self._stderr_reader = threading.Thread(
+            target=self._read_stderr,
+            name=f"skilllite-server-{skill_dir.name}-stderr",
+            daemon=True,
+        )
+        self._stderr_reader.start()
+        self._reader = threading.Thread(
+            target=self._read_responses,
+            name=f"skilllite-server-{skill_dir.name}",
+            daemon=True,
+        )
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._exit_reason is None and self.process.poll() is None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def _messages(self) -> Iterator[Dict[str, Any]]:
+        """Yield response messages until the server's stdout ends."""
+        stdout = self.process.stdout
+        if self.framing != FRAMING_MSGPACK:
+            loads = get_serializer().loads
+            for line in stdout:
+                if line.strip():
+                    yield _decode(loads, line)
+            return
+        unpack = msgpack_codec()[1]
+        while True:
+            header = stdout.read(4)
+            if len(header) < 4:
+                return
+            if header[:1] == b"{":
+                # Start-up failures arrive as a JSON line in every framing.
+                yield _decode(json.loads, header + stdout.readline())
+                continue
+            size = int.from_bytes(header, "big")
+            body = stdout.read(size)
+            if len(body) < size:
+                return
+            yield _decode(unpack, body)
+
+    def _read_stderr(self) -> None:
+        stderr = self.process.stderr
+        try:
+            for data in iter(lambda: stderr.read1(READ_SIZE), b""):
+                self._stderr.extend(data)
+                if len(self._stderr) > STDERR_TAIL_BYTES:
+                    del self._stderr[: len(self._stderr) - STDERR_TAIL_BYTES]
+        except (OSError, ValueError):
+            pass
+
+    def _crash_reason(self) -> str:
+        """Why the server's stdout ended, with the tail of its stderr."""
+        reason = "skill server exited unexpectedly"
+        try:
+            returncode = self.process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            returncode = None
+        if returncode is not None:
+            reason += f" (exit code {returncode})"
+        self._stderr_reader.join(timeout=1.0)
+        tail = bytes(self._stderr).decode("utf-8", errors="replace").strip()
+        if tail:
+            reason += f"; stderr:\n{tail}"
+        return reason
+
+    def _read_responses(self) -> None:
+        reason = None
+        try:
+            for message in self._messages():
+                if "fatal" in message:
+                    reason = f"skill server failed to start: {message['fatal']}"
+                    break
+                with self._lock:
+                    future = self._pending.pop(str(message.get("id")), None)
+                if future is not None:
+                    _settle(future, message)
+        except _InvalidResponseError as e:
+            reason = f"invalid skill server response: {e}"
+        except (OSError, ValueError):
+            pass
+
+        if reason is None and self._exit_reason is None:
+            reason = self._crash_reason()
+        with self._lock:
+            if self._exit_reason is None:
+                self._exit_reason = reason
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            _settle(future, ServerCrashedError(self._exit_reason))
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+    def submit(
+        self,
+        input_json: Optional[str] = None,
+        input_file: Optional[str] = None,
+        input_data: Any = None,
+    ) -> Tuple[str, "concurrent.futures.Future[Dict[str, Any]]"]:
+        """
+        Send one request; the returned future resolves with its response.
+
+        Pass exactly one of the input arguments: JSON framing takes
+        ``input_json`` or ``input_file``, msgpack framing ``input_data`` or
+        ``input_file``.
+
+        Args:
+            input_json: The input, already encoded as JSON
+            input_file: JSON file holding a staged input
+            input_data: The input itself (msgpack framing)
+        """
+        future: "concurrent.futures.Future[Dict[str, Any]]" = concurrent.futures.Future()
+        with self._lock:
+            if self._exit_reason is not None:
+                raise ServerCrashedError(self._exit_reason)
+            request_id = str(next(self._ids))
+            line = self._frame(request_id, input_json, input_file, input_data)
+            self._pending[request_id] = future
+            self.calls += 1
+            try:
+                self.process.stdin.write(line)
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                del self._pending[request_id]
+                raise ServerCrashedError(f"server stdin closed: {e}") from e
+        return request_id, future
+
+    def _frame(
+        self,
+        request_id: str,
+        input_json: Optional[str],
+        input_file: Optional[str],
+        input_data: Any,
+    ) -> bytes:
+        """Encode one request in the server's framing."""
+        if self.framing == FRAMING_MSGPACK:
+            request = {"id": request_id}
+            if input_file is not None:
+                request["input_file"] = input_file
+            else:
+                request["input"] = input_data
+            body = msgpack_codec()[0](request)
+            return len(body).to_bytes(4, "big") + body
+        if input_file is not None:
+            body = '"input_file": ' + json.dumps(input_file)
+        else:
+            body = '"input": ' + input_json
+        return ('{"id": "%s", %s}\n' % (request_id, body)).encode("utf-8")
+
+    def _forget(self, request_id: str) -> None:
+        """Stop waiting for a request; its late response is dropped."""
+        with self._lock:
+            self._pending.pop(request_id, None)
+        self.last_used = time.monotonic()
+
+    def call(
+        self,
+        timeout: Optional[float],
+        input_json: Optional[str] = None,
+        input_file: Optional[str] = None,
+        input_data: Any = None,
+    ) -> Dict[str, Any]:
+        """Send a request (see ``submit``) and wait for its response."""
+        request_id, future = self.submit(input_json, input_file, input_data)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            raise ServerTimeoutError() from None
+        finally:
+            self._forget(request_id)
+
+    async def acall(
+        self,
+        timeout: Optional[float],
+        input_json: Optional[str] = None,
+        input_file: Optional[str] = None,
+        input_data: Any = None,
+    ) -> Dict[str, Any]:
+        """Async twin of ``call``; waits without blocking the event loop."""
+        request_id, future = self.submit(input_json, input_file, input_data)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            raise ServerTimeoutError() from None
+        finally:
+            self._forget(request_id)
+
+    def close(self, force: bool = False) -> None:
+        """
+        Stop the server.
+
+        A graceful close ends the server's input: requests already in flight
+        are still answered, then the server exits and the reader reaps it.
+        """
+        with self._lock:
+            if self._exit_reason is None:
+                self._exit_reason = "skill server closed"
+            busy = bool(self._pending)
+        if force and self.process.poll() is None:
+            self.process.kill()
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        if force or busy:
+            return
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class ServerGroup:
+    """
+    The server processes of one skill.
+
+    A call goes to an idle server, to a newly started one while the group
+    is below ``max_size``, or else to the server with the fewest requests
+    in flight.
+    """
+
+    def __init__(self, config: "PoolConfig", skill_dir: Path, spec: ServerSpec):
+        self.config = config
+        self.skill_dir = skill_dir
+        self.spec = spec
+        self._servers: List[_ServerProcess] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def pick(self) -> _ServerProcess:
+        """Choose the server for the next call, starting one if needed."""
+        with self._lock:
+            if self._closed:
+                raise ServerCrashedError("skill server group closed")
+            self._servers = [server for server in self._servers if server.alive]
+            idle = [server for server in self._servers if server.in_flight == 0]
+            if idle:
+                return idle[-1]
+            if len(self._servers) < self.config.max_size:
+                server = _ServerProcess(self.config, self.skill_dir, self.spec)
+                self._servers.append(server)
+                return server
+            return min(self._servers, key=lambda server: server.in_flight)
+
+    def discard(self, server: _ServerProcess) -> None:
+        """Kill a server that timed out; its other requests fail as crashed."""
+        with self._lock:
+            if server in self._servers:
+                self._servers.remove(server)
+        server.close(force=True)
+
+    def warm(self) -> None:
+        """Start servers until the group holds at least min_size of them."""
+        with self._lock:
+            if self._closed:
+                return
+            self._servers = [server for server in self._servers if server.alive]
+            while len(self._servers) < self.config.min_size:
+                self._servers.append(_ServerProcess(self.config, self.skill_dir, self.spec))
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """Close idle servers above min_size that exceeded idle_timeout."""
+        now = time.monotonic() if now is None else now
+        evicted: List[_ServerProcess] = []
+        with self._lock:
+            self._servers = [server for server in self._servers if server.alive]
+            # Servers used least recently go first.
+            for server in sorted(self._servers, key=lambda s: s.last_used):
+                if len(self._servers) <= self.config.min_size:
+                    break
+                if server.in_flight == 0 and now - server.last_used > self.config.idle_timeout:
+                    self._servers.remove(server)
+                    evicted.append(server)
+        for server in evicted:
+            server.close()
+        return len(evicted)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            servers = [server for server in self._servers if server.alive]
+        return {
+            "workers": len(servers),
+            "idle": sum(1 for server in servers if server.in_flight == 0),
+            "in_flight": sum(server.in_flight for server in servers),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            servers, self._servers = self._servers, []
+        for server in servers:
+            server.close()
+
+
+__all__ = [
+    "FRAMINGS",
+    "ServerSpec",
+    "negotiate_framing",
+    "parse_server_spec",
+]
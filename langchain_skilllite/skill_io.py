@@ -0,0 +1,108 @@
+"""
+Fast input/output helpers for skill scripts.
+
+Skill scripts usually read their input with ``json.loads(sys.stdin.read())``
+and print ``json.dumps(result)``. These helpers do the same with ``orjson``
+or ``msgspec`` when the skill's interpreter has one, falling back to the
+standard library, and read a large staged input straight from its file
+(``SKILLLITE_INPUT_FILE``, see ``langchain_skilllite.payload``) instead of
+through ``sys.stdin``.
+
+The module only needs the standard library, so a skill whose environment
+does not have langchain-skilllite installed can ship a copy of this file
+next to its scripts.
+
+Usage (in a skill script):
+    from langchain_skilllite.skill_io import read_input, write_output
+
+    data = read_input()
+    write_output({"result": data["text"].upper()})
+"""
+
+import json
+import os
+import sys
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Same variable as langchain_skilllite.payload.INPUT_FILE_ENV
+INPUT_FILE_ENV = "SKILLLITE_INPUT_FILE"
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or bytes with the fastest available library."""
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        if msgspec is not None:
+            return msgspec.json.decode(data)
+    except (ValueError, getattr(msgspec, "DecodeError", ValueError)):
+        pass
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON with the fastest available library."""
+    try:
+        if orjson is not None:
+            return orjson.dumps(obj)
+        if msgspec is not None:
+            return msgspec.json.encode(obj)
+    except (TypeError, OverflowError, ValueError):
+        pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as JSON text with the fastest available library."""
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def read_input() -> Any:
+    """
+    Read and decode the skill's JSON input.
+
+    Returns:
+        The decoded input ({} when the input is empty)
+    """
+    path = os.environ.get(INPUT_FILE_ENV)
+    if path:
+        with open(path, "rb") as f:
+            raw: Union[str, bytes] = f.read()
+    else:
+        stdin = getattr(sys.stdin, "buffer", sys.stdin)
+        raw = stdin.read()
+    if not raw.strip():
+        return {}
+    return loads(raw)
+
+
+def write_output(obj: Any) -> None:
+    """Write ``obj`` to stdout as one JSON line."""
+    data = dumps_bytes(obj) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        sys.stdout.flush()
+        buffer.write(data)
+        buffer.flush()
+    else:
+        sys.stdout.write(data.decode("utf-8"))
+
+
+__all__ = [
+    "INPUT_FILE_ENV",
+    "dumps",
+    "dumps_bytes",
+    "loads",
+    "read_input",
+    "write_output",
+]
@@ -0,0 +1,450 @@
+"""
+Prepared toolkit snapshots for fast cold starts.
+
+``SkillLiteToolkit.from_directory`` discovers skills, parses their
+front matter and builds tool descriptions in every process. A snapshot
+stores the result once - tool names, descriptions, input schemas, SKILL.md
+content hashes and cached scan verdicts - in a compact binary file that
+workers read through a memory map. Loading only stats each skill to check
+that the snapshot is still current; changed or added skills are re-read,
+removed skills are dropped.
+
+File layout (little endian):
+
+    header   magic, format version, flags, entry count, roots (blob ref)
+    table    one fixed-size record per skill: SKILL.md mtime/size, scripts
+             mtime and (offset, length) references into the blob
+    blob     UTF-8 strings, identical strings stored once
+
+Usage:
+    # At build/deploy time
+    toolkit = SkillLiteToolkit(SkillManager(skills_dir="./skills"), scan_cache=scan_cache)
+    toolkit.export_snapshot("skills.snap", skills_dir="./skills")
+
+    # In every worker
+    tools = SkillLiteToolkit.from_snapshot("skills.snap", sandbox_level=3)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from langchain_skilllite.discovery import _index_entry, _mtime_ns
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+    from langchain_skilllite.scan_cache import ScanCache
+
+SNAPSHOT_MAGIC = b"SKLSNAP\x00"
+SNAPSHOT_VERSION = 1
+
+# Header flag: descriptions are front-matter descriptions (lazy toolkits)
+FLAG_FRONT_MATTER_DESCRIPTIONS = 1
+
+VALIDATE_MODES = ("none", "stat", "hash")
+
+# magic, version, flags, entry count, roots offset, roots length
+_HEADER = struct.Struct("<8sHHIII")
+# SKILL.md mtime_ns, size, scripts/ mtime_ns (-1 = none), then (offset, length)
+# of: name, path, entry point, SKILL.md hash, description, tool description,
+# input schema (JSON), scan content hash, scan verdict (JSON)
+_ENTRY = struct.Struct("<qqq" + "II" * 9)
+_NO_VALUE = 0xFFFFFFFF
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is missing, truncated or of another version."""
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """
+    One skill in a snapshot.
+
+    Attributes:
+        name: Skill (and tool) name
+        path: Skill directory
+        entry_point: Entry point script, relative to the skill directory
+        skill_hash: SHA-256 of SKILL.md
+        description: Front-matter description
+        tool_description: Description the tool is built with
+        input_schema: ``input_schema`` declared in SKILL.md, if any
+        scan_hash: ScanCache content hash of the skill's scripts, if exported
+        verdict: Cached scan verdict for ``scan_hash``, if any
+        mtime_ns: SKILL.md mtime when the snapshot was taken
+        size: SKILL.md size when the snapshot was taken
+        scripts_mtime_ns: mtime of the scripts directory (None if absent)
+    """
+
+    name: str
+    path: Path
+    entry_point: str
+    skill_hash: str
+    description: Optional[str]
+    tool_description: str
+    input_schema: Optional[Dict[str, Any]]
+    scan_hash: Optional[str]
+    verdict: Optional[Dict[str, Any]]
+    mtime_ns: int
+    size: int
+    scripts_mtime_ns: Optional[int]
+
+    def index_entry(self) -> Dict[str, Any]:
+        """The entry in the form LazySkillRegistry registers."""
+        return {
+            "path": str(self.path),
+            "name": self.name,
+            "description": self.description,
+            "entry_point": self.entry_point,
+        }
+
+
+@dataclass(frozen=True)
+class ToolkitSnapshot:
+    """
+    Contents of a snapshot file, after validation.
+
+    Attributes:
+        entries: Skills in the snapshot
+        roots: Skills directories the snapshot was taken from
+        front_matter_descriptions: Whether tool descriptions are front-matter
+            descriptions (lazy toolkits) rather than full SKILL.md content
+        refreshed: Skills re-read from disk because they changed
+        added: Skills found in ``roots`` that were not in the file
+        removed: Skills in the file whose directory no longer exists
+    """
+
+    entries: Tuple[SnapshotEntry, ...]
+    roots: Tuple[Path, ...] = ()
+    front_matter_descriptions: bool = False
+    refreshed: Tuple[str, ...] = ()
+    added: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+
+
+# ==================== Building entries ====================
+
+
+def _tool_description(
+    name: str, description: Optional[str], full_content: str, front_matter: bool
+) -> str:
+    """Same rule as SkillLiteToolkit._build_tool."""
+    if front_matter:
+        full_content = ""
+    return full_content or description or f"Execute the {name} skill"
+
+
+def entry_from_disk(skill_dir: Path, front_matter_descriptions: bool) -> SnapshotEntry:
+    """Read one skill from disk into a snapshot entry (no scan verdict)."""
+    from skilllite.core.metadata import parse_skill_metadata
+
+    index = _index_entry(skill_dir)
+    full_content = "" if front_matter_descriptions else (skill_dir / "SKILL.md").read_text(
+        encoding="utf-8"
+    )
+    return SnapshotEntry(
+        name=index["name"],
+        path=skill_dir,
+        entry_point=index["entry_point"],
+        skill_hash=index["hash"],
+        description=index["description"],
+        tool_description=_tool_description(
+            index["name"], index["description"], full_content, front_matter_descriptions
+        ),
+        input_schema=parse_skill_metadata(skill_dir).input_schema,
+        scan_hash=None,
+        verdict=None,
+        mtime_ns=index["mtime_ns"],
+        size=index["size"],
+        scripts_mtime_ns=index["scripts_mtime_ns"],
+    )
+
+
+def entry_from_skill(
+    skill_info: "SkillInfo",
+    tool_description: str,
+    scan_cache: Optional["ScanCache"] = None,
+) -> SnapshotEntry:
+    """
+    Build a snapshot entry for a registered skill.
+
+    Args:
+        skill_info: Skill to record
+        tool_description: Description of the skill's tool
+        scan_cache: Optional ScanCache whose verdict for the skill is recorded
+    """
+    skill_dir = Path(skill_info.path).resolve()
+    index = _index_entry(skill_dir)
+    scan_hash = verdict = None
+    if scan_cache is not None:
+        scan_hash = scan_cache.content_hash(skill_info)
+        verdict = scan_cache.get(scan_hash)
+    return SnapshotEntry(
+        name=skill_info.name,
+        path=skill_dir,
+        entry_point=index["entry_point"],
+        skill_hash=index["hash"],
+        description=skill_info.description,
+        tool_description=tool_description,
+        input_schema=skill_info.metadata.input_schema,
+        scan_hash=scan_hash,
+        verdict=verdict,
+        mtime_ns=index["mtime_ns"],
+        size=index["size"],
+        scripts_mtime_ns=index["scripts_mtime_ns"],
+    )
+
+
+# ==================== Writing ====================
+
+
+class _Blob:
+    """String table; identical strings are stored once."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self._offsets: Dict[bytes, int] = {}
+
+    def add(self, value: Optional[str]) -> Tuple[int, int]:
+        if value is None:
+            return _NO_VALUE, 0
+        raw = value.encode("utf-8")
+        offset = self._offsets.get(raw)
+        if offset is None:
+            offset = self._offsets[raw] = len(self.data)
+            self.data += raw
+        return offset, len(raw)
+
+    def add_json(self, value: Any) -> Tuple[int, int]:
+        if value is None:
+            return _NO_VALUE, 0
+        return self.add(json.dumps(value, sort_keys=True, separators=(",", ":")))
+
+
+def write_snapshot(
+    path: Union[str, Path],
+    entries: Iterable[SnapshotEntry],
+    roots: Sequence[Union[str, Path]] = (),
+    front_matter_descriptions: bool = False,
+) -> int:
+    """
+    Write a snapshot file atomically.
+
+    Args:
+        path: Destination file
+        entries: Skills to store
+        roots: Skills directories scanned for added skills when loading
+        front_matter_descriptions: Whether descriptions come from front matter
+
+    Returns:
+        Number of entries written
+    """
+    entries = list(entries)
+    blob = _Blob()
+    table = bytearray()
+    for entry in entries:
+        refs = (
+            blob.add(entry.name),
+            blob.add(str(entry.path)),
+            blob.add(entry.entry_point),
+            blob.add(entry.skill_hash),
+            blob.add(entry.description),
+            blob.add(entry.tool_description),
+            blob.add_json(entry.input_schema),
+            blob.add(entry.scan_hash),
+            blob.add_json(entry.verdict),
+        )
+        scripts_mtime = -1 if entry.scripts_mtime_ns is None else entry.scripts_mtime_ns
+        table += _ENTRY.pack(
+            entry.mtime_ns, entry.size, scripts_mtime, *(v for ref in refs for v in ref)
+        )
+    roots_ref = blob.add_json([str(Path(root).resolve()) for root in roots])
+    flags = FLAG_FRONT_MATTER_DESCRIPTIONS if front_matter_descriptions else 0
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, len(entries), *roots_ref)
+
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(table)
+            f.write(blob.data)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return len(entries)
+
+
+# ==================== Reading ====================
+
+
+def read_snapshot(path: Union[str, Path]) -> ToolkitSnapshot:
+    """
+    Read a snapshot file through a memory map (no validation).
+
+    Raises:
+        SnapshotError: If the file is missing, truncated or of another version
+    """
+    path = Path(path).expanduser()
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise SnapshotError(f"Snapshot is truncated: {path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return _parse(view, path)
+    except OSError as e:
+        raise SnapshotError(f"Cannot read snapshot {path}: {e}") from e
+
+
+def _parse(view: mmap.mmap, path: Path) -> ToolkitSnapshot:
+    magic, version, flags, count, *roots_ref = _HEADER.unpack_from(view, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError(f"Not a SkillLite snapshot: {path}")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}: {path}")
+    blob_start = _HEADER.size + count * _ENTRY.size
+    if blob_start > len(view):
+        raise SnapshotError(f"Snapshot is truncated: {path}")
+
+    def text(offset: int, length: int) -> Optional[str]:
+        if offset == _NO_VALUE:
+            return None
+        start = blob_start + offset
+        if start + length > len(view):
+            raise SnapshotError(f"Snapshot is truncated: {path}")
+        return view[start:start + length].decode("utf-8")
+
+    def document(offset: int, length: int) -> Any:
+        value = text(offset, length)
+        return None if value is None else json.loads(value)
+
+    entries = []
+    for index in range(count):
+        mtime_ns, size, scripts_mtime, *refs = _ENTRY.unpack_from(
+            view, _HEADER.size + index * _ENTRY.size
+        )
+        pairs = list(zip(refs[0::2], refs[1::2]))
+        entries.append(
+            SnapshotEntry(
+                name=text(*pairs[0]) or "",
+                path=Path(text(*pairs[1]) or ""),
+                entry_point=text(*pairs[2]) or "",
+                skill_hash=text(*pairs[3]) or "",
+                description=text(*pairs[4]),
+                tool_description=text(*pairs[5]) or "",
+                input_schema=document(*pairs[6]),
+                scan_hash=text(*pairs[7]),
+                verdict=document(*pairs[8]),
+                mtime_ns=mtime_ns,
+                size=size,
+                scripts_mtime_ns=None if scripts_mtime < 0 else scripts_mtime,
+            )
+        )
+    return ToolkitSnapshot(
+        entries=tuple(entries),
+        roots=tuple(Path(root) for root in document(*roots_ref) or ()),
+        front_matter_descriptions=bool(flags & FLAG_FRONT_MATTER_DESCRIPTIONS),
+    )
+
+
+# ==================== Validation ====================
+
+
+def _is_current(entry: SnapshotEntry, mode: str) -> bool:
+    skill_md = entry.path / "SKILL.md"
+    stat = skill_md.stat()
+    if (
+        stat.st_mtime_ns != entry.mtime_ns
+        or stat.st_size != entry.size
+        or _mtime_ns(entry.path / "scripts") != entry.scripts_mtime_ns
+    ):
+        return False
+    if mode == "hash":
+        return hashlib.sha256(skill_md.read_bytes()).hexdigest() == entry.skill_hash
+    return True
+
+
+def validate_snapshot(snapshot: ToolkitSnapshot, mode: str = "stat") -> ToolkitSnapshot:
+    """
+    Bring a snapshot up to date with the skills on disk.
+
+    Args:
+        snapshot: Snapshot as read from the file
+        mode: "stat" compares SKILL.md mtime/size and the scripts directory
+            mtime, "hash" additionally re-hashes SKILL.md, "none" trusts
+            the snapshot as-is
+
+    Returns:
+        Snapshot with changed skills re-read, removed skills dropped and
+        skills added to the snapshot's roots included
+    """
+    if mode not in VALIDATE_MODES:
+        raise ValueError(f"validate must be one of {', '.join(VALIDATE_MODES)}")
+    if mode == "none":
+        return snapshot
+
+    front_matter = snapshot.front_matter_descriptions
+    entries: List[SnapshotEntry] = []
+    refreshed: List[str] = []
+    removed: List[str] = []
+    for entry in snapshot.entries:
+        try:
+            if _is_current(entry, mode):
+                entries.append(entry)
+                continue
+            entries.append(entry_from_disk(entry.path, front_matter))
+            refreshed.append(entry.name)
+        except OSError:
+            removed.append(entry.name)
+
+    added: List[str] = []
+    known = {entry.path for entry in snapshot.entries}
+    for root in snapshot.roots:
+        try:
+            children = sorted(root.iterdir())
+        except OSError:
+            continue
+        for skill_dir in children:
+            if skill_dir in known or not (skill_dir / "SKILL.md").is_file():
+                continue
+            try:
+                entry = entry_from_disk(skill_dir, front_matter)
+            except Exception:
+                continue
+            if entry.entry_point:
+                entries.append(entry)
+                added.append(entry.name)
+
+    return replace(
+        snapshot,
+        entries=tuple(entries),
+        refreshed=tuple(refreshed),
+        added=tuple(added),
+        removed=tuple(removed),
+    )
+
+
+def load_snapshot(path: Union[str, Path], validate: str = "stat") -> ToolkitSnapshot:
+    """Read and validate a snapshot file (see ``validate_snapshot``)."""
+    return validate_snapshot(read_snapshot(path), validate)
+
+
+__all__ = [
+    "SnapshotEntry",
+    "SnapshotError",
+    "ToolkitSnapshot",
+    "load_snapshot",
+    "read_snapshot",
+    "validate_snapshot",
+    "write_snapshot",
+]
@@ -0,0 +1,384 @@
+"""
+Incremental skill output.
+
+Skill scripts write their result to stdout. Without streaming, a tool call
+returns nothing until the process exits and the whole output is held in
+memory. With ``SkillLiteTool(streaming=True)`` (or a ``max_output_bytes``
+cap) stdout is read as it is produced:
+
+- each chunk (``stream_mode="text"``) or each parsed NDJSON record
+  (``stream_mode="ndjson"``) is reported as a ``skilllite_stream`` custom
+  event, which SkillLiteCallbackHandler receives as ``on_tool_stream``;
+- output beyond ``max_output_bytes`` is dropped as it arrives instead of
+  being buffered, and the result is marked as truncated;
+- ``SkillLiteTool.stream_output`` / ``astream_output`` iterate over the
+  chunks of one call.
+
+Streaming works on the warm worker pool and on the skillbox subprocess
+path. The executing code picks up the active OutputStream through a context
+variable, like the phase timer in ``timing``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import inspect
+import json
+import os
+import select
+import subprocess
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+from skilllite.sandbox.base import ExecutionResult
+
+from langchain_skilllite.timing import (
+    PHASE_EXECUTION,
+    PHASE_OUTPUT_PARSING,
+    PHASE_SANDBOX_SPAWN,
+    phase,
+)
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+    from skilllite.sandbox.context import ExecutionContext
+
+# Custom event carrying one chunk (or NDJSON record) of a tool run's output
+STREAM_EVENT = "skilllite_stream"
+
+STREAM_MODES = ("text", "ndjson")
+
+READ_SIZE = 64 * 1024
+
+# stderr is only kept for error messages: its last bytes are enough
+STDERR_TAIL_BYTES = 64 * 1024
+
+_active: ContextVar[Optional["OutputStream"]] = ContextVar("skilllite_output", default=None)
+
+
+class OutputStream:
+    """
+    Receives a skill's stdout incrementally and keeps at most ``max_bytes``.
+
+    Bytes beyond the cap are counted and dropped. Kept bytes are decoded
+    incrementally and handed to ``on_chunk`` as text chunks, or as NDJSON
+    records (parsed JSON, or the raw line when it is not JSON).
+
+    Attributes:
+        mode: "text" or "ndjson"
+        max_bytes: Cap on kept stdout bytes (None = no cap)
+        kept_bytes: Bytes of stdout kept so far
+        dropped_bytes: Bytes of stdout dropped by the cap
+        chunks: Chunks (or records) handed to ``on_chunk``
+    """
+
+    def __init__(
+        self,
+        on_chunk: Optional[Callable[[Any], Any]] = None,
+        max_bytes: Optional[int] = None,
+        mode: str = "text",
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            on_chunk: Called with each chunk or record; may return an awaitable
+                when the stream is fed through ``afeed``
+            max_bytes: Cap on kept stdout bytes (None = no cap)
+            mode: "text" for raw chunks, "ndjson" for one record per line
+
+        Raises:
+            ValueError: If mode is unknown or max_bytes is negative
+        """
+        if mode not in STREAM_MODES:
+            raise ValueError(f"stream mode must be one of {', '.join(STREAM_MODES)}")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self.on_chunk = on_chunk
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.kept_bytes = 0
+        self.dropped_bytes = 0
+        self.chunks = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._parts: List[str] = []
+        self._partial_line = ""
+
+    @property
+    def truncated(self) -> bool:
+        return self.dropped_bytes > 0
+
+    @property
+    def text(self) -> str:
+        """Kept stdout, decoded."""
+        return "".join(self._parts)
+
+    def _accept(self, data: bytes, final: bool = False) -> List[Any]:
+        if self.max_bytes is not None:
+            room = max(self.max_bytes - self.kept_bytes, 0)
+            if len(data) > room:
+                self.dropped_bytes += len(data) - room
+                data = data[:room]
+        self.kept_bytes += len(data)
+        text = self._decoder.decode(data, final)
+        if text:
+            self._parts.append(text)
+        if self.mode == "text":
+            return [text] if text else []
+
+        lines = (self._partial_line + text).split("\n")
+        self._partial_line = "" if final else lines.pop()
+        records = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                records.append(line)
+        return records
+
+    def feed(self, data: bytes) -> None:
+        """Add stdout bytes, calling ``on_chunk`` synchronously."""
+        for chunk in self._accept(data):
+            self._emit(chunk)
+
+    async def afeed(self, data: bytes) -> None:
+        """Add stdout bytes, awaiting ``on_chunk`` when it is async."""
+        for chunk in self._accept(data):
+            outcome = self._emit(chunk)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+    def close(self) -> None:
+        """Flush a trailing partial character or NDJSON line."""
+        for chunk in self._accept(b"", final=True):
+            self._emit(chunk)
+
+    async def aclose(self) -> None:
+        """Async twin of ``close``."""
+        for chunk in self._accept(b"", final=True):
+            outcome = self._emit(chunk)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+    def _emit(self, chunk: Any) -> Any:
+        self.chunks += 1
+        if self.on_chunk is not None:
+            return self.on_chunk(chunk)
+        return None
+
+    def apply(self, result: ExecutionResult) -> ExecutionResult:
+        """Mark a result parsed from the kept output as truncated, if it was."""
+        if not self.truncated:
+            return result
+        output = dict(result.output) if isinstance(result.output, dict) else {"result": self.text}
+        output["truncated"] = True
+        output["dropped_bytes"] = self.dropped_bytes
+        return replace(result, output=output)
+
+
+@contextmanager
+def output_stream(stream: Optional[OutputStream]) -> Iterator[Optional[OutputStream]]:
+    """
+    Make ``stream`` the destination of skill output executed in this context.
+
+    None marks output of this context as neither streamed nor capped, so a
+    tool run nested in a streaming one does not write to its stream.
+    """
+    token = _active.set(stream)
+    try:
+        yield stream
+    finally:
+        _active.reset(token)
+
+
+def active_stream() -> Optional[OutputStream]:
+    """OutputStream of the current tool run, if it streams or caps output."""
+    return _active.get()
+
+
+def _keep_tail(buffer: bytearray, data: bytes) -> None:
+    buffer.extend(data)
+    if len(buffer) > STDERR_TAIL_BYTES:
+        del buffer[: len(buffer) - STDERR_TAIL_BYTES]
+
+
+def _timed_out(timeout: Optional[float]) -> ExecutionResult:
+    return ExecutionResult(
+        success=False,
+        error=f"Execution timed out after {timeout} seconds",
+        exit_code=-1,
+    )
+
+
+def _spawn_failed(cmd: List[str], error: Exception) -> ExecutionResult:
+    if isinstance(error, FileNotFoundError):
+        return ExecutionResult(
+            success=False,
+            error=f"skillbox binary not found at: {cmd[0]}",
+            exit_code=-1,
+        )
+    return ExecutionResult(success=False, error=f"Execution failed: {str(error)}", exit_code=-1)
+
+
+def _command(context: "ExecutionContext", skill_info: "SkillInfo", input_data: Dict[str, Any]):
+    from skilllite.sandbox.execution_service import UnifiedExecutionService
+
+    executor = UnifiedExecutionService.get_instance()._executor
+    cmd = executor._build_run_command(context, skill_info.path, input_data)
+    env = executor._build_env(context, skill_info.path)
+    return executor, cmd, env
+
+
+def run_skill(
+    context: "ExecutionContext",
+    skill_info: "SkillInfo",
+    input_data: Dict[str, Any],
+    stream: OutputStream,
+) -> ExecutionResult:
+    """
+    Execute a skill through skillbox, feeding stdout to ``stream`` as it arrives.
+
+    Like ``async_execution.run_skill``, the caller runs the level 3
+    security flow first and passes the resulting context.
+    """
+    executor, cmd, env = _command(context, skill_info, input_data)
+    try:
+        with phase(PHASE_SANDBOX_SPAWN):
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+            )
+    except Exception as e:
+        return _spawn_failed(cmd, e)
+
+    stderr = bytearray()
+    deadline = None if context.timeout is None else time.monotonic() + context.timeout
+    try:
+        with phase(PHASE_EXECUTION):
+            try:
+                process.stdin.write(json.dumps(input_data).encode("utf-8"))
+                process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+            streams = {process.stdout.fileno(): True, process.stderr.fileno(): False}
+            while streams:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise subprocess.TimeoutExpired(cmd, context.timeout)
+                ready, _, _ = select.select(list(streams), [], [], remaining)
+                for fd in ready:
+                    data = os.read(fd, READ_SIZE)
+                    if not data:
+                        del streams[fd]
+                    elif streams[fd]:
+                        stream.feed(data)
+                    else:
+                        _keep_tail(stderr, data)
+            stream.close()
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            returncode = process.wait(remaining)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        return _timed_out(context.timeout)
+    except BaseException:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        raise
+    finally:
+        for pipe in (process.stdout, process.stderr):
+            pipe.close()
+
+    with phase(PHASE_OUTPUT_PARSING):
+        result = executor._parse_output(
+            stream.text, stderr.decode("utf-8", errors="replace"), returncode
+        )
+    return stream.apply(result)
+
+
+async def arun_skill(
+    context: "ExecutionContext",
+    skill_info: "SkillInfo",
+    input_data: Dict[str, Any],
+    stream: OutputStream,
+) -> ExecutionResult:
+    """Async twin of ``run_skill`` built on asyncio subprocesses."""
+    executor, cmd, env = _command(context, skill_info, input_data)
+    try:
+        with phase(PHASE_SANDBOX_SPAWN):
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+    except Exception as e:
+        return _spawn_failed(cmd, e)
+
+    stderr = bytearray()
+
+    async def read_stderr() -> None:
+        while True:
+            data = await process.stderr.read(READ_SIZE)
+            if not data:
+                return
+            _keep_tail(stderr, data)
+
+    async def communicate() -> int:
+        try:
+            process.stdin.write(json.dumps(input_data).encode("utf-8"))
+            await process.stdin.drain()
+            process.stdin.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        stderr_task = asyncio.ensure_future(read_stderr())
+        try:
+            while True:
+                data = await process.stdout.read(READ_SIZE)
+                if not data:
+                    break
+                await stream.afeed(data)
+            await stream.aclose()
+            await stderr_task
+        finally:
+            stderr_task.cancel()
+        return await process.wait()
+
+    try:
+        with phase(PHASE_EXECUTION):
+            returncode = await asyncio.wait_for(communicate(), context.timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return _timed_out(context.timeout)
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    with phase(PHASE_OUTPUT_PARSING):
+        result = executor._parse_output(
+            stream.text, stderr.decode("utf-8", errors="replace"), returncode
+        )
+    return stream.apply(result)
+
+
+__all__ = [
+    "STREAM_EVENT",
+    "OutputStream",
+    "active_stream",
+    "output_stream",
+]
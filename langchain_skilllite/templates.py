@@ -0,0 +1,323 @@
+"""
+Prebuilt execution templates and explicit warmup.
+
+The first call of a skill pays for everything its environment needs before
+the script can run: the dependency virtualenv is created and populated (the
+sandbox does this lazily, on the first execution of every new dependency
+set), the interpreter is started cold, and on the pooled path the workers
+are spawned. That makes the first call after a deploy an outlier by seconds
+or minutes.
+
+A SandboxTemplate is the reusable part of that work for one skill: the
+resolved dependency list, the prepared virtualenv (in the same environment
+cache skillbox uses, so sandbox levels 2 and 3 find it ready), a validated
+interpreter and the resolved entry script. Templates are cached per skill
+and stay valid until SKILL.md or ``.skilllite.lock`` change; skills with
+the same dependency set share one environment.
+
+``SkillLiteToolkit.warmup()`` prepares the templates of its skills up front,
+registers their interpreters with the worker pool (so skills with
+dependencies can be pooled too) and starts the pooled workers, reporting
+how long each step took.
+
+Usage:
+    from langchain_skilllite import SkillLiteToolkit
+
+    toolkit = SkillLiteToolkit(manager, sandbox_level=1, pool=SkillWorkerPool())
+    report = toolkit.warmup()
+    print(report.timings)   # {"pdf-extract": {"dependencies": 41.2, ...}, ...}
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from skilllite import SkillInfo
+
+logger = logging.getLogger(__name__)
+
+PHASE_DEPENDENCIES = "dependencies"
+PHASE_INTERPRETER = "interpreter"
+PHASE_WORKERS = "workers"
+PHASE_TOTAL = "total"
+
+LOCK_FILE_NAME = ".skilllite.lock"
+
+_VERSION_PROBE = "import sys; print('%d.%d.%d' % sys.version_info[:3])"
+
+
+class TemplateError(Exception):
+    """A skill's execution environment could not be prepared."""
+
+
+def _fingerprint(skill_dir: Path) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(mtime_ns, size) of the files a template depends on (None if missing)."""
+    stats = []
+    for name in ("SKILL.md", LOCK_FILE_NAME):
+        try:
+            stat = (skill_dir / name).stat()
+            stats.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stats.append(None)
+    return tuple(stats)
+
+
+@dataclass(frozen=True)
+class SandboxTemplate:
+    """
+    Prepared execution environment of one skill.
+
+    Attributes:
+        skill_name: Name of the skill
+        skill_dir: Resolved skill directory
+        entry_script: Absolute entry script (None if the skill has none)
+        language: Dependency language ("python", "node", ...)
+        packages: Resolved dependencies (empty = runs on the host interpreter)
+        env_path: Prepared environment in the shared env cache (None = no dependencies)
+        python: Validated interpreter for the skill's Python scripts
+        python_version: Version reported by ``python``
+        fingerprint: Stats of SKILL.md and the lock file the template was built from
+        timings: Seconds spent per preparation step
+    """
+
+    skill_name: str
+    skill_dir: Path
+    entry_script: Optional[Path]
+    language: str
+    packages: Tuple[str, ...]
+    env_path: Optional[Path]
+    python: str
+    python_version: str
+    fingerprint: Tuple[Optional[Tuple[int, int]], ...]
+    timings: Dict[str, float] = field(default_factory=dict, compare=False)
+
+    @property
+    def isolated(self) -> bool:
+        """True when the skill runs on its own dependency environment."""
+        return self.env_path is not None
+
+    def is_current(self) -> bool:
+        """Check that the skill's declaration is unchanged and the environment still exists."""
+        if _fingerprint(self.skill_dir) != self.fingerprint:
+            return False
+        return Path(self.python).exists() if self.isolated else True
+
+
+def _resolve_packages(skill_dir: Path) -> Tuple[str, List[str]]:
+    """Dependencies of a skill, resolved the way the sandbox resolves them."""
+    from skilllite.core.metadata import parse_skill_metadata
+
+    try:
+        from skilllite.cli.init import parse_compatibility_for_packages
+    except ImportError:
+        parse_compatibility_for_packages = None
+
+    try:
+        metadata = parse_skill_metadata(skill_dir)
+    except Exception as e:
+        raise TemplateError(f"Cannot parse SKILL.md of {skill_dir.name}: {e}") from e
+
+    # The lock file wins over the compatibility whitelist, as in skillbox.
+    packages = metadata.resolved_packages
+    if packages is None and parse_compatibility_for_packages is not None:
+        packages = parse_compatibility_for_packages(metadata.compatibility)
+    return metadata.language or "python", list(packages or [])
+
+
+def _environment_path(language: str, packages: List[str]) -> Path:
+    """Location of the environment for a dependency set in the shared cache."""
+    from skilllite.cli.init import _compute_packages_hash, _get_cache_dir, _get_cache_key
+
+    return _get_cache_dir() / _get_cache_key(language, _compute_packages_hash(packages))
+
+
+def _venv_python(env_path: Path) -> Path:
+    return env_path / ("Scripts" if os.name == "nt" else "bin") / "python"
+
+
+class TemplateCache:
+    """
+    Cache of SandboxTemplates, keyed by skill directory.
+
+    Thread-safe; concurrent preparations of skills with the same
+    dependency set build the shared environment once.
+
+    Attributes:
+        python_executable: Interpreter for skills without dependencies
+        probe_timeout: Seconds allowed for validating an interpreter
+    """
+
+    def __init__(self, python_executable: Optional[str] = None, probe_timeout: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            python_executable: Host interpreter (default: sys.executable)
+            probe_timeout: Seconds allowed for validating an interpreter
+        """
+        self.python_executable = python_executable or sys.executable
+        self.probe_timeout = probe_timeout
+        self._templates: Dict[str, SandboxTemplate] = {}
+        # interpreter -> version, so shared environments are probed once
+        self._versions: Dict[str, str] = {}
+        self._env_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, skill_info: "SkillInfo") -> Optional[SandboxTemplate]:
+        """Return the skill's template if one was prepared and is still current."""
+        with self._lock:
+            template = self._templates.get(str(Path(skill_info.path).resolve()))
+        return template if template is not None and template.is_current() else None
+
+    def prepare(self, skill_info: "SkillInfo") -> SandboxTemplate:
+        """
+        Return the skill's template, building it if missing or stale.
+
+        Args:
+            skill_info: Skill to prepare
+
+        Returns:
+            SandboxTemplate; its ``timings`` show the cost of the build that
+            produced it (a cached template is returned unchanged)
+
+        Raises:
+            TemplateError: If dependencies cannot be installed or the
+                interpreter does not start
+        """
+        template = self.get(skill_info)
+        if template is not None:
+            return template
+
+        skill_dir = Path(skill_info.path).resolve()
+        fingerprint = _fingerprint(skill_dir)
+        timings: Dict[str, float] = {}
+
+        started = time.perf_counter()
+        language, packages = _resolve_packages(skill_dir)
+        env_path = self._ensure_environment(language, packages) if packages else None
+        timings[PHASE_DEPENDENCIES] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        python = str(_venv_python(env_path)) if env_path and language == "python" else self.python_executable
+        version = self._validate(python)
+        timings[PHASE_INTERPRETER] = time.perf_counter() - started
+
+        metadata = getattr(skill_info, "metadata", None)
+        entry_point = getattr(metadata, "entry_point", None) if metadata else None
+        template = SandboxTemplate(
+            skill_name=skill_info.name,
+            skill_dir=skill_dir,
+            entry_script=skill_dir / entry_point if entry_point else None,
+            language=language,
+            packages=tuple(sorted(packages)),
+            env_path=env_path,
+            python=python,
+            python_version=version,
+            fingerprint=fingerprint,
+            timings=timings,
+        )
+        with self._lock:
+            self._templates[str(skill_dir)] = template
+        return template
+
+    def _ensure_environment(self, language: str, packages: List[str]) -> Path:
+        """Create (or reuse) the cached environment for a dependency set."""
+        try:
+            from skilllite.cli.init import _ensure_python_env
+        except ImportError as e:
+            raise TemplateError(f"Dependency environments are not available: {e}") from e
+        if language != "python":
+            raise TemplateError(f"Cannot prebuild {language} dependencies")
+
+        env_path = _environment_path(language, packages)
+        with self._lock:
+            env_lock = self._env_locks.setdefault(str(env_path), threading.Lock())
+        with env_lock:
+            try:
+                env_path.parent.mkdir(parents=True, exist_ok=True)
+                _ensure_python_env(env_path, packages)
+            except (OSError, RuntimeError) as e:
+                raise TemplateError(f"Failed to prepare environment {env_path.name}: {e}") from e
+        return env_path
+
+    def _validate(self, python: str) -> str:
+        """Start the interpreter once and return its version."""
+        with self._lock:
+            version = self._versions.get(python)
+        if version is not None:
+            return version
+        try:
+            completed = subprocess.run(
+                [python, "-c", _VERSION_PROBE],
+                capture_output=True,
+                text=True,
+                timeout=self.probe_timeout,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise TemplateError(f"Interpreter {python} did not start: {e}") from e
+        if completed.returncode != 0:
+            raise TemplateError(
+                f"Interpreter {python} exited with code {completed.returncode}: "
+                f"{completed.stderr.strip()}"
+            )
+        version = completed.stdout.strip()
+        with self._lock:
+            self._versions[python] = version
+        return version
+
+    def invalidate(self, skill_dir: Union[str, Path]) -> None:
+        """Forget the template of one skill (the shared environment is kept)."""
+        with self._lock:
+            self._templates.pop(str(Path(skill_dir).resolve()), None)
+
+    def templates(self) -> List[SandboxTemplate]:
+        """Return all prepared templates."""
+        with self._lock:
+            return list(self._templates.values())
+
+
+@dataclass
+class WarmupReport:
+    """
+    Outcome of ``SkillLiteToolkit.warmup``.
+
+    Attributes:
+        timings: Seconds per step ("dependencies", "interpreter", "workers",
+            "total") for each skill that was prepared
+        errors: Error message for each skill that could not be prepared
+        elapsed: Wall-clock seconds for the whole warmup
+    """
+
+    timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True when every skill was prepared."""
+        return not self.errors
+
+    def slowest(self, n: int = 5) -> List[Tuple[str, float]]:
+        """The ``n`` skills that took longest to prepare, slowest first."""
+        totals = [(name, steps.get(PHASE_TOTAL, 0.0)) for name, steps in self.timings.items()]
+        return sorted(totals, key=lambda item: item[1], reverse=True)[:n]
+
+
+__all__ = [
+    "SandboxTemplate",
+    "TemplateCache",
+    "TemplateError",
+    "WarmupReport",
+]
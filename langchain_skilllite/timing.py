@@ -0,0 +1,157 @@
+"""
+Latency measurement for SkillLite tool runs.
+
+Two building blocks:
+
+- ``collect_phases()`` / ``phase(name)``: a context-local phase timer.
+  SkillLiteTool opens a collector around each run, and the execution code
+  wraps its steps (queue wait, security scan, confirmation wait, sandbox
+  spawn, execution, output parsing) in ``phase`` blocks. Outside a collector,
+  ``phase`` costs a single context-variable lookup.
+- ``LatencyHistogram``: an HDR-style log-linear histogram with bounded
+  relative error, used by SkillLiteCallbackHandler to report p50/p95/p99
+  per tool and per phase.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+
+# Custom event carrying the phase breakdown and outcome (``success``) of one tool run
+TIMING_EVENT = "skilllite_timing"
+
+PHASE_QUEUE_WAIT = "queue_wait"
+PHASE_SECURITY_SCAN = "security_scan"
+PHASE_CONFIRMATION_WAIT = "confirmation_wait"
+PHASE_SANDBOX_SPAWN = "sandbox_spawn"
+PHASE_EXECUTION = "execution"
+PHASE_OUTPUT_PARSING = "output_parsing"
+
+_phases: ContextVar[Optional[Dict[str, float]]] = ContextVar("skilllite_phases", default=None)
+
+
+@contextmanager
+def collect_phases() -> Iterator[Dict[str, float]]:
+    """Collect the durations of ``phase`` blocks run inside this context."""
+    phases: Dict[str, float] = {}
+    token = _phases.set(phases)
+    try:
+        yield phases
+    finally:
+        _phases.reset(token)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block and add its duration to the active collector, if any."""
+    phases = _phases.get()
+    if phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram.
+
+    Values are recorded in microseconds into log-linear buckets: each power
+    of two is split into ``2 ** sub_bucket_bits`` linear sub-buckets, so
+    every reported percentile is within ``2 ** -sub_bucket_bits`` relative
+    error (under 1% by default) while memory stays bounded.
+
+    Attributes:
+        count: Number of recorded values
+        total: Sum of recorded values, in seconds
+        min: Smallest recorded value, in seconds
+        max: Largest recorded value, in seconds
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        if sub_bucket_bits < 1:
+            raise ValueError("sub_bucket_bits must be >= 1")
+        self.sub_bucket_bits = sub_bucket_bits
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: Dict[Tuple[int, int], int] = {}
+
+    def _bucket(self, micros: int) -> Tuple[int, int]:
+        exponent = micros.bit_length() - 1
+        if exponent < self.sub_bucket_bits:
+            return (0, micros)
+        return (exponent, micros >> (exponent - self.sub_bucket_bits))
+
+    def _bucket_value(self, bucket: Tuple[int, int]) -> float:
+        """Midpoint of a bucket, in microseconds."""
+        exponent, mantissa = bucket
+        if exponent == 0:
+            return float(mantissa)
+        shift = exponent - self.sub_bucket_bits
+        return (mantissa + 0.5) * (1 << shift)
+
+    def record(self, seconds: float) -> None:
+        """Record one latency value."""
+        seconds = max(seconds, 0.0)
+        bucket = self._bucket(max(int(seconds * 1_000_000), 0))
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """Return the value at ``percent`` (0-100), in seconds."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= target:
+                value = self._bucket_value(bucket) / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's values (same ``sub_bucket_bits``) into this one."""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for bucket, count in other._buckets.items():
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, p50/p95/p99 and max, in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+__all__ = [
+    "LatencyHistogram",
+    "collect_phases",
+    "phase",
+    "TIMING_EVENT",
+]
@@ -6,51 +6,1420 @@ This module provides LangChain-compatible tool wrappers for SkillLite skills.
 IMPORTANT: This is now a lightweight wrapper around the core skilllite SDK.
 All types and core logic are imported from skilllite.core.adapters.langchain
 and skilllite.core.protocols. This eliminates code duplication and ensures
-consistency across all integration points.
+consistency across all integration points. SkillLiteTool and SkillLiteToolkit
+are thin subclasses that only add optional execution backends.
 
 For direct SDK usage, import from:
 - skilllite.core.adapters.langchain: SkillLiteTool, SkillLiteToolkit
 - skilllite.core.protocols: SecurityScanResult, ConfirmationCallback
+
+Only the SDK base classes are imported eagerly. The backward-compatible
+re-exports (SkillManager, SkillInfo, SecurityScanResult and the confirmation
+callback types) and the optional backends (pool, caches, lazy discovery) are
+imported on first use.
 """
 
 from __future__ import annotations
 
-from typing import List, Optional, TYPE_CHECKING
+import asyncio
+import hashlib
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    BaseCallbackHandler,
+    CallbackManagerForToolRun,
+)
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import merge_configs
+from pydantic import Field
 
 # Import core classes from skilllite SDK - Single Source of Truth
 # This eliminates the ~500 lines of duplicate code that was here before
-from skilllite.core.adapters.langchain import (
-    SkillLiteTool,
-    SkillLiteToolkit,
+from skilllite.core.adapters.langchain import SkillLiteTool as _CoreSkillLiteTool
+from skilllite.core.adapters.langchain import SkillLiteToolkit as _CoreSkillLiteToolkit
+
+from langchain_skilllite.descriptions import (
+    DESCRIPTION_MODES,
+    DescribeSkillTool,
+    default_store,
 )
-from skilllite.core.protocols import (
-    SecurityScanResult,
-    ConfirmationCallback,
-    AsyncConfirmationCallback,
+from langchain_skilllite.limits import ConcurrencyLimiter, ConcurrencyLimitError
+from langchain_skilllite.metrics import SANDBOX_LEVEL_METADATA_KEY
+from langchain_skilllite.result_cache import CACHE_EVENT, ResultCache
+from langchain_skilllite.streaming import (
+    STREAM_EVENT,
+    OutputStream,
+    active_stream,
+    output_stream,
+)
+from langchain_skilllite.timing import (
+    PHASE_CONFIRMATION_WAIT,
+    PHASE_EXECUTION,
+    PHASE_QUEUE_WAIT,
+    PHASE_SECURITY_SCAN,
+    TIMING_EVENT,
+    collect_phases,
+    phase,
 )
-
-# Re-export for backward compatibility
-from skilllite import SkillManager, SkillInfo
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from skilllite import SkillInfo, SkillManager
+    from skilllite.core.protocols import AsyncConfirmationCallback, ConfirmationCallback
+    from skilllite.sandbox.base import ExecutionResult
+    from skilllite.sandbox.context import ExecutionContext
+
+    from langchain_skilllite.confirmation import ConfirmationQueue
+    from langchain_skilllite.outputs import OutputPolicy
+    from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+    from langchain_skilllite.prescan import PrescanReport
+    from langchain_skilllite.scan_cache import ScanCache
+    from langchain_skilllite.selection import SkillIndex
+    from langchain_skilllite.serialization import Serializer
+    from langchain_skilllite.templates import TemplateCache, WarmupReport
+
+# Re-exported for backward compatibility; resolved on first access
+_LAZY_REEXPORTS = {
+    "SkillManager": "skilllite",
+    "SkillInfo": "skilllite",
+    "SecurityScanResult": "skilllite.core.protocols",
+    "ConfirmationCallback": "skilllite.core.protocols",
+    "AsyncConfirmationCallback": "skilllite.core.protocols",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_REEXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _extract_input_data(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Unwrap tool arguments; LangChain may wrap them in a 'kwargs' key."""
+    if "kwargs" in kwargs and isinstance(kwargs["kwargs"], dict) and len(kwargs) == 1:
+        return kwargs["kwargs"]
+    return kwargs
+
+
+def _format_result(result: "ExecutionResult") -> str:
+    """Turn an ExecutionResult into the string returned to the LLM."""
+    if result.success:
+        return result.output or "Execution completed successfully"
+    return f"Error: {result.error}"
+
+
+def _confirmation_required(report: str) -> "ExecutionResult":
+    """Result returned when a scan needs approval but no callback is configured."""
+    from skilllite.sandbox.base import ExecutionResult
+
+    return ExecutionResult(
+        success=False,
+        error=f"Security confirmation required:\n{report}",
+        exit_code=2,
+    )
+
+
+def _cancelled_by_user() -> "ExecutionResult":
+    """Result returned when the user declines a security confirmation."""
+    from skilllite.sandbox.base import ExecutionResult
+
+    return ExecutionResult(
+        success=False,
+        error="Execution cancelled by user after security review",
+        exit_code=1,
+    )
+
+
+def _confirmation_pending(ticket: Any, report: str) -> "ExecutionResult":
+    """Result returned when a call was parked on a ConfirmationQueue."""
+    from skilllite.sandbox.base import ExecutionResult
+
+    return ExecutionResult(
+        success=False,
+        error=(
+            f"Security confirmation pending (scan_id={ticket.scan_id}). The call is "
+            f"parked until it is approved or rejected:\n{report}"
+        ),
+        exit_code=2,
+    )
+
+
+def _not_admitted(error: ConcurrencyLimitError) -> "ExecutionResult":
+    """Result returned when a concurrency limit rejects a run."""
+    from skilllite.sandbox.base import ExecutionResult
+
+    return ExecutionResult(success=False, error=str(error), exit_code=1)
+
+
+def _cache_event(
+    skill_info: SkillInfo,
+    key: str,
+    result: Optional["ExecutionResult"],
+) -> Dict[str, Any]:
+    """Payload of the ``skilllite_cache`` custom event."""
+    return {"skill_name": skill_info.name, "hit": result is not None, "key": key}
+
+
+def _timing_event(skill_name: str, phases: Dict[str, float], success: bool) -> Dict[str, Any]:
+    """Payload of the ``skilllite_timing`` custom event."""
+    return {"skill_name": skill_name, "phases": dict(phases), "success": success}
+
+
+def _stream_event(skill_info: SkillInfo, stream: OutputStream, chunk: Any) -> Dict[str, Any]:
+    """Payload of the ``skilllite_stream`` custom event."""
+    return {
+        "skill_name": skill_info.name,
+        "chunk": chunk,
+        "index": stream.chunks - 1,
+        "bytes": stream.kept_bytes,
+    }
+
+
+class _StreamCollector(BaseCallbackHandler):
+    """Forwards the stream events of one tool to ``put`` (see ``stream_output``)."""
+
+    run_inline = True
+
+    def __init__(self, tool_name: str, put: Callable[[Any], None]):
+        self.tool_name = tool_name
+        self.put = put
+
+    def on_custom_event(self, name: str, data: Any, *, run_id: Any, **kwargs: Any) -> None:
+        if name == STREAM_EVENT and data.get("skill_name") == self.tool_name:
+            self.put(data["chunk"])
+
+
+def _cleared_context(context: "ExecutionContext") -> "ExecutionContext":
+    """
+    Context to execute with once the level 3 scan passed or was confirmed.
+
+    Like UnifiedExecutionService, drop to level 1 so skillbox does not redo
+    the scan (and prompt) that already happened in Python.
+    """
+    if context.sandbox_level == "3":
+        return context.with_override(sandbox_level="1")
+    return context
+
+
+def _skill_code_hash(skill_info: SkillInfo) -> str:
+    """Hash a skill's entry script so confirmations expire when the code changes."""
+    entry_point = getattr(skill_info.metadata, "entry_point", None) if skill_info.metadata else None
+    if not entry_point:
+        return ""
+    script = skill_info.path / entry_point
+    try:
+        return hashlib.sha256(script.read_bytes()).hexdigest()[:16]
+    except OSError:
+        return ""
+
 
 # ============================================================================
-# Extended SkillLiteToolkit with from_directory convenience method
-# The core SkillLiteTool and SkillLiteToolkit are imported from skilllite SDK
+# SkillLiteTool / SkillLiteToolkit
+# Thin subclasses of the skilllite SDK classes that add optional execution
+# backends (e.g. the warm worker pool). Without those options they behave
+# exactly like the SDK classes.
 # ============================================================================
 
-class ExtendedSkillLiteToolkit:
+class SkillLiteTool(_CoreSkillLiteTool):
     """
-    Extended LangChain Toolkit for SkillLite with additional convenience methods.
+    LangChain BaseTool adapter for a single SkillLite skill.
+
+    Extends the skilllite SDK tool with an optional warm worker pool. When
+    ``pool`` is set, Python skills run on pre-started workers instead of a
+    fresh interpreter per call; the security scan and confirmation flow for
+    sandbox level 3 still runs before every pooled execution.
+
+    With ``scan_cache`` set, level 3 scan verdicts and user approvals are
+    looked up by the content hash of the skill's scripts, so unchanged skills
+    are not rescanned. With ``result_cache`` set, results of skills it covers
+    are memoized and hits/misses are reported as ``skilllite_cache`` events.
+    With ``limiter`` set, runs wait for a concurrency slot before executing
+    and are rejected with an error message when its queue is full.
 
-    This class extends the core SkillLiteToolkit with:
-    - from_directory: Load skills directly from a directory path
+    With ``streaming`` set, stdout is read as the skill writes it and each
+    chunk (or NDJSON record) is reported as a ``skilllite_stream`` event;
+    ``stream_output`` / ``astream_output`` iterate over them. Output beyond
+    ``max_output_bytes`` is dropped as it arrives and the result is marked
+    as truncated.
 
-    For basic usage, use the imported SkillLiteToolkit directly.
+    With ``confirmation_queue`` set, level 3 calls needing approval are not
+    confirmed through a callback: they are parked on the queue and return a
+    pending-confirmation error carrying the ticket's scan id, and resume when
+    the ticket is approved (see ConfirmationQueue).
+
+    ``args_schema`` may be a JSON schema dict (the skill's declared
+    ``input_schema``, shared between tools by the toolkit's summary mode).
+
+    ``serializer`` picks the JSON library used to encode the input and parse
+    the output of pooled calls ("orjson", "msgspec", "json" or a Serializer;
+    default: the fastest installed, see ``langchain_skilllite.serialization``).
+
+    ``output_policy`` bounds what the tool returns: output beyond its
+    ``max_bytes`` is truncated to its head and/or tail and, with an
+    OutputStore, kept in full for ``read_skill_output``.
+
+    Attributes:
+        pool: Optional SkillWorkerPool used for warm execution
+        scan_cache: Optional ScanCache for level 3 scan verdicts and approvals
+        result_cache: Optional ResultCache memoizing deterministic skills
+        limiter: Optional ConcurrencyLimiter for admission control
+        streaming: Report stdout incrementally as ``skilllite_stream`` events
+        stream_mode: "text" for raw chunks, "ndjson" for one record per line
+        max_output_bytes: Cap on kept stdout bytes (None = no cap)
+        confirmation_queue: Optional ConfirmationQueue for deferred approval
+        serializer: Optional serializer name or Serializer for pooled calls
+        output_policy: Optional OutputPolicy bounding returned output
     """
 
+    args_schema: Optional[Any] = Field(
+        default=None,
+        description="Pydantic model or JSON schema dict for arguments",
+    )
+    pool: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Optional SkillWorkerPool for warm execution",
+    )
+
+    scan_cache: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Optional ScanCache for level 3 scan verdicts and approvals",
+    )
+    result_cache: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Optional ResultCache memoizing deterministic skills",
+    )
+    limiter: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Optional ConcurrencyLimiter for admission control",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Report stdout incrementally as skilllite_stream events",
+    )
+    stream_mode: str = Field(
+        default="text",
+        description='"text" for raw chunks, "ndjson" for one record per line',
+    )
+    max_output_bytes: Optional[int] = Field(
+        default=None,
+        description="Cap on kept stdout bytes (None = no cap)",
+    )
+    confirmation_queue: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Optional ConfirmationQueue parking calls that need approval",
+    )
+    serializer: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Serializer name or instance for pooled inputs and outputs",
+    )
+    output_policy: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Optional OutputPolicy bounding the returned output",
+    )
+
+    # Session-level confirmation cache shared by all tools: skill_name -> code hash
+    _confirmed_skills: ClassVar[Dict[str, str]] = {}
+
+    def run(
+        self, tool_input: Any, *args: Any, metadata: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> Any:
+        """Run the tool, labelling the run with the sandbox level it executes at."""
+        return super().run(tool_input, *args, metadata=self._run_metadata(metadata), **kwargs)
+
+    async def arun(
+        self, tool_input: Any, *args: Any, metadata: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> Any:
+        """Async twin of ``run``."""
+        metadata = self._run_metadata(metadata)
+        return await super().arun(tool_input, *args, metadata=metadata, **kwargs)
+
+    def _run_metadata(self, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run metadata with the sandbox level this call will actually use.
+
+        Execution reads the level from the environment (SKILLBOX_SANDBOX_LEVEL)
+        when it runs, not from the ``sandbox_level`` the tool was built with,
+        so resolve it here the same way ``_execute`` does.
+        """
+        skill_info = self.manager._registry.get_skill(self.skill_name)
+        if skill_info:
+            level = self._execution_context(skill_info).sandbox_level
+        else:
+            from skilllite.sandbox.context import ExecutionContext
+
+            level = ExecutionContext.from_current_env().sandbox_level
+        return {**(metadata or {}), SANDBOX_LEVEL_METADATA_KEY: level}
+
+    def _run(
+        self,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Execute the skill synchronously."""
+        # Failures come back as strings, so the timing event also reports the outcome.
+        phases: Dict[str, float] = {}
+        success = False
+        try:
+            skill_info = self.manager._registry.get_skill(self.skill_name)
+            if not skill_info:
+                return f"Error: Skill '{self.skill_name}' not found"
+            stream = self._output_stream(skill_info, run_manager)
+            with collect_phases() as phases, output_stream(stream):
+                result = self._execute_cached(skill_info, _extract_input_data(kwargs), run_manager)
+            output = self._bounded(_format_result(result))
+            success = result.success
+            return output
+        except Exception as e:
+            return f"Execution failed: {str(e)}"
+        finally:
+            if run_manager is not None:
+                run_manager.get_child().on_custom_event(
+                    TIMING_EVENT,
+                    _timing_event(self.skill_name, phases, success),
+                    run_id=run_manager.run_id,
+                )
+
+    async def _arun(
+        self,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Execute the skill asynchronously without blocking executor threads."""
+        phases: Dict[str, float] = {}
+        success = False
+        try:
+            skill_info = self.manager._registry.get_skill(self.skill_name)
+            if not skill_info:
+                return f"Error: Skill '{self.skill_name}' not found"
+            stream = self._output_stream(skill_info, run_manager)
+            with collect_phases() as phases, output_stream(stream):
+                result = await self._aexecute_cached(
+                    skill_info, _extract_input_data(kwargs), run_manager
+                )
+            output = self._bounded(_format_result(result))
+            success = result.success
+            return output
+        except Exception as e:
+            return f"Execution failed: {str(e)}"
+        finally:
+            if run_manager is not None:
+                await run_manager.get_child().on_custom_event(
+                    TIMING_EVENT,
+                    _timing_event(self.skill_name, phases, success),
+                    run_id=run_manager.run_id,
+                )
+
+    def _bounded(self, output: Any) -> Any:
+        """Apply the output policy, if any, to what the tool returns."""
+        if self.output_policy is None:
+            return output
+        return self.output_policy.apply(output, self.skill_name)
+
+    def _output_stream(
+        self,
+        skill_info: SkillInfo,
+        run_manager: Optional[
+            Union[CallbackManagerForToolRun, AsyncCallbackManagerForToolRun]
+        ] = None,
+    ) -> Optional[OutputStream]:
+        """OutputStream for one run, or None when output is neither streamed nor capped."""
+        if not self.streaming and self.max_output_bytes is None:
+            return None
+        on_chunk = None
+        if self.streaming and run_manager is not None:
+            child, run_id = run_manager.get_child(), run_manager.run_id
+
+            def on_chunk(chunk: Any) -> Any:
+                return child.on_custom_event(
+                    STREAM_EVENT, _stream_event(skill_info, stream, chunk), run_id=run_id
+                )
+
+        stream = OutputStream(on_chunk, max_bytes=self.max_output_bytes, mode=self.stream_mode)
+        return stream
+
+    def _streaming_copy(self) -> "SkillLiteTool":
+        return self if self.streaming else self.model_copy(update={"streaming": True})
+
+    def stream_output(
+        self,
+        tool_input: Union[str, Dict[str, Any]],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """
+        Run the tool and yield its output as the skill produces it.
+
+        Yields text chunks (or NDJSON records with ``stream_mode="ndjson"``).
+        When nothing was streamed (a result cache hit, a rejected or failed
+        run) the final tool result is yielded once instead. Callbacks in
+        ``config`` receive the usual tool events.
+        """
+        chunks: "queue.Queue[Any]" = queue.Queue()
+        done = object()
+        outcome: Dict[str, Any] = {}
+        config = merge_configs(config, {"callbacks": [_StreamCollector(self.name, chunks.put)]})
+        tool = self._streaming_copy()
+
+        def run() -> None:
+            try:
+                outcome["result"] = tool.invoke(tool_input, config=config, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                chunks.put(done)
+
+        thread = threading.Thread(target=run, name=f"skilllite-stream-{self.name}", daemon=True)
+        thread.start()
+        streamed = False
+        while True:
+            chunk = chunks.get()
+            if chunk is done:
+                break
+            streamed = True
+            yield chunk
+        thread.join()
+        if "error" in outcome:
+            raise outcome["error"]
+        if not streamed:
+            yield outcome["result"]
+
+    async def astream_output(
+        self,
+        tool_input: Union[str, Dict[str, Any]],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Async twin of ``stream_output``; the run is awaited on the current loop."""
+        chunks: "asyncio.Queue[Any]" = asyncio.Queue()
+        done = object()
+        config = merge_configs(
+            config, {"callbacks": [_StreamCollector(self.name, chunks.put_nowait)]}
+        )
+        task = asyncio.ensure_future(
+            self._streaming_copy().ainvoke(tool_input, config=config, **kwargs)
+        )
+        task.add_done_callback(lambda _: chunks.put_nowait(done))
+        try:
+            streamed = False
+            while True:
+                chunk = await chunks.get()
+                if chunk is done:
+                    break
+                streamed = True
+                yield chunk
+            result = task.result()
+            if not streamed:
+                yield result
+        finally:
+            if not task.done():
+                task.cancel()
+
+    def _execute_cached(
+        self,
+        skill_info: SkillInfo,
+        input_data: Dict[str, Any],
+        run_manager: Optional[CallbackManagerForToolRun] = None,
+    ) -> "ExecutionResult":
+        """``_execute`` behind the result cache, when one covers this skill."""
+        cache = self.result_cache
+        if cache is None or not cache.applies_to(skill_info):
+            return self._execute_admitted(skill_info, input_data)
+
+        key, result = cache.lookup(skill_info, input_data)
+        if run_manager is not None:
+            run_manager.get_child().on_custom_event(
+                CACHE_EVENT, _cache_event(skill_info, key, result), run_id=run_manager.run_id
+            )
+        if result is None:
+            result = self._execute_admitted(skill_info, input_data)
+            cache.store(skill_info, key, result)
+        return result
+
+    async def _aexecute_cached(
+        self,
+        skill_info: SkillInfo,
+        input_data: Dict[str, Any],
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> "ExecutionResult":
+        """Async twin of ``_execute_cached``."""
+        cache = self.result_cache
+        if cache is None or not cache.applies_to(skill_info):
+            return await self._aexecute_admitted(skill_info, input_data)
+
+        key, result = cache.lookup(skill_info, input_data)
+        if run_manager is not None:
+            await run_manager.get_child().on_custom_event(
+                CACHE_EVENT, _cache_event(skill_info, key, result), run_id=run_manager.run_id
+            )
+        if result is None:
+            result = await self._aexecute_admitted(skill_info, input_data)
+            cache.store(skill_info, key, result)
+        return result
+
+    def _execute_admitted(
+        self,
+        skill_info: SkillInfo,
+        input_data: Dict[str, Any],
+    ) -> "ExecutionResult":
+        """``_execute`` once the limiter, if any, admitted the run."""
+        if self.limiter is None:
+            return self._execute(skill_info, input_data)
+        try:
+            with phase(PHASE_QUEUE_WAIT):
+                lease = self.limiter.acquire(skill_info)
+        except ConcurrencyLimitError as e:
+            return _not_admitted(e)
+        try:
+            return self._execute(skill_info, input_data)
+        finally:
+            lease.release()
+
+    async def _aexecute_admitted(
+        self,
+        skill_info: SkillInfo,
+        input_data: Dict[str, Any],
+    ) -> "ExecutionResult":
+        """Async twin of ``_execute_admitted``; shares the limiter's slots."""
+        if self.limiter is None:
+            return await self._aexecute(skill_info, input_data)
+        try:
+            with phase(PHASE_QUEUE_WAIT):
+                lease = await self.limiter.aacquire(skill_info)
+        except ConcurrencyLimitError as e:
+            return _not_admitted(e)
+        try:
+            return await self._aexecute(skill_info, input_data)
+        finally:
+            lease.release()
+
+    def _execute(self, skill_info: SkillInfo, input_data: Dict[str, Any]) -> "ExecutionResult":
+        """Run the skill on the worker pool when possible, else via UnifiedExecutionService."""
+        from skilllite.sandbox.execution_service import UnifiedExecutionService
+
+        stream = active_stream()
+        pooled = self.pool is not None and self.pool.supports(skill_info)
+        deferred = self.confirmation_queue is not None
+        if not pooled and self.scan_cache is None and stream is None and not deferred:
+            service = UnifiedExecutionService.get_instance()
+            # The service scans, spawns and parses internally: one opaque phase.
+            with phase(PHASE_EXECUTION):
+                return service.execute_skill(
+                    skill_info=skill_info,
+                    input_data=input_data,
+                    confirmation_callback=self.confirmation_callback,
+                    allow_network=self.allow_network,
+                    timeout=self.timeout,
+                )
+
+        # Pool, scan cache, streaming or deferred confirmation: run the security flow here, then execute
+        # with the resulting context so the service does not scan a second time.
+        context = self._execution_context(skill_info)
+        denied = self._security_preflight(skill_info, input_data, context)
+        if denied is not None:
+            return denied
+        context = _cleared_context(context)
+
+        # Level 2 relies on skillbox isolation, which pooled workers do not provide.
+        if pooled and context.sandbox_level != "2":
+            return self.pool.execute(
+                skill_info, input_data, timeout=context.timeout, **self._pool_options(stream)
+            )
+        if stream is not None:
+            from langchain_skilllite import streaming
+
+            return streaming.run_skill(context, skill_info, input_data, stream)
+        with phase(PHASE_EXECUTION):
+            return UnifiedExecutionService.get_instance().execute_with_context(
+                context=context,
+                skill_dir=skill_info.path,
+                input_data=input_data,
+            )
+
+    def _pool_options(self, stream: Optional[OutputStream]) -> Dict[str, Any]:
+        """Optional keyword arguments for ``pool.execute``: only those in use."""
+        options: Dict[str, Any] = {}
+        if stream is not None:
+            options["stream"] = stream
+        if self.serializer is not None:
+            from langchain_skilllite.serialization import get_serializer
+
+            options["serializer"] = get_serializer(self.serializer)
+        return options
+
+    def _execution_context(self, skill_info: SkillInfo) -> "ExecutionContext":
+        """Resolve the execution context the same way UnifiedExecutionService does."""
+        from skilllite.sandbox.context import ExecutionContext
+
+        context = ExecutionContext.from_current_env().with_override(
+            allow_network=self.allow_network,
+            timeout=self.timeout,
+        )
+        if skill_info.metadata and getattr(skill_info.metadata, "requires_elevated_permissions", False):
+            context = context.with_elevated_permissions()
+        return context
+
+    async def _aexecute(self, skill_info: SkillInfo, input_data: Dict[str, Any]) -> "ExecutionResult":
+        """Async twin of ``_execute`` built on asyncio subprocesses and async pool IPC."""
+        from langchain_skilllite import async_execution
+
+        context = self._execution_context(skill_info)
+        denied = await self._asecurity_preflight(skill_info, input_data, context)
+        if denied is not None:
+            return denied
+        context = _cleared_context(context)
+
+        stream = active_stream()
+        if self.pool is not None and self.pool.supports(skill_info) and context.sandbox_level != "2":
+            return await self.pool.aexecute(
+                skill_info, input_data, timeout=context.timeout, **self._pool_options(stream)
+            )
+        if stream is not None:
+            from langchain_skilllite import streaming
+
+            return await streaming.arun_skill(context, skill_info, input_data, stream)
+        return await async_execution.run_skill(context, skill_info, input_data)
+
+    def _security_preflight(
+        self,
+        skill_info: SkillInfo,
+        input_data: Dict[str, Any],
+        context: "ExecutionContext",
+    ) -> Optional["ExecutionResult"]:
+        """
+        Run the sandbox level 3 scan and confirmation flow.
+
+        Returns:
+            None if execution may proceed, otherwise the ExecutionResult to return
+        """
+        if context.sandbox_level != "3":
+            return None
+
+        approval_key = self._approval_key(skill_info)
+        if self._is_approved(skill_info, approval_key):
+            return None
+
+        with phase(PHASE_SECURITY_SCAN):
+            if self.scan_cache is not None:
+                scan_result = self.scan_cache.scan(skill_info, input_data)
+            else:
+                from skilllite.core.security import SecurityScanner
+
+                scan_result = SecurityScanner.get_instance().scan_skill(skill_info, input_data)
+        if not scan_result.requires_confirmation:
+            return None
+
+        report = scan_result.format_report()
+        if self.confirmation_queue is not None:
+            return self._park(scan_result.scan_id, report, input_data, approval_key)
+        if not self.confirmation_callback:
+            return _confirmation_required(report)
+        with phase(PHASE_CONFIRMATION_WAIT):
+            confirmed = self.confirmation_callback(report, scan_result.scan_id)
+        return self._confirmation_outcome(skill_info, approval_key, confirmed)
+
+    async def _asecurity_preflight(
+        self,
+        skill_info: SkillInfo,
+        input_data: Dict[str, Any],
+        context: "ExecutionContext",
+    ) -> Optional["ExecutionResult"]:
+        """
+        Async twin of ``_security_preflight``.
+
+        Awaits ``async_confirmation_callback`` natively; a sync
+        ``confirmation_callback`` is run on a thread since it may block on input.
+        """
+        if context.sandbox_level != "3":
+            return None
+
+        approval_key = self._approval_key(skill_info)
+        if self._is_approved(skill_info, approval_key):
+            return None
+
+        with phase(PHASE_SECURITY_SCAN):
+            if self.scan_cache is not None:
+                scan_result = await self.scan_cache.ascan(skill_info, input_data)
+            else:
+                from langchain_skilllite import async_execution
+
+                scan_result = await async_execution.scan_skill(skill_info, input_data)
+        if not scan_result.requires_confirmation:
+            return None
+
+        report = scan_result.format_report()
+        if self.confirmation_queue is not None:
+            return self._park(scan_result.scan_id, report, input_data, approval_key)
+        if not (self.async_confirmation_callback or self.confirmation_callback):
+            return _confirmation_required(report)
+        with phase(PHASE_CONFIRMATION_WAIT):
+            if self.async_confirmation_callback:
+                confirmed = await self.async_confirmation_callback(report, scan_result.scan_id)
+            else:
+                confirmed = await asyncio.to_thread(
+                    self.confirmation_callback, report, scan_result.scan_id
+                )
+        return self._confirmation_outcome(skill_info, approval_key, confirmed)
+
+    def _park(
+        self,
+        scan_id: str,
+        report: str,
+        input_data: Dict[str, Any],
+        approval_key: str,
+    ) -> "ExecutionResult":
+        """Park the call on the confirmation queue and build the pending result."""
+        ticket = self.confirmation_queue.park(self, scan_id, report, input_data, approval_key)
+        if ticket is None:
+            from skilllite.sandbox.base import ExecutionResult
+
+            return ExecutionResult(
+                success=False,
+                error=f"Too many pending security confirmations; call not parked:\n{report}",
+                exit_code=2,
+            )
+        return _confirmation_pending(ticket, report)
+
+    def _approval_key(self, skill_info: SkillInfo) -> str:
+        """Key under which a user's approval of this skill is remembered."""
+        if self.scan_cache is not None:
+            return self.scan_cache.content_hash(skill_info)
+        return _skill_code_hash(skill_info)
+
+    def _is_approved(self, skill_info: SkillInfo, approval_key: str) -> bool:
+        if not approval_key:
+            return False
+        if self.scan_cache is not None:
+            return self.scan_cache.is_approved(approval_key)
+        return self._confirmed_skills.get(skill_info.name) == approval_key
+
+    def _confirmation_outcome(
+        self,
+        skill_info: SkillInfo,
+        approval_key: str,
+        confirmed: bool,
+    ) -> Optional["ExecutionResult"]:
+        """Remember an approval for this skill content, or build the cancellation result."""
+        if not confirmed:
+            return _cancelled_by_user()
+        if self.scan_cache is not None:
+            self.scan_cache.approve(approval_key)
+        else:
+            self._confirmed_skills[skill_info.name] = approval_key
+        return None
+
+
+def _resolve_result_cache(cache: Optional[Union[bool, ResultCache]]) -> Optional[ResultCache]:
+    """
+    Map the toolkit ``cache`` option to a ResultCache.
+
+    None memoizes only skills that declare ``deterministic: true``, True
+    memoizes every skill, False disables memoization.
+    """
+    if cache is None:
+        return ResultCache.deterministic_only()
+    if cache is True:
+        return ResultCache()
+    if cache is False:
+        return None
+    return cache
+
+
+def _resolve_limiter(
+    limits: Optional[Union[bool, ConcurrencyLimiter]],
+) -> Optional[ConcurrencyLimiter]:
+    """
+    Map the toolkit ``limits`` option to a ConcurrencyLimiter.
+
+    None (or True) honours only ``max_concurrency`` declared in SKILL.md
+    front matter, False disables admission control.
+    """
+    if limits is None or limits is True:
+        return ConcurrencyLimiter()
+    if limits is False:
+        return None
+    return limits
+
+
+class SkillLiteToolkit(_CoreSkillLiteToolkit):
+    """
+    LangChain Toolkit for SkillLite.
+
+    Extends the skilllite SDK toolkit so that created tools are
+    langchain_skilllite.SkillLiteTool instances and can share a worker pool,
+    and adds concurrent batch execution, query-time tool selection and an
+    explicit warmup step.
+
+    Usage:
+        toolkit = SkillLiteToolkit(SkillManager(skills_dir="./skills"), sandbox_level=1)
+        results = toolkit.execute_batch(
+            [("text-upper", {"text": "hi"}), ("greeter", {"name": "Alice"})],
+            max_concurrency=4,
+        )
+        tools = toolkit.select_tools("make this text uppercase", k=3)
+        report = toolkit.warmup()
+    """
+
+    def __init__(
+        self,
+        manager: "SkillManager",
+        sandbox_level: int = 3,
+        allow_network: bool = False,
+        timeout: Optional[int] = None,
+        confirmation_callback: Optional[ConfirmationCallback] = None,
+        async_confirmation_callback: Optional[AsyncConfirmationCallback] = None,
+        skill_names: Optional[List[str]] = None,
+        pool: Optional[Union["PoolConfig", SkillWorkerPool]] = None,
+        scan_cache: Optional[ScanCache] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
+        limits: Optional[Union[bool, ConcurrencyLimiter]] = None,
+        streaming: bool = False,
+        stream_mode: str = "text",
+        max_output_bytes: Optional[int] = None,
+        index: Optional[Union[str, Path, "SkillIndex"]] = None,
+        description_mode: str = "full",
+        describe_tool: bool = True,
+        templates: Optional["TemplateCache"] = None,
+        confirmation_queue: Optional["ConfirmationQueue"] = None,
+        serializer: Optional[Union[str, "Serializer"]] = None,
+        output_policy: Optional["OutputPolicy"] = None,
+    ):
+        """
+        Initialize the toolkit.
+
+        ``from_manager``, ``from_directory`` and ``from_snapshot`` take the
+        same options (after ``skill_names`` and the sandbox settings, keyword
+        only) and pass them through unchanged.
+
+        Args:
+            manager: SkillManager instance with registered skills
+            sandbox_level: Sandbox security level (1/2/3, default: 3)
+            allow_network: Whether to allow network access for all tools
+            timeout: Execution timeout in seconds for all tools
+            confirmation_callback: Sync callback for security confirmation
+            async_confirmation_callback: Async callback for security confirmation
+            skill_names: Optional list of skill names to include (default: all)
+            pool: Enable warm worker execution. Pass a PoolConfig to create a
+                new pool, or a SkillWorkerPool to share one between toolkits.
+            scan_cache: Reuse level 3 scan verdicts and approvals for
+                unchanged skills
+            cache: Result memoization. None memoizes only skills declaring
+                ``deterministic: true`` in SKILL.md, True memoizes every
+                skill, False disables it, or pass a configured ResultCache.
+            limits: Concurrency limits. None honours ``max_concurrency``
+                declared in SKILL.md, False disables admission control, or
+                pass a ConcurrencyLimiter (shareable between toolkits).
+            streaming: Report stdout incrementally as ``skilllite_stream``
+                events (see SkillLiteTool.stream_output)
+            stream_mode: "text" for raw chunks, "ndjson" for one record per line
+            max_output_bytes: Drop stdout beyond this many bytes per call
+                and mark the result as truncated
+            index: SkillIndex for ``select_tools``, or the path it is
+                persisted to (default: an in-memory index)
+            description_mode: "full" describes each tool with its SKILL.md;
+                "summary" uses the front-matter description and declared
+                input_schema and adds a ``describe_skill`` meta-tool
+            describe_tool: Add the ``describe_skill`` meta-tool in summary mode
+            templates: TemplateCache of prebuilt dependency environments
+                used by ``warmup``
+            confirmation_queue: ConfirmationQueue on which level 3 calls
+                needing approval are parked until ``approve``/``reject``
+                (instead of blocking on a confirmation callback)
+            serializer: "orjson", "msgspec", "json" or a Serializer used to
+                encode inputs and parse outputs on pooled workers (default:
+                the fastest installed library)
+            output_policy: OutputPolicy truncating outputs beyond its
+                ``max_bytes``; with an OutputStore the full output is kept and
+                a ``read_skill_output`` tool is added
+        """
+        if description_mode not in DESCRIPTION_MODES:
+            raise ValueError(f"description_mode must be one of {', '.join(DESCRIPTION_MODES)}")
+        super().__init__(
+            manager=manager,
+            sandbox_level=sandbox_level,
+            allow_network=allow_network,
+            timeout=timeout,
+            confirmation_callback=confirmation_callback,
+            async_confirmation_callback=async_confirmation_callback,
+            skill_names=skill_names,
+        )
+        if pool is not None:
+            from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+
+            if isinstance(pool, PoolConfig):
+                pool = SkillWorkerPool(pool)
+        self.pool = pool
+        self.scan_cache = scan_cache
+        self.result_cache = _resolve_result_cache(cache)
+        self.limiter = _resolve_limiter(limits)
+        self.streaming = streaming
+        self.stream_mode = stream_mode
+        self.max_output_bytes = max_output_bytes
+        self._index = index
+        self.description_mode = description_mode
+        self.describe_tool = describe_tool and description_mode == "summary"
+        self.templates = templates
+        self.confirmation_queue = confirmation_queue
+        self.serializer = None
+        if serializer is not None:
+            from langchain_skilllite.serialization import get_serializer
+
+            # Resolve now so an unknown or missing library fails here, not per call.
+            self.serializer = get_serializer(serializer)
+        self.output_policy = output_policy
+        self._batch_tools: Dict[str, SkillLiteTool] = {}
+
+    def to_tools(self) -> List[SkillLiteTool]:
+        """
+        Convert skills to LangChain tools.
+
+        Returns:
+            List of SkillLiteTool instances, followed by the ``describe_skill``
+            meta-tool in summary mode and the ``read_skill_output`` meta-tool
+            when the output policy has a store
+        """
+        tools: List[Any] = [self._build_tool(skill) for skill in self.get_executable_skills()]
+        return self._with_meta_tools(tools)
+
+    def _with_meta_tools(self, tools: List[Any]) -> List[Any]:
+        if self.describe_tool:
+            tools.append(DescribeSkillTool(manager=self.manager, skill_names=self.skill_names))
+        policy = self.output_policy
+        if policy is not None and policy.store is not None:
+            from langchain_skilllite.outputs import ReadSkillOutputTool
+
+            tools.append(ReadSkillOutputTool(store=policy.store, max_bytes=policy.max_bytes))
+        return tools
+
+    # ==================== Tool Selection ====================
+
+    @property
+    def index(self) -> "SkillIndex":
+        """SkillIndex used by ``select_tools`` (created on first use)."""
+        from langchain_skilllite.selection import SkillIndex
+
+        if not isinstance(self._index, SkillIndex):
+            self._index = SkillIndex(self._index)
+        return self._index
+
+    def select_tools(self, query: str, k: int = 5) -> List[SkillLiteTool]:
+        """
+        Return the tools of the ``k`` skills most relevant to a query.
+
+        Skills are ranked with a local BM25 index over their names and
+        descriptions, which is brought up to date with the manager (only
+        changed skills are re-indexed) before every search. Bind the result
+        to the agent for this query instead of every tool.
+
+        Args:
+            query: Free text, typically the user's message
+            k: Maximum number of tools
+
+        Returns:
+            SkillLiteTool instances, most relevant first; empty when no
+            skill shares a term with the query
+        """
+        index = self.index
+        index.update(self.get_executable_skills())
+        tools = []
+        for name, _ in index.search(query, k):
+            tool = self._batch_tool(name)
+            if tool is not None:
+                tools.append(tool)
+        return tools
+
+    # ==================== Warmup ====================
+
+    def warmup(
+        self,
+        skill_names: Optional[List[str]] = None,
+        max_workers: int = 4,
+    ) -> "WarmupReport":
+        """
+        Prepare the execution environment of every skill ahead of its first call.
+
+        For each skill the dependency environment is built (or reused from
+        the shared environment cache) and its interpreter is started once to
+        validate it. With a worker pool, the interpreter is registered with
+        the pool and ``min_size`` workers are started. Skills are prepared
+        concurrently; a failing skill is reported and does not stop the others.
+
+        Args:
+            skill_names: Skills to prepare (default: all executable skills)
+            max_workers: Skills prepared at the same time
+
+        Returns:
+            WarmupReport with per-step timings and per-skill errors
+        """
+        from langchain_skilllite.templates import (
+            PHASE_DEPENDENCIES,
+            PHASE_INTERPRETER,
+            PHASE_TOTAL,
+            PHASE_WORKERS,
+            TemplateCache,
+            TemplateError,
+            WarmupReport,
+        )
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if self.templates is None:
+            self.templates = TemplateCache()
+        templates = self.templates
+        skills = self.get_executable_skills()
+        if skill_names is not None:
+            skills = [skill for skill in skills if skill.name in skill_names]
+
+        def prepare(skill: SkillInfo) -> Dict[str, float]:
+            started = time.perf_counter()
+            cached = templates.get(skill)
+            template = cached or templates.prepare(skill)
+            # A template that was already prepared costs nothing this time.
+            timings = {PHASE_DEPENDENCIES: 0.0, PHASE_INTERPRETER: 0.0}
+            if cached is None:
+                timings.update(template.timings)
+            if self.pool is not None:
+                step = time.perf_counter()
+                if template.isolated and template.language == "python":
+                    self.pool.use_interpreter(template.skill_dir, template.python)
+                self.pool.warm(skill)
+                timings[PHASE_WORKERS] = time.perf_counter() - step
+            timings[PHASE_TOTAL] = time.perf_counter() - started
+            return timings
+
+        report = WarmupReport()
+        started = time.perf_counter()
+        if skills:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(skills)), thread_name_prefix="skilllite-warmup"
+            ) as executor:
+                futures = {skill.name: executor.submit(prepare, skill) for skill in skills}
+                for name, future in futures.items():
+                    try:
+                        report.timings[name] = future.result()
+                    except (TemplateError, OSError, RuntimeError) as e:
+                        report.errors[name] = str(e)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    # ==================== Prescan ====================
+
+    def prescan(self, max_workers: Optional[int] = None) -> "PrescanReport":
+        """
+        Security-scan every executable skill now, CPU-count scans at a time.
+
+        Verdicts are stored in ``scan_cache`` (a memory-only ScanCache is
+        created if the toolkit has none), so level 3 calls of unchanged
+        skills do not scan again. Tools built before a cache was created do
+        not see it; call this before ``to_tools``.
+
+        Args:
+            max_workers: Scans run at the same time (default: CPU count)
+
+        Returns:
+            PrescanReport with scan results, timings and a per-skill issue summary
+        """
+        from langchain_skilllite.prescan import prescan_skills
+        from langchain_skilllite.scan_cache import ScanCache
+
+        if self.scan_cache is None:
+            self.scan_cache = ScanCache()
+        return prescan_skills(self.get_executable_skills(), self.scan_cache, max_workers)
+
+    # ==================== Snapshots ====================
+
+    def export_snapshot(
+        self,
+        path: Union[str, Path],
+        skills_dir: Optional[Union[str, Path]] = None,
+    ) -> int:
+        """
+        Write the toolkit's prepared tools to a snapshot file.
+
+        The snapshot records each executable skill's name, tool description,
+        input schema and SKILL.md hash, plus the scan verdict cached in
+        ``scan_cache`` (if any), for ``from_snapshot`` to load without
+        re-parsing the skills.
+
+        Args:
+            path: Destination file
+            skills_dir: Directory checked for added skills when the
+                snapshot is loaded
+
+        Returns:
+            Number of skills written
+        """
+        from langchain_skilllite.discovery import LazySkillInfo
+        from langchain_skilllite.snapshot import entry_from_skill, write_snapshot
+
+        skills = self.get_executable_skills()
+        entries = [
+            entry_from_skill(skill, self._tool_description(skill), self.scan_cache)
+            for skill in skills
+        ]
+        return write_snapshot(
+            path,
+            entries,
+            roots=[skills_dir] if skills_dir else (),
+            front_matter_descriptions=any(isinstance(s, LazySkillInfo) for s in skills),
+        )
+
+    @staticmethod
+    def _tool_description(skill: SkillInfo) -> str:
+        from langchain_skilllite.discovery import LazySkillInfo
+
+        # Use full SKILL.md content as description so the LLM can infer
+        # correct parameters from usage examples. Lazily discovered skills
+        # keep their front-matter description so SKILL.md is not read here.
+        full_content = "" if isinstance(skill, LazySkillInfo) else skill.get_full_content()
+        return full_content or skill.description or f"Execute the {skill.name} skill"
+
+    def _build_tool(
+        self,
+        skill: SkillInfo,
+        description: Optional[str] = None,
+        input_schema: Optional[Dict[str, Any]] = None,
+    ) -> SkillLiteTool:
+        # Descriptions and schemas are shared process-wide (see descriptions).
+        store = default_store()
+        args_schema = None
+        if self.description_mode == "summary":
+            description = store.summary(skill, hint=self.describe_tool)
+            if input_schema is not None:
+                args_schema = store.share_schema(input_schema)
+            else:
+                args_schema = store.input_schema(skill)
+        else:
+            description = store.intern(description or self._tool_description(skill))
+        return SkillLiteTool(
+            name=skill.name,
+            description=description,
+            args_schema=args_schema,
+            manager=self.manager,
+            skill_name=skill.name,
+            allow_network=self.allow_network,
+            timeout=self.timeout,
+            sandbox_level=self.sandbox_level,
+            confirmation_callback=self.confirmation_callback,
+            async_confirmation_callback=self.async_confirmation_callback,
+            pool=self.pool,
+            scan_cache=self.scan_cache,
+            result_cache=self.result_cache,
+            limiter=self.limiter,
+            streaming=self.streaming,
+            stream_mode=self.stream_mode,
+            max_output_bytes=self.max_output_bytes,
+            confirmation_queue=self.confirmation_queue,
+            serializer=self.serializer,
+            output_policy=self.output_policy,
+        )
+
+    # ==================== Batch Execution ====================
+
+    def _batch_tool(self, skill_name: str) -> Optional[SkillLiteTool]:
+        """Return the (cached) tool used to run ``skill_name`` in a batch or selection."""
+        tool = self._batch_tools.get(skill_name)
+        if tool is None:
+            if self.skill_names and skill_name not in self.skill_names:
+                return None
+            skill = self.manager.get_skill(skill_name)
+            if not skill:
+                return None
+            tool = self._batch_tools.setdefault(skill_name, self._build_tool(skill))
+        return tool
+
+    def _execute_call(self, skill_name: str, input_data: Dict[str, Any]) -> "ExecutionResult":
+        from skilllite.sandbox.base import ExecutionResult
+
+        try:
+            tool = self._batch_tool(skill_name)
+            if tool is None:
+                return ExecutionResult(
+                    success=False,
+                    error=f"Skill '{skill_name}' not found",
+                    exit_code=1,
+                )
+            return tool._execute_cached(self.manager.get_skill(skill_name), input_data)
+        except Exception as e:
+            return ExecutionResult(success=False, error=f"Execution failed: {str(e)}", exit_code=-1)
+
+    async def _aexecute_call(self, skill_name: str, input_data: Dict[str, Any]) -> "ExecutionResult":
+        from skilllite.sandbox.base import ExecutionResult
+
+        try:
+            tool = self._batch_tool(skill_name)
+            if tool is None:
+                return ExecutionResult(
+                    success=False,
+                    error=f"Skill '{skill_name}' not found",
+                    exit_code=1,
+                )
+            return await tool._aexecute_cached(self.manager.get_skill(skill_name), input_data)
+        except Exception as e:
+            return ExecutionResult(success=False, error=f"Execution failed: {str(e)}", exit_code=-1)
+
+    def execute_batch(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+    ) -> List["ExecutionResult"]:
+        """
+        Execute several skill calls concurrently.
+
+        Calls run on a thread pool (and on the worker pool, if configured), so
+        the wall-clock time approaches that of the slowest call rather than
+        the sum. A failing call never affects the others.
+
+        Args:
+            calls: Sequence of (skill_name, input_data) pairs
+            max_concurrency: Maximum number of calls in flight (default: all)
+
+        Returns:
+            One ExecutionResult per call, in the same order as ``calls``
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if not calls:
+            return []
+
+        workers = min(len(calls), max_concurrency or len(calls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="skilllite-batch") as executor:
+            return list(executor.map(lambda call: self._execute_call(*call), calls))
+
+    async def aexecute_batch(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+    ) -> List["ExecutionResult"]:
+        """
+        Async twin of ``execute_batch`` built on the native async execution path.
+
+        Args:
+            calls: Sequence of (skill_name, input_data) pairs
+            max_concurrency: Maximum number of calls in flight (default: all)
+
+        Returns:
+            One ExecutionResult per call, in the same order as ``calls``
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if not calls:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency or len(calls))
+
+        async def run(skill_name: str, input_data: Dict[str, Any]) -> "ExecutionResult":
+            async with semaphore:
+                return await self._aexecute_call(skill_name, input_data)
+
+        return list(await asyncio.gather(*(run(name, data) for name, data in calls)))
+
+    @classmethod
+    def from_manager(
+        cls,
+        manager: "SkillManager",
+        skill_names: Optional[List[str]] = None,
+        allow_network: bool = False,
+        timeout: Optional[int] = None,
+        sandbox_level: int = 3,
+        confirmation_callback: Optional[ConfirmationCallback] = None,
+        async_confirmation_callback: Optional[AsyncConfirmationCallback] = None,
+        *,
+        prescan: bool = False,
+        pool: Optional[Union["PoolConfig", SkillWorkerPool]] = None,
+        scan_cache: Optional[ScanCache] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
+        limits: Optional[Union[bool, ConcurrencyLimiter]] = None,
+        streaming: bool = False,
+        stream_mode: str = "text",
+        max_output_bytes: Optional[int] = None,
+        index: Optional[Union[str, Path, "SkillIndex"]] = None,
+        description_mode: str = "full",
+        describe_tool: bool = True,
+        templates: Optional["TemplateCache"] = None,
+        confirmation_queue: Optional["ConfirmationQueue"] = None,
+        serializer: Optional[Union[str, "Serializer"]] = None,
+        output_policy: Optional["OutputPolicy"] = None,
+    ) -> List[SkillLiteTool]:
+        """
+        Create LangChain tools from a SkillManager.
+
+        The keyword-only toolkit options (``pool``, ``scan_cache``, ``cache``,
+        ``limits``, ...) are documented on ``SkillLiteToolkit.__init__``.
+
+        Args:
+            manager: SkillManager instance with registered skills
+            skill_names: Optional list of skill names to include (default: all)
+            allow_network: Whether to allow network access for all tools
+            timeout: Execution timeout in seconds for all tools
+            sandbox_level: Sandbox security level (1/2/3, default: 3)
+            confirmation_callback: Sync callback for security confirmation
+            async_confirmation_callback: Async callback for security confirmation
+            prescan: Security-scan every skill up front, one scan per CPU
+                at a time, storing the verdicts in ``scan_cache`` (a
+                memory-only ScanCache is created if none is given)
+
+        Returns:
+            List of SkillLiteTool instances
+        """
+        toolkit = cls(
+            manager=manager,
+            skill_names=skill_names,
+            allow_network=allow_network,
+            timeout=timeout,
+            sandbox_level=sandbox_level,
+            confirmation_callback=confirmation_callback,
+            async_confirmation_callback=async_confirmation_callback,
+            pool=pool,
+            scan_cache=scan_cache,
+            cache=cache,
+            limits=limits,
+            streaming=streaming,
+            stream_mode=stream_mode,
+            max_output_bytes=max_output_bytes,
+            index=index,
+            description_mode=description_mode,
+            describe_tool=describe_tool,
+            templates=templates,
+            confirmation_queue=confirmation_queue,
+            serializer=serializer,
+            output_policy=output_policy,
+        )
+        if prescan:
+            toolkit.prescan()
+        return toolkit.to_tools()
+
     @staticmethod
     def from_directory(
         skills_dir: str,
@@ -60,36 +1429,198 @@ class ExtendedSkillLiteToolkit:
         sandbox_level: int = 3,
         confirmation_callback: Optional[ConfirmationCallback] = None,
         async_confirmation_callback: Optional[AsyncConfirmationCallback] = None,
+        *,
+        lazy: bool = False,
+        manifest_path: Optional[str] = None,
+        prescan: bool = False,
+        pool: Optional[Union["PoolConfig", SkillWorkerPool]] = None,
+        scan_cache: Optional[ScanCache] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
+        limits: Optional[Union[bool, ConcurrencyLimiter]] = None,
+        streaming: bool = False,
+        stream_mode: str = "text",
+        max_output_bytes: Optional[int] = None,
+        index: Optional[Union[str, Path, "SkillIndex"]] = None,
+        description_mode: str = "full",
+        describe_tool: bool = True,
+        templates: Optional["TemplateCache"] = None,
+        confirmation_queue: Optional["ConfirmationQueue"] = None,
+        serializer: Optional[Union[str, "Serializer"]] = None,
+        output_policy: Optional["OutputPolicy"] = None,
     ) -> List[SkillLiteTool]:
         """
         Create LangChain tools from a skills directory.
 
         Convenience method that creates a SkillManager and loads all skills.
 
+        The keyword-only toolkit options (``pool``, ``scan_cache``, ``cache``,
+        ``limits``, ...) are documented on ``SkillLiteToolkit.__init__``.
+
         Args:
             skills_dir: Path to directory containing skill folders
-            skill_names: Optional list of skill names to include
-            allow_network: Whether to allow network access
-            timeout: Execution timeout in seconds
-            sandbox_level: Sandbox security level (1/2/3)
+            skill_names: Optional list of skill names to include (default: all)
+            allow_network: Whether to allow network access for all tools
+            timeout: Execution timeout in seconds for all tools
+            sandbox_level: Sandbox security level (1/2/3, default: 3)
             confirmation_callback: Sync callback for security confirmation
             async_confirmation_callback: Async callback for security confirmation
+            lazy: Index only name/description/entry point at startup and
+                parse each skill on first use (tool descriptions then come
+                from the SKILL.md front matter)
+            manifest_path: Where the lazy index is persisted (default: a
+                file per skills directory under ``~/.cache/skilllite/manifests``)
+            prescan: Security-scan every skill up front (see ``from_manager``)
 
         Returns:
             List of SkillLiteTool instances
         """
-        manager = SkillManager(skills_dir=skills_dir)
+        if lazy:
+            from langchain_skilllite.discovery import LazySkillManager
+
+            manager = LazySkillManager(skills_dir=skills_dir, manifest_path=manifest_path)
+        else:
+            from skilllite import SkillManager
+
+            manager = SkillManager(skills_dir=skills_dir)
         return SkillLiteToolkit.from_manager(
             manager=manager,
+            prescan=prescan,
             skill_names=skill_names,
             allow_network=allow_network,
             timeout=timeout,
             sandbox_level=sandbox_level,
             confirmation_callback=confirmation_callback,
             async_confirmation_callback=async_confirmation_callback,
+            pool=pool,
+            scan_cache=scan_cache,
+            cache=cache,
+            limits=limits,
+            streaming=streaming,
+            stream_mode=stream_mode,
+            max_output_bytes=max_output_bytes,
+            index=index,
+            description_mode=description_mode,
+            describe_tool=describe_tool,
+            templates=templates,
+            confirmation_queue=confirmation_queue,
+            serializer=serializer,
+            output_policy=output_policy,
         )
 
+    @staticmethod
+    def from_snapshot(
+        path: Union[str, Path],
+        skill_names: Optional[List[str]] = None,
+        allow_network: bool = False,
+        timeout: Optional[int] = None,
+        sandbox_level: int = 3,
+        confirmation_callback: Optional[ConfirmationCallback] = None,
+        async_confirmation_callback: Optional[AsyncConfirmationCallback] = None,
+        *,
+        validate: str = "stat",
+        prescan: bool = False,
+        pool: Optional[Union["PoolConfig", SkillWorkerPool]] = None,
+        scan_cache: Optional[ScanCache] = None,
+        cache: Optional[Union[bool, ResultCache]] = None,
+        limits: Optional[Union[bool, ConcurrencyLimiter]] = None,
+        streaming: bool = False,
+        stream_mode: str = "text",
+        max_output_bytes: Optional[int] = None,
+        index: Optional[Union[str, Path, "SkillIndex"]] = None,
+        description_mode: str = "full",
+        describe_tool: bool = True,
+        templates: Optional["TemplateCache"] = None,
+        confirmation_queue: Optional["ConfirmationQueue"] = None,
+        serializer: Optional[Union[str, "Serializer"]] = None,
+        output_policy: Optional["OutputPolicy"] = None,
+    ) -> List[SkillLiteTool]:
+        """
+        Create LangChain tools from a snapshot written by ``export_snapshot``.
+
+        Skills are registered from the snapshot without parsing SKILL.md;
+        each is parsed on first execution, like ``from_directory(lazy=True)``.
+        Scan verdicts stored in the snapshot are seeded into ``scan_cache``.
+
+        The keyword-only toolkit options (``pool``, ``scan_cache``, ``cache``,
+        ``limits``, ...) are documented on ``SkillLiteToolkit.__init__``.
+
+        Args:
+            path: Snapshot file
+            skill_names: Optional list of skill names to include (default: all)
+            allow_network: Whether to allow network access for all tools
+            timeout: Execution timeout in seconds for all tools
+            sandbox_level: Sandbox security level (1/2/3, default: 3)
+            confirmation_callback: Sync callback for security confirmation
+            async_confirmation_callback: Async callback for security confirmation
+            validate: "stat" (default) re-reads skills whose SKILL.md or
+                scripts directory changed, "hash" also compares SKILL.md
+                hashes, "none" trusts the snapshot
+            prescan: Security-scan skills without a stored verdict up front
+                (see ``from_manager``)
+
+        Returns:
+            List of SkillLiteTool instances
+
+        Raises:
+            SnapshotError: If the file is not a readable snapshot
+        """
+        from langchain_skilllite.discovery import LazySkillManager
+        from langchain_skilllite.scan_cache import ScanCache
+        from langchain_skilllite.snapshot import load_snapshot
+
+        if prescan and scan_cache is None:
+            scan_cache = ScanCache()
+        snapshot = load_snapshot(path, validate=validate)
+
+        manager = LazySkillManager(persist_manifest=False)
+        toolkit = SkillLiteToolkit(
+            manager=manager,
+            skill_names=skill_names,
+            allow_network=allow_network,
+            timeout=timeout,
+            sandbox_level=sandbox_level,
+            confirmation_callback=confirmation_callback,
+            async_confirmation_callback=async_confirmation_callback,
+            pool=pool,
+            scan_cache=scan_cache,
+            cache=cache,
+            limits=limits,
+            streaming=streaming,
+            stream_mode=stream_mode,
+            max_output_bytes=max_output_bytes,
+            index=index,
+            description_mode=description_mode,
+            describe_tool=describe_tool,
+            templates=templates,
+            confirmation_queue=confirmation_queue,
+            serializer=serializer,
+            output_policy=output_policy,
+        )
+        scan_cache = toolkit.scan_cache
+        tools: List[Any] = []
+        for entry in snapshot.entries:
+            if not entry.entry_point or (skill_names and entry.name not in skill_names):
+                continue
+            skill = manager._registry._register_entry(entry.index_entry())
+            if scan_cache is not None and entry.scan_hash and entry.verdict is not None:
+                scan_cache.seed(entry.scan_hash, entry.verdict)
+            tools.append(toolkit._build_tool(skill, entry.tool_description, entry.input_schema))
+        if prescan:
+            # Verdicts seeded from the snapshot count as cached.
+            toolkit.prescan()
+        return toolkit._with_meta_tools(tools)
+
+
+# ============================================================================
+# Backward-compatible alias for the from_directory convenience method
+# ============================================================================
+
+class ExtendedSkillLiteToolkit:
+    """
+    Backward-compatible holder of ``from_directory``.
+
+    ``from_directory`` is defined on SkillLiteToolkit itself; use
+    ``SkillLiteToolkit.from_directory`` directly.
+    """
 
-# Add from_directory method to the imported SkillLiteToolkit for backward compatibility
-# This allows users to call SkillLiteToolkit.from_directory() as before
-SkillLiteToolkit.from_directory = staticmethod(ExtendedSkillLiteToolkit.from_directory)
+    from_directory = staticmethod(SkillLiteToolkit.from_directory)
@@ -0,0 +1,362 @@
+"""
+Hot reload of a skills directory.
+
+Without this module the only way to pick up added or edited skills is to
+call ``from_directory`` again and rebuild every SkillLiteTool.
+WatchingSkillLiteToolkit keeps a skills directory registered and, when it
+changes, re-registers only the affected skills: their tools are rebuilt,
+removed skills disappear, and everything else keeps the same tool objects.
+
+Each reload publishes a new immutable ToolSnapshot with an increasing
+``version``. Agent runs that grabbed a snapshot keep a consistent tool list
+while later runs see the new one; there is no global reload pause.
+
+Changes are detected with ``watchdog`` (inotify on Linux) when installed,
+and by polling file stats otherwise:
+
+    pip install watchdog
+
+Usage:
+    from langchain_skilllite.watch import WatchingSkillLiteToolkit
+
+    toolkit = WatchingSkillLiteToolkit("./skills", sandbox_level=3)
+    toolkit.start()
+
+    snapshot = toolkit.snapshot       # pin for one agent run
+    agent = create_react_agent(llm, list(snapshot.tools))
+    ...
+    toolkit.stop()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from skilllite import SkillManager
+
+from langchain_skilllite.discovery import LazySkillManager
+from langchain_skilllite.tools import SkillLiteTool, SkillLiteToolkit
+
+logger = logging.getLogger(__name__)
+
+_IGNORED_DIRS = {"__pycache__", ".git", "node_modules"}
+
+# (relative path, mtime_ns, size) of every file that defines a skill
+_Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def _skill_signature(skill_dir: Path) -> _Signature:
+    """Stat signature of SKILL.md, the lock file and everything under scripts/."""
+    paths = [skill_dir / "SKILL.md", skill_dir / ".skilllite.lock"]
+    scripts_dir = skill_dir / "scripts"
+    if scripts_dir.is_dir():
+        for root, dirs, names in os.walk(scripts_dir):
+            dirs[:] = sorted(d for d in dirs if d not in _IGNORED_DIRS)
+            paths.extend(Path(root) / name for name in sorted(names))
+
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append((str(path.relative_to(skill_dir)), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _skill_dirs(directory: Path) -> List[Path]:
+    """Skill directories below ``directory``, like SkillRegistry.scan_directory."""
+    if (directory / "SKILL.md").exists():
+        return [directory]
+    try:
+        children = list(directory.iterdir())
+    except OSError:
+        return []
+    return sorted(path for path in children if path.is_dir() and (path / "SKILL.md").exists())
+
+
+@dataclass(frozen=True)
+class ToolSnapshot:
+    """
+    Immutable view of the toolkit's tools at one point in time.
+
+    Attributes:
+        version: Increases by one with every reload that changed something
+        tools: Tools in this snapshot
+        added: Skill names added by the reload that produced this snapshot
+        updated: Skill names whose tools were rebuilt by that reload
+        removed: Skill names removed by that reload
+    """
+
+    version: int
+    tools: Tuple[SkillLiteTool, ...]
+    added: Tuple[str, ...] = ()
+    updated: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+
+    @property
+    def names(self) -> List[str]:
+        return [tool.name for tool in self.tools]
+
+    def get(self, name: str) -> Optional[SkillLiteTool]:
+        """Return the tool for a skill name, if present in this snapshot."""
+        for tool in self.tools:
+            if tool.name == name:
+                return tool
+        return None
+
+    def __iter__(self) -> Iterator[SkillLiteTool]:
+        return iter(self.tools)
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+
+class WatchingSkillLiteToolkit(SkillLiteToolkit):
+    """
+    SkillLiteToolkit that follows changes to its skills directory.
+
+    Call ``refresh()`` to apply pending changes synchronously, or ``start()``
+    to apply them from a background thread as they happen.
+
+    Attributes:
+        skills_dir: Watched directory
+        backend: "watchdog" or "poll", resolved when the watcher starts
+    """
+
+    def __init__(
+        self,
+        skills_dir: Union[str, Path],
+        lazy: bool = False,
+        manifest_path: Optional[str] = None,
+        backend: str = "auto",
+        poll_interval: float = 1.0,
+        debounce: float = 0.2,
+        on_reload: Optional[Callable[[ToolSnapshot], None]] = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the toolkit and load the initial snapshot.
+
+        Args:
+            skills_dir: Directory containing skill folders
+            lazy: Use LazySkillManager for discovery
+            manifest_path: Manifest location for lazy discovery
+            backend: "auto" (watchdog if installed, else polling),
+                "watchdog" or "poll"
+            poll_interval: Seconds between rescans with the polling backend
+            debounce: Seconds to wait after a change event before reloading,
+                so bursts of writes are applied together
+            on_reload: Called with the new snapshot after each reload
+            **kwargs: Options passed to SkillLiteToolkit (sandbox_level,
+                pool, scan_cache, confirmation_callback, ...)
+        """
+        if backend not in ("auto", "watchdog", "poll"):
+            raise ValueError("backend must be 'auto', 'watchdog' or 'poll'")
+        self.skills_dir = Path(skills_dir).resolve()
+        if lazy:
+            manager = LazySkillManager(skills_dir=self.skills_dir, manifest_path=manifest_path)
+        else:
+            manager = SkillManager(skills_dir=self.skills_dir)
+        super().__init__(manager, **kwargs)
+
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.on_reload = on_reload
+
+        self._reload_lock = threading.Lock()
+        self._signatures: Dict[Path, _Signature] = {}
+        self._dir_names: Dict[Path, str] = {}
+        for skill_dir in _skill_dirs(self.skills_dir):
+            self._signatures[skill_dir] = _skill_signature(skill_dir)
+        for skill in manager.list_skills():
+            self._dir_names[Path(skill.path).resolve()] = skill.name
+        self._snapshot = ToolSnapshot(version=1, tools=tuple(super().to_tools()))
+
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer: Any = None
+
+    # ==================== Snapshots ====================
+
+    @property
+    def snapshot(self) -> ToolSnapshot:
+        """The current snapshot; hold on to it for a consistent tool list."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def to_tools(self) -> List[SkillLiteTool]:
+        """Tools of the current snapshot."""
+        return list(self._snapshot.tools)
+
+    # ==================== Reloading ====================
+
+    def refresh(self) -> ToolSnapshot:
+        """
+        Apply changes in the skills directory.
+
+        Only skills whose SKILL.md, lock file or scripts changed are
+        re-registered; tools of unchanged skills are reused as-is.
+
+        Returns:
+            The current snapshot (a new one if anything changed)
+        """
+        with self._reload_lock:
+            current = {d: _skill_signature(d) for d in _skill_dirs(self.skills_dir)}
+            removed_dirs = [d for d in self._signatures if d not in current]
+            changed_dirs = [d for d, sig in current.items() if self._signatures.get(d) != sig]
+            if not removed_dirs and not changed_dirs:
+                return self._snapshot
+
+            registry = self.manager._registry
+            removed_names = []
+            for skill_dir in removed_dirs + changed_dirs:
+                name = self._dir_names.pop(skill_dir, None)
+                if name is not None:
+                    self._unregister(name, skill_dir)
+                    removed_names.append(name)
+                self._signatures.pop(skill_dir, None)
+
+            loaded_names = []
+            for skill_dir in changed_dirs:
+                try:
+                    info = registry.register_skill(skill_dir)
+                except Exception as e:
+                    logger.warning(f"Failed to reload skill at {skill_dir}: {e}")
+                    continue
+                self._signatures[skill_dir] = current[skill_dir]
+                self._dir_names[skill_dir] = info.name
+                loaded_names.append(info.name)
+
+            tools = {tool.name: tool for tool in self._snapshot.tools}
+            for name in removed_names:
+                tools.pop(name, None)
+            for name in loaded_names:
+                if self.skill_names and name not in self.skill_names:
+                    continue
+                if registry.is_executable(name):
+                    tools[name] = self._build_tool(registry.get_skill(name))
+
+            previous = {tool.name for tool in self._snapshot.tools}
+            snapshot = ToolSnapshot(
+                version=self._snapshot.version + 1,
+                tools=tuple(tools.values()),
+                added=tuple(n for n in tools if n not in previous),
+                updated=tuple(n for n in loaded_names if n in previous and n in tools),
+                removed=tuple(n for n in previous if n not in tools),
+            )
+            self._snapshot = snapshot
+
+        logger.info(
+            f"Skills reloaded (v{snapshot.version}): +{len(snapshot.added)} "
+            f"~{len(snapshot.updated)} -{len(snapshot.removed)}"
+        )
+        if self.on_reload:
+            self.on_reload(snapshot)
+        return snapshot
+
+    def _unregister(self, name: str, skill_dir: Path) -> None:
+        """Remove a skill from the registry and drop its per-skill caches."""
+        registry = self.manager._registry
+        registry._skills.pop(name, None)
+        registry._analyzed_skills.discard(name)
+        for tool_name in [
+            t for t, info in registry._multi_script_tools.items() if info["skill_name"] == name
+        ]:
+            del registry._multi_script_tools[tool_name]
+
+        self._batch_tools.pop(name, None)
+        if self.pool is not None:
+            self.pool.invalidate(skill_dir)
+        if self.templates is not None:
+            self.templates.invalidate(skill_dir)
+
+    # ==================== Watching ====================
+
+    def start(self) -> None:
+        """Start watching the skills directory in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._observer = self._start_observer()
+        self._thread = threading.Thread(
+            target=self._watch_loop, name="skilllite-watch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching. The current snapshot stays valid."""
+        self._stop.set()
+        self._changed.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "WatchingSkillLiteToolkit":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _start_observer(self) -> Any:
+        """Start a watchdog observer, or return None to fall back to polling."""
+        if self.backend == "poll":
+            return None
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError as e:
+            if self.backend == "watchdog":
+                raise ImportError(
+                    "watchdog is required for backend='watchdog'. "
+                    "Install it with: pip install watchdog"
+                ) from e
+            self.backend = "poll"
+            return None
+
+        changed = self._changed
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: Any) -> None:
+                changed.set()
+
+        observer = Observer()
+        observer.schedule(_Handler(), str(self.skills_dir), recursive=True)
+        observer.start()
+        self.backend = "watchdog"
+        return observer
+
+    def _watch_loop(self) -> None:
+        polling = self._observer is None
+        while not self._stop.is_set():
+            if polling:
+                self._stop.wait(self.poll_interval)
+            else:
+                self._changed.wait()
+                # Let bursts of writes (editor saves, git checkouts) settle.
+                self._stop.wait(self.debounce)
+                self._changed.clear()
+            if self._stop.is_set():
+                return
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Skill reload failed: {e}")
+
+
+__all__ = ["ToolSnapshot", "WatchingSkillLiteToolkit"]
@@ -0,0 +1,71 @@
+"""Shared fixtures for the unit tests."""
+
+import textwrap
+from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+ECHO_SCRIPT = "print('{}')\n"
+
+USAGE_DOCS = "\n# Usage\n\nFull usage docs.\n"
+
+
+def _write_skill(
+    root: Path,
+    name: str,
+    script: Optional[str] = ECHO_SCRIPT,
+    description: str = "Does things",
+    front_matter: str = "",
+    body: str = USAGE_DOCS,
+    entry_point: str = "scripts/main.py",
+) -> Path:
+    """Write a skill directory with a SKILL.md and (unless ``script`` is None) its entry script."""
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n{front_matter}---\n{body}"
+    )
+    if script is not None:
+        script_path = skill_dir / entry_point
+        script_path.parent.mkdir(parents=True, exist_ok=True)
+        script_path.write_text(textwrap.dedent(script))
+    return skill_dir
+
+
+def _make_skill(
+    root: Path,
+    name: str,
+    script: Optional[str] = ECHO_SCRIPT,
+    entry_point: str = "scripts/main.py",
+    **kwargs,
+) -> MagicMock:
+    """Write a skill directory and return a SkillInfo-like mock pointing at it."""
+    skill_dir = _write_skill(root, name, script, entry_point=entry_point, **kwargs)
+    skill_info = MagicMock()
+    skill_info.name = name
+    skill_info.path = skill_dir
+    skill_info.metadata.entry_point = entry_point
+    skill_info.metadata.resolved_packages = None
+    skill_info.metadata.requires_elevated_permissions = False
+    skill_info.get_full_content.return_value = (skill_dir / "SKILL.md").read_text()
+    return skill_info
+
+
+@pytest.fixture(autouse=True)
+def _cache_home(tmp_path_factory, monkeypatch):
+    """Keep default cache locations (lazy discovery manifests) out of the real home."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
+@pytest.fixture
+def write_skill():
+    """``write_skill(root, name, script=..., description=..., front_matter=..., body=...)``."""
+    return _write_skill
+
+
+@pytest.fixture
+def make_skill():
+    """``make_skill(root, name, ...)``: like ``write_skill`` but returns a SkillInfo-like mock."""
+    return _make_skill
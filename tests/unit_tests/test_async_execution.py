@@ -0,0 +1,81 @@
+"""Unit tests for the asyncio execution helpers."""
+
+import asyncio
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from langchain_skilllite import async_execution
+from langchain_skilllite.pool import _parse_output
+
+
+def _mock_service(script: str) -> MagicMock:
+    """Build a service whose executor runs ``script`` with the current Python."""
+    service = MagicMock()
+    service._executor._build_run_command.return_value = [sys.executable, "-c", script]
+    service._executor._build_env.return_value = None
+    service._executor._parse_output.side_effect = _parse_output
+    return service
+
+
+@pytest.fixture
+def skill_info(tmp_path):
+    info = MagicMock()
+    info.name = "test_skill"
+    info.path = tmp_path
+    info.metadata.entry_point = "scripts/main.py"
+    return info
+
+
+class TestRunSkill:
+    """Tests for async_execution.run_skill."""
+
+    @patch('skilllite.sandbox.execution_service.UnifiedExecutionService.get_instance')
+    async def test_pipes_input_and_parses_output(self, mock_get_instance, skill_info):
+        mock_get_instance.return_value = _mock_service(
+            "import json, sys; print(json.dumps({'echo': json.load(sys.stdin)['x']}))"
+        )
+        context = MagicMock(timeout=10)
+
+        result = await async_execution.run_skill(context, skill_info, {"x": 42})
+
+        assert result.success is True
+        assert result.output == {"echo": 42}
+
+    @patch('skilllite.sandbox.execution_service.UnifiedExecutionService.get_instance')
+    async def test_timeout(self, mock_get_instance, skill_info):
+        mock_get_instance.return_value = _mock_service("import time; time.sleep(5)")
+        context = MagicMock(timeout=0.2)
+
+        result = await async_execution.run_skill(context, skill_info, {})
+
+        assert result.success is False
+        assert "timed out" in result.error
+
+    @patch('skilllite.sandbox.execution_service.UnifiedExecutionService.get_instance')
+    async def test_many_calls_in_flight(self, mock_get_instance, skill_info):
+        mock_get_instance.return_value = _mock_service(
+            "import time; time.sleep(0.3); print('done')"
+        )
+        context = MagicMock(timeout=10)
+
+        results = await asyncio.gather(
+            *(async_execution.run_skill(context, skill_info, {}) for _ in range(20))
+        )
+
+        assert all(r.success for r in results)
+
+
+class TestScanSkill:
+    """Tests for async_execution.scan_skill."""
+
+    async def test_no_skillbox_binary_is_safe(self, skill_info):
+        scanner = MagicMock()
+        scanner.skillbox_path = None
+        scanner._generate_input_hash.return_value = "hash"
+        with patch('skilllite.core.security.SecurityScanner.get_instance', return_value=scanner):
+            result = await async_execution.scan_skill(skill_info, {})
+
+        assert result.is_safe is True
+        assert result.requires_confirmation is False
@@ -0,0 +1,56 @@
+"""Smoke tests for the benchmark runner."""
+
+import json
+
+from benchmarks.run import compare, main, timing_result, value_result
+from benchmarks.skillgen import generate_skills
+
+
+def test_generate_skills_reuses_complete_directory(tmp_path):
+    skills_dir = generate_skills(tmp_path, 3)
+    skill_md = skills_dir / "bench-skill-00000" / "SKILL.md"
+    mtime = skill_md.stat().st_mtime_ns
+
+    assert generate_skills(tmp_path, 3) == skills_dir
+    assert len([p for p in skills_dir.iterdir() if p.is_dir()]) == 3
+    assert skill_md.stat().st_mtime_ns == mtime
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "results": [
+            timing_result("latency", {"level": 1}, [1.0]),
+            value_result("throughput", {"concurrency": 8}, 100.0, "calls/s", "higher"),
+        ]
+    }
+    report = {
+        "results": [
+            timing_result("latency", {"level": 1}, [1.1]),
+            value_result("throughput", {"concurrency": 8}, 50.0, "calls/s", "higher"),
+        ]
+    }
+
+    regressions = compare(report, baseline, threshold=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("throughput")
+
+
+def test_runner_writes_json_report(tmp_path):
+    output = tmp_path / "results.json"
+
+    status = main([
+        "--only", "construction,callbacks",
+        "--sizes", "5",
+        "--repeats", "1",
+        "--calls", "2",
+        "--workdir", str(tmp_path / "work"),
+        "-o", str(output),
+    ])
+
+    report = json.loads(output.read_text())
+    assert status == 0
+    assert report["metadata"]["versions"]["langchain-skilllite"]
+    names = {(r["name"], json.dumps(r["params"], sort_keys=True)) for r in report["results"]}
+    assert ("construction", '{"mode": "eager", "skills": 5}') in names
+    assert ("callback_overhead", '{"handler": "callback"}') in names
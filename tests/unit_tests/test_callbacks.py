@@ -1,9 +1,15 @@
 """Unit tests for SkillLiteCallbackHandler."""
 
-import pytest
+import asyncio
+import json
+import queue
+import threading
 from uuid import uuid4
 
-from langchain_skilllite.callbacks import SkillLiteCallbackHandler
+import pytest
+
+from langchain_skilllite.callbacks import AsyncSkillLiteCallbackHandler, SkillLiteCallbackHandler
+from langchain_skilllite.timing import TIMING_EVENT
 
 
 class TestSkillLiteCallbackHandler:
@@ -14,7 +20,7 @@ class TestSkillLiteCallbackHandler:
         handler = SkillLiteCallbackHandler()
         
         assert handler.verbose is False
-        assert handler.execution_log == []
+        assert list(handler.execution_log) == []
 
     def test_handler_verbose_mode(self):
         """Test handler with verbose mode."""
@@ -105,6 +111,20 @@ class TestSkillLiteCallbackHandler:
         assert summary["errors"] == 1
         assert summary["success_rate"] == 0.5
 
+    def test_cache_events_counted(self):
+        """Test that result cache custom events show up in the summary."""
+        handler = SkillLiteCallbackHandler()
+
+        handler.on_custom_event("skilllite_cache", {"skill_name": "tool1", "hit": False}, run_id=uuid4())
+        handler.on_custom_event("skilllite_cache", {"skill_name": "tool1", "hit": True}, run_id=uuid4())
+        handler.on_custom_event("other_event", {"hit": True}, run_id=uuid4())
+
+        summary = handler.get_execution_summary()
+        assert [e["event"] for e in handler.execution_log] == ["cache_miss", "cache_hit"]
+        assert summary["cache_hits"] == 1
+        assert summary["cache_misses"] == 1
+        assert summary["cache_hit_rate"] == 0.5
+
     def test_clear_log(self):
         """Test clearing the execution log."""
         handler = SkillLiteCallbackHandler()
@@ -127,3 +147,201 @@ class TestSkillLiteCallbackHandler:
         assert "SkillLite" in captured.out
         assert "test_tool" in captured.out
 
+
+class TestBoundedExecutionLog:
+    """Tests for the ring-buffer log, O(1) counters and event sinks."""
+
+    @staticmethod
+    def _run_tools(handler, count):
+        for i in range(count):
+            run_id = uuid4()
+            handler.on_tool_start({"name": f"tool{i}"}, "input", run_id=run_id)
+            handler.on_tool_end("output", run_id=run_id)
+
+    def test_ring_buffer_keeps_recent_events(self):
+        handler = SkillLiteCallbackHandler(max_log_size=4)
+
+        self._run_tools(handler, 5)
+
+        assert len(handler.execution_log) == 4
+        assert handler.execution_log[0]["tool_name"] == "tool3"
+        assert handler.execution_log[-1]["tool_name"] == "tool4"
+
+    def test_log_slicing_and_recent(self):
+        handler = SkillLiteCallbackHandler(max_log_size=4)
+
+        self._run_tools(handler, 5)
+
+        log = handler.execution_log
+        assert [e["tool_name"] for e in log[-3:]] == ["tool3", "tool4", "tool4"]
+        assert log.recent(3) == log[-3:]
+        assert log.recent(10) == list(log)
+        assert log.recent(0) == []
+
+    def test_summary_counts_evicted_events(self):
+        handler = SkillLiteCallbackHandler(max_log_size=2)
+
+        self._run_tools(handler, 10)
+
+        summary = handler.get_execution_summary()
+        assert summary["total_events"] == 20
+        assert summary["tool_executions"] == 10
+        assert summary["success_rate"] == 1.0
+
+    def test_clear_log_resets_counters(self):
+        handler = SkillLiteCallbackHandler()
+        self._run_tools(handler, 3)
+
+        handler.clear_log()
+
+        assert handler.get_execution_summary()["total_events"] == 0
+
+    def test_jsonl_sink_without_memory_log(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        handler = SkillLiteCallbackHandler(max_log_size=0, sink=path)
+
+        self._run_tools(handler, 3)
+        handler.close()
+
+        assert len(handler.execution_log) == 0
+        events = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [e["event"] for e in events] == ["tool_start", "tool_end"] * 3
+
+    def test_queue_sink_counts_drops(self):
+        events = queue.Queue(maxsize=3)
+        handler = SkillLiteCallbackHandler(sink=events)
+
+        self._run_tools(handler, 2)
+
+        assert events.qsize() == 3
+        assert handler.dropped_events == 1
+
+        handler.clear_log()
+        assert handler.dropped_events == 0
+
+    def test_callable_sink(self):
+        received = []
+        handler = SkillLiteCallbackHandler(sink=received.append)
+
+        self._run_tools(handler, 1)
+
+        assert [e["event"] for e in received] == ["tool_start", "tool_end"]
+
+    def test_invalid_sink(self):
+        with pytest.raises(TypeError):
+            SkillLiteCallbackHandler(sink=42)
+
+
+class TestLatencyTracking:
+    """Tests for per-run timing, phase events and latency percentiles."""
+
+    def test_interleaved_runs_are_timed_independently(self):
+        handler = SkillLiteCallbackHandler()
+        first, second = uuid4(), uuid4()
+
+        handler.on_tool_start({"name": "slow"}, "input", run_id=first)
+        handler.on_tool_start({"name": "fast"}, "input", run_id=second)
+        assert handler._current_tool == "fast"
+        handler.on_tool_end("output", run_id=second)
+        handler.on_tool_error(ValueError("boom"), run_id=first)
+
+        fast, slow = handler.execution_log[2], handler.execution_log[3]
+        assert fast["tool_name"] == "fast"
+        assert slow["tool_name"] == "slow"
+        assert slow["duration"] >= fast["duration"] >= 0
+        assert handler._current_tool is None
+
+    def test_phase_events_attached_to_run(self):
+        handler = SkillLiteCallbackHandler()
+        run_id = uuid4()
+
+        handler.on_tool_start({"name": "skill"}, "input", run_id=run_id)
+        handler.on_custom_event(
+            TIMING_EVENT,
+            {"skill_name": "skill", "phases": {"sandbox_spawn": 0.02, "execution": 0.1}},
+            run_id=run_id,
+        )
+        handler.on_tool_end("output", run_id=run_id)
+
+        assert handler.execution_log[-1]["phases"] == {"sandbox_spawn": 0.02, "execution": 0.1}
+        phases = handler.get_execution_summary()["phases"]["skill"]
+        assert phases["execution"]["count"] == 1
+        assert phases["sandbox_spawn"]["p50"] == pytest.approx(0.02, rel=0.01)
+
+    def test_summary_percentiles(self):
+        handler = SkillLiteCallbackHandler()
+        for _ in range(10):
+            run_id = uuid4()
+            handler.on_tool_start({"name": "skill"}, "input", run_id=run_id)
+            handler.on_tool_end("output", run_id=run_id)
+
+        latency = handler.get_execution_summary()["latency"]["skill"]
+        assert latency["count"] == 10
+        assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+        assert handler.get_latency_histogram("skill").count == 10
+
+        handler.clear_log()
+        assert handler.get_execution_summary()["latency"] == {}
+
+
+class TestConcurrentHandlers:
+    """Tests for parallel tool runs sharing one handler."""
+
+    def test_threads_attribute_runs_correctly(self):
+        handler = SkillLiteCallbackHandler(max_log_size=None, shards=4)
+        barrier = threading.Barrier(8)
+
+        def worker(index):
+            barrier.wait()
+            for _ in range(200):
+                run_id = uuid4()
+                handler.on_tool_start({"name": f"tool{index}"}, "input", run_id=run_id)
+                handler.on_tool_end(f"out{index}", run_id=run_id)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = handler.get_execution_summary()
+        assert summary["tool_executions"] == 1600
+        assert summary["successful"] == 1600
+        assert all(summary["latency"][f"tool{i}"]["count"] == 200 for i in range(8))
+        for event in handler.execution_log:
+            if event["event"] == "tool_end":
+                assert event["output_preview"] == "out" + event["tool_name"][4:]
+        assert handler._runs == {}
+
+    async def test_async_handler_interleaved_runs(self):
+        handler = AsyncSkillLiteCallbackHandler()
+
+        async def run(name, delay):
+            run_id = uuid4()
+            await handler.on_tool_start({"name": name}, "input", run_id=run_id)
+            await asyncio.sleep(delay)
+            await handler.on_tool_end(name, run_id=run_id)
+
+        await asyncio.gather(run("slow", 0.05), run("fast", 0.0))
+
+        ends = [e for e in handler.execution_log if e["event"] == "tool_end"]
+        assert [e["tool_name"] for e in ends] == ["fast", "slow"]
+        assert all(e["output_preview"] == e["tool_name"] for e in ends)
+        assert handler.get_execution_summary()["success_rate"] == 1
+
+    async def test_async_handler_with_tool(self):
+        from langchain_core.tools import tool
+
+        @tool
+        async def echo(text: str) -> str:
+            """Echo text."""
+            return text
+
+        handler = AsyncSkillLiteCallbackHandler()
+        await asyncio.gather(
+            *(echo.ainvoke({"text": str(i)}, config={"callbacks": [handler]}) for i in range(5))
+        )
+
+        summary = handler.get_execution_summary()
+        assert summary["tool_executions"] == 5
+        assert summary["latency"]["echo"]["count"] == 5
@@ -0,0 +1,146 @@
+"""Unit tests for deferred security confirmation."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from langchain_skilllite.confirmation import ConfirmationQueue, UnknownTicketError
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.tools import SecurityScanResult, SkillLiteTool
+
+SCRIPT = (
+    "import json, sys\n"
+    "data = json.loads(sys.stdin.read())\n"
+    "print(json.dumps({'result': data['text'].upper()}))\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def scanner(monkeypatch):
+    monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "3")
+    scanner = MagicMock()
+    scanner.scan_skill.return_value = SecurityScanResult(
+        is_safe=False,
+        issues=[{"severity": "High", "rule_id": "py-exec", "description": "exec call"}],
+        scan_id="scan-1",
+        code_hash="hash",
+        high_severity_count=1,
+    )
+    with patch('skilllite.core.security.SecurityScanner.get_instance', return_value=scanner):
+        yield scanner
+
+
+@pytest.fixture
+def pool():
+    pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def clear_confirmations():
+    SkillLiteTool._confirmed_skills.clear()
+    yield
+    SkillLiteTool._confirmed_skills.clear()
+
+
+def _tool(skill, pool, queue, callback=None):
+    manager = MagicMock()
+    manager._registry.get_skill.return_value = skill
+    return SkillLiteTool(
+        name=skill.name,
+        description="A risky skill",
+        manager=manager,
+        skill_name=skill.name,
+        pool=pool,
+        confirmation_callback=callback,
+        confirmation_queue=queue,
+    )
+
+
+class TestConfirmationQueue:
+    """Tests for ticket storage."""
+
+    def test_tickets_expire(self, tmp_path, make_skill, pool):
+        queue = ConfirmationQueue(ttl=0.05)
+        _tool(make_skill(tmp_path, "risky", SCRIPT), pool, queue)._run(text="a")
+        assert "scan-1" in queue
+
+        time.sleep(0.1)
+
+        assert len(queue) == 0 and queue.expired == 1
+        with pytest.raises(UnknownTicketError):
+            queue.approve("scan-1")
+
+    def test_bounded_and_unique_ids(self, tmp_path, make_skill, pool):
+        queue = ConfirmationQueue(max_pending=2)
+        tool = _tool(make_skill(tmp_path, "risky", SCRIPT), pool, queue)
+
+        tool._run(text="a")
+        tool._run(text="b")
+        refused = tool._run(text="c")
+
+        assert [t.scan_id for t in queue.pending()] == ["scan-1", "scan-1-2"]
+        assert refused.startswith("Error: Too many pending security confirmations")
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            ConfirmationQueue(ttl=0)
+        with pytest.raises(ValueError):
+            ConfirmationQueue(max_pending=0)
+
+
+class TestDeferredExecution:
+    """Tests for parking and resuming tool calls."""
+
+    def test_park_then_approve(self, tmp_path, make_skill, pool):
+        queue = ConfirmationQueue()
+        callback = MagicMock(return_value=True)
+        tool = _tool(make_skill(tmp_path, "risky", SCRIPT), pool, queue, callback)
+
+        pending = tool._run(text="hi")
+
+        assert pending.startswith("Error: Security confirmation pending (scan_id=scan-1)")
+        assert queue.get("scan-1").input_data == {"text": "hi"}
+        assert pool.stats() == {}
+        callback.assert_not_called()
+
+        result = queue.approve("scan-1")
+        assert result.output == {"result": "HI"}
+        # The approval is remembered: the next call runs without a ticket.
+        assert tool._run(text="x") == {"result": "X"}
+        assert len(queue) == 0
+
+    def test_reject(self, tmp_path, make_skill, pool):
+        queue = ConfirmationQueue()
+        tool = _tool(make_skill(tmp_path, "risky", SCRIPT), pool, queue)
+        tool._run(text="hi")
+
+        result = queue.reject("scan-1")
+
+        assert "cancelled by user" in result.error
+        assert pool.stats() == {}
+        with pytest.raises(UnknownTicketError):
+            queue.reject("scan-1")
+
+    def test_changed_code_not_approved(self, tmp_path, make_skill, pool):
+        queue = ConfirmationQueue()
+        skill = make_skill(tmp_path, "risky", SCRIPT)
+        tool = _tool(skill, pool, queue)
+        tool._run(text="hi")
+
+        (skill.path / "scripts" / "main.py").write_text(SCRIPT + "# changed\n")
+        result = queue.approve("scan-1")
+
+        assert "changed after scan scan-1" in result.error
+        assert pool.stats() == {}
+
+    async def test_async_approve(self, tmp_path, make_skill, pool):
+        queue = ConfirmationQueue()
+        tool = _tool(make_skill(tmp_path, "risky", SCRIPT), pool, queue)
+        tool._run(text="hi")
+
+        result = await queue.aapprove("scan-1")
+
+        assert result.output == {"result": "HI"}
@@ -0,0 +1,117 @@
+"""Unit tests for compact, shared tool descriptions."""
+
+import os
+
+import pytest
+from skilllite import SkillManager
+
+from langchain_skilllite.descriptions import DESCRIBE_TOOL_NAME, default_store
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.tools import SkillLiteToolkit
+
+UPPER_SCRIPT = (
+    "import json, sys\n"
+    "data = json.loads(sys.stdin.read())\n"
+    "print(json.dumps({'result': data['text'].upper()}))\n"
+)
+
+SKILL = {
+    "description": "Uppercase text",
+    "front_matter": (
+        "input_schema:\n  type: object\n  properties:\n    text:\n      type: string\n"
+        "  required: [text]\n"
+    ),
+    "body": "\n# Usage\n\n" + "Long usage documentation. " * 50 + "\n",
+}
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    root = tmp_path / "skills"
+    write_skill(root, "upper-a", UPPER_SCRIPT, **SKILL)
+    write_skill(root, "upper-b", UPPER_SCRIPT, **SKILL)
+    return root
+
+
+def _by_name(tools):
+    return {tool.name: tool for tool in tools}
+
+
+class TestSummaryMode:
+    """Tests for description_mode="summary"."""
+
+    def test_compact_description_and_schema(self, skills_dir):
+        tools = _by_name(SkillLiteToolkit.from_directory(str(skills_dir), description_mode="summary"))
+
+        upper = tools["upper-a"]
+        assert upper.description.startswith("Uppercase text")
+        assert "Long usage documentation" not in upper.description
+        assert upper.tool_call_schema["properties"] == {"text": {"type": "string"}}
+        assert DESCRIBE_TOOL_NAME in tools
+
+    def test_describe_tool_returns_full_content(self, skills_dir):
+        tools = _by_name(SkillLiteToolkit.from_directory(
+            str(skills_dir), description_mode="summary", skill_names=["upper-a"]
+        ))
+        describe = tools[DESCRIBE_TOOL_NAME]
+
+        assert "Long usage documentation" in describe.invoke({"skill_name": "upper-a"})
+        assert describe.invoke({"skill_name": "upper-b"}).startswith("Error: unknown skill")
+
+    def test_describe_tool_can_be_disabled(self, skills_dir):
+        toolkit = SkillLiteToolkit(
+            SkillManager(skills_dir=str(skills_dir)), description_mode="summary", describe_tool=False
+        )
+
+        tools = toolkit.to_tools()
+
+        assert DESCRIBE_TOOL_NAME not in _by_name(tools)
+        assert tools[0].description == "Uppercase text"
+
+    def test_schema_tool_still_executes(self, skills_dir):
+        pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+        try:
+            tools = _by_name(SkillLiteToolkit.from_directory(
+                str(skills_dir), sandbox_level=1, pool=pool, description_mode="summary"
+            ))
+
+            assert tools["upper-a"].invoke({"text": "hi"}) == {"result": "HI"}
+        finally:
+            pool.shutdown()
+
+    def test_invalid_mode(self, skills_dir):
+        with pytest.raises(ValueError):
+            SkillLiteToolkit(SkillManager(skills_dir=str(skills_dir)), description_mode="tiny")
+
+
+class TestSharing:
+    """Tests for process-wide sharing of descriptions and schemas."""
+
+    def test_toolkits_share_strings_and_schemas(self, skills_dir):
+        first = _by_name(SkillLiteToolkit.from_directory(str(skills_dir), description_mode="summary"))
+        second = _by_name(SkillLiteToolkit.from_directory(str(skills_dir), description_mode="summary"))
+
+        assert first["upper-a"].description is second["upper-a"].description
+        assert first["upper-a"].args_schema is second["upper-a"].args_schema
+        # Identical declarations in different skills share one schema object.
+        assert first["upper-a"].args_schema is first["upper-b"].args_schema
+
+    def test_full_descriptions_interned(self, skills_dir):
+        first = _by_name(SkillLiteToolkit.from_directory(str(skills_dir)))
+        second = _by_name(SkillLiteToolkit.from_directory(str(skills_dir)))
+
+        assert "Long usage documentation" in first["upper-a"].description
+        assert first["upper-a"].description is second["upper-a"].description
+        assert first["upper-a"].args_schema is None
+
+    def test_schema_cache_follows_skill_md(self, skills_dir):
+        skill_md = skills_dir / "upper-a" / "SKILL.md"
+        toolkit = SkillLiteToolkit(SkillManager(skills_dir=str(skills_dir)))
+        skill = toolkit.manager.get_skill("upper-a")
+        assert default_store().input_schema(skill)["required"] == ["text"]
+
+        skill_md.write_text(skill_md.read_text().replace("required: [text]", "required: []"))
+        stat = skill_md.stat()
+        os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert default_store().input_schema(skill)["required"] == []
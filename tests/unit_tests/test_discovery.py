@@ -0,0 +1,116 @@
+"""Unit tests for lazy, manifest-backed skill discovery."""
+
+import json
+import os
+
+import pytest
+
+from langchain_skilllite.discovery import (
+    LazySkillInfo,
+    LazySkillManager,
+    default_manifest_path,
+    front_matter,
+)
+from langchain_skilllite.tools import SkillLiteToolkit
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    root = tmp_path / "skills"
+    write_skill(root, "alpha")
+    write_skill(root, "beta", description="Beta skill")
+    write_skill(root, "notes", script=None)
+    return root
+
+
+class TestLazySkillManager:
+    """Tests for LazySkillManager."""
+
+    def test_indexes_without_parsing(self, skills_dir):
+        manager = LazySkillManager(skills_dir=skills_dir)
+
+        alpha = manager.get_skill("alpha")
+        assert isinstance(alpha, LazySkillInfo)
+        assert alpha.description == "Does things"
+        assert sorted(s.name for s in manager.list_executable_skills()) == ["alpha", "beta"]
+        assert [s.name for s in manager.list_prompt_only_skills()] == ["notes"]
+        assert not any(s.is_loaded for s in manager.list_skills())
+
+    def test_full_metadata_loaded_on_first_use(self, skills_dir):
+        alpha = LazySkillManager(skills_dir=skills_dir).get_skill("alpha")
+
+        assert alpha.metadata.entry_point == "scripts/main.py"
+        assert alpha.is_loaded
+        assert "Full usage docs." in alpha.get_full_content()
+
+    def test_manifest_reused_across_starts(self, skills_dir):
+        first = LazySkillManager(skills_dir=skills_dir)
+        assert first._registry.parsed == 3
+        assert default_manifest_path(skills_dir).exists()
+        assert sorted(p.name for p in skills_dir.iterdir()) == ["alpha", "beta", "notes"]
+
+        second = LazySkillManager(skills_dir=skills_dir)
+        assert (second._registry.parsed, second._registry.reused) == (0, 3)
+
+    def test_only_changed_skills_reparsed(self, skills_dir, write_skill):
+        LazySkillManager(skills_dir=skills_dir)
+        skill_md = skills_dir / "beta" / "SKILL.md"
+        skill_md.write_text("---\nname: beta\ndescription: Updated beta\n---\n")
+        stat = skill_md.stat()
+        os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        write_skill(skills_dir, "gamma")
+
+        manager = LazySkillManager(skills_dir=skills_dir)
+
+        assert (manager._registry.parsed, manager._registry.reused) == (2, 2)
+        assert manager.get_skill("beta").description == "Updated beta"
+        manifest = json.loads(default_manifest_path(skills_dir).read_text())
+        assert len(manifest["skills"]) == 4
+
+    def test_custom_manifest_path(self, skills_dir, tmp_path):
+        manifest_path = tmp_path / "index" / "manifest.json"
+        LazySkillManager(skills_dir=skills_dir, manifest_path=manifest_path)
+
+        assert manifest_path.exists()
+        assert not default_manifest_path(skills_dir).exists()
+
+    def test_corrupt_manifest_ignored(self, skills_dir):
+        manifest_path = default_manifest_path(skills_dir)
+        manifest_path.parent.mkdir(parents=True)
+        manifest_path.write_text("{not json")
+
+        manager = LazySkillManager(skills_dir=skills_dir)
+
+        assert manager._registry.parsed == 3
+
+
+class TestFrontMatter:
+    """Tests for the shared front-matter cache."""
+
+    def test_parsed_once_until_changed(self, skills_dir, write_skill):
+        first = front_matter(skills_dir / "beta")
+        assert first["description"] == "Beta skill"
+        assert front_matter(skills_dir / "beta") is first
+
+        write_skill(skills_dir, "beta", description="Beta skill, v2")
+        os.utime(skills_dir / "beta" / "SKILL.md", ns=(1, 1))
+
+        assert front_matter(skills_dir / "beta")["description"] == "Beta skill, v2"
+
+    def test_missing_or_invalid(self, tmp_path, write_skill):
+        write_skill(tmp_path, "broken", front_matter="key: [unclosed\n")
+
+        assert front_matter(tmp_path / "missing") == {}
+        assert front_matter(tmp_path / "broken") == {}
+
+
+class TestFromDirectoryLazy:
+    """Tests for SkillLiteToolkit.from_directory(lazy=True)."""
+
+    def test_tools_use_front_matter_description(self, skills_dir):
+        tools = SkillLiteToolkit.from_directory(str(skills_dir), lazy=True)
+
+        by_name = {tool.name: tool for tool in tools}
+        assert sorted(by_name) == ["alpha", "beta"]
+        assert by_name["beta"].description == "Beta skill"
+        assert not by_name["alpha"].manager.get_skill("alpha").is_loaded
@@ -0,0 +1,82 @@
+"""Import-time tests: the package must stay cheap to import."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import langchain_skilllite
+
+# Opt-in bound for ``import langchain_skilllite`` alone, in seconds (set
+# SKILLLITE_IMPORT_BUDGET, e.g. 0.1 on a quiet machine). Eager imports of
+# skilllite and LangChain take several hundred milliseconds; the module check
+# below catches them without depending on machine speed.
+IMPORT_BUDGET_ENV = "SKILLLITE_IMPORT_BUDGET"
+
+HEAVY_MODULES = ("skilllite", "langchain_core", "pydantic", "yaml")
+
+
+def _import_in_subprocess(statement: str) -> dict:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def _loaded(modules, prefixes):
+    return [m for m in modules if m.split(".")[0] in prefixes]
+
+
+def test_package_import_is_lazy():
+    result = _import_in_subprocess("import langchain_skilllite")
+
+    assert _loaded(result["modules"], HEAVY_MODULES) == []
+
+
+@pytest.mark.skipif(IMPORT_BUDGET_ENV not in os.environ, reason=f"set {IMPORT_BUDGET_ENV} to time it")
+def test_package_import_within_budget():
+    result = _import_in_subprocess("import langchain_skilllite")
+
+    assert result["elapsed"] < float(os.environ[IMPORT_BUDGET_ENV])
+
+
+def test_callbacks_do_not_load_sdk_adapter():
+    result = _import_in_subprocess("from langchain_skilllite import SkillLiteCallbackHandler")
+
+    assert "skilllite.core.adapters.langchain" not in result["modules"]
+
+
+@pytest.mark.parametrize("name", langchain_skilllite.__all__)
+def test_public_names_resolve(name):
+    assert getattr(langchain_skilllite, name) is not None
+    assert name in dir(langchain_skilllite)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        _ = langchain_skilllite.DoesNotExist
+
+
+def test_tools_reexports_resolve():
+    from skilllite import SkillManager
+
+    from langchain_skilllite.tools import (
+        ExtendedSkillLiteToolkit,
+        SecurityScanResult,
+        SkillLiteToolkit,
+    )
+    from langchain_skilllite.tools import SkillManager as ReexportedManager
+
+    assert ReexportedManager is SkillManager
+    assert SecurityScanResult.__name__ == "SecurityScanResult"
+    assert "from_directory" in vars(SkillLiteToolkit)
+    assert ExtendedSkillLiteToolkit.from_directory is SkillLiteToolkit.from_directory
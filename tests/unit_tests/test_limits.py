@@ -0,0 +1,158 @@
+"""Unit tests for concurrency limits and admission control."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_skilllite.limits import (
+    ConcurrencyLimiter,
+    QueueFullError,
+    QueueTimeoutError,
+)
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.tools import SkillLiteToolkit
+
+UPPER_SCRIPT = (
+    "import json, sys\n"
+    "data = json.loads(sys.stdin.read())\n"
+    "print(json.dumps({'result': data['text'].upper()}))\n"
+)
+
+LIMIT_ONE = "max_concurrency: 1\n"
+
+
+class TestConcurrencyLimiter:
+    """Tests for ConcurrencyLimiter."""
+
+    def test_per_skill_limit_across_threads(self, tmp_path, make_skill):
+        limiter = ConcurrencyLimiter(skill_limits={"heavy": 2}, max_queue=None)
+        skill = make_skill(tmp_path, "heavy")
+        running = peak = 0
+        lock = threading.Lock()
+
+        def run():
+            nonlocal running, peak
+            lease = limiter.acquire(skill)
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            lease.release()
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+        assert limiter.stats()["skills"]["heavy"] == {"limit": 2, "active": 0, "queued": 0}
+
+    def test_global_limit_spans_skills(self, tmp_path, make_skill):
+        limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=0)
+        lease = limiter.acquire(make_skill(tmp_path, "a"))
+
+        with pytest.raises(QueueFullError, match="concurrency limit"):
+            limiter.acquire(make_skill(tmp_path, "b"))
+        lease.release()
+        limiter.acquire(make_skill(tmp_path, "b")).release()
+        assert limiter.rejected == 1
+
+    def test_front_matter_limit(self, tmp_path, make_skill):
+        limiter = ConcurrencyLimiter(default_skill_limit=5)
+
+        assert limiter.limit_for(make_skill(tmp_path, "declared", front_matter=LIMIT_ONE)) == 1
+        assert limiter.limit_for(make_skill(tmp_path, "plain")) == 5
+
+    def test_queue_timeout(self, tmp_path, make_skill):
+        limiter = ConcurrencyLimiter(skill_limits={"heavy": 1}, queue_timeout=0.05)
+        skill = make_skill(tmp_path, "heavy")
+        lease = limiter.acquire(skill)
+
+        with pytest.raises(QueueTimeoutError):
+            limiter.acquire(skill)
+        lease.release()
+        assert limiter.timed_out == 1
+        assert limiter.stats()["skills"]["heavy"]["queued"] == 0
+
+    async def test_async_and_sync_share_slots(self, tmp_path, make_skill):
+        limiter = ConcurrencyLimiter(skill_limits={"heavy": 1}, queue_timeout=0.05)
+        skill = make_skill(tmp_path, "heavy")
+        lease = limiter.acquire(skill)
+
+        with pytest.raises(QueueTimeoutError):
+            await limiter.aacquire(skill)
+        lease.release()
+        (await limiter.aacquire(skill)).release()
+
+    async def test_slot_handed_to_async_waiter(self, tmp_path, make_skill):
+        limiter = ConcurrencyLimiter(skill_limits={"heavy": 1})
+        skill = make_skill(tmp_path, "heavy")
+        lease = limiter.acquire(skill)
+
+        waiter = asyncio.ensure_future(limiter.aacquire(skill))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        threading.Thread(target=lease.release).start()
+        (await asyncio.wait_for(waiter, 1)).release()
+
+        assert limiter.stats()["skills"]["heavy"]["active"] == 0
+
+    async def test_cancelled_waiter_leaves_queue(self, tmp_path, make_skill):
+        limiter = ConcurrencyLimiter(skill_limits={"heavy": 1})
+        skill = make_skill(tmp_path, "heavy")
+        lease = limiter.acquire(skill)
+
+        waiter = asyncio.ensure_future(limiter.aacquire(skill))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        lease.release()
+
+        assert limiter.stats()["skills"]["heavy"] == {"limit": 1, "active": 0, "queued": 0}
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(max_concurrency=0)
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(skill_limits={"heavy": 0})
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(max_queue=-1)
+
+
+class TestToolAdmission:
+    """Tests for limits applied by SkillLiteTool."""
+
+    def test_toolkit_limits_option(self):
+        limiter = ConcurrencyLimiter(max_concurrency=4)
+
+        assert isinstance(SkillLiteToolkit(MagicMock()).limiter, ConcurrencyLimiter)
+        assert SkillLiteToolkit(MagicMock(), limits=False).limiter is None
+        assert SkillLiteToolkit(MagicMock(), limits=limiter).limiter is limiter
+
+    async def test_rejection_returned_as_tool_error(self, tmp_path, make_skill):
+        skills_dir = tmp_path / "skills"
+        make_skill(skills_dir, "heavy", UPPER_SCRIPT, front_matter=LIMIT_ONE)
+        limiter = ConcurrencyLimiter(max_queue=0)
+        pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+        try:
+            tool = SkillLiteToolkit.from_directory(
+                str(skills_dir), sandbox_level=1, pool=pool, cache=False, limits=limiter
+            )[0]
+            lease = limiter.acquire(tool.manager.get_skill("heavy"))
+
+            rejected = tool.invoke({"text": "hi"})
+            arejected = await tool.ainvoke({"text": "hi"})
+            lease.release()
+
+            assert rejected.startswith("Error: Skill 'heavy' is at its concurrency limit")
+            assert arejected == rejected
+            assert tool.invoke({"text": "hi"}) == {"result": "HI"}
+        finally:
+            pool.shutdown()
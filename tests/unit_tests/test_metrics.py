@@ -0,0 +1,194 @@
+"""Unit tests for the SkillLite metrics exporters and handler."""
+
+import urllib.request
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from skilllite.sandbox.base import ExecutionResult
+
+from langchain_skilllite.metrics import (
+    SANDBOX_LEVEL_METADATA_KEY,
+    PrometheusExporter,
+    SkillLiteMetricsHandler,
+)
+from langchain_skilllite.result_cache import CACHE_EVENT
+from langchain_skilllite.timing import TIMING_EVENT
+from langchain_skilllite.tools import SkillLiteToolkit
+
+SKILL_METADATA = {SANDBOX_LEVEL_METADATA_KEY: 3}
+
+
+def _toolkit(skill: MagicMock, monkeypatch) -> SkillLiteToolkit:
+    monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+    manager = MagicMock()
+    manager.get_skill.return_value = skill
+    manager._registry.get_skill.return_value = skill
+    pool = MagicMock()
+    pool.supports.return_value = True
+    pool.execute.return_value = ExecutionResult(success=True, output={"ok": 1})
+    return SkillLiteToolkit(manager=manager, sandbox_level=3, pool=pool, cache=False)
+
+
+class TestPrometheusExporter:
+    """Tests for PrometheusExporter and SkillLiteMetricsHandler."""
+
+    def test_records_calls_latency_and_in_flight(self):
+        exporter = PrometheusExporter(buckets=(0.1, 1.0))
+        handler = SkillLiteMetricsHandler(exporter)
+        ok, failed = uuid4(), uuid4()
+
+        handler.on_tool_start({"name": "upper"}, "", run_id=ok, metadata=SKILL_METADATA)
+        handler.on_tool_start({"name": "upper"}, "", run_id=failed, metadata=SKILL_METADATA)
+        assert 'skilllite_tool_in_flight{tool="upper",sandbox_level="3"} 2' in exporter.render()
+
+        handler.on_custom_event(TIMING_EVENT, {"phases": {"execution": 0.5}}, run_id=ok)
+        handler.on_custom_event(CACHE_EVENT, {"hit": False}, run_id=ok)
+        handler.on_tool_end("done", run_id=ok)
+        handler.on_tool_error(ValueError("boom"), run_id=failed)
+
+        text = exporter.render()
+        labels = 'tool="upper",sandbox_level="3"'
+        assert f'skilllite_tool_calls_total{{{labels},status="ok"}} 1' in text
+        assert f'skilllite_tool_calls_total{{{labels},status="error"}} 1' in text
+        assert f"skilllite_tool_in_flight{{{labels}}} 0" in text
+        assert f'skilllite_tool_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f'skilllite_tool_phase_duration_seconds_bucket{{{labels},phase="execution",le="0.1"}} 0' in text
+        assert f'skilllite_tool_phase_duration_seconds_bucket{{{labels},phase="execution",le="1.0"}} 1' in text
+        assert f'skilllite_result_cache_lookups_total{{{labels},result="miss"}} 1' in text
+        assert "# TYPE skilllite_tool_duration_seconds histogram" in text
+
+    def test_bound_instruments_reused(self):
+        exporter = MagicMock(wraps=PrometheusExporter())
+        handler = SkillLiteMetricsHandler(exporter)
+        for _ in range(3):
+            run_id = uuid4()
+            handler.on_tool_start({"name": "upper"}, "", run_id=run_id, metadata=SKILL_METADATA)
+            handler.on_tool_end("done", run_id=run_id)
+
+        exporter.bind.assert_called_once_with("upper", "3")
+
+    def test_non_skilllite_tools_ignored(self):
+        exporter = PrometheusExporter()
+        handler = SkillLiteMetricsHandler(exporter)
+        run_id = uuid4()
+        handler.on_tool_start({"name": "search"}, "", run_id=run_id, metadata={})
+        handler.on_tool_end("done", run_id=run_id)
+
+        assert exporter.render() == ""
+
+    def test_scan_cache_hit_ratio(self):
+        scan_cache = MagicMock(hits=3, misses=1)
+        exporter = PrometheusExporter()
+        SkillLiteMetricsHandler(exporter, scan_cache=scan_cache)
+
+        assert "skilllite_scan_cache_hit_ratio 0.75" in exporter.render()
+
+    def test_label_values_escaped(self):
+        exporter = PrometheusExporter()
+        exporter.bind('we"ird\\tool', "3").started()
+
+        assert 'tool="we\\"ird\\\\tool"' in exporter.render()
+
+    def test_http_endpoint(self):
+        exporter = PrometheusExporter()
+        exporter.bind("upper", "3").started()
+        server = exporter.start_http_server(port=0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode()
+        finally:
+            exporter.shutdown()
+
+        assert "skilllite_tool_in_flight" in body
+
+    def test_toolkit_tools_report_sandbox_level(self, tmp_path, make_skill, monkeypatch):
+        toolkit = _toolkit(make_skill(tmp_path, "upper"), monkeypatch)
+        exporter = PrometheusExporter()
+        handler = SkillLiteMetricsHandler(exporter)
+
+        toolkit._batch_tool("upper").invoke({"text": "hi"}, config={"callbacks": [handler]})
+
+        text = exporter.render()
+        assert 'skilllite_tool_calls_total{tool="upper",sandbox_level="1",status="ok"} 1' in text
+
+    def test_failed_skill_counts_as_error(self, tmp_path, make_skill, monkeypatch):
+        """A skill whose script fails returns an error string; the call still counts as an error."""
+        from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+        skill = make_skill(tmp_path, "broken", script="raise SystemExit('boom')\n")
+        manager = MagicMock()
+        manager.get_skill.return_value = skill
+        manager._registry.get_skill.return_value = skill
+        pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+        toolkit = SkillLiteToolkit(manager=manager, sandbox_level=3, pool=pool, cache=False)
+        exporter = PrometheusExporter()
+        handler = SkillLiteMetricsHandler(exporter)
+        try:
+            output = toolkit._batch_tool("broken").invoke({}, config={"callbacks": [handler]})
+        finally:
+            pool.shutdown()
+
+        assert output.startswith("Error:")
+        text = exporter.render()
+        assert 'skilllite_tool_calls_total{tool="broken",sandbox_level="1",status="error"} 1' in text
+        assert 'skilllite_tool_calls_total{tool="broken",sandbox_level="1",status="ok"} 0' in text
+
+    def test_timing_event_success_flag_sets_status(self):
+        exporter = PrometheusExporter()
+        handler = SkillLiteMetricsHandler(exporter)
+        run_id = uuid4()
+        handler.on_tool_start({"name": "skill"}, "", run_id=run_id, metadata=SKILL_METADATA)
+        handler.on_custom_event(TIMING_EVENT, {"phases": {}, "success": False}, run_id=run_id)
+        handler.on_tool_end("Error: boom", run_id=run_id)
+
+        assert 'status="error"} 1' in exporter.render()
+        assert not handler._failed
+
+    async def test_label_reflects_elevated_permissions(self, tmp_path, make_skill, monkeypatch):
+        skill = make_skill(tmp_path, "upper")
+        skill.metadata.requires_elevated_permissions = True
+        toolkit = _toolkit(skill, monkeypatch)
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "2")
+        exporter = PrometheusExporter()
+        handler = SkillLiteMetricsHandler(exporter)
+
+        await toolkit._batch_tool("upper").ainvoke({"text": "hi"}, config={"callbacks": [handler]})
+
+        assert 'tool="upper",sandbox_level="1"' in exporter.render()
+
+
+class TestOpenTelemetryExporter:
+    """Tests for OpenTelemetryExporter against the SDK's in-memory reader."""
+
+    def test_records_metrics(self):
+        pytest.importorskip("opentelemetry.sdk.metrics")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+        from langchain_skilllite.metrics import OpenTelemetryExporter
+
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader])
+        handler = SkillLiteMetricsHandler(
+            OpenTelemetryExporter(meter_provider=provider),
+            scan_cache=MagicMock(hits=1, misses=1),
+        )
+        run_id = uuid4()
+        handler.on_tool_start({"name": "upper"}, "", run_id=run_id, metadata=SKILL_METADATA)
+        handler.on_tool_end("done", run_id=run_id)
+
+        metrics = {
+            metric.name: metric
+            for resource in reader.get_metrics_data().resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        }
+        calls = metrics["skilllite.tool.calls"].data.data_points[0]
+        assert calls.value == 1
+        assert dict(calls.attributes) == {"tool": "upper", "sandbox_level": "3", "status": "ok"}
+        assert metrics["skilllite.tool.duration"].data.data_points[0].count == 1
+        assert metrics["skilllite.tool.in_flight"].data.data_points[0].value == 0
+        assert metrics["skilllite.scan_cache.hit_ratio"].data.data_points[0].value == 0.5
@@ -0,0 +1,138 @@
+"""Unit tests for the output policy and the output side store."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from skilllite import SkillManager
+
+from langchain_skilllite.callbacks import _output_preview
+from langchain_skilllite.outputs import OutputPolicy, OutputStore, ReadSkillOutputTool
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.tools import SkillLiteToolkit
+
+SCRIPT = (
+    "import json, sys\n"
+    "data = json.loads(sys.stdin.read())\n"
+    "print(json.dumps({'rows': ['row %d' % i for i in range(data['n'])]}))\n"
+)
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    front_matter = "entry_point: scripts/main.py\n"
+    write_skill(tmp_path, "rows", SCRIPT, description="Lists rows", front_matter=front_matter)
+    return tmp_path
+
+
+@pytest.fixture
+def pool():
+    pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+    yield pool
+    pool.shutdown()
+
+
+class TestOutputPolicy:
+    """Tests for truncation."""
+
+    def test_small_output_unchanged(self):
+        policy = OutputPolicy(max_bytes=100)
+        output = {"result": "ok"}
+
+        assert policy.apply(output, "s") is output
+        assert policy.apply("short", "s") == "short"
+
+    @pytest.mark.parametrize("keep", ["head", "tail", "head_tail"])
+    def test_truncation_modes(self, keep):
+        text = "".join(chr(ord("a") + i % 26) for i in range(1000))
+
+        bounded = OutputPolicy(max_bytes=100, keep=keep).apply(text, "s")
+
+        assert "[Output truncated" in bounded and "of 1000 bytes" in bounded
+        assert bounded.startswith(text[:50]) == (keep != "tail")
+        assert bounded.endswith(text[-50:]) == (keep != "head")
+        assert len(bounded.encode("utf-8")) < 100 + 200
+
+    def test_multibyte_characters_not_split(self):
+        bounded = OutputPolicy(max_bytes=11, keep="head").apply("é" * 100, "s")
+
+        assert bounded.startswith("é" * 5 + "\n[Output truncated")
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            OutputPolicy(max_bytes=0)
+        with pytest.raises(ValueError):
+            OutputPolicy(keep="middle")
+        with pytest.raises(ValueError):
+            OutputStore(max_entries=0)
+
+
+class TestOutputStore:
+    """Tests for spilled outputs and their retrieval."""
+
+    def test_spill_and_read_back(self):
+        store = OutputStore()
+        policy = OutputPolicy(max_bytes=100, store=store)
+        output = {"rows": ["row %d" % i for i in range(200)]}
+
+        bounded = policy.apply(output, "rows")
+        ref = bounded.split("stored as '")[1].split("'")[0]
+        reader = ReadSkillOutputTool(store=store, max_bytes=1000)
+
+        first = reader.invoke({"ref": ref})
+        assert first.endswith("continue with offset=1000]")
+        full = json.dumps(output, ensure_ascii=False)
+        assert first.startswith(full[:1000])
+        more = reader.invoke({"ref": ref, "offset": 1000, "length": 50})
+        assert more.startswith(full[1000:1050])
+        assert reader.invoke({"ref": "out-missing"}).startswith("Error: unknown or expired")
+
+    def test_bounded_by_entries_and_bytes(self, tmp_path):
+        store = OutputStore(max_entries=2, max_bytes=250, directory=str(tmp_path))
+
+        refs = [store.put(b"x" * 100, "s") for _ in range(3)]
+
+        assert refs[0] not in store and store.evicted == 1
+        assert store.put(b"y" * 300, "s") is None
+        assert store.read(refs[2], 10, 5) == "xxxxx"
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(f"{r}.txt" for r in refs[1:])
+        store.clear()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestToolkitOutputPolicy:
+    """Tests for the policy on toolkit-built tools."""
+
+    async def test_tools_bounded_and_reader_added(self, skills_dir, pool, monkeypatch):
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+        store = OutputStore()
+        tools = SkillLiteToolkit.from_directory(
+            str(skills_dir),
+            sandbox_level=1,
+            pool=pool,
+            output_policy=OutputPolicy(max_bytes=200, store=store),
+        )
+        rows, reader = tools
+
+        assert reader.name == "read_skill_output"
+        assert rows.invoke({"n": 2}) == {"rows": ["row 0", "row 1"]}
+        bounded = await rows.ainvoke({"n": 500})
+        assert isinstance(bounded, str) and "read_skill_output" in bounded
+        assert len(store) == 1
+
+    def test_no_reader_without_store(self, skills_dir):
+        manager = SkillManager(skills_dir=str(skills_dir))
+
+        tools = SkillLiteToolkit(manager, output_policy=OutputPolicy()).to_tools()
+
+        assert [t.name for t in tools] == ["rows"]
+        assert tools[0].output_policy is not None
+
+
+def test_callback_preview_is_bounded():
+    output = {"rows": ["x" * 1000] * 10000}
+    message = MagicMock(content=output)
+
+    preview = _output_preview(message)
+
+    assert len(preview) <= 200 and preview.startswith("{'rows': ['xxx")
@@ -0,0 +1,125 @@
+"""Unit tests for out-of-band staging of large payloads."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from langchain_skilllite.payload import encode_json
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+
+SCRIPT = """
+    import json, mmap, os, sys
+    source = os.environ.get("SKILLLITE_INPUT_FILE")
+    if source and "mmap" in sys.argv[0]:
+        with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            data = json.loads(m[:])
+    else:
+        data = json.loads(sys.stdin.read())
+    print(json.dumps({
+        "length": len(data["text"]),
+        "staged": bool(source),
+        "echo": data["text"] if data.get("echo") else "",
+    }))
+"""
+
+SERVER_SCRIPT = """
+    def handle(data):
+        return {"length": len(data["text"])}
+"""
+
+
+@pytest.fixture
+def sizer(tmp_path, make_skill):
+    return make_skill(tmp_path, "sizer", SCRIPT)
+
+
+@pytest.fixture
+def staging(tmp_path):
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    return staging
+
+
+@pytest.fixture
+def pool(staging):
+    pool = SkillWorkerPool(
+        PoolConfig(min_size=0, max_size=1, large_payload_bytes=1024, payload_dir=str(staging))
+    )
+    yield pool
+    pool.shutdown()
+
+
+class TestEncodeJson:
+    """Tests for encode_json."""
+
+    def test_small_payload_inline(self, staging):
+        text, staged = encode_json({"text": "hi"}, 1024, str(staging))
+
+        assert text == '{"text": "hi"}' and staged is None
+
+    def test_large_payload_staged_and_removed(self, staging):
+        data = {"text": "é" * 2000}
+
+        text, staged = encode_json(data, 1024, str(staging))
+
+        assert text is None
+        assert Path(staged.path).parent == staging
+        assert staged.size == os.path.getsize(staged.path)
+        assert staged.read_text() == encode_json(data, None)[0]
+        staged.close()
+        assert list(staging.iterdir()) == []
+
+
+class TestPooledPayloads:
+    """Tests for staged inputs and spilled outputs on pooled workers."""
+
+    def test_large_input_staged(self, sizer, staging, pool):
+        result = pool.execute(sizer, {"text": "x" * 5000})
+
+        assert result.output == {"length": 5000, "staged": True, "echo": ""}
+        assert list(staging.iterdir()) == []
+
+    def test_small_input_inline(self, sizer, pool):
+        result = pool.execute(sizer, {"text": "abc"})
+
+        assert result.output == {"length": 3, "staged": False, "echo": ""}
+
+    def test_script_can_mmap_input(self, sizer, pool):
+        (sizer.path / "scripts" / "main.py").rename(sizer.path / "scripts" / "mmap_main.py")
+        sizer.metadata.entry_point = "scripts/mmap_main.py"
+
+        result = pool.execute(sizer, {"text": "y" * 5000})
+
+        assert result.output["length"] == 5000 and result.output["staged"] is True
+
+    async def test_large_output_spilled(self, sizer, staging, pool):
+        result = await pool.aexecute(sizer, {"text": "z" * 5000, "echo": True})
+
+        assert result.output["echo"] == "z" * 5000
+        assert list(staging.iterdir()) == []
+
+    def test_large_input_on_server(self, tmp_path, make_skill, staging, pool):
+        skill = make_skill(
+            tmp_path, "sizer", SERVER_SCRIPT, front_matter="server: scripts/main.py\n"
+        )
+
+        result = pool.execute(skill, {"text": "w" * 5000})
+
+        assert result.output == {"length": 5000}
+        assert list(staging.iterdir()) == []
+
+    def test_staging_disabled(self, sizer, staging):
+        pool = SkillWorkerPool(
+            PoolConfig(min_size=0, max_size=1, large_payload_bytes=None, payload_dir=str(staging))
+        )
+        try:
+            result = pool.execute(sizer, {"text": "x" * 5000, "echo": True})
+        finally:
+            pool.shutdown()
+
+        assert result.output["staged"] is False and len(result.output["echo"]) == 5000
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            PoolConfig(large_payload_bytes=-1)
@@ -0,0 +1,194 @@
+"""Unit tests for the warm SkillWorkerPool."""
+
+import asyncio
+import gc
+import time
+import weakref
+
+import pytest
+
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+
+UPPER_SCRIPT = """
+    import json, os, sys
+    data = json.loads(sys.stdin.read())
+    # Each call runs in a child forked from the worker; the parent is the worker.
+    print(json.dumps({"result": data["text"].upper(), "worker": os.getppid()}))
+"""
+
+LEAKY_SCRIPT = """
+    import json, os, sys
+    seen = {
+        "module": "leaky_marker" in sys.modules,
+        "env": os.environ.get("LEAKY_MARKER"),
+        "cwd": os.getcwd(),
+    }
+    sys.modules["leaky_marker"] = sys
+    os.environ["LEAKY_MARKER"] = "set"
+    os.chdir("/")
+    print(json.dumps(seen))
+"""
+
+
+@pytest.fixture
+def pool():
+    pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=2, max_calls_per_worker=3))
+    yield pool
+    pool.shutdown()
+
+
+class TestPoolConfig:
+    """Tests for PoolConfig validation."""
+
+    def test_defaults(self):
+        config = PoolConfig()
+        assert config.min_size <= config.max_size
+
+    def test_memory_limit_follows_skillbox(self, monkeypatch):
+        monkeypatch.setenv("SKILLBOX_MAX_MEMORY_MB", "256")
+        assert PoolConfig().max_memory_mb == 256
+        assert PoolConfig(max_memory_mb=None).max_memory_mb is None
+
+    def test_min_above_max_rejected(self):
+        with pytest.raises(ValueError):
+            PoolConfig(min_size=3, max_size=2)
+
+
+class TestSkillWorkerPool:
+    """Tests for SkillWorkerPool."""
+
+    def test_supports_python_entry_points_only(self, tmp_path, make_skill, pool):
+        py_skill = make_skill(tmp_path, "py", UPPER_SCRIPT)
+        sh_skill = make_skill(tmp_path, "sh", "echo hi", entry_point="scripts/main.sh")
+        assert pool.supports(py_skill) is True
+        assert pool.supports(sh_skill) is False
+
+    def test_execute_reuses_worker(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "upper", UPPER_SCRIPT)
+
+        first = pool.execute(skill, {"text": "hello"}, timeout=10)
+        second = pool.execute(skill, {"text": "world"}, timeout=10)
+
+        assert first.success is True
+        assert first.output["result"] == "HELLO"
+        assert second.output["result"] == "WORLD"
+        assert first.output["worker"] == second.output["worker"]
+
+    def test_worker_recycled_after_max_calls(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "upper", UPPER_SCRIPT)
+
+        pids = [pool.execute(skill, {"text": "x"}, timeout=10).output["worker"] for _ in range(4)]
+
+        assert len(set(pids[:3])) == 1
+        assert pids[3] != pids[0]
+
+    def test_calls_do_not_share_state(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "leaky", LEAKY_SCRIPT)
+
+        first = pool.execute(skill, {}, timeout=10).output
+        second = pool.execute(skill, {}, timeout=10).output
+
+        assert second == first
+        assert first["module"] is False and first["env"] is None
+
+    def test_hard_exit_is_reported(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "exit", "import os\nos._exit(3)\n")
+
+        result = pool.execute(skill, {}, timeout=10)
+
+        assert result.success is False
+        assert result.exit_code == 3
+        assert list(pool.stats().values())[0]["workers"] == 1
+
+    def test_script_failure_is_reported(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "boom", "raise RuntimeError('boom')\n")
+
+        result = pool.execute(skill, {}, timeout=10)
+
+        assert result.success is False
+        assert "boom" in result.error
+
+    def test_timeout_discards_worker(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "slow", "import time\ntime.sleep(5)\n")
+
+        result = pool.execute(skill, {}, timeout=0.2)
+
+        assert result.success is False
+        assert "timed out" in result.error
+        assert list(pool.stats().values())[0]["workers"] == 0
+
+    def test_idle_eviction(self, tmp_path, make_skill):
+        pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=2, idle_timeout=0))
+        try:
+            skill = make_skill(tmp_path, "upper", UPPER_SCRIPT)
+            pool.execute(skill, {"text": "x"}, timeout=10)
+            pool.evict_idle()
+            assert list(pool.stats().values())[0]["workers"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_idle_pool_shrinks_without_further_calls(self, tmp_path, make_skill):
+        pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=2, idle_timeout=0.2))
+        try:
+            skill = make_skill(tmp_path, "upper", UPPER_SCRIPT)
+            pool.execute(skill, {"text": "x"}, timeout=10)
+            assert list(pool.stats().values())[0]["workers"] == 1
+
+            deadline = time.monotonic() + 5
+            while list(pool.stats().values())[0]["workers"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert list(pool.stats().values())[0]["workers"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_shutdown_stops_reaper(self):
+        pool = SkillWorkerPool(PoolConfig(min_size=0, idle_timeout=0.2))
+        pool.shutdown()
+
+        pool._reaper.join(timeout=5)
+        assert not pool._reaper.is_alive()
+
+    def test_warm_starts_min_size_workers(self, tmp_path, make_skill):
+        pool = SkillWorkerPool(PoolConfig(min_size=2, max_size=2))
+        try:
+            skill = make_skill(tmp_path, "upper", UPPER_SCRIPT)
+            pool.warm(skill)
+            assert list(pool.stats().values())[0] == {"workers": 2, "idle": 2}
+        finally:
+            pool.shutdown()
+
+    async def test_aexecute_runs_concurrently(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "upper", UPPER_SCRIPT)
+
+        results = await asyncio.gather(
+            *(pool.aexecute(skill, {"text": f"t{i}"}, timeout=10) for i in range(6))
+        )
+
+        assert [r.output["result"] for r in results] == [f"T{i}" for i in range(6)]
+        assert list(pool.stats().values())[0]["workers"] <= pool.config.max_size
+
+    async def test_aexecute_timeout(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "slow", "import time\ntime.sleep(5)\n")
+
+        result = await pool.aexecute(skill, {}, timeout=0.2)
+
+        assert result.success is False
+        assert "timed out" in result.error
+
+    def test_shutdown_releases_pool(self):
+        pool = SkillWorkerPool(PoolConfig(min_size=0))
+        ref = weakref.ref(pool)
+        pool.shutdown()
+        del pool
+        gc.collect()
+
+        assert ref() is None
+
+    def test_invalidate_drops_skill_workers(self, tmp_path, make_skill, pool):
+        skill = make_skill(tmp_path, "upper", UPPER_SCRIPT)
+        first = pool.execute(skill, {"text": "x"}, timeout=10).output["worker"]
+
+        pool.invalidate(skill.path)
+
+        assert pool.stats() == {}
+        assert pool.execute(skill, {"text": "x"}, timeout=10).output["worker"] != first
@@ -0,0 +1,98 @@
+"""Unit tests for the parallel security prescan."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from skilllite import SkillManager
+
+from langchain_skilllite.prescan import prescan_skills
+from langchain_skilllite.scan_cache import ScanCache
+from langchain_skilllite.tools import SecurityScanResult, SkillLiteToolkit
+
+SKILLS = ("alpha", "beta", "gamma", "risky")
+
+
+def _scan(skill_info, input_data, *args, **kwargs):
+    time.sleep(0.2)
+    if skill_info.name == "broken":
+        raise RuntimeError("scanner crashed")
+    risky = skill_info.name == "risky"
+    return SecurityScanResult(
+        is_safe=not risky,
+        issues=[{"severity": "High", "rule_id": "py-exec", "description": "exec"}] if risky else [],
+        scan_id=f"scan-{skill_info.name}",
+        code_hash="hash",
+        high_severity_count=int(risky),
+    )
+
+
+@pytest.fixture
+def scanner():
+    scanner = MagicMock()
+    scanner.skillbox_path = None
+    scanner._scan_cache = {}
+    scanner._generate_input_hash.return_value = "input-hash"
+    scanner.scan_skill.side_effect = _scan
+    with patch('skilllite.core.security.SecurityScanner.get_instance', return_value=scanner):
+        yield scanner
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    for name in SKILLS:
+        write_skill(tmp_path / "skills", name, f"print('{name}')\n", description=name)
+    return tmp_path / "skills"
+
+
+@pytest.fixture
+def manager(skills_dir):
+    return SkillManager(skills_dir=str(skills_dir))
+
+
+class TestPrescan:
+    """Tests for prescan_skills / SkillLiteToolkit.prescan."""
+
+    def test_scans_in_parallel_and_summarizes(self, manager, scanner):
+        cache = ScanCache()
+
+        started = time.monotonic()
+        report = prescan_skills(manager.list_executable_skills(), cache, max_workers=4)
+
+        assert time.monotonic() - started < 0.6
+        assert set(report.results) == set(SKILLS)
+        assert (report.scanned, report.cached, report.flagged) == (4, [], ["risky"])
+        summary = report.summary()
+        assert summary["risky"]["high"] == 1 and summary["risky"]["rules"] == ["py-exec"]
+        assert summary["alpha"]["safe"] is True
+
+    def test_verdicts_reused(self, manager, scanner):
+        toolkit = SkillLiteToolkit(manager, scan_cache=ScanCache())
+        toolkit.prescan()
+
+        report = toolkit.prescan()
+
+        assert scanner.scan_skill.call_count == 4
+        assert sorted(report.cached) == sorted(SKILLS)
+        assert report.flagged == ["risky"]
+
+    def test_scan_errors_reported(self, manager, scanner):
+        broken = MagicMock(path=manager.get_skill("alpha").path, metadata=None)
+        broken.name = "broken"
+
+        report = prescan_skills([broken, manager.get_skill("beta")], ScanCache())
+
+        assert report.errors == {"broken": "scanner crashed"}
+        assert list(report.results) == ["beta"]
+
+    def test_from_directory_creates_verdict_store(self, skills_dir, scanner):
+        tools = SkillLiteToolkit.from_directory(str(skills_dir), sandbox_level=3, prescan=True)
+
+        cache = tools[0].scan_cache
+        assert isinstance(cache, ScanCache)
+        assert all(tool.scan_cache is cache for tool in tools)
+        assert cache.misses == 4
+
+    def test_invalid_workers(self, manager, scanner):
+        with pytest.raises(ValueError):
+            prescan_skills(manager.list_executable_skills(), ScanCache(), max_workers=0)
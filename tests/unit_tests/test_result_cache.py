@@ -0,0 +1,167 @@
+"""Unit tests for ResultCache and result memoization in SkillLiteTool."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from skilllite.sandbox.base import ExecutionResult
+
+from langchain_skilllite.callbacks import SkillLiteCallbackHandler
+from langchain_skilllite.result_cache import (
+    DiskResultBackend,
+    MemoryResultBackend,
+    ResultCache,
+    canonical_json,
+)
+from langchain_skilllite.tools import SkillLiteToolkit
+
+DETERMINISTIC = "deterministic: true\n"
+
+
+def _ok(output) -> ExecutionResult:
+    return ExecutionResult(success=True, output=output)
+
+
+class TestBackends:
+    """Tests for the built-in result cache backends."""
+
+    def test_memory_lru_by_bytes(self):
+        backend = MemoryResultBackend(max_bytes=10)
+        backend.set("a", b"12345")
+        backend.set("b", b"12345")
+        backend.get("a")
+        backend.set("c", b"12345")
+
+        assert backend.get("a") == b"12345"
+        assert backend.get("b") is None
+        assert backend.size_bytes == 10
+
+    def test_memory_skips_oversized_payloads(self):
+        backend = MemoryResultBackend(max_bytes=4)
+        backend.set("a", b"12345")
+        assert backend.get("a") is None
+
+    def test_disk_persists_and_evicts(self, tmp_path):
+        backend = DiskResultBackend(tmp_path, max_bytes=10)
+        backend.set("a", b"12345")
+        backend.set("b", b"12345")
+
+        reopened = DiskResultBackend(tmp_path, max_bytes=10)
+        assert reopened.get("a") == b"12345"
+        reopened.set("c", b"12345")
+
+        assert reopened.get("b") is None
+        assert not (tmp_path / "b.json").exists()
+        assert reopened.size_bytes == 10
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_canonical_json_ignores_key_order(self):
+        assert canonical_json({"b": 1, "a": [1, 2]}) == canonical_json({"a": [1, 2], "b": 1})
+
+    def test_key_depends_on_input_and_content(self, tmp_path, make_skill):
+        skill = make_skill(tmp_path, "upper")
+        cache = ResultCache()
+        key = cache.key(skill, {"text": "a", "n": 1})
+
+        assert cache.key(skill, {"n": 1, "text": "a"}) == key
+        assert cache.key(skill, {"text": "b", "n": 1}) != key
+        (skill.path / "scripts" / "main.py").write_text("print('changed!')\n")
+        assert cache.key(skill, {"text": "a", "n": 1}) != key
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = ResultCache(ttl=0.05)
+        cache.put("k", _ok({"x": 1}), ttl=0.05)
+        assert cache.get("k").output == {"x": 1}
+
+        time.sleep(0.06)
+        assert cache.get("k") is None
+
+    def test_failures_not_cached(self):
+        cache = ResultCache()
+        cache.put("k", ExecutionResult(success=False, error="boom"))
+        assert cache.get("k") is None
+
+    def test_policy(self, tmp_path, make_skill):
+        declared = make_skill(tmp_path, "upper", front_matter=DETERMINISTIC)
+        plain = make_skill(tmp_path, "clock")
+
+        assert ResultCache.deterministic_only().applies_to(declared) is True
+        assert ResultCache.deterministic_only().applies_to(plain) is False
+        assert ResultCache(skills=["clock"]).applies_to(plain) is True
+        assert ResultCache().applies_to(plain) is True
+
+    def test_disk_backend_requires_cache_dir(self):
+        with pytest.raises(ValueError):
+            ResultCache(backend="disk")
+
+
+class TestToolkitMemoization:
+    """Tests for memoized execution through SkillLiteToolkit."""
+
+    @staticmethod
+    def _toolkit(tmp_path, make_skill, monkeypatch, cache=None, deterministic=True):
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+        skill = make_skill(
+            tmp_path, "upper", front_matter=DETERMINISTIC if deterministic else ""
+        )
+        manager = MagicMock()
+        manager.get_skill.return_value = skill
+        manager._registry.get_skill.return_value = skill
+        pool = MagicMock()
+        pool.supports.return_value = True
+        pool.execute.side_effect = lambda info, data, timeout=None: _ok(
+            {"result": data["text"].upper()}
+        )
+        return SkillLiteToolkit(manager=manager, pool=pool, cache=cache), pool
+
+    def test_deterministic_skill_memoized_by_default(self, tmp_path, make_skill, monkeypatch):
+        toolkit, pool = self._toolkit(tmp_path, make_skill, monkeypatch)
+
+        results = toolkit.execute_batch([("upper", {"text": "hi"})] * 3, max_concurrency=1)
+
+        assert [r.output for r in results] == [{"result": "HI"}] * 3
+        assert pool.execute.call_count == 1
+        assert toolkit.result_cache.hits == 2
+
+    def test_undeclared_skill_not_memoized(self, tmp_path, make_skill, monkeypatch):
+        toolkit, pool = self._toolkit(tmp_path, make_skill, monkeypatch, deterministic=False)
+
+        toolkit.execute_batch([("upper", {"text": "hi"})] * 2, max_concurrency=1)
+
+        assert pool.execute.call_count == 2
+
+    def test_cache_false_disables(self, tmp_path, make_skill, monkeypatch):
+        toolkit, pool = self._toolkit(tmp_path, make_skill, monkeypatch, cache=False)
+
+        toolkit.execute_batch([("upper", {"text": "hi"})] * 2, max_concurrency=1)
+
+        assert toolkit.result_cache is None
+        assert pool.execute.call_count == 2
+
+    def test_hits_reported_to_callback_handler(self, tmp_path, make_skill, monkeypatch):
+        toolkit, pool = self._toolkit(tmp_path, make_skill, monkeypatch, cache=True)
+        tool = toolkit._batch_tool("upper")
+        handler = SkillLiteCallbackHandler()
+
+        tool.invoke({"text": "hi"}, config={"callbacks": [handler]})
+        tool.invoke({"text": "hi"}, config={"callbacks": [handler]})
+
+        summary = handler.get_execution_summary()
+        assert summary["cache_misses"] == 1
+        assert summary["cache_hits"] == 1
+        assert pool.execute.call_count == 1
+
+    async def test_async_path_memoized(self, tmp_path, make_skill, monkeypatch):
+        toolkit, pool = self._toolkit(tmp_path, make_skill, monkeypatch)
+
+        async def aexecute(info, data, timeout=None):
+            return _ok({"result": data["text"].upper()})
+
+        pool.aexecute.side_effect = aexecute
+        results = await toolkit.aexecute_batch([("upper", {"text": "hi"})] * 2, max_concurrency=1)
+
+        assert [r.output for r in results] == [{"result": "HI"}] * 2
+        assert pool.aexecute.call_count == 1
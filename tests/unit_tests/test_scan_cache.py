@@ -0,0 +1,148 @@
+"""Unit tests for the content-addressed ScanCache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from langchain_skilllite.scan_cache import ScanCache
+from langchain_skilllite.tools import SecurityScanResult, SkillLiteTool
+
+
+def _risky_result() -> SecurityScanResult:
+    return SecurityScanResult(
+        is_safe=False,
+        issues=[{"severity": "High", "rule_id": "py-exec", "description": "exec call"}],
+        scan_id="original",
+        code_hash="hash",
+        high_severity_count=1,
+    )
+
+
+@pytest.fixture
+def scanner():
+    scanner = MagicMock()
+    scanner.skillbox_path = None
+    scanner._scan_cache = {}
+    scanner._generate_input_hash.return_value = "input-hash"
+    scanner.scan_skill.return_value = _risky_result()
+    with patch('skilllite.core.security.SecurityScanner.get_instance', return_value=scanner):
+        yield scanner
+
+
+class TestScanCache:
+    """Tests for ScanCache."""
+
+    def test_hit_skips_scan(self, tmp_path, make_skill, scanner):
+        skill = make_skill(tmp_path, "scanned")
+        cache = ScanCache()
+
+        first = cache.scan(skill, {})
+        second = cache.scan(skill, {})
+
+        assert scanner.scan_skill.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second.requires_confirmation is True
+        assert second.scan_id != first.scan_id
+        assert scanner._scan_cache[second.scan_id] is second
+
+    def test_content_change_invalidates(self, tmp_path, make_skill, scanner):
+        skill = make_skill(tmp_path, "scanned")
+        cache = ScanCache()
+        before = cache.content_hash(skill)
+
+        (skill.path / "scripts" / "main.py").write_text("print('changed, longer')\n")
+
+        assert cache.content_hash(skill) != before
+        cache.scan(skill, {})
+        assert cache.misses == 1
+
+    def test_rules_version_is_part_of_key(self, tmp_path, make_skill, scanner):
+        skill = make_skill(tmp_path, "scanned")
+        assert ScanCache(rules_version="a").content_hash(skill) != ScanCache(
+            rules_version="b"
+        ).content_hash(skill)
+
+    def test_disk_store_shared_across_instances(self, tmp_path, make_skill, scanner):
+        skill = make_skill(tmp_path, "scanned")
+        cache_dir = tmp_path / "cache"
+
+        ScanCache(cache_dir=cache_dir).scan(skill, {})
+        fresh = ScanCache(cache_dir=cache_dir)
+        result = fresh.scan(skill, {})
+
+        assert scanner.scan_skill.call_count == 1
+        assert fresh.hits == 1
+        assert result.high_severity_count == 1
+
+    def test_lru_eviction(self, tmp_path, make_skill, scanner):
+        cache = ScanCache(max_entries=2)
+        skills = [make_skill(tmp_path, f"s{i}", f"print({i})\n") for i in range(3)]
+        for skill in skills:
+            cache.scan(skill, {})
+
+        cache.scan(skills[0], {})
+
+        assert scanner.scan_skill.call_count == 4
+
+    def test_scan_errors_not_cached(self, tmp_path, make_skill, scanner):
+        scanner.scan_skill.return_value = SecurityScanResult(
+            is_safe=False,
+            issues=[{"severity": "High", "rule_id": "scan-timeout"}],
+            high_severity_count=1,
+        )
+        skill = make_skill(tmp_path, "scanned")
+        cache = ScanCache()
+
+        cache.scan(skill, {})
+        cache.scan(skill, {})
+
+        assert scanner.scan_skill.call_count == 2
+
+    def test_approvals_persist(self, tmp_path, make_skill, scanner):
+        skill = make_skill(tmp_path, "scanned")
+        cache_dir = tmp_path / "cache"
+        key = ScanCache(cache_dir=cache_dir).content_hash(skill)
+
+        ScanCache(cache_dir=cache_dir).approve(key)
+        fresh = ScanCache(cache_dir=cache_dir)
+
+        assert fresh.is_approved(key) is True
+        fresh.revoke(key)
+        assert ScanCache(cache_dir=cache_dir).is_approved(key) is False
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            ScanCache(max_entries=0)
+
+
+class TestToolWithScanCache:
+    """Tests for SkillLiteTool using a ScanCache."""
+
+    @patch('skilllite.sandbox.execution_service.UnifiedExecutionService.get_instance')
+    def test_approval_skips_rescan_and_prompt(
+        self, mock_get_instance, tmp_path, make_skill, scanner, monkeypatch
+    ):
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "3")
+        service = MagicMock()
+        service.execute_with_context.return_value = MagicMock(success=True, output="ok")
+        mock_get_instance.return_value = service
+        skill = make_skill(tmp_path, "scanned")
+        manager = MagicMock()
+        manager._registry.get_skill.return_value = skill
+        callback = MagicMock(return_value=True)
+
+        tool = SkillLiteTool(
+            name="scanned",
+            description="A scanned skill",
+            manager=manager,
+            skill_name="scanned",
+            confirmation_callback=callback,
+            scan_cache=ScanCache(),
+        )
+
+        assert tool._run() == "ok"
+        assert tool._run() == "ok"
+        assert callback.call_count == 1
+        assert scanner.scan_skill.call_count == 1
+        context = service.execute_with_context.call_args.kwargs["context"]
+        assert context.sandbox_level == "1"
@@ -0,0 +1,112 @@
+"""Unit tests for query-time tool selection."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from skilllite import SkillManager
+
+from langchain_skilllite.selection import SkillIndex, tokenize
+from langchain_skilllite.tools import SkillLiteToolkit
+
+SKILLS = {
+    "pdf-extract": "Extract text and tables from PDF documents",
+    "csv-stats": "Compute summary statistics for a CSV file",
+    "text-upper": "Convert text to uppercase",
+    "weather": "Look up the weather forecast for a city",
+}
+
+
+def _skill(name: str, description: str) -> MagicMock:
+    skill = MagicMock()
+    skill.name = name
+    skill.description = description
+    return skill
+
+
+def _skills(overrides=None):
+    descriptions = {**SKILLS, **(overrides or {})}
+    return [_skill(name, text) for name, text in descriptions.items() if text is not None]
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    for name, description in SKILLS.items():
+        write_skill(tmp_path / "skills", name, description=description)
+    return tmp_path / "skills"
+
+
+class TestSkillIndex:
+    """Tests for SkillIndex."""
+
+    def test_tokenize(self):
+        assert tokenize("Converting the PDFs, please!") == ["convert", "pdf"]
+
+    def test_ranks_relevant_skill_first(self):
+        index = SkillIndex()
+        index.update(_skills())
+
+        results = index.search("get the tables out of this pdf", k=2)
+
+        assert [name for name, _ in results] == ["pdf-extract"]
+        assert index.search("convert my text to upper case")[0][0] == "text-upper"
+        assert index.search("zzz unknown") == []
+
+    def test_incremental_update(self):
+        index = SkillIndex()
+        assert index.update(_skills()) == 4
+
+        assert index.update(_skills()) == 0
+        changed = index.update(_skills({"weather": "Translate text between languages"}))
+
+        assert (changed, index.updated) == (1, 1)
+        assert index.search("forecast") == []
+        assert index.search("translate")[0][0] == "weather"
+
+    def test_removed_skills_dropped(self):
+        index = SkillIndex()
+        index.update(_skills())
+
+        assert index.update(_skills({"csv-stats": None})) == 1
+        assert "csv-stats" not in index
+        assert index.search("csv") == []
+
+    def test_persisted_index_reused(self, tmp_path):
+        path = tmp_path / "index.json"
+        SkillIndex(path).update(_skills())
+
+        reloaded = SkillIndex(path)
+
+        assert len(reloaded) == 4
+        assert reloaded.update(_skills()) == 0
+        assert reloaded.search("weather")[0][0] == "weather"
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "index.json"
+        path.write_text("{not json")
+
+        assert len(SkillIndex(path)) == 0
+
+
+class TestSelectTools:
+    """Tests for SkillLiteToolkit.select_tools."""
+
+    def test_returns_top_k_tools(self, skills_dir):
+        toolkit = SkillLiteToolkit(SkillManager(skills_dir=str(skills_dir)), sandbox_level=1)
+
+        tools = toolkit.select_tools("what is the weather in Paris", k=2)
+
+        assert [tool.name for tool in tools] == ["weather"]
+        assert toolkit.select_tools("weather")[0] is tools[0]
+
+    def test_respects_skill_names_and_persists(self, tmp_path, skills_dir):
+        path = tmp_path / "index.json"
+        toolkit = SkillLiteToolkit(
+            SkillManager(skills_dir=str(skills_dir)),
+            skill_names=["csv-stats", "text-upper"],
+            index=path,
+        )
+
+        assert toolkit.select_tools("weather forecast") == []
+        assert [t.name for t in toolkit.select_tools("csv statistics")] == ["csv-stats"]
+        reloaded = SkillIndex(path)
+        assert len(reloaded) == 2 and "weather" not in reloaded
@@ -0,0 +1,155 @@
+"""Unit tests for pluggable serializers, msgpack server framing and skill_io."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_skilllite import serialization
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.serialization import Serializer, get_serializer
+from langchain_skilllite.server import FRAMING_JSON, negotiate_framing, parse_server_spec
+from langchain_skilllite.tools import SkillLiteTool, SkillLiteToolkit
+
+IO_SCRIPT = """
+    from langchain_skilllite.skill_io import read_input, write_output
+    data = read_input()
+    write_output({"result": data.get("text", "").upper(), "keys": sorted(data)})
+"""
+
+
+@pytest.fixture
+def pool():
+    pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1, large_payload_bytes=256))
+    yield pool
+    pool.shutdown()
+
+
+class TestSerializers:
+    """Tests for serializer resolution and fallbacks."""
+
+    def test_auto_prefers_fast_library(self):
+        expected = "json"
+        for name in ("orjson", "msgspec"):
+            try:
+                __import__(name)
+            except ImportError:
+                continue
+            expected = name
+            break
+
+        assert get_serializer().name == expected
+        assert get_serializer() is get_serializer("auto")
+        assert get_serializer("json").dumps({"a": 1}) == '{"a": 1}'
+
+    def test_fast_serializer_matches_stdlib(self):
+        serializer = get_serializer()
+        # Values fast libraries reject are handled by the stdlib instead.
+        data = {1: "int key", "big": 2 ** 70, "text": "é"}
+
+        assert json.loads(serializer.dumps(data)) == json.loads(json.dumps(data))
+        assert serializer.loads('{"x": NaN}')["x"] != 0
+        with pytest.raises(json.JSONDecodeError):
+            serializer.loads("{not json}")
+        with pytest.raises(TypeError):
+            serializer.dumps({"s": {1, 2}})
+
+    def test_non_json_not_parsed_twice(self, monkeypatch):
+        serializer = get_serializer()
+        if serializer.name == "json":
+            pytest.skip("no fast JSON library installed")
+        stdlib_loads = json.loads
+        reparsed = []
+
+        def spy(data, **kwargs):
+            reparsed.append(data)
+            return stdlib_loads(data, **kwargs)
+
+        monkeypatch.setattr(json, "loads", spy)
+
+        for text in ("{not json}", b"{progress: 50%}", "{" + "9" * 30):
+            with pytest.raises(json.JSONDecodeError):
+                serializer.loads(text)
+        assert serializer.loads(b'{"x": Infinity}')["x"] == float("inf")
+        # Only text with stdlib-only constructs reaches the stdlib parser.
+        assert reparsed == ["{" + "9" * 30, b'{"x": Infinity}']
+
+    def test_unknown_and_missing(self):
+        with pytest.raises(ValueError):
+            get_serializer("yaml")
+        with pytest.raises(ValueError):
+            SkillLiteToolkit(MagicMock(), serializer="yaml")
+        try:
+            import msgspec  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="pip install msgspec"):
+                get_serializer("msgspec")
+
+
+class TestPooledSerialization:
+    """Tests for serializers on pooled workers and the skill_io helpers."""
+
+    @pytest.mark.parametrize("name", ["json", "auto"])
+    def test_skill_io_round_trip(self, tmp_path, make_skill, pool, name):
+        skill = make_skill(tmp_path, "upper", IO_SCRIPT)
+        serializer = get_serializer(name)
+
+        small = pool.execute(skill, {"text": "hé"}, serializer=serializer)
+        large = pool.execute(skill, {"text": "x" * 1000}, serializer=serializer)
+
+        assert small.output == {"result": "HÉ", "keys": ["text"]}
+        assert large.output["result"] == "X" * 1000
+
+    async def test_tool_passes_serializer(self, tmp_path, make_skill, pool, monkeypatch):
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+        skill = make_skill(tmp_path, "upper", IO_SCRIPT)
+        manager = MagicMock()
+        manager._registry.get_skill.return_value = skill
+        used = []
+
+        class Recording(Serializer):
+            def loads(self, data):
+                used.append(data)
+                return super().loads(data)
+
+        tool = SkillLiteTool(
+            name="upper", description="Uppercases", manager=manager, skill_name="upper",
+            sandbox_level=1, pool=pool, serializer=Recording(),
+        )
+
+        assert tool._run(text="a") == {"result": "A", "keys": ["text"]}
+        assert await tool._arun(text="b") == {"result": "B", "keys": ["text"]}
+        assert len(used) == 2
+
+
+class TestServerFraming:
+    """Tests for the msgpack framing negotiated in SKILL.md."""
+
+    SERVER = """
+        def handle(data):
+            return {"result": data["text"].upper(), "size": len(data["text"])}
+    """
+
+    @pytest.fixture
+    def skill(self, tmp_path, make_skill):
+        return make_skill(
+            tmp_path, "upper", self.SERVER,
+            front_matter="server: scripts/main.py\nserver_framing: msgpack\n",
+        )
+
+    def test_falls_back_to_json_without_msgpack(self, skill, pool, monkeypatch):
+        monkeypatch.setattr(serialization, "_msgpack", None)
+
+        assert parse_server_spec(skill).framing == "msgpack"
+        assert negotiate_framing(parse_server_spec(skill)).framing == FRAMING_JSON
+        assert pool.execute(skill, {"text": "x" * 1000}).output == {
+            "result": "X" * 1000, "size": 1000
+        }
+
+    async def test_msgpack_round_trip(self, skill, pool):
+        pytest.importorskip("msgpack")
+
+        assert pool.server_spec(skill).framing == "msgpack"
+        assert pool.execute(skill, {"text": "hi"}).output == {"result": "HI", "size": 2}
+        result = await pool.aexecute(skill, {"text": "yo"})
+        assert result.output == {"result": "YO", "size": 2}
@@ -0,0 +1,171 @@
+"""Unit tests for persistent skill servers."""
+
+import asyncio
+import time
+
+import pytest
+
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.server import parse_server_spec
+from langchain_skilllite.tools import SkillLiteToolkit
+
+SERVER_SCRIPT = """
+    import json, os, sys, time
+    LOADED_AT = time.time()        # module-level work runs once per server
+
+    def handle(data):
+        if data.get("fail"):
+            raise ValueError("bad input")
+        time.sleep(data.get("delay", 0))
+        print("noise on stdout")
+        return {"result": data["text"].upper(), "pid": os.getpid(), "loaded_at": LOADED_AT}
+
+    def echo(data):
+        return data["text"]
+
+    def crash(data):
+        sys.stderr.write("out of coffee\\n")
+        sys.stderr.flush()
+        os._exit(7)
+
+    if __name__ == "__main__":
+        print(json.dumps(handle(json.loads(sys.stdin.read()))))
+"""
+
+
+@pytest.fixture
+def server_skill(tmp_path, make_skill):
+    """``server_skill(server=..., front_matter=..., root=tmp_path)`` creates a server skill."""
+
+    def make(server: str = "scripts/main.py", front_matter: str = "", root=tmp_path):
+        return make_skill(
+            root,
+            "upper",
+            SERVER_SCRIPT,
+            description="Uppercases",
+            front_matter=f"entry_point: scripts/main.py\nserver: {server}\n{front_matter}",
+        )
+
+    return make
+
+
+@pytest.fixture
+def pool():
+    pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+    yield pool
+    pool.shutdown()
+
+
+class TestServerSpec:
+    """Tests for reading the server declaration."""
+
+    def test_handler_and_concurrency(self, server_skill):
+        skill = server_skill(server="scripts/main.py:echo", front_matter="server_concurrency: 4\n")
+
+        spec = parse_server_spec(skill)
+
+        assert spec.script == (skill.path / "scripts" / "main.py").resolve()
+        assert (spec.handler, spec.concurrency) == ("echo", 4)
+
+    def test_non_python_server_ignored(self, server_skill):
+        assert parse_server_spec(server_skill(server="scripts/main.js")) is None
+
+    def test_servers_can_be_disabled(self, server_skill):
+        pool = SkillWorkerPool(PoolConfig(servers=False))
+        try:
+            assert pool.server_spec(server_skill()) is None
+        finally:
+            pool.shutdown()
+
+
+class TestServerExecution:
+    """Tests for running calls on persistent servers."""
+
+    def test_module_loaded_once(self, server_skill, pool):
+        skill = server_skill()
+
+        first = pool.execute(skill, {"text": "a"}, timeout=10)
+        second = pool.execute(skill, {"text": "b"}, timeout=10)
+
+        assert first.success and second.success
+        assert second.output["result"] == "B"
+        assert first.output["pid"] == second.output["pid"]
+        assert first.output["loaded_at"] == second.output["loaded_at"]
+
+    def test_named_handler_scalar_output(self, server_skill, pool):
+        skill = server_skill(server="scripts/main.py:echo")
+
+        assert pool.execute(skill, {"text": "hi"}, timeout=10).output == {"result": "hi"}
+
+    def test_handler_error_keeps_server(self, server_skill, pool):
+        skill = server_skill()
+
+        failed = pool.execute(skill, {"fail": True}, timeout=10)
+        ok = pool.execute(skill, {"text": "x"}, timeout=10)
+
+        assert not failed.success
+        assert "ValueError: bad input" in failed.error
+        assert ok.success
+        assert pool.stats()[str(skill.path.resolve())]["workers"] == 1
+
+    def test_missing_handler_reported(self, server_skill, pool):
+        skill = server_skill(server="scripts/main.py:nope")
+
+        result = pool.execute(skill, {"text": "x"}, timeout=10)
+
+        assert not result.success
+        assert "does not define a callable 'nope'" in result.error
+
+    def test_crash_reports_stderr_tail(self, server_skill, pool):
+        skill = server_skill(server="scripts/main.py:crash")
+
+        result = pool.execute(skill, {"text": "x"}, timeout=10)
+
+        assert not result.success
+        assert "exited unexpectedly (exit code 7)" in result.error
+        assert "out of coffee" in result.error
+
+    async def test_concurrent_requests_multiplexed(self, server_skill, pool):
+        skill = server_skill(front_matter="server_concurrency: 4\n")
+
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(pool.aexecute(skill, {"text": str(i), "delay": 0.3}, timeout=10) for i in range(4))
+        )
+        elapsed = time.monotonic() - started
+
+        assert [r.output["result"] for r in results] == ["0", "1", "2", "3"]
+        assert len({r.output["pid"] for r in results}) == 1
+        assert elapsed < 1.0
+
+    def test_timeout_replaces_server(self, server_skill, pool):
+        skill = server_skill()
+        first = pool.execute(skill, {"text": "a"}, timeout=10)
+
+        timed_out = pool.execute(skill, {"text": "a", "delay": 5}, timeout=0.2)
+        after = pool.execute(skill, {"text": "b"}, timeout=10)
+
+        assert "timed out" in timed_out.error
+        assert after.success
+        assert after.output["pid"] != first.output["pid"]
+
+    def test_invalidate_restarts_server(self, server_skill, pool):
+        skill = server_skill()
+        first = pool.execute(skill, {"text": "a"}, timeout=10)
+
+        pool.invalidate(skill.path)
+        second = pool.execute(skill, {"text": "a"}, timeout=10)
+
+        assert second.output["pid"] != first.output["pid"]
+
+    def test_toolkit_routes_to_server(self, tmp_path, server_skill, pool):
+        server_skill(root=tmp_path / "skills")
+        tool = SkillLiteToolkit.from_directory(
+            str(tmp_path / "skills"), sandbox_level=1, pool=pool, cache=False
+        )[0]
+
+        first = tool.invoke({"text": "hi"})
+        second = tool.invoke({"text": "hi"})
+
+        assert first["result"] == "HI"
+        assert first["pid"] == second["pid"]
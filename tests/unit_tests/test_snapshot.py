@@ -0,0 +1,165 @@
+"""Unit tests for toolkit snapshots."""
+
+import os
+from pathlib import Path
+
+import pytest
+from skilllite import SkillManager
+
+from langchain_skilllite.discovery import LazySkillManager
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.scan_cache import ScanCache
+from langchain_skilllite.snapshot import SnapshotError, load_snapshot, read_snapshot
+from langchain_skilllite.tools import SkillLiteToolkit
+
+UPPER_SCRIPT = (
+    "import json, sys\n"
+    "data = json.loads(sys.stdin.read())\n"
+    "print(json.dumps({'result': data['text'].upper()}))\n"
+)
+
+SCHEMA = "input_schema:\n  type: object\n  properties:\n    text:\n      type: string\n"
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    root = tmp_path / "skills"
+    write_skill(root, "alpha", UPPER_SCRIPT, front_matter=SCHEMA)
+    write_skill(root, "beta", UPPER_SCRIPT, description="Beta skill", front_matter=SCHEMA)
+    return root
+
+
+@pytest.fixture
+def snapshot_path(skills_dir, tmp_path):
+    path = tmp_path / "skills.snap"
+    toolkit = SkillLiteToolkit(SkillManager(skills_dir=str(skills_dir)), sandbox_level=1)
+    assert toolkit.export_snapshot(path, skills_dir=skills_dir) == 2
+    return path
+
+
+class TestSnapshotFile:
+    """Tests for writing and reading snapshot files."""
+
+    def test_round_trip(self, snapshot_path, skills_dir):
+        snapshot = read_snapshot(snapshot_path)
+
+        entries = {e.name: e for e in snapshot.entries}
+        assert sorted(entries) == ["alpha", "beta"]
+        assert entries["beta"].description == "Beta skill"
+        assert "Full usage docs." in entries["alpha"].tool_description
+        assert entries["alpha"].input_schema["properties"]["text"]["type"] == "string"
+        assert entries["alpha"].entry_point == "scripts/main.py"
+        assert snapshot.roots == (skills_dir.resolve(),)
+        assert not snapshot.front_matter_descriptions
+
+    def test_unchanged_skills_not_reread(self, snapshot_path):
+        snapshot = load_snapshot(snapshot_path)
+
+        assert (snapshot.refreshed, snapshot.added, snapshot.removed) == ((), (), ())
+
+    def test_changed_skill_refreshed(self, snapshot_path, skills_dir):
+        skill_md = skills_dir / "alpha" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text().replace("Does things", "Does more things"))
+        _touch(skill_md)
+
+        snapshot = load_snapshot(snapshot_path)
+
+        assert snapshot.refreshed == ("alpha",)
+        alpha = next(e for e in snapshot.entries if e.name == "alpha")
+        assert alpha.description == "Does more things"
+        assert "Does more things" in alpha.tool_description
+
+    def test_hash_mode_catches_same_stat_edit(self, snapshot_path, skills_dir):
+        skill_md = skills_dir / "alpha" / "SKILL.md"
+        stat = skill_md.stat()
+        skill_md.write_text(skill_md.read_text().replace("Does things", "Does THINGS"))
+        os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_snapshot(snapshot_path).refreshed == ()
+        assert load_snapshot(snapshot_path, validate="hash").refreshed == ("alpha",)
+
+    def test_added_and_removed_skills(self, snapshot_path, skills_dir, write_skill):
+        write_skill(skills_dir, "gamma", UPPER_SCRIPT, front_matter=SCHEMA)
+        (skills_dir / "beta" / "SKILL.md").unlink()
+
+        snapshot = load_snapshot(snapshot_path)
+
+        assert snapshot.added == ("gamma",)
+        assert snapshot.removed == ("beta",)
+        assert sorted(e.name for e in snapshot.entries) == ["alpha", "gamma"]
+
+    def test_invalid_files_rejected(self, tmp_path):
+        bad = tmp_path / "bad.snap"
+        bad.write_bytes(b"not a snapshot at all, just some bytes")
+
+        with pytest.raises(SnapshotError):
+            read_snapshot(bad)
+        with pytest.raises(SnapshotError):
+            read_snapshot(tmp_path / "missing.snap")
+
+    def test_invalid_validate_mode(self, snapshot_path):
+        with pytest.raises(ValueError):
+            load_snapshot(snapshot_path, validate="sometimes")
+
+
+class TestFromSnapshot:
+    """Tests for SkillLiteToolkit.from_snapshot."""
+
+    def test_tools_match_directory_toolkit(self, snapshot_path, skills_dir):
+        expected = SkillLiteToolkit.from_directory(str(skills_dir), sandbox_level=1)
+        tools = SkillLiteToolkit.from_snapshot(snapshot_path, sandbox_level=1)
+
+        assert [(t.name, t.description) for t in tools] == [
+            (t.name, t.description) for t in expected
+        ]
+        assert isinstance(tools[0].manager, LazySkillManager)
+        assert not tools[0].manager.get_skill("alpha").is_loaded
+
+    def test_skill_names_filter(self, snapshot_path):
+        tools = SkillLiteToolkit.from_snapshot(snapshot_path, skill_names=["beta"])
+
+        assert [t.name for t in tools] == ["beta"]
+
+    def test_lazy_toolkit_keeps_front_matter_descriptions(self, skills_dir, tmp_path):
+        path = tmp_path / "lazy.snap"
+        toolkit = SkillLiteToolkit(
+            LazySkillManager(skills_dir=skills_dir, persist_manifest=False)
+        )
+        toolkit.export_snapshot(path)
+
+        tools = SkillLiteToolkit.from_snapshot(path)
+
+        assert read_snapshot(path).front_matter_descriptions
+        assert {t.name: t.description for t in tools}["beta"] == "Beta skill"
+
+    def test_scan_verdicts_seeded(self, skills_dir, tmp_path):
+        (skills_dir / "beta" / "scripts" / "main.py").write_text("print('{}')\n")
+        scan_cache = ScanCache()
+        manager = SkillManager(skills_dir=str(skills_dir))
+        alpha_hash = scan_cache.content_hash(manager.get_skill("alpha"))
+        scan_cache.seed(alpha_hash, {"is_safe": True, "issues": []})
+        path = tmp_path / "scanned.snap"
+        SkillLiteToolkit(manager, scan_cache=scan_cache).export_snapshot(path)
+
+        fresh = ScanCache()
+        SkillLiteToolkit.from_snapshot(path, scan_cache=fresh)
+
+        assert fresh.get(alpha_hash) == {"is_safe": True, "issues": []}
+        assert next(e for e in read_snapshot(path).entries if e.name == "beta").verdict is None
+
+    def test_tools_execute_through_pool(self, snapshot_path):
+        pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+        try:
+            tools = SkillLiteToolkit.from_snapshot(
+                snapshot_path, sandbox_level=1, pool=pool, cache=False
+            )
+            alpha = next(t for t in tools if t.name == "alpha")
+
+            assert alpha.invoke({"text": "hi"}) == {"result": "HI"}
+        finally:
+            pool.shutdown()
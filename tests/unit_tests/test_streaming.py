@@ -0,0 +1,165 @@
+"""Unit tests for streaming skill output."""
+
+import time
+
+import pytest
+
+from langchain_skilllite.callbacks import (
+    AsyncSkillLiteCallbackHandler,
+    SkillLiteCallbackHandler,
+)
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.streaming import OutputStream
+from langchain_skilllite.tools import SkillLiteToolkit
+
+COUNT_SCRIPT = (
+    "import json, sys, time\n"
+    "data = json.loads(sys.stdin.read())\n"
+    "for i in range(data['n']):\n"
+    "    print(json.dumps({'i': i}))\n"
+    "    time.sleep(data.get('delay', 0))\n"
+)
+
+
+def _output_size(n: int) -> int:
+    return sum(len(f'{{"i": {i}}}\n') for i in range(n))
+
+
+@pytest.fixture
+def pool():
+    pool = SkillWorkerPool(PoolConfig(min_size=0, max_size=1))
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    write_skill(tmp_path / "skills", "counter", COUNT_SCRIPT, description="Counts")
+    return tmp_path / "skills"
+
+
+def _tool(skills_dir, pool, **kwargs):
+    return SkillLiteToolkit.from_directory(
+        str(skills_dir), sandbox_level=1, pool=pool, cache=False, **kwargs
+    )[0]
+
+
+class TestOutputStream:
+    """Tests for OutputStream."""
+
+    def test_cap_drops_excess_bytes(self):
+        chunks = []
+        stream = OutputStream(chunks.append, max_bytes=5)
+
+        stream.feed(b"abc")
+        stream.feed(b"defgh")
+        stream.close()
+
+        assert chunks == ["abc", "de"]
+        assert stream.text == "abcde"
+        assert (stream.kept_bytes, stream.dropped_bytes) == (5, 6 - 3)
+
+    def test_ndjson_records_across_chunks(self):
+        records = []
+        stream = OutputStream(records.append, mode="ndjson")
+
+        stream.feed(b'{"a": 1}\n{"b"')
+        stream.feed(b': 2}\nplain\n{"c": 3}')
+        stream.close()
+
+        assert records == [{"a": 1}, {"b": 2}, "plain", {"c": 3}]
+
+    def test_multibyte_character_split(self):
+        chunks = []
+        stream = OutputStream(chunks.append)
+        data = "héllo".encode()
+
+        stream.feed(data[:2])
+        stream.feed(data[2:])
+
+        assert "".join(chunks) == "héllo"
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            OutputStream(mode="xml")
+
+
+class TestPoolStreaming:
+    """Tests for streaming through pooled workers."""
+
+    def test_chunks_arrive_before_exit(self, skills_dir, pool):
+        tool = _tool(skills_dir, pool)
+        arrivals = []
+        stream = OutputStream(lambda chunk: arrivals.append(time.monotonic()))
+        skill = tool.manager.get_skill("counter")
+
+        started = time.monotonic()
+        result = pool.execute(skill, {"n": 3, "delay": 0.1}, timeout=10, stream=stream)
+        finished = time.monotonic()
+
+        assert result.success
+        assert len(arrivals) == 3
+        assert arrivals[0] - started < finished - started - 0.15
+
+    def test_worker_enforces_cap(self, skills_dir, pool):
+        tool = _tool(skills_dir, pool)
+        stream = OutputStream(max_bytes=20)
+
+        result = pool.execute(tool.manager.get_skill("counter"), {"n": 50}, stream=stream)
+
+        assert stream.kept_bytes == 20
+        assert result.output["truncated"] is True
+        assert result.output["dropped_bytes"] == _output_size(50) - 20
+
+
+class TestStreamingTool:
+    """Tests for SkillLiteTool streaming mode."""
+
+    def test_stream_output_yields_records(self, skills_dir, pool):
+        tool = _tool(skills_dir, pool, stream_mode="ndjson")
+
+        records = list(tool.stream_output({"n": 3}))
+
+        assert records == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+    async def test_astream_output_yields_chunks(self, skills_dir, pool):
+        tool = _tool(skills_dir, pool)
+
+        chunks = [chunk async for chunk in tool.astream_output({"n": 2, "delay": 0.05})]
+
+        assert "".join(chunks) == '{"i": 0}\n{"i": 1}\n'
+
+    def test_callback_handler_receives_stream_events(self, skills_dir, pool):
+        handler = SkillLiteCallbackHandler()
+        tool = _tool(skills_dir, pool, streaming=True)
+
+        tool.invoke({"n": 3}, config={"callbacks": [handler]})
+
+        summary = handler.get_execution_summary()
+        assert summary["stream_chunks"] == 3
+        assert summary["total_events"] == 2
+        assert summary["time_to_first_output"]["counter"]["count"] == 1
+        assert handler.execution_log[-1]["stream"]["chunks"] == 3
+
+    async def test_async_handler_receives_stream_events(self, skills_dir, pool):
+        handler = AsyncSkillLiteCallbackHandler()
+        tool = _tool(skills_dir, pool, streaming=True)
+
+        await tool.ainvoke({"n": 2}, config={"callbacks": [handler]})
+
+        assert handler.get_execution_summary()["stream_chunks"] == 2
+
+    def test_max_output_bytes_truncates_result(self, skills_dir, pool):
+        tool = _tool(skills_dir, pool, max_output_bytes=9)
+
+        result = tool.invoke({"n": 100})
+
+        assert result == {"i": 0, "truncated": True, "dropped_bytes": _output_size(100) - 9}
+
+    async def test_final_result_yielded_when_nothing_streamed(self, skills_dir):
+        tool = _tool(skills_dir, None)
+
+        chunks = [chunk async for chunk in tool.astream_output({"n": 1})]
+
+        assert len(chunks) == 1
+        assert "failed" in chunks[0].lower()
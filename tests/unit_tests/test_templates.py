@@ -0,0 +1,153 @@
+"""Unit tests for prebuilt execution templates and toolkit warmup."""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from skilllite import SkillManager
+
+from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+from langchain_skilllite.templates import (
+    TemplateCache,
+    TemplateError,
+    _environment_path,
+)
+from langchain_skilllite.tools import SkillLiteToolkit
+
+EXECUTABLE_SCRIPT = (
+    "import json, sys\n"
+    "data = json.loads(sys.stdin.read())\n"
+    "print(json.dumps({'result': data['text'].upper(), 'python': sys.executable}))\n"
+)
+
+
+def _write_lock(skill_dir: Path, packages) -> Path:
+    """Record resolved packages for a skill, as dependency resolution would."""
+    (skill_dir / ".skilllite.lock").write_text(json.dumps({
+        "compatibility_hash": hashlib.sha256(b"").hexdigest(),
+        "resolved_packages": packages,
+    }))
+    return skill_dir
+
+
+def _fake_environment(packages) -> Path:
+    """Pre-populate the env cache so no virtualenv has to be built."""
+    env_path = _environment_path("python", packages)
+    python = env_path / ("Scripts" if os.name == "nt" else "bin") / "python"
+    python.parent.mkdir(parents=True)
+    python.symlink_to(sys.executable)
+    (env_path / ".agentskill_complete").write_text("")
+    return python
+
+
+@pytest.fixture(autouse=True)
+def env_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("AGENTSKILL_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def pool():
+    pool = SkillWorkerPool(PoolConfig(min_size=1, max_size=1))
+    yield pool
+    pool.shutdown()
+
+
+class TestTemplateCache:
+    """Tests for TemplateCache."""
+
+    def test_host_interpreter_template(self, tmp_path, write_skill):
+        write_skill(tmp_path / "skills", "upper", EXECUTABLE_SCRIPT)
+        skill = SkillManager(skills_dir=str(tmp_path / "skills")).get_skill("upper")
+        cache = TemplateCache()
+
+        template = cache.prepare(skill)
+
+        assert not template.isolated
+        assert template.python == sys.executable
+        assert template.python_version == "%d.%d.%d" % sys.version_info[:3]
+        assert template.entry_script == template.skill_dir / "scripts" / "main.py"
+        assert cache.prepare(skill) is template
+
+    def test_dependencies_use_shared_environment(self, tmp_path, write_skill):
+        python = _fake_environment(["fakepkg"])
+        _write_lock(write_skill(tmp_path / "skills", "a", EXECUTABLE_SCRIPT), ["fakepkg"])
+        _write_lock(write_skill(tmp_path / "skills", "b", EXECUTABLE_SCRIPT), ["fakepkg"])
+        manager = SkillManager(skills_dir=str(tmp_path / "skills"))
+        cache = TemplateCache()
+
+        first = cache.prepare(manager.get_skill("a"))
+        second = cache.prepare(manager.get_skill("b"))
+
+        assert first.isolated and first.packages == ("fakepkg",)
+        assert first.python == second.python == str(python)
+
+    def test_changed_lock_file_makes_template_stale(self, tmp_path, write_skill):
+        _fake_environment(["fakepkg"])
+        skill_dir = write_skill(tmp_path / "skills", "a", EXECUTABLE_SCRIPT)
+        _write_lock(skill_dir, ["fakepkg"])
+        skill = SkillManager(skills_dir=str(tmp_path / "skills")).get_skill("a")
+        cache = TemplateCache()
+        cache.prepare(skill)
+
+        (skill_dir / ".skilllite.lock").unlink()
+
+        assert cache.get(skill) is None
+        assert not cache.prepare(skill).isolated
+
+    def test_broken_interpreter(self, tmp_path, write_skill):
+        write_skill(tmp_path / "skills", "upper", EXECUTABLE_SCRIPT)
+        skill = SkillManager(skills_dir=str(tmp_path / "skills")).get_skill("upper")
+
+        with pytest.raises(TemplateError):
+            TemplateCache(python_executable=str(tmp_path / "missing-python")).prepare(skill)
+
+
+class TestWarmup:
+    """Tests for SkillLiteToolkit.warmup."""
+
+    def test_reports_timings_and_starts_workers(self, tmp_path, write_skill, pool):
+        write_skill(tmp_path / "skills", "upper", EXECUTABLE_SCRIPT)
+        toolkit = SkillLiteToolkit(
+            SkillManager(skills_dir=str(tmp_path / "skills")), sandbox_level=1, pool=pool
+        )
+
+        report = toolkit.warmup()
+
+        assert report.ok
+        assert set(report.timings["upper"]) == {"dependencies", "interpreter", "workers", "total"}
+        assert report.slowest(1)[0][0] == "upper"
+        stats = pool.stats()[str((tmp_path / "skills" / "upper").resolve())]
+        assert stats["idle"] == 1
+
+        again = toolkit.warmup()
+        assert again.timings["upper"]["interpreter"] == 0.0
+
+    def test_dependency_skill_pooled_on_its_interpreter(self, tmp_path, write_skill, pool):
+        python = _fake_environment(["fakepkg"])
+        _write_lock(write_skill(tmp_path / "skills", "deps", EXECUTABLE_SCRIPT), ["fakepkg"])
+        toolkit = SkillLiteToolkit(
+            SkillManager(skills_dir=str(tmp_path / "skills")), sandbox_level=1, pool=pool
+        )
+        skill = toolkit.manager.get_skill("deps")
+        assert not pool.supports(skill)
+
+        toolkit.warmup()
+
+        assert pool.supports(skill)
+        result = pool.execute(skill, {"text": "hi"}, timeout=10)
+        assert result.output == {"result": "HI", "python": str(python)}
+
+    def test_failures_reported_per_skill(self, tmp_path, write_skill):
+        write_skill(tmp_path / "skills", "upper", EXECUTABLE_SCRIPT)
+        toolkit = SkillLiteToolkit(
+            SkillManager(skills_dir=str(tmp_path / "skills")),
+            templates=TemplateCache(python_executable=str(tmp_path / "missing-python")),
+        )
+
+        report = toolkit.warmup(skill_names=["upper"])
+
+        assert not report.ok
+        assert "did not start" in report.errors["upper"]
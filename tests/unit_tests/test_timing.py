@@ -0,0 +1,69 @@
+"""Unit tests for phase timing and LatencyHistogram."""
+
+import random
+
+import pytest
+
+from langchain_skilllite.timing import LatencyHistogram, collect_phases, phase
+
+
+class TestPhases:
+    """Tests for collect_phases / phase."""
+
+    def test_phases_accumulate_inside_collector(self):
+        with collect_phases() as phases:
+            with phase("execution"):
+                pass
+            with phase("execution"):
+                pass
+            with phase("output_parsing"):
+                pass
+
+        assert set(phases) == {"execution", "output_parsing"}
+        assert all(seconds >= 0 for seconds in phases.values())
+
+    def test_phase_outside_collector_is_noop(self):
+        with phase("execution"):
+            pass
+        with collect_phases() as phases:
+            pass
+        assert phases == {}
+
+    def test_phase_recorded_on_error(self):
+        with collect_phases() as phases:
+            with pytest.raises(RuntimeError):
+                with phase("execution"):
+                    raise RuntimeError("boom")
+        assert "execution" in phases
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty(self):
+        summary = LatencyHistogram().summary()
+        assert summary["count"] == 0
+        assert summary["p99"] == 0.0
+
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-3, 1) for _ in range(5000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 95, 99):
+            exact = values[int(len(values) * percent / 100) - 1]
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=0.02)
+        assert histogram.percentile(100) == pytest.approx(values[-1])
+
+    def test_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(0.001)
+        b.record(0.5)
+        a.merge(b)
+
+        assert a.count == 2
+        assert a.max == 0.5
+        with pytest.raises(ValueError):
+            a.merge(LatencyHistogram(sub_bucket_bits=4))
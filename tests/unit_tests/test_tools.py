@@ -1,8 +1,9 @@
 """Unit tests for SkillLiteTool and SkillLiteToolkit."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 from langchain_skilllite.tools import (
@@ -17,6 +18,8 @@ class MockSkillInfo:
     """Mock skill info for testing."""
     name: str
     description: Optional[str] = None
+    metadata: Optional[object] = None
+    path: Optional[Path] = None
 
     def get_full_content(self) -> str:
         """Return mock full content."""
@@ -168,6 +171,105 @@ class TestSkillLiteTool:
         assert "Error" in result
         assert "Skill not found" in result
 
+    def test_run_uses_pool_when_supported(self, monkeypatch):
+        """Test that pooled tools execute on the worker pool."""
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+        mock_pool = MagicMock()
+        mock_pool.supports.return_value = True
+        mock_pool.execute.return_value = MockExecutionResult(success=True, output="pooled")
+
+        mock_manager = MagicMock()
+        mock_manager._registry.get_skill.return_value = MockSkillInfo(name="test_skill")
+
+        tool = SkillLiteTool(
+            name="test_skill",
+            description="A test skill",
+            manager=mock_manager,
+            skill_name="test_skill",
+            pool=mock_pool,
+        )
+
+        assert tool._run(text="hi") == "pooled"
+        mock_pool.execute.assert_called_once()
+        assert mock_pool.execute.call_args.args[1] == {"text": "hi"}
+
+    @patch('skilllite.sandbox.execution_service.UnifiedExecutionService.get_instance')
+    def test_run_level2_bypasses_pool(self, mock_get_instance, monkeypatch):
+        """Test that sandbox level 2 keeps using skillbox isolation."""
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "2")
+        mock_service = MagicMock()
+        mock_service.execute_with_context.return_value = MockExecutionResult(success=True, output="boxed")
+        mock_get_instance.return_value = mock_service
+        mock_pool = MagicMock()
+        mock_pool.supports.return_value = True
+
+        mock_manager = MagicMock()
+        mock_manager._registry.get_skill.return_value = MockSkillInfo(name="test_skill")
+
+        tool = SkillLiteTool(
+            name="test_skill",
+            description="A test skill",
+            manager=mock_manager,
+            skill_name="test_skill",
+            pool=mock_pool,
+        )
+
+        assert tool._run() == "boxed"
+        mock_pool.execute.assert_not_called()
+
+    async def test_arun_uses_async_pool(self, monkeypatch):
+        """Test that _arun awaits the pool's async path instead of a thread."""
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+        mock_pool = MagicMock()
+        mock_pool.supports.return_value = True
+        mock_pool.aexecute = AsyncMock(
+            return_value=MockExecutionResult(success=True, output="async pooled")
+        )
+
+        mock_manager = MagicMock()
+        mock_manager._registry.get_skill.return_value = MockSkillInfo(name="test_skill")
+
+        tool = SkillLiteTool(
+            name="test_skill",
+            description="A test skill",
+            manager=mock_manager,
+            skill_name="test_skill",
+            pool=mock_pool,
+        )
+
+        assert await tool._arun(text="hi") == "async pooled"
+        mock_pool.aexecute.assert_awaited_once()
+        mock_pool.execute.assert_not_called()
+
+    @patch('langchain_skilllite.async_execution.scan_skill')
+    async def test_arun_awaits_async_confirmation(self, mock_scan, monkeypatch):
+        """Test that async_confirmation_callback is awaited natively."""
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "3")
+        mock_scan.return_value = SecurityScanResult(
+            is_safe=False,
+            issues=[{"severity": "High", "description": "test"}],
+            scan_id="scan-1",
+            high_severity_count=1,
+        )
+        confirm = AsyncMock(return_value=False)
+
+        mock_manager = MagicMock()
+        mock_manager._registry.get_skill.return_value = MockSkillInfo(name="risky_skill")
+
+        tool = SkillLiteTool(
+            name="risky_skill",
+            description="A risky skill",
+            manager=mock_manager,
+            skill_name="risky_skill",
+            async_confirmation_callback=confirm,
+        )
+
+        result = await tool._arun()
+
+        confirm.assert_awaited_once()
+        assert confirm.call_args.args[1] == "scan-1"
+        assert "cancelled" in result
+
 
 class TestSkillLiteToolkit:
     """Tests for SkillLiteToolkit class."""
@@ -223,3 +325,142 @@ class TestSkillLiteToolkit:
         assert tools[0].timeout == 60
         assert tools[0].sandbox_level == 2
 
+    def test_from_manager_shares_pool(self):
+        """Test that from_manager hands the same pool to every tool."""
+        mock_manager = MagicMock()
+        mock_manager.list_executable_skills.return_value = [
+            MockSkillInfo(name="skill1", description="First skill"),
+            MockSkillInfo(name="skill2", description="Second skill"),
+        ]
+        mock_pool = MagicMock()
+
+        tools = SkillLiteToolkit.from_manager(mock_manager, pool=mock_pool)
+
+        assert all(tool.pool is mock_pool for tool in tools)
+
+    def test_from_manager_forwards_constructor_options(self):
+        """Test that from_manager forwards options only the constructor declares."""
+        mock_manager = MagicMock()
+        mock_manager.list_executable_skills.return_value = [
+            MockSkillInfo(name="skill1", description="First skill"),
+        ]
+
+        tools = SkillLiteToolkit.from_manager(
+            mock_manager, description_mode="summary", describe_tool=False, max_output_bytes=10
+        )
+
+        assert [tool.name for tool in tools] == ["skill1"]
+        assert tools[0].max_output_bytes == 10
+        with pytest.raises(TypeError):
+            SkillLiteToolkit.from_manager(mock_manager, unknown_option=True)
+
+    def test_from_manager_accepts_baseline_options_positionally(self):
+        """Test that the sandbox options keep their positional order."""
+        mock_manager = MagicMock()
+        mock_manager.list_executable_skills.return_value = [
+            MockSkillInfo(name="skill1", description="First skill"),
+        ]
+
+        tools = SkillLiteToolkit.from_manager(mock_manager, None, True, 60, 2)
+
+        assert tools[0].allow_network is True
+        assert tools[0].timeout == 60
+        assert tools[0].sandbox_level == 2
+        with pytest.raises(TypeError):
+            SkillLiteToolkit.from_manager(mock_manager, None, True, 60, 2, None, None, None)
+
+    def test_pool_config_builds_a_pool(self):
+        """Test that the constructor turns a PoolConfig into a SkillWorkerPool."""
+        from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+
+        toolkit = SkillLiteToolkit(manager=MagicMock(), pool=PoolConfig(min_size=0, max_size=1))
+        try:
+            assert isinstance(toolkit.pool, SkillWorkerPool)
+        finally:
+            toolkit.pool.shutdown()
+
+    def test_from_directory_accepts_pool_config(self, tmp_path, write_skill):
+        """Test that from_directory hands a pool built from a PoolConfig to its tools."""
+        from langchain_skilllite.pool import PoolConfig, SkillWorkerPool
+
+        write_skill(tmp_path, "echo")
+
+        tools = SkillLiteToolkit.from_directory(
+            str(tmp_path), pool=PoolConfig(min_size=0, max_size=1)
+        )
+        try:
+            assert [tool.name for tool in tools] == ["echo"]
+            assert isinstance(tools[0].pool, SkillWorkerPool)
+        finally:
+            tools[0].pool.shutdown()
+
+
+class TestSkillLiteToolkitBatch:
+    """Tests for SkillLiteToolkit.execute_batch / aexecute_batch."""
+
+    @staticmethod
+    def _toolkit(pool):
+        mock_manager = MagicMock()
+        mock_manager.get_skill.side_effect = lambda name: (
+            None if name == "missing" else MockSkillInfo(name=name)
+        )
+        return SkillLiteToolkit(manager=mock_manager, pool=pool)
+
+    def test_execute_batch_preserves_order_and_isolates_failures(self, monkeypatch):
+        """Test that results come back in order and one failure stays local."""
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+
+        def execute(skill_info, input_data, timeout=None):
+            if input_data.get("fail"):
+                raise RuntimeError("worker exploded")
+            return MockExecutionResult(success=True, output=input_data["n"])
+
+        mock_pool = MagicMock()
+        mock_pool.supports.return_value = True
+        mock_pool.execute.side_effect = execute
+        toolkit = self._toolkit(mock_pool)
+
+        results = toolkit.execute_batch(
+            [
+                ("skill1", {"n": 1}),
+                ("skill2", {"fail": True}),
+                ("missing", {}),
+                ("skill1", {"n": 4}),
+            ],
+            max_concurrency=2,
+        )
+
+        assert [r.success for r in results] == [True, False, False, True]
+        assert results[0].output == 1
+        assert results[3].output == 4
+        assert "worker exploded" in results[1].error
+        assert "not found" in results[2].error
+
+    async def test_aexecute_batch_runs_concurrently(self, monkeypatch):
+        """Test that async batches overlap instead of running back to back."""
+        import asyncio
+        import time
+
+        monkeypatch.setenv("SKILLBOX_SANDBOX_LEVEL", "1")
+
+        async def aexecute(skill_info, input_data, timeout=None):
+            await asyncio.sleep(0.2)
+            return MockExecutionResult(success=True, output=input_data["n"])
+
+        mock_pool = MagicMock()
+        mock_pool.supports.return_value = True
+        mock_pool.aexecute.side_effect = aexecute
+        toolkit = self._toolkit(mock_pool)
+
+        start = time.perf_counter()
+        results = await toolkit.aexecute_batch([("skill1", {"n": i}) for i in range(5)])
+        elapsed = time.perf_counter() - start
+
+        assert [r.output for r in results] == list(range(5))
+        assert elapsed < 0.6
+
+    def test_execute_batch_rejects_bad_concurrency(self):
+        """Test that max_concurrency must be positive."""
+        toolkit = self._toolkit(MagicMock())
+        with pytest.raises(ValueError):
+            toolkit.execute_batch([("skill1", {})], max_concurrency=0)
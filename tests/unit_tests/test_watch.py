@@ -0,0 +1,115 @@
+"""Unit tests for the hot-reloading WatchingSkillLiteToolkit."""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_skilllite.watch import WatchingSkillLiteToolkit
+
+
+def _touch(path: Path) -> None:
+    """Bump mtime so the change is visible even on coarse-grained filesystems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def skills_dir(tmp_path, write_skill):
+    root = tmp_path / "skills"
+    write_skill(root, "alpha")
+    write_skill(root, "beta")
+    return root
+
+
+class TestWatchingSkillLiteToolkit:
+    """Tests for WatchingSkillLiteToolkit."""
+
+    def test_initial_snapshot(self, skills_dir):
+        toolkit = WatchingSkillLiteToolkit(skills_dir, backend="poll")
+
+        assert toolkit.version == 1
+        assert sorted(toolkit.snapshot.names) == ["alpha", "beta"]
+
+    def test_refresh_without_changes_keeps_snapshot(self, skills_dir):
+        toolkit = WatchingSkillLiteToolkit(skills_dir, backend="poll")
+        snapshot = toolkit.snapshot
+
+        assert toolkit.refresh() is snapshot
+
+    def test_add_update_remove_only_touch_affected_tools(self, skills_dir, write_skill):
+        toolkit = WatchingSkillLiteToolkit(skills_dir, backend="poll")
+        before = toolkit.snapshot
+        alpha = before.get("alpha")
+
+        write_skill(skills_dir, "gamma")
+        skill_md = skills_dir / "beta" / "SKILL.md"
+        skill_md.write_text("---\nname: beta\ndescription: Beta v2\n---\n")
+        _touch(skill_md)
+        shutil.rmtree(skills_dir / "alpha")
+        after = toolkit.refresh()
+
+        assert after.version == before.version + 1
+        assert (after.added, after.updated, after.removed) == (("gamma",), ("beta",), ("alpha",))
+        assert sorted(after.names) == ["beta", "gamma"]
+        assert "Beta v2" in after.get("beta").description
+        # The old snapshot is untouched
+        assert before.get("alpha") is alpha
+        assert toolkit.manager.get_skill("alpha") is None
+
+    def test_unchanged_tools_are_reused(self, skills_dir):
+        toolkit = WatchingSkillLiteToolkit(skills_dir, backend="poll")
+        beta = toolkit.snapshot.get("beta")
+
+        script = skills_dir / "alpha" / "scripts" / "main.py"
+        script.write_text("print('{\"v\": 2}')\n")
+        _touch(script)
+        snapshot = toolkit.refresh()
+
+        assert snapshot.updated == ("alpha",)
+        assert snapshot.get("beta") is beta
+
+    def test_update_invalidates_pool_workers(self, skills_dir):
+        pool = MagicMock()
+        toolkit = WatchingSkillLiteToolkit(skills_dir, backend="poll", pool=pool)
+
+        skill_md = skills_dir / "alpha" / "SKILL.md"
+        _touch(skill_md)
+        toolkit.refresh()
+
+        pool.invalidate.assert_called_once_with((skills_dir / "alpha").resolve())
+
+    def test_skill_names_filter_applies_to_new_skills(self, skills_dir, write_skill):
+        toolkit = WatchingSkillLiteToolkit(skills_dir, backend="poll", skill_names=["alpha"])
+        write_skill(skills_dir, "gamma")
+
+        assert toolkit.refresh().names == ["alpha"]
+
+    def test_lazy_discovery(self, skills_dir, write_skill):
+        toolkit = WatchingSkillLiteToolkit(skills_dir, backend="poll", lazy=True)
+        write_skill(skills_dir, "gamma", description="Lazy gamma")
+
+        snapshot = toolkit.refresh()
+
+        assert snapshot.get("gamma").description == "Lazy gamma"
+
+    def test_polling_thread_publishes_snapshots(self, skills_dir, write_skill):
+        reloaded = threading.Event()
+        toolkit = WatchingSkillLiteToolkit(
+            skills_dir,
+            backend="poll",
+            poll_interval=0.05,
+            on_reload=lambda snapshot: reloaded.set(),
+        )
+        with toolkit:
+            write_skill(skills_dir, "gamma")
+            assert reloaded.wait(5)
+
+        assert "gamma" in toolkit.snapshot.names
+
+    def test_invalid_backend(self, skills_dir):
+        with pytest.raises(ValueError):
+            WatchingSkillLiteToolkit(skills_dir, backend="fanotify")